@@ -16,6 +16,7 @@ PlanCraft - Multi-Agent 설정 모듈
 """
 
 import os
+import re
 import sys
 from typing import Dict, List, Any, Optional, Callable, Type, TYPE_CHECKING
 from dataclasses import dataclass, field
@@ -130,10 +131,19 @@ class AgentSpec:
     # 라우팅 키워드 (LLM 라우팅 시 참조)
     routing_keywords: List[str] = field(default_factory=list)
 
+    # [NEW] 섹션 키워드 (기획서 섹션 → 필요 결과 매핑, provides와 함께 사용)
+    section_keywords: List[str] = field(default_factory=list)
+
     # 추가 메타데이터
     timeout_seconds: int = 60
     retry_count: int = 2
 
+    # [NEW] 비용/효용 모델 사전 추정치 (agents/agent_cost_model.py, 실측 전까지 사용)
+    expected_latency_ms: int = 10000   # 기본 모델 1회 실행 지연시간
+    expected_tokens: int = 3000        # 1회 실행 토큰 (입력+출력)
+    routing_benefit: float = 0.5       # 기획서 품질 기여도 (0.0~1.0, 예산 초과 시 낮은 것부터 축소)
+    routing_skippable: bool = True     # 예산 초과 시 생략 가능 여부 (False면 다운그레이드만)
+
     def __post_init__(self):
         """result_key 기본값 자동 설정"""
         if not self.result_key:
@@ -155,6 +165,11 @@ class AgentSpec:
             "depends_on": self.depends_on,
             "provides": self.provides,
             "routing_keywords": self.routing_keywords,
+            "section_keywords": self.section_keywords,
+            "expected_latency_ms": self.expected_latency_ms,
+            "expected_tokens": self.expected_tokens,
+            "routing_benefit": self.routing_benefit,
+            "routing_skippable": self.routing_skippable,
         }
 
     def check_deprecation(self) -> None:
@@ -212,8 +227,13 @@ def _load_agents_from_yaml() -> Dict[str, AgentSpec]:
                 depends_on=agent_data.get("depends_on", []),
                 provides=agent_data.get("provides", []),
                 routing_keywords=agent_data.get("routing_keywords", []),
+                section_keywords=agent_data.get("section_keywords", []),
                 timeout_seconds=agent_data.get("timeout_seconds", 60),
                 retry_count=agent_data.get("retry_count", 2),
+                expected_latency_ms=agent_data.get("expected_latency_ms", 10000),
+                expected_tokens=agent_data.get("expected_tokens", 3000),
+                routing_benefit=agent_data.get("routing_benefit", 0.5),
+                routing_skippable=agent_data.get("routing_skippable", True),
             )
             registry[agent_id] = spec
 
@@ -300,7 +320,12 @@ else:
             depends_on=[],
             provides=["tam", "sam", "som", "competitors", "trends"],
         routing_keywords=["시장", "규모", "경쟁사", "트렌드", "TAM", "SAM", "SOM", "분석"],
+        section_keywords=["시장", "경쟁", "트렌드", "TAM", "SAM", "SOM", "market", "competitor"],
         timeout_seconds=90,
+        expected_latency_ms=12000,
+        expected_tokens=3500,
+        routing_benefit=1.0,
+        routing_skippable=False,
     ),
 
     "bm": AgentSpec(
@@ -315,7 +340,12 @@ else:
         depends_on=["market"],  # 시장 분석 후 BM 수립 (순서 보장)
         provides=["revenue_model", "pricing", "moat"],
         routing_keywords=["수익", "가격", "BM", "비즈니스", "모델", "구독", "광고", "B2B", "B2C"],
+        section_keywords=["비즈니스 모델", "수익", "가격", "BM", "business model", "revenue", "pricing"],
         timeout_seconds=60,
+        expected_latency_ms=10000,
+        expected_tokens=3000,
+        routing_benefit=0.9,
+        routing_skippable=False,
     ),
 
     "financial": AgentSpec(
@@ -330,7 +360,11 @@ else:
         depends_on=["bm"],  # BM 결과 필수
         provides=["investment", "monthly_pl", "bep", "scenarios"],
         routing_keywords=["재무", "투자", "비용", "매출", "BEP", "손익", "예산", "자금"],
+        section_keywords=["재무", "투자", "손익", "매출", "예산", "BEP", "financial"],
         timeout_seconds=90,
+        expected_latency_ms=12000,
+        expected_tokens=3500,
+        routing_benefit=0.7,
     ),
 
     "risk": AgentSpec(
@@ -345,7 +379,11 @@ else:
         depends_on=["bm"],  # BM 결과 참조
         provides=["risks", "mitigation", "kri"],
         routing_keywords=["리스크", "위험", "대응", "문제", "장애", "규제"],
+        section_keywords=["리스크", "위험", "risk"],
         timeout_seconds=60,
+        expected_latency_ms=9000,
+        expected_tokens=2500,
+        routing_benefit=0.5,
     ),
 
     "tech": AgentSpec(
@@ -360,7 +398,11 @@ else:
         depends_on=[],  # 독립적으로 수행 가능
         provides=["recommended_stack", "architecture_desc", "roadmap"],
         routing_keywords=["기술", "아키텍처", "개발", "스택", "인프라", "클라우드", "앱", "웹"],
+        section_keywords=["기술", "아키텍처", "개발 로드맵", "로드맵", "tech", "architecture"],
         timeout_seconds=60,
+        expected_latency_ms=9000,
+        expected_tokens=2500,
+        routing_benefit=0.4,
     ),
 
     "content": AgentSpec(
@@ -375,7 +417,11 @@ else:
         depends_on=["market"],  # 시장 분석(타겟) 필요
         provides=["brand_concept", "acquisition_strategy"],
         routing_keywords=["마케팅", "브랜딩", "콘텐츠", "홍보", "유입", "운영"],
+        section_keywords=["마케팅", "브랜드", "브랜딩", "콘텐츠", "홍보", "유입", "marketing", "brand"],
         timeout_seconds=60,
+        expected_latency_ms=8000,
+        expected_tokens=2500,
+        routing_benefit=0.3,
     ),
 }
 
@@ -674,6 +720,62 @@ def resolve_execution_order(required_agents: List[str]) -> List[str]:
     return flat_order
 
 
+# =============================================================================
+# 섹션 → 전문 에이전트 결과 매핑 (Writer 파이프라인)
+# =============================================================================
+
+def _section_text(section: Any) -> str:
+    if isinstance(section, dict):
+        parts = [section.get("name") or section.get("title") or "", section.get("description") or ""]
+        parts.extend(str(p) for p in section.get("key_points") or [])
+        return " ".join(parts)
+    return str(section)
+
+
+def _term_matches(term: str, text: str) -> bool:
+    """영문 용어는 영숫자 경계 기준 (SOM ≠ some), 한글 용어는 부분 문자열 기준"""
+    term = term.replace("_", " ").lower()
+    if term.isascii():
+        return re.search(rf"(?<![a-z0-9]){re.escape(term)}(?![a-z0-9])", text) is not None
+    return term in text
+
+
+def map_sections_to_result_keys(
+    sections: List[Any],
+    agent_ids: Optional[List[str]] = None
+) -> List[List[str]]:
+    """
+    [NEW] 기획서 섹션별로 작성에 필요한 전문 에이전트 결과 키 목록 반환
+
+    섹션명/설명/핵심 포인트에 에이전트의 provides(예: "bep", "revenue_model") 또는
+    section_keywords(예: "재무", "리스크")가 등장하면 해당 에이전트 결과가 필요하다고 봅니다.
+    어떤 에이전트와도 매칭되지 않는 섹션(개요 등)은 결과를 기다리지 않고 작성합니다.
+
+    Args:
+        sections: Structurer 출력의 sections (dict 또는 문자열)
+        agent_ids: 후보 에이전트 (None이면 Registry 전체)
+
+    Returns:
+        List[List[str]]: sections와 같은 순서의 결과 키 목록
+
+    Example:
+        >>> map_sections_to_result_keys([{"name": "재무 계획"}, {"name": "프로젝트 개요"}])
+        [["financial_plan"], []]
+    """
+    specs = [
+        spec for agent_id, spec in AGENT_REGISTRY.items()
+        if agent_ids is None or agent_id in agent_ids
+    ]
+    mapping = []
+    for section in sections:
+        text = _section_text(section).lower()
+        mapping.append([
+            spec.result_key for spec in specs
+            if any(_term_matches(term, text) for term in list(spec.provides) + list(spec.section_keywords))
+        ])
+    return mapping
+
+
 # =============================================================================
 # DAG → Mermaid 그래프 Export (디버깅/문서화용)
 # =============================================================================
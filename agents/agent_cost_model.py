@@ -0,0 +1,351 @@
+"""
+PlanCraft - 전문 에이전트 비용/효용 모델 (Adaptive Routing)
+
+규칙 기반 라우팅(detect_required_agents)은 목적/키워드만으로 에이전트를 고르기 때문에
+"빠른 생성" 프리셋에서도 4~6개 에이전트가 기본 모델로 모두 실행되었습니다.
+
+이 모듈은 에이전트별 실측 지연시간/토큰(ExecutionStats)을 EWMA로 학습하고,
+프리셋 예산(RoutingBudget)을 넘는 계획은 효용 손실 대비 절감량이 가장 큰 조치부터
+적용해 예산 안으로 줄입니다.
+
+조치 우선순위 (효용 손실이 작은 순):
+    1. 캐시 적중 예정 에이전트: 비용 0으로 계산 (조치 불필요)
+    2. 다운그레이드: 경량 모델(예: gpt-4o-mini)로 실행
+    3. 생략: routing_skippable 에이전트 중 다른 에이전트가 의존하지 않는 것
+
+- 사전 추정치: config/agents.yaml의 expected_latency_ms / expected_tokens / routing_benefit
+  (실행 이력 저장소 agents/agent_stats_store.py에 충분한 이력이 있으면 이력 p50/평균 토큰 우선)
+- 학습: NativeSupervisor._execute_plan 종료 시 observe_execution_stats()
+- 결과: RoutingDecision.downgraded / skipped / reasoning
+
+사용 예시:
+    from agents.agent_cost_model import RoutingBudget, agent_cost_model
+
+    budget = RoutingBudget.from_preset(get_preset("fast"))
+    decision = detect_required_agents(overview, purpose, budget=budget, cost_model=agent_cost_model)
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.file_logger import get_file_logger
+
+logger = get_file_logger()
+
+# 모델별 상대 프로필 (기본 모델 대비 지연시간 배율, 토큰 단가 가중치)
+MODEL_PROFILES: Dict[str, Dict[str, float]] = {
+    "gpt-4o": {"latency_factor": 1.0, "cost_weight": 1.0},
+    "gpt-4o-mini": {"latency_factor": 0.6, "cost_weight": 0.06},
+}
+DEFAULT_MODEL = "gpt-4o"
+
+# 조치별 효용 손실 비율 (routing_benefit 대비)
+DOWNGRADE_BENEFIT_LOSS = 0.3
+SKIP_BENEFIT_LOSS = 1.0
+
+# EWMA 가중치 (최근 실행 반영 비율)
+EWMA_ALPHA = 0.3
+
+
+def _profile(model: Optional[str]) -> Dict[str, float]:
+    return MODEL_PROFILES.get(model or DEFAULT_MODEL, MODEL_PROFILES[DEFAULT_MODEL])
+
+
+@dataclass
+class AgentCostEstimate:
+    """에이전트 1회 실행 비용 추정치"""
+    latency_ms: float
+    tokens: float
+    samples: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"latency_ms": round(self.latency_ms, 1), "tokens": round(self.tokens, 1), "samples": self.samples}
+
+
+@dataclass
+class RoutingBudget:
+    """
+    전문 에이전트 실행 예산 (프리셋 기반)
+
+    Attributes:
+        latency_ms: 계획 Critical Path 지연시간 예산 (None이면 제한 없음)
+        tokens: 토큰 예산 (기본 모델 단가 환산 토큰, None이면 제한 없음)
+        downgrade_model: 다운그레이드에 사용할 경량 모델 (None이면 다운그레이드 없이 생략만)
+        base_model: 에이전트 기본 모델 (Supervisor LLM)
+    """
+    latency_ms: Optional[float] = None
+    tokens: Optional[float] = None
+    downgrade_model: Optional[str] = None
+    base_model: str = DEFAULT_MODEL
+
+    @property
+    def limited(self) -> bool:
+        return self.latency_ms is not None or self.tokens is not None
+
+    @classmethod
+    def from_preset(cls, preset, base_model: str = DEFAULT_MODEL) -> Optional["RoutingBudget"]:
+        """프리셋의 specialist_* 예산 설정 → RoutingBudget (예산이 없으면 None)"""
+        budget = cls(
+            latency_ms=getattr(preset, "specialist_latency_budget_ms", None),
+            tokens=getattr(preset, "specialist_token_budget", None),
+            downgrade_model=getattr(preset, "specialist_downgrade_model", None),
+            base_model=base_model,
+        )
+        return budget if budget.limited else None
+
+
+class AgentCostModel:
+    """
+    에이전트×모델별 지연시간/토큰 EWMA (프로세스 전역, 스레드 안전)
+
+    관측값이 없으면 AgentSpec 사전 추정치에 모델 프로필 배율을 적용합니다.
+    """
+
+    def __init__(self, alpha: float = EWMA_ALPHA):
+        self.alpha = alpha
+        self._estimates: Dict[Tuple[str, str], AgentCostEstimate] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, agent_id: str, latency_ms: float, tokens: float, model: Optional[str] = None) -> None:
+        key = (agent_id, model or DEFAULT_MODEL)
+        with self._lock:
+            current = self._estimates.get(key)
+            if current is None:
+                self._estimates[key] = AgentCostEstimate(latency_ms, tokens, 1)
+                return
+            current.latency_ms += self.alpha * (latency_ms - current.latency_ms)
+            current.tokens += self.alpha * (tokens - current.tokens)
+            current.samples += 1
+
+    def observe_execution_stats(self, execution_stats: Dict[str, Any]) -> int:
+        """
+        ExecutionStats.to_dict() 결과 학습 (실제로 실행되어 성공한 에이전트만)
+
+        Returns:
+            int: 학습에 반영한 에이전트 수
+        """
+        observed = 0
+        for agent_id, agent_stats in (execution_stats or {}).get("agent_stats", {}).items():
+            if not agent_stats.get("success") or agent_stats.get("cache_hit") or agent_stats.get("fallback_used"):
+                continue
+            self.observe(
+                agent_id,
+                agent_stats.get("execution_time_ms", 0.0),
+                agent_stats.get("total_tokens", 0),
+                agent_stats.get("model_type") or None,
+            )
+            observed += 1
+        return observed
+
+    def estimate(self, agent_id: str, model: Optional[str] = None) -> AgentCostEstimate:
+        """에이전트×모델 비용 추정 (관측값 → 실행 이력 저장소 → 사전 추정치 순)"""
+        model = model or DEFAULT_MODEL
+        with self._lock:
+            measured = self._estimates.get((agent_id, model))
+            if measured is not None:
+                return AgentCostEstimate(measured.latency_ms, measured.tokens, measured.samples)
+
+        from agents.agent_config import AGENT_REGISTRY
+        from agents.agent_stats_store import get_agent_stats_store
+
+        # [NEW] 프로세스 재시작 후에도 과거 실행 이력 사용 (agents/agent_stats_store.py)
+        history = get_agent_stats_store().agent_history(agent_id, model)
+        if history is not None:
+            return AgentCostEstimate(history["latency_p50_ms"], history["avg_tokens"], history["executed"])
+
+        spec = AGENT_REGISTRY.get(agent_id)
+        latency = spec.expected_latency_ms if spec else 10000
+        tokens = spec.expected_tokens if spec else 3000
+        return AgentCostEstimate(latency * _profile(model)["latency_factor"], tokens)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """{"agent_id@model": {latency_ms, tokens, samples}}"""
+        with self._lock:
+            return {f"{a}@{m}": est.to_dict() for (a, m), est in self._estimates.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._estimates.clear()
+
+
+# 전역 비용 모델 (Supervisor 실행마다 학습, /metrics/specialists 노출)
+agent_cost_model = AgentCostModel()
+
+
+# =============================================================================
+# 예산 적용
+# =============================================================================
+
+@dataclass
+class BudgetedPlan:
+    """예산 적용 결과"""
+    required: List[str]
+    downgraded: Dict[str, str]
+    skipped: List[str]
+    latency_ms: float
+    tokens: float
+    reasons: List[str]
+
+
+def _dependency_closure(agents: Iterable[str], graph: Dict[str, List[str]]) -> List[str]:
+    """의존 에이전트 포함 (resolve_execution_plan_dag와 동일한 Closure, 입력 순서 유지)"""
+    ordered = list(dict.fromkeys(agents))
+    index = 0
+    while index < len(ordered):
+        for dep in graph.get(ordered[index], []):
+            if dep not in ordered:
+                ordered.append(dep)
+        index += 1
+    return ordered
+
+
+def _memoized_estimate(cost_model: AgentCostModel) -> Callable[[str, str], AgentCostEstimate]:
+    """
+    [NEW] 계획 1회 동안 에이전트×모델 추정치를 한 번만 조회하는 estimate
+
+    관측값이 없는(콜드) 에이전트는 estimate()마다 실행 이력 저장소(SQLite)를 집계하므로,
+    후보 조치마다 _plan_cost를 다시 계산하는 plan_within_budget에서는 조회 결과를 재사용합니다.
+    """
+    memo: Dict[Tuple[str, str], AgentCostEstimate] = {}
+
+    def estimate(agent_id: str, model: str) -> AgentCostEstimate:
+        key = (agent_id, model)
+        if key not in memo:
+            memo[key] = cost_model.estimate(agent_id, model)
+        return memo[key]
+
+    return estimate
+
+
+def _plan_cost(
+    agents: List[str],
+    downgraded: Dict[str, str],
+    budget: RoutingBudget,
+    estimate: Callable[[str, str], AgentCostEstimate],
+    cached: set,
+    graph: Dict[str, List[str]],
+) -> Tuple[float, float]:
+    """(Critical Path 지연시간, 기본 모델 단가 환산 토큰)"""
+    finish: Dict[str, float] = {}
+    tokens = 0.0
+
+    def finish_ms(agent_id: str) -> float:
+        if agent_id not in finish:
+            model = downgraded.get(agent_id, budget.base_model)
+            own = 0.0 if agent_id in cached else estimate(agent_id, model).latency_ms
+            deps = [d for d in graph.get(agent_id, []) if d in agents]
+            finish[agent_id] = own + max((finish_ms(d) for d in deps), default=0.0)
+        return finish[agent_id]
+
+    for agent_id in agents:
+        if agent_id in cached:
+            continue
+        model = downgraded.get(agent_id, budget.base_model)
+        tokens += estimate(agent_id, model).tokens * _profile(model)["cost_weight"]
+    latency = max((finish_ms(a) for a in agents), default=0.0)
+    return latency, tokens
+
+
+def _overrun(latency: float, tokens: float, budget: RoutingBudget) -> float:
+    """예산 대비 초과 비율 합 (0이면 예산 이내)"""
+    over = 0.0
+    if budget.latency_ms:
+        over += max(0.0, latency / budget.latency_ms - 1.0)
+    if budget.tokens:
+        over += max(0.0, tokens / budget.tokens - 1.0)
+    return over
+
+
+def plan_within_budget(
+    required: List[str],
+    budget: RoutingBudget,
+    cost_model: Optional[AgentCostModel] = None,
+    cached_agents: Iterable[str] = (),
+) -> BudgetedPlan:
+    """
+    예산을 넘는 계획을 다운그레이드/생략으로 줄임 (Greedy)
+
+    매 단계 "초과 비율 감소량 / 효용 손실"이 가장 큰 조치를 적용하고,
+    예산 이내가 되거나 초과를 줄이는 조치가 없으면 멈춥니다.
+
+    Args:
+        required: 규칙 기반 라우팅 결과
+        budget: 실행 예산
+        cost_model: 비용 모델 (None이면 전역 agent_cost_model)
+        cached_agents: 결과 캐시 적중이 예상되는 에이전트 (비용 0)
+
+    Returns:
+        BudgetedPlan
+    """
+    from agents.agent_config import AGENT_REGISTRY, get_dependency_graph
+
+    estimate = _memoized_estimate(cost_model or agent_cost_model)
+    graph = get_dependency_graph()
+    cached = set(cached_agents)
+    agents = _dependency_closure(required, graph)
+    downgraded: Dict[str, str] = {}
+    skipped: List[str] = []
+    reasons: List[str] = []
+
+    latency, tokens = _plan_cost(agents, downgraded, budget, estimate, cached, graph)
+    if cached & set(agents):
+        reasons.append(f"캐시 적중 예상: {sorted(cached & set(agents))}")
+
+    while _overrun(latency, tokens, budget) > 0:
+        current = _overrun(latency, tokens, budget)
+        best = None  # (score, action, agent_id, latency, tokens)
+        for agent_id in agents:
+            if agent_id in cached:
+                continue
+            spec = AGENT_REGISTRY.get(agent_id)
+            benefit = spec.routing_benefit if spec else 0.5
+            candidates = []
+            if budget.downgrade_model and agent_id not in downgraded and budget.downgrade_model != budget.base_model:
+                candidates.append(("downgrade", DOWNGRADE_BENEFIT_LOSS))
+            has_dependents = any(agent_id in graph.get(other, []) for other in agents if other != agent_id)
+            if spec is not None and spec.routing_skippable and not has_dependents:
+                candidates.append(("skip", SKIP_BENEFIT_LOSS))
+
+            for action, loss in candidates:
+                trial_agents = [a for a in agents if a != agent_id] if action == "skip" else agents
+                trial_downgraded = dict(downgraded)
+                if action == "downgrade":
+                    trial_downgraded[agent_id] = budget.downgrade_model
+                trial_latency, trial_tokens = _plan_cost(
+                    trial_agents, trial_downgraded, budget, estimate, cached, graph
+                )
+                reduction = current - _overrun(trial_latency, trial_tokens, budget)
+                if reduction <= 0:
+                    continue
+                score = reduction / max(benefit * loss, 1e-6)
+                if best is None or score > best[0]:
+                    best = (score, action, agent_id, trial_latency, trial_tokens)
+
+        if best is None:
+            reasons.append(f"예산 초과 유지 (추가 절감 조치 없음): 예상 {latency:.0f}ms / {tokens:.0f} 토큰")
+            break
+
+        _, action, agent_id, new_latency, new_tokens = best
+        if action == "downgrade":
+            downgraded[agent_id] = budget.downgrade_model
+            reasons.append(f"{agent_id} → {budget.downgrade_model} 다운그레이드")
+        else:
+            agents.remove(agent_id)
+            downgraded.pop(agent_id, None)
+            skipped.append(agent_id)
+            reasons.append(f"{agent_id} 생략")
+        latency, tokens = new_latency, new_tokens
+
+    if downgraded or skipped:
+        reasons.append(
+            f"예산 {budget.latency_ms or '-'}ms / {budget.tokens or '-'} 토큰 → 예상 {latency:.0f}ms / {tokens:.0f} 토큰"
+        )
+    return BudgetedPlan(
+        required=[a for a in required if a not in skipped],
+        downgraded=downgraded,
+        skipped=skipped,
+        latency_ms=latency,
+        tokens=tokens,
+        reasons=reasons,
+    )
@@ -0,0 +1,342 @@
+"""
+PlanCraft - 전문 에이전트 실행 이력 저장소 (Agent Stats Store)
+
+ExecutionStats / AgentExecutionStats는 실행마다 만들어져 results["_execution_stats"]에
+기록된 뒤 버려졌기 때문에, 타임아웃/실행 순서/에이전트 선택을 과거 실측 없이 고정값으로
+정해야 했습니다.
+
+이 모듈은 에이전트 실행 1건을 SQLite에 한 행으로 저장하고 (에이전트별 최근
+MAX_ROWS_PER_AGENT건 유지), 에이전트 × 모델 × 프리셋별로 지연시간 백분위수,
+재시도/Fallback/캐시 적중 비율, 평균 토큰을 집계합니다.
+
+활용처 (NativeSupervisor):
+    - 타임아웃: 이력 p95 × TIMEOUT_P95_FACTOR (agents.yaml timeout_seconds 이하로만 단축)
+      [NEW] 타임아웃된 실행도 중단 시점까지의 시간(= 당시 타임아웃 이상)으로 p95에 포함하므로,
+            단축된 타임아웃에 걸리는 실행이 늘면 제안값도 다시 늘어납니다.
+    - 실행 순서: 준비된 에이전트 중 남은 Critical Path가 긴 에이전트부터 시작
+    - 에이전트 선택: AgentCostModel이 EWMA 관측값이 없을 때 이력 p50/평균 토큰 사용
+
+- 저장 경로: settings.AGENT_STATS_DB_PATH (PLANCRAFT_AGENT_STATS_DB, ":memory:" 가능)
+- 조회 API: GET /metrics/agents (api/main.py)
+
+사용 예시:
+    from agents.agent_stats_store import get_agent_stats_store
+
+    store = get_agent_stats_store()
+    store.record_execution_stats(results["_execution_stats"], preset="fast")
+    store.summarize(agent_id="market")                      # {"market": {...}}
+    store.summarize(group_by=("agent_id", "model_type"))    # {"market@gpt-4o": {...}}
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.file_logger import get_file_logger
+
+logger = get_file_logger()
+
+# 에이전트별 보관 행 수 (초과분은 오래된 것부터 삭제)
+MAX_ROWS_PER_AGENT = 500
+# 이력 기반 판단에 필요한 최소 실행 수 (캐시 적중/Fallback 제외)
+MIN_HISTORY_SAMPLES = 5
+# 이력 기반 타임아웃 = p95 × 배율 (하한 MIN_TIMEOUT_SEC, 상한 agents.yaml timeout_seconds)
+TIMEOUT_P95_FACTOR = 2.0
+MIN_TIMEOUT_SEC = 20.0
+
+GROUP_COLUMNS = ("agent_id", "model_type", "preset")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS agent_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at REAL NOT NULL,
+    plan_id TEXT,
+    agent_id TEXT NOT NULL,
+    model_type TEXT NOT NULL DEFAULT '',
+    preset TEXT NOT NULL DEFAULT '',
+    success INTEGER NOT NULL,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    fallback_used INTEGER NOT NULL DEFAULT 0,
+    cache_hit INTEGER NOT NULL DEFAULT 0,
+    execution_time_ms REAL NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    timed_out INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_agent_runs_agent ON agent_runs (agent_id, id);
+"""
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """선형 보간 백분위수 (values는 정렬된 목록)"""
+    if not values:
+        return 0.0
+    rank = (len(values) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+class AgentStatsStore:
+    """
+    SQLite 기반 에이전트 실행 이력 (스레드 안전)
+
+    집계 결과는 필터별로 메모리에 캐시하고 기록 시 무효화합니다.
+    (라우팅/스케줄링이 계획마다 여러 번 조회하므로 매번 SQL을 실행하지 않음)
+    """
+
+    def __init__(self, db_path: str = ":memory:", max_rows_per_agent: int = MAX_ROWS_PER_AGENT):
+        self.db_path = db_path
+        self.max_rows_per_agent = max_rows_per_agent
+        if db_path != ":memory:":
+            db_dir = os.path.dirname(db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._lock = threading.Lock()
+        self._summary_cache: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
+
+    def _migrate(self) -> None:
+        """[NEW] 이전 스키마 DB 파일에 timed_out 컬럼 추가"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(agent_runs)")}
+        if "timed_out" not in columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE agent_runs ADD COLUMN timed_out INTEGER NOT NULL DEFAULT 0")
+
+    # -------------------------------------------------------------------------
+    # 기록
+    # -------------------------------------------------------------------------
+
+    def record_execution_stats(self, execution_stats: Dict[str, Any], preset: str = "") -> int:
+        """
+        ExecutionStats.to_dict() 결과의 에이전트별 통계 저장
+
+        Returns:
+            int: 저장한 행 수
+        """
+        now = time.time()
+        plan_id = (execution_stats or {}).get("plan_id", "")
+        rows = [
+            (
+                now, plan_id, agent_id,
+                agent_stats.get("model_type") or "",
+                preset or "",
+                int(bool(agent_stats.get("success"))),
+                int(agent_stats.get("retry_count") or 0),
+                int(bool(agent_stats.get("fallback_used"))),
+                int(bool(agent_stats.get("cache_hit"))),
+                float(agent_stats.get("execution_time_ms") or 0.0),
+                int(agent_stats.get("total_tokens") or 0),
+                int(agent_stats.get("error_category") == "TIMEOUT_ERROR"),
+            )
+            for agent_id, agent_stats in (execution_stats or {}).get("agent_stats", {}).items()
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO agent_runs (recorded_at, plan_id, agent_id, model_type, preset, success,"
+                    " retry_count, fallback_used, cache_hit, execution_time_ms, total_tokens, timed_out)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                for agent_id in {row[2] for row in rows}:
+                    self._conn.execute(
+                        "DELETE FROM agent_runs WHERE agent_id = ? AND id NOT IN"
+                        " (SELECT id FROM agent_runs WHERE agent_id = ? ORDER BY id DESC LIMIT ?)",
+                        (agent_id, agent_id, self.max_rows_per_agent),
+                    )
+            self._summary_cache.clear()
+        return len(rows)
+
+    def clear(self) -> None:
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM agent_runs")
+            self._summary_cache.clear()
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+
+    def summarize(
+        self,
+        agent_id: Optional[str] = None,
+        model_type: Optional[str] = None,
+        preset: Optional[str] = None,
+        group_by: Iterable[str] = ("agent_id",),
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        실행 이력 집계
+
+        Args:
+            agent_id / model_type / preset: 필터 (None이면 전체)
+            group_by: 그룹 컬럼 ("agent_id", "model_type", "preset" 조합)
+
+        Returns:
+            {"market" | "market@gpt-4o" | "market@gpt-4o/fast": {
+                runs, executed, success_rate, retry_rate, fallback_rate, cache_hit_rate, timeout_rate,
+                latency_p50_ms, latency_p90_ms, latency_p95_ms, avg_tokens
+            }}
+            토큰은 실제로 실행된 건(캐시 적중/Fallback 제외) 기준이며, 지연시간은 여기에
+            타임아웃 건(중단 시점까지의 시간)을 더해 계산합니다. (타임아웃 건을 빼면 p95가 과소 추정됨)
+        """
+        group_by = tuple(group_by)
+        unknown = set(group_by) - set(GROUP_COLUMNS)
+        if unknown or "agent_id" not in group_by:
+            raise ValueError(f"group_by는 agent_id를 포함한 {GROUP_COLUMNS} 조합이어야 합니다: {group_by}")
+
+        cache_key = (agent_id, model_type, preset, group_by)
+        with self._lock:
+            cached = self._summary_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            filters, params = [], []
+            for column, value in (("agent_id", agent_id), ("model_type", model_type), ("preset", preset)):
+                if value is not None:
+                    filters.append(f"{column} = ?")
+                    params.append(value)
+            where = f" WHERE {' AND '.join(filters)}" if filters else ""
+            rows = self._conn.execute(
+                f"SELECT {', '.join(group_by)}, success, retry_count, fallback_used, cache_hit,"
+                f" execution_time_ms, total_tokens, timed_out FROM agent_runs{where} ORDER BY id",
+                params,
+            ).fetchall()
+
+            groups: Dict[str, List[tuple]] = {}
+            for row in rows:
+                keys = row[:len(group_by)]
+                label = keys[0]
+                if len(keys) > 1:
+                    label += "@" + "/".join(k or "-" for k in keys[1:])
+                groups.setdefault(label, []).append(row[len(group_by):])
+
+            summary = {label: self._summarize_rows(group) for label, group in groups.items()}
+            self._summary_cache[cache_key] = summary
+            return summary
+
+    @staticmethod
+    def _summarize_rows(rows: List[tuple]) -> Dict[str, Any]:
+        runs = len(rows)
+        executed = [r for r in rows if r[0] and not r[2] and not r[3]]
+        # [NEW] 타임아웃 건은 최소 타임아웃 값만큼 걸린 것으로 포함 (시작 전 생략된 건은 0ms라 제외)
+        timed_out = [r for r in rows if r[6] and r[4] > 0]
+        latencies = sorted(r[4] for r in executed + timed_out)
+        return {
+            "runs": runs,
+            "executed": len(executed),
+            "success_rate": round(sum(r[0] for r in rows) / runs, 3),
+            "retry_rate": round(sum(1 for r in rows if r[1] > 0) / runs, 3),
+            "fallback_rate": round(sum(r[2] for r in rows) / runs, 3),
+            "cache_hit_rate": round(sum(r[3] for r in rows) / runs, 3),
+            "timeout_rate": round(sum(r[6] for r in rows) / runs, 3),
+            "latency_p50_ms": round(_percentile(latencies, 50), 1),
+            "latency_p90_ms": round(_percentile(latencies, 90), 1),
+            "latency_p95_ms": round(_percentile(latencies, 95), 1),
+            "avg_tokens": round(sum(r[5] for r in executed) / len(executed), 1) if executed else 0.0,
+        }
+
+    def agent_history(self, agent_id: str, model_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        이력 기반 판단에 충분한 실행 수(MIN_HISTORY_SAMPLES)가 있을 때만 집계 반환
+
+        스케줄링 경로의 조회이므로 DB 오류(잠김/손상/I/O)는 이력 없음(None)으로 처리하여
+        호출 측이 agents.yaml 타임아웃/사전 추정치를 사용하게 합니다.
+        """
+        try:
+            summary = self.summarize(agent_id=agent_id, model_type=model_type).get(agent_id)
+        except sqlite3.Error as e:
+            logger.warning(f"[AgentStatsStore] {agent_id} 실행 이력 조회 실패, 사전 추정치 사용: {e}")
+            return None
+        if summary is None or summary["executed"] < MIN_HISTORY_SAMPLES:
+            return None
+        return summary
+
+    def suggest_timeout_sec(self, agent_id: str, configured_sec: float, model_type: Optional[str] = None) -> float:
+        """
+        이력 p95 기반 타임아웃 (설정값보다 늘리지 않음)
+
+        이력이 부족하면 설정값(agents.yaml timeout_seconds)을 그대로 반환합니다.
+        p95에는 타임아웃 건도 포함되므로, 단축된 타임아웃에 자주 걸리면 제안값이 다시 늘어납니다.
+        """
+        history = self.agent_history(agent_id, model_type)
+        if history is None:
+            return configured_sec
+        suggested = max(MIN_TIMEOUT_SEC, history["latency_p95_ms"] * TIMEOUT_P95_FACTOR / 1000)
+        return min(configured_sec, suggested)
+
+    def expected_latency_ms(self, agent_id: str, model_type: Optional[str] = None) -> Optional[float]:
+        """이력 p50 지연시간 (이력이 부족하면 None)"""
+        history = self.agent_history(agent_id, model_type)
+        return history["latency_p50_ms"] if history else None
+
+
+def critical_path_priority(
+    agent_ids: Iterable[str],
+    deps: Dict[str, List[str]],
+    latency_ms: Dict[str, float],
+) -> Dict[str, float]:
+    """
+    에이전트별 남은 Critical Path 길이 (자신 + 가장 긴 후속 에이전트 체인, ms)
+
+    준비된 에이전트 중 이 값이 큰 것부터 시작하면 워커 수가 부족할 때
+    긴 체인이 뒤로 밀려 전체 시간이 늘어나는 것을 막습니다.
+    """
+    agent_ids = list(agent_ids)
+    dependents: Dict[str, List[str]] = {a: [] for a in agent_ids}
+    for agent_id in agent_ids:
+        for dep in deps.get(agent_id, []):
+            if dep in dependents:
+                dependents[dep].append(agent_id)
+
+    priority: Dict[str, float] = {}
+
+    def visit(agent_id: str) -> float:
+        if agent_id not in priority:
+            priority[agent_id] = latency_ms.get(agent_id, 0.0) + max(
+                (visit(d) for d in dependents[agent_id]), default=0.0
+            )
+        return priority[agent_id]
+
+    for agent_id in agent_ids:
+        visit(agent_id)
+    return priority
+
+
+# =============================================================================
+# 전역 저장소 (지연 생성)
+# =============================================================================
+
+_store: Optional[AgentStatsStore] = None
+_store_lock = threading.Lock()
+
+
+def get_agent_stats_store() -> AgentStatsStore:
+    """전역 실행 이력 저장소 (settings.AGENT_STATS_DB_PATH, 열기 실패 시 메모리 DB)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            from utils.settings import settings
+
+            try:
+                _store = AgentStatsStore(settings.AGENT_STATS_DB_PATH)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"[AgentStatsStore] {settings.AGENT_STATS_DB_PATH} 열기 실패, 메모리 DB 사용: {e}")
+                _store = AgentStatsStore(":memory:")
+        return _store
+
+
+def reset_agent_stats_store(store: Optional[AgentStatsStore] = None) -> None:
+    """전역 저장소 교체 (설정 변경/테스트용, None이면 다음 조회 시 재생성)"""
+    global _store
+    with _store_lock:
+        _store = store
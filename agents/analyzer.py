@@ -16,9 +16,12 @@ from datetime import datetime
 from langchain_core.messages import SystemMessage, HumanMessage
 from utils.llm import get_llm
 from utils.schemas import AnalysisResult
-from utils.time_context import get_time_context, get_time_instruction
+from utils.prompt_layout import build_cacheable_messages
+from utils.prompt_budget import (
+    PromptAssembler, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_MEDIUM, PRIORITY_REQUIRED,
+)
 from graph.state import PlanCraftState, update_state, ensure_dict
-from prompts.analyzer_prompt import ANALYZER_SYSTEM_PROMPT, ANALYZER_USER_PROMPT
+from prompts.analyzer_prompt import ANALYZER_SYSTEM_PROMPT, ANALYZER_USER_INSTRUCTIONS, ANALYZER_USER_PROMPT
 from utils.file_logger import get_file_logger
 
 # LLM은 함수 내에서 동적 초기화 (설정 유연성)
@@ -128,42 +131,55 @@ def run(state: PlanCraftState) -> PlanCraftState:
             f"지시: 분석 단계에서부터 위 지적 사항을 근본적으로 해결할 수 있는 방안을 제시하세요."
         )
     
-    context_parts = []
-    if file_context_msg:
-        # 파일 내용을 컨텍스트 최상단에 배치
-        context_parts.append(file_context_msg)
-        
-    if web_context:
-        context_parts.append(f"[웹에서 가져온 정보]\n{web_context}")
-    if rag_context:
-        context_parts.append(f"[기획서 작성 가이드]\n{rag_context}")
-    context = "\n\n".join(context_parts) if context_parts else "없음"
-    
     # [Logic] 프리셋 로딩 (프롬프트 구성 및 LLM 설정용)
     from utils.settings import get_preset, settings
     active_preset = state.get("generation_preset", settings.active_preset)
     preset_config = get_preset(active_preset)
 
-    # 3. 프롬프트 구성 (시간 컨텍스트 주입 + 동적 설정 적용)
+    # 3. 프롬프트 구성 (동적 설정 적용)
     # min_key_features를 프롬프트에 주입 (f-string 사용 시 JSON 중괄호 충돌 방지를 위해 replace 사용)
-    system_msg_content = get_time_context() + ANALYZER_SYSTEM_PROMPT.replace(
+    system_msg_content = ANALYZER_SYSTEM_PROMPT.replace(
         "{min_key_features}", str(preset_config.min_key_features)
     )
 
+    # [NEW] 구성 요소별 토큰 측정 + Analyzer 예산 맞춤 (RAG/웹 → 이전 기획서 → 첨부 파일 순으로 자름)
+    parts = (PromptAssembler("analyzer")
+        .add("system", system_msg_content, PRIORITY_REQUIRED)
+        .add("instructions", ANALYZER_USER_INSTRUCTIONS, PRIORITY_REQUIRED)
+        .add("user_input", user_input, PRIORITY_REQUIRED)
+        .add("review", f"{review_context}\n{current_analysis_str}", PRIORITY_REQUIRED)
+        .add("file", file_context_msg, PRIORITY_HIGH, min_tokens=1000)
+        .add("previous_plan", previous_plan, PRIORITY_MEDIUM, min_tokens=500)
+        .add("rag", rag_context, PRIORITY_LOW)
+        .add("web", web_context, PRIORITY_LOW)
+        .fit())
+
+    context_parts = []
+    if parts["file"]:
+        # 파일 내용을 컨텍스트 최상단에 배치
+        context_parts.append(parts["file"])
+        
+    if parts["web"]:
+        context_parts.append(f"[웹에서 가져온 정보]\n{parts['web']}")
+    if parts["rag"]:
+        context_parts.append(f"[기획서 작성 가이드]\n{parts['rag']}")
+    context = "\n\n".join(context_parts) if context_parts else "없음"
+
     # 프롬프트 템플릿의 {review_data}, {current_analysis} 인자 전달
     user_msg_content = ANALYZER_USER_PROMPT.format(
         user_input=user_input,
-        previous_plan=previous_plan if previous_plan else "없음",
+        previous_plan=parts["previous_plan"] or "없음",
         context=context,
         review_data=review_context,
         current_analysis=current_analysis_str
-    ) + get_time_instruction()
-
+    )
 
-    messages = [
-        {"role": "system", "content": system_msg_content},
-        {"role": "user", "content": user_msg_content}
-    ]
+    # [NEW] 정적 지침 → 요청별 데이터 → 시간 컨텍스트 순서 (Prompt Prefix Cache 적중)
+    messages = build_cacheable_messages(
+        system_prompt=system_msg_content,
+        static_instructions=ANALYZER_USER_INSTRUCTIONS,
+        dynamic_content=user_msg_content,
+    )
     
     # 4. LLM 호출
     try:
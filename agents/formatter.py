@@ -14,20 +14,190 @@ PlanCraft Agent - Formatter Agent
     - analysis: 분석 결과
     - review: 검토 결과
     - structure: 구조 정보
+    - draft: 작성된 섹션 목록
+    - specialist_analysis: 전문 에이전트 분석 결과
 
 출력:
     - chat_summary: 채팅용 요약 메시지
     - final_output: 기존 기획서 (유지)
 
+[NEW] 규칙 기반 요약 + 선택적 LLM 다듬기 (preset.chat_summary_polish):
+    - 제목/핵심 기능/섹션 목록/검토 강점/전문 분석 수치는 이미 state에 구조화되어 있으므로
+      build_chat_summary()가 LLM 호출 없이 요약을 만들고 바로 반환합니다.
+    - off: 규칙 기반 요약만 사용
+    - background: 기획서를 먼저 반환하고, 공용 실행기에서 다듬은 요약을 thread_id별로 보관
+      (get_polished_summary, GET /api/workflow/status/{thread_id}의 chat_summary,
+       Streamlit 채팅 요약은 다음 화면 갱신 때 교체). 그래프 state/체크포인트의 chat_summary는
+      규칙 기반 요약으로 남습니다.
+      같은 thread_id로 새 실행이 시작되면 이전 실행의 다듬기 결과는 버립니다 (실행 번호 비교).
+    - sync: 기존처럼 반환 전에 LLM으로 다듬음 (실패 시 규칙 기반 요약 유지)
+
 Best Practice 적용:
     - PlanCraftState 타입 어노테이션: 명시적 입출력 타입
     - NOTE: Formatter는 자유형식 요약을 출력하므로 Structured Output 미적용
 """
 
+import contextvars
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
 from utils.llm import get_llm
-from graph.state import PlanCraftState
+from utils.file_logger import get_file_logger
+from graph.state import PlanCraftState, ensure_dict, safe_get
 from prompts.formatter_prompt import FORMATTER_SYSTEM_PROMPT, FORMATTER_USER_PROMPT
 
+# [NEW] 채팅 요약 LLM 다듬기 모드
+POLISH_OFF = "off"
+POLISH_BACKGROUND = "background"
+POLISH_SYNC = "sync"
+
+# 규칙 기반 요약에 표시하는 항목 수
+SUMMARY_MAX_FEATURES = 3
+SUMMARY_MAX_SECTIONS = 8
+SUMMARY_MAX_STRENGTHS = 2
+
+# 비동기로 다듬은 요약 보관 개수 (thread_id 기준, 오래된 것부터 제거)
+POLISHED_MAX_ENTRIES = 256
+
+
+def _strip_code_fence(text: str) -> str:
+    """[FIX] 마크다운 코드 블록 제거 (UI 렌더링 오류 방지)"""
+    if text.startswith("```"):
+        return text.strip().removeprefix("```markdown").removeprefix("```").removesuffix("```").strip()
+    return text
+
+
+def _specialist_highlights(specialist_analysis) -> list:
+    """전문 에이전트 결과 중 요약에 쓸 수치 (시장 규모, 수익 모델, BEP)"""
+    results = ensure_dict(specialist_analysis or {})
+    highlights = []
+
+    tam = safe_get(ensure_dict(results.get("market_analysis") or {}), "tam") or {}
+    if isinstance(tam, dict) and tam.get("value"):
+        value = tam.get("value_krw") or tam.get("value")
+        highlights.append(f"전체 시장 규모 {value}" + (f" (연 {tam['cagr']} 성장)" if tam.get("cagr") else ""))
+
+    primary = safe_get(ensure_dict(results.get("business_model") or {}), "primary_model") or {}
+    if isinstance(primary, dict) and primary.get("name"):
+        highlights.append(f"수익 모델: {primary['name']}")
+
+    bep = safe_get(ensure_dict(results.get("financial_plan") or {}), "bep") or {}
+    if isinstance(bep, dict) and bep.get("bep_month"):
+        highlights.append(f"출시 후 {bep['bep_month']}개월 손익분기 목표")
+
+    return highlights
+
+
+def build_chat_summary(state: PlanCraftState) -> str:
+    """
+    [NEW] state의 구조화 데이터로 채팅 요약 생성 (LLM 호출 없음, 결정적)
+
+    FORMATTER_SYSTEM_PROMPT의 출력 형식을 따르며, 점수/판정은 노출하지 않습니다.
+
+    Args:
+        state: structure/analysis/draft/review/specialist_analysis를 포함한 상태
+
+    Returns:
+        str: 마크다운 채팅 요약
+    """
+    analysis = state.get("analysis")
+    structure = state.get("structure")
+    draft = ensure_dict(state.get("draft") or {})
+
+    title = safe_get(structure, "title") or safe_get(analysis, "topic") or "기획서"
+    concept = safe_get(analysis, "purpose") or safe_get(analysis, "topic") or title
+    key_features = list(safe_get(analysis, "key_features", []) or draft.get("key_features") or [])
+    target_users = safe_get(analysis, "target_users", "")
+    sections = [ensure_dict(sec).get("name", "") for sec in draft.get("sections", [])]
+    sections = [name for name in sections if name]
+
+    lines = [f"## ✨ {title} 기획서 완성!", "", "### 핵심 콘셉트", f"> {concept}", ""]
+
+    if key_features:
+        lines.append(f"### 주요 기능 (Top {min(len(key_features), SUMMARY_MAX_FEATURES)})")
+        lines.extend(f"{i}. **{feature}**" for i, feature in enumerate(key_features[:SUMMARY_MAX_FEATURES], 1))
+        lines.append("")
+
+    if target_users:
+        lines.extend(["### 타겟 사용자", str(target_users), ""])
+
+    if sections:
+        shown = " · ".join(sections[:SUMMARY_MAX_SECTIONS])
+        more = f" 외 {len(sections) - SUMMARY_MAX_SECTIONS}개" if len(sections) > SUMMARY_MAX_SECTIONS else ""
+        lines.extend(["### 기획서 구성", f"{len(sections)}개 섹션: {shown}{more}", ""])
+
+    strengths = list(safe_get(state.get("review"), "strengths", []) or [])[:SUMMARY_MAX_STRENGTHS]
+    highlights = strengths + _specialist_highlights(state.get("specialist_analysis"))
+    if highlights:
+        lines.append("### 하이라이트")
+        lines.extend(f"- {item}" for item in highlights)
+        lines.append("")
+
+    lines.extend(["---", "📄 **상세 기획서**는 아래에서 확인하세요!"])
+    return "\n".join(lines)
+
+
+class PolishedSummaryStore:
+    """
+    백그라운드에서 다듬은 채팅 요약 보관소 (프로세스 전역, 스레드 안전)
+
+    thread_id → (실행 번호, 요약). begin()이 새 실행 번호를 발급하면 이전 실행의 요약은
+    무효화되고, 이후 도착한 이전 실행(또는 discard 이후)의 put()은 무시됩니다.
+    """
+
+    def __init__(self, max_entries: int = POLISHED_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[int, Optional[str]]]" = OrderedDict()
+        self._run_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def begin(self, thread_id: str) -> int:
+        """새 다듬기 실행 등록 (이전 실행의 요약 무효화) 후 실행 번호 반환"""
+        with self._lock:
+            run_id = next(self._run_ids)
+            self._entries[thread_id] = (run_id, None)
+            self._evict(thread_id)
+            return run_id
+
+    def put(self, thread_id: str, run_id: int, summary: str) -> bool:
+        """현재 실행의 결과만 저장 (오래된 실행이면 무시하고 False)"""
+        with self._lock:
+            current = self._entries.get(thread_id)
+            if current is None or current[0] != run_id:
+                return False
+            self._entries[thread_id] = (run_id, summary)
+            self._evict(thread_id)
+            return True
+
+    def get(self, thread_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(thread_id)
+            return entry[1] if entry else None
+
+    def discard(self, thread_id: str) -> None:
+        with self._lock:
+            self._entries.pop(thread_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, thread_id: str) -> None:
+        self._entries.move_to_end(thread_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+# 전역 보관소 (API 상태 조회에서 사용)
+polished_summaries = PolishedSummaryStore()
+
+
+def get_polished_summary(thread_id: str) -> Optional[str]:
+    """백그라운드 다듬기가 끝난 채팅 요약 (없거나 진행 중이면 None)"""
+    return polished_summaries.get(thread_id) if thread_id else None
+
 
 class FormatterAgent:
     """
@@ -38,7 +208,8 @@ class FormatterAgent:
     NOTE: Formatter는 자유형식 요약을 출력하므로 with_structured_output() 미적용
 
     Attributes:
-        llm: AzureChatOpenAI 인스턴스
+        model_type: LLM 다듬기에 사용할 모델
+        polish: 다듬기 모드 (None이면 프리셋의 chat_summary_polish)
 
     Example:
         >>> agent = FormatterAgent()
@@ -47,14 +218,24 @@ class FormatterAgent:
         >>> print(result["chat_summary"])
     """
 
-    def __init__(self, model_type: str = "gpt-4o-mini"):
+    def __init__(self, model_type: str = "gpt-4o-mini", polish: Optional[str] = None):
         """
         Formatter Agent를 초기화합니다.
 
         Args:
             model_type: 사용할 LLM 모델 (요약은 빠른 모델로 충분)
+            polish: 다듬기 모드 (off/background/sync, None이면 프리셋 설정)
         """
-        self.llm = get_llm(model_type=model_type, temperature=0.5)
+        self.model_type = model_type
+        self.polish = polish
+        self._llm = None
+
+    @property
+    def llm(self):
+        """[NEW] LLM은 다듬기가 필요할 때만 생성"""
+        if self._llm is None:
+            self._llm = get_llm(model_type=self.model_type, temperature=0.5)
+        return self._llm
 
     def run(self, state: PlanCraftState) -> PlanCraftState:
         """
@@ -70,65 +251,49 @@ class FormatterAgent:
         Returns:
             PlanCraftState: chat_summary가 추가된 상태
         """
-        from graph.state import update_state, safe_get
+        from graph.state import update_state
+        from utils.settings import get_preset, settings
+
+        logger = get_file_logger()
 
         # =====================================================================
-        # 1. 입력 데이터 추출 (dict-access 방식 - TypedDict 호환)
+        # 1. 규칙 기반 요약 (LLM 호출 없음)
         # =====================================================================
-        analysis = state.get("analysis")
-        review = state.get("review")
-        structure = state.get("structure")
-
-        # 제목 추출
-        title = "기획서"
-        if structure and safe_get(structure, "title"):
-            title = safe_get(structure, "title")
-        elif analysis and safe_get(analysis, "topic"):
-            title = safe_get(analysis, "topic")
-
-        # 분석 정보
-        topic = safe_get(analysis, "topic", "")
-        purpose = safe_get(analysis, "purpose", "")
-        target_users = safe_get(analysis, "target_users", "")
-        key_features = safe_get(analysis, "key_features", [])
-
-        # 검토 정보 (내부용 - 점수는 사용자에게 노출하지 않음)
-        strengths = safe_get(review, "strengths", [])
+        chat_summary = build_chat_summary(state)
 
         # =====================================================================
-        # 2. 프롬프트 구성 및 LLM 호출
+        # 2. 선택적 LLM 다듬기
         # =====================================================================
-        messages = [
-            {"role": "system", "content": FORMATTER_SYSTEM_PROMPT},
-            {"role": "user", "content": FORMATTER_USER_PROMPT.format(
-                title=title,
-                topic=topic,
-                purpose=purpose,
-                target_users=target_users,
-                key_features=", ".join(key_features) if key_features else "정보 없음",
-                strengths=", ".join(strengths[:2]) if strengths else "우수한 구조와 명확한 목표"
-            )}
-        ]
-
+        polish = self.polish or get_preset(
+            state.get("generation_preset", settings.active_preset)
+        ).chat_summary_polish
+        thread_id = state.get("thread_id")
+        if thread_id:
+            polished_summaries.discard(thread_id)  # 이전 실행의 다듬은 요약(및 진행 중 다듬기) 무효화
+
+        messages = self._build_messages(state, chat_summary)
         error_msg = None
-        try:
-            response = self.llm.invoke(messages)
-            chat_summary = response.content
-            
-            # [FIX] 마크다운 코드 블록 제거 (UI 렌더링 오류 방지)
-            if chat_summary.startswith("```"):
-                chat_summary = chat_summary.strip().removeprefix("```markdown").removeprefix("```").removesuffix("```").strip()
-        except Exception as e:
-            # 실패 시 기본 요약 생성
-            chat_summary = self._generate_fallback_summary(
-                title, topic, purpose, key_features
+        if polish == POLISH_SYNC:
+            try:
+                chat_summary = self._polish(messages)
+            except Exception as e:
+                # 실패 시 규칙 기반 요약 유지
+                error_msg = f"포맷팅 오류: {str(e)}"
+        elif polish == POLISH_BACKGROUND and thread_id:
+            from agents.specialist_executor import POOL_BACKGROUND, get_executor, new_session
+
+            # 후처리 전용 풀 (전문 에이전트/분할 작성 워커를 점유하지 않음)
+            run_id = polished_summaries.begin(thread_id)
+            get_executor(POOL_BACKGROUND).submit(
+                new_session(f"{thread_id}:formatter"), contextvars.copy_context().run,
+                self._polish_in_background, messages, thread_id, run_id, logger,
             )
-            error_msg = f"포맷팅 오류: {str(e)}"
+            logger.info(f"[Formatter] 채팅 요약 다듬기 백그라운드 실행 ({thread_id})")
 
         final_output = state.get("final_output") or ""
 
         # =====================================================================
-        # 4. 상태 업데이트 (TypedDict dict-access 방식)
+        # 3. 상태 업데이트 (TypedDict dict-access 방식)
         # =====================================================================
         # refine_count를 0으로 리셋하여 사용자 수정 기회 3회 보장
         # (내부 Reviewer 루프와 사용자 수정은 별개)
@@ -142,42 +307,38 @@ class FormatterAgent:
             updates["error"] = error_msg
 
         return update_state(state, **updates)
-    
-
 
-    def _generate_fallback_summary(
-        self,
-        title: str,
-        topic: str,
-        purpose: str,
-        key_features: list
-    ) -> str:
-        """
-        LLM 실패 시 기본 요약을 생성합니다.
-
-        Args:
-            title: 기획서 제목
-            topic: 주제
-            purpose: 목적
-            key_features: 핵심 기능 목록
-
-        Returns:
-            str: 기본 요약 메시지
-        """
-        features_text = ""
-        for i, feature in enumerate(key_features[:3], 1):
-            features_text += f"{i}. **{feature}**\n"
+    def _build_messages(self, state: PlanCraftState, draft_summary: str) -> list:
+        """다듬기 프롬프트 (분석 정보 + 규칙 기반 요약)"""
+        analysis = state.get("analysis")
+        key_features = safe_get(analysis, "key_features", []) or []
+        # 검토 정보 (내부용 - 점수는 사용자에게 노출하지 않음)
+        strengths = safe_get(state.get("review"), "strengths", []) or []
 
-        return f"""## {title} 기획서 완성!
+        return [
+            {"role": "system", "content": FORMATTER_SYSTEM_PROMPT},
+            {"role": "user", "content": FORMATTER_USER_PROMPT.format(
+                title=safe_get(state.get("structure"), "title") or safe_get(analysis, "topic") or "기획서",
+                topic=safe_get(analysis, "topic", ""),
+                purpose=safe_get(analysis, "purpose", ""),
+                target_users=safe_get(analysis, "target_users", ""),
+                key_features=", ".join(key_features) if key_features else "정보 없음",
+                strengths=", ".join(strengths[:2]) if strengths else "우수한 구조와 명확한 목표",
+                draft_summary=draft_summary,
+            )}
+        ]
 
-### 핵심 콘셉트
-> {purpose}
+    def _polish(self, messages: list) -> str:
+        """LLM으로 요약 다듬기 (실패 시 예외 전파)"""
+        return _strip_code_fence(self.llm.invoke(messages).content)
 
-### 주요 기능
-{features_text}
----
-상세 기획서는 아래에서 확인하세요!
-"""
+    def _polish_in_background(self, messages: list, thread_id: str, run_id: int, logger) -> None:
+        """공용 실행기 작업: 다듬은 요약을 보관소에 저장 (실패 시 규칙 기반 요약 유지)"""
+        try:
+            if not polished_summaries.put(thread_id, run_id, self._polish(messages)):
+                logger.info(f"[Formatter] 이전 실행의 다듬은 요약 무시 ({thread_id}, run {run_id})")
+        except Exception as e:
+            logger.warning(f"[Formatter] 채팅 요약 다듬기 실패, 규칙 기반 요약 유지 ({thread_id}): {e}")
 
 
 def run(state: PlanCraftState) -> PlanCraftState:
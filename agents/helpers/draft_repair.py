@@ -0,0 +1,194 @@
+"""
+Draft Repair Helper
+
+[NEW] Writer 자체 검증 실패 시 초안 전체를 다시 요청하지 않고,
+실패한 섹션/누락 요소만 다시 작성하여 기존 초안에 병합합니다.
+
+- 부실 섹션: 해당 섹션만 보강
+- 다이어그램/차트/Specialist 데이터 누락: 가장 관련 있는 섹션 1개에 추가 (없으면 새 섹션)
+- 섹션 개수 부족: 기존 목차와 겹치지 않는 섹션만 추가 작성
+
+나머지 섹션은 목차(이름/분량)만 전달하므로 재시도 1회의 출력 토큰이 수리 대상 분량으로 줄어듭니다.
+"""
+from typing import Dict, List
+
+from graph.state import ensure_dict
+from agents.helpers.incremental_refine import match_section_name
+from agents.helpers.prompt_builder import build_visual_feedback
+from agents.helpers.validator import MIN_CONTENT_LENGTH, DraftDiagnosis
+
+# 누락 요소를 추가할 섹션 선택 키워드 (앞쪽 키워드 우선)
+DIAGRAM_SECTION_KEYWORDS = ["아키텍처", "플로우", "프로세스", "흐름", "구조", "기능"]
+CHART_SECTION_KEYWORDS = ["수익", "매출", "재무", "성장", "시장"]
+SPECIALIST_SECTION_KEYWORDS = {
+    "TAM/SAM/SOM": ["시장"],
+    "경쟁사 분석": ["경쟁", "시장"],
+    "BEP/손익분기": ["재무", "손익", "수익"],
+    "리스크": ["리스크", "위험"],
+}
+REFERENCE_SECTION_KEYWORDS = ["참고 자료", "참고자료", "References"]
+
+
+def find_section(sections: List[dict], keywords: List[str]) -> str:
+    """키워드 순서대로 이름이 일치하는 첫 섹션명 (없으면 빈 문자열)"""
+    for keyword in keywords:
+        for sec in sections:
+            if keyword in sec.get("name", ""):
+                return sec["name"]
+    return ""
+
+
+def select_repair_targets(draft_dict: dict, diagnosis: DraftDiagnosis) -> Dict[str, List[str]]:
+    """
+    수리 대상 섹션과 섹션별 수리 사유
+
+    Returns:
+        Dict[str, List[str]]: 섹션명 → 수리 사유 목록 (기존 섹션에 없는 이름은 새 섹션으로 추가)
+    """
+    sections = [ensure_dict(sec) for sec in draft_dict.get("sections", [])]
+    longest = max(sections, key=lambda s: len(s.get("content", "")), default={}).get("name", "")
+    targets: Dict[str, List[str]] = {}
+
+    def add(name: str, reason: str):
+        targets.setdefault(name, []).append(reason)
+
+    for name in diagnosis.short_sections:
+        add(name, f"내용 보강 (최소 {MIN_CONTENT_LENGTH * 5}자 이상, 구체적 수치/사례 포함)")
+
+    if diagnosis.missing_diagram:
+        add(find_section(sections, DIAGRAM_SECTION_KEYWORDS) or longest or "서비스 구조",
+            "Mermaid 다이어그램 추가")
+
+    if diagnosis.missing_chart:
+        add(find_section(sections, CHART_SECTION_KEYWORDS) or longest or "수익 모델",
+            "ASCII 차트 추가")
+
+    for label in diagnosis.missing_specialist:
+        add(find_section(sections, SPECIALIST_SECTION_KEYWORDS.get(label, [])) or label,
+            f"전문 에이전트 분석의 {label} 내용 반영")
+
+    return targets
+
+
+def build_repair_prompt(draft_dict: dict, diagnosis: DraftDiagnosis,
+                        targets: Dict[str, List[str]], preset) -> str:
+    """수리 요청 프롬프트 (전체 목차 + 수리 대상 섹션 본문 + 추가 섹션 수)"""
+    sections = [ensure_dict(sec) for sec in draft_dict.get("sections", [])]
+    by_name = {sec.get("name", ""): sec for sec in sections}
+
+    outline = "\n".join(
+        f"{i}. {sec.get('name', '')} ({len(sec.get('content', ''))}자)"
+        for i, sec in enumerate(sections, 1)
+    )
+
+    target_blocks = []
+    for name, reasons in targets.items():
+        current = by_name.get(name)
+        header = f"### {name} [{'수정' if current else '새 섹션'}] - {', '.join(reasons)}"
+        body = current.get("content", "") if current else "(아직 없음)"
+        target_blocks.append(f"{header}\n{body}")
+
+    extra = ""
+    if diagnosis.missing_section_count > 0:
+        extra = (
+            f"\n**추가 섹션**: 현재 목차에 없는 섹션을 {diagnosis.missing_section_count}개 이상 새로 작성하세요. "
+            "기존 섹션과 주제가 겹치지 않아야 합니다.\n"
+        )
+
+    visual_feedback = build_visual_feedback(diagnosis.issues, preset)
+
+    return f"""
+=====================================================================
+🔧 **[초안 부분 수리]** 검증 실패: {', '.join(diagnosis.issues)}
+이미 작성된 초안은 유지하고, 아래 섹션만 다시 작성하거나 추가하세요.
+수정 섹션은 이름을 그대로 유지하고 기존 내용을 살려 보완한 **전체 본문**을 반환하세요.
+목록에 없는 기존 섹션은 반환하지 마세요.
+
+**현재 목차**:
+{outline}
+
+**수리 대상**:
+{chr(10).join(target_blocks) if target_blocks else '(없음)'}
+{extra}{visual_feedback}
+=====================================================================
+"""
+
+
+def splice_repair(draft_dict: dict, patch_dict: dict, targets: Dict[str, List[str]],
+                  max_new_sections: int = 0) -> dict:
+    """
+    수리 결과를 기존 초안에 병합
+
+    - 결과 섹션명은 번호 제거/부분 일치로 기존 섹션 또는 수리 대상에 매핑 ("2. 시장 분석" → "시장 분석")
+    - 수리 대상 섹션은 매핑된 결과로 교체, 수리 대상이 아닌 기존 섹션을 덮어쓴 결과는 무시
+    - 새 섹션 추가: 수리 대상으로 요청한 새 이름 + 요청하지 않은 이름은 max_new_sections개까지
+      ('참고 자료' 섹션이 마지막이면 그 앞에 삽입)
+    """
+    sections = [dict(ensure_dict(sec)) for sec in draft_dict.get("sections", [])]
+    index = {sec.get("name", ""): i for i, sec in enumerate(sections)}
+    existing = list(index)
+    new_targets = [name for name in targets if name not in index]
+
+    added: Dict[str, dict] = {}
+    replaced = set()
+    extra_count = 0
+    for patch in patch_dict.get("sections", []):
+        patch = ensure_dict(patch)
+        name, content = patch.get("name", ""), patch.get("content", "")
+        matched = match_section_name(name, existing, by_number=False)
+        if matched:
+            if matched in targets and matched not in replaced:
+                replaced.add(matched)
+                sections[index[matched]] = {**sections[index[matched]], "content": content}
+            continue
+        if not name or not content:
+            continue
+        requested = match_section_name(name, new_targets, by_number=False)
+        if requested:
+            added.setdefault(requested, {"name": requested, "content": content})
+        elif extra_count < max_new_sections and name not in added:
+            extra_count += 1
+            added[name] = {"name": name, "content": content}
+
+    insert_at = len(sections)
+    if sections and any(kw in sections[-1].get("name", "") for kw in REFERENCE_SECTION_KEYWORDS):
+        insert_at -= 1
+    sections[insert_at:insert_at] = list(added.values())
+
+    for i, sec in enumerate(sections, 1):
+        sec["id"] = i
+
+    return {**draft_dict, "sections": sections}
+
+
+def repair_draft(llm, base_messages: list, draft_dict: dict, diagnosis: DraftDiagnosis,
+                 preset, logger) -> dict:
+    """
+    실패한 섹션/누락 요소만 다시 작성하여 병합한 초안 반환
+
+    Args:
+        llm: Writer LLM (DraftResult 구조화 출력, 수리 대상 섹션만 반환)
+        base_messages: 초안 작성에 사용한 기본 메시지 (변경하지 않음, Prompt Cache 접두부 공유)
+        draft_dict: 검증에 실패한 초안
+        diagnosis: diagnose_draft 결과
+        preset: 프리셋 설정
+        logger: 로거
+
+    Returns:
+        dict: 수리 결과가 병합된 초안
+    """
+    targets = select_repair_targets(draft_dict, diagnosis)
+    repair_prompt = build_repair_prompt(draft_dict, diagnosis, targets, preset)
+    logger.info(
+        f"[Writer Repair] 수리 대상 {len(targets)}개 섹션 "
+        f"(+ 추가 {diagnosis.missing_section_count}개): {list(targets)}"
+    )
+
+    patch_dict = ensure_dict(llm.invoke([*base_messages, {"role": "user", "content": repair_prompt}]))
+    repaired = splice_repair(draft_dict, patch_dict, targets, max_new_sections=diagnosis.missing_section_count)
+
+    logger.info(
+        f"[Writer Repair] 병합 완료: 반환 {len(patch_dict.get('sections', []))}개, "
+        f"섹션 {len(draft_dict.get('sections', []))} → {len(repaired['sections'])}개"
+    )
+    return repaired
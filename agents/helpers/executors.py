@@ -80,15 +80,15 @@ def execute_specialist_agents(state: PlanCraftState, user_input: str,
         if existing_analysis:
             logger.info("[Writer] ✅ 워크플로우에서 미리 수행된 전문 분석 결과를 재사용합니다.")
             try:
-                from agents.supervisor import NativeSupervisor
-                supervisor = NativeSupervisor()
-                specialist_context = supervisor._integrate_results(existing_analysis)
+                from agents.supervisor import get_supervisor
+                supervisor = get_supervisor()
+                specialist_context = supervisor.integrate_results(existing_analysis)
                 return specialist_context, state
             except ImportError:
                 # NativeSupervisor가 없으면 PlanSupervisor 시도 (호환성)
                 from agents.supervisor import PlanSupervisor
                 supervisor = PlanSupervisor()
-                specialist_context = supervisor._integrate_results(existing_analysis)
+                specialist_context = supervisor.integrate_results(existing_analysis)
                 return specialist_context, state
             except Exception as e:
                 logger.warning(f"[Writer] 분석 결과 통합 실패: {e}")
@@ -96,7 +96,7 @@ def execute_specialist_agents(state: PlanCraftState, user_input: str,
 
         # 2. 결과가 없을 때만 직접 실행 (Fallback - 워크플로우 노드 스킵된 경우)
         try:
-            from agents.supervisor import PlanSupervisor
+            from agents.supervisor import get_supervisor
 
             logger.info("[Writer] 🤖 전문 에이전트 분석 시작 (Supervisor)...")
 
@@ -111,22 +111,21 @@ def execute_specialist_agents(state: PlanCraftState, user_input: str,
             tech_stack = analysis_dict.get("tech_stack", "React Native + Node.js + PostgreSQL")
             user_constraints = analysis_dict.get("user_constraints", [])
 
-            web_search_list = []
-            if web_context:
-                for line in web_context.split("\n"):
-                    if line.strip():
-                        web_search_list.append({"title": "", "content": line[:500]})
+            # [NEW] 근거 번들 공유 (web_context 줄 단위 분할 대신)
+            from utils.evidence_bundle import get_evidence_bundle
+            market_evidence = get_evidence_bundle(state).render("market", kinds=("web",))
 
-            supervisor = PlanSupervisor()
+            supervisor = get_supervisor()
             specialist_results = supervisor.run(
                 service_overview=user_input,
                 target_market=target_market,
                 target_users=target_users,
                 tech_stack=tech_stack,
                 development_scope="MVP 3개월",
-                web_search_results=web_search_list,
+                web_search_results=market_evidence,
                 user_constraints=user_constraints,
-                deep_analysis_mode=state.get("deep_analysis_mode", False) # [NEW]
+                deep_analysis_mode=state.get("deep_analysis_mode", False), # [NEW]
+                session_id=state.get("thread_id")
             )
 
             specialist_context = specialist_results.get("integrated_context", "")
@@ -146,7 +145,7 @@ def execute_specialist_agents(state: PlanCraftState, user_input: str,
         if previous_specialist:
             from agents.supervisor import PlanSupervisor
             supervisor = PlanSupervisor()
-            specialist_context = supervisor._integrate_results(previous_specialist)
+            specialist_context = supervisor.integrate_results(previous_specialist)
             logger.info("[Writer] 이전 전문 에이전트 분석 결과 재사용")
 
     return specialist_context, state
@@ -0,0 +1,110 @@
+"""
+Incremental Refine Helper
+
+[NEW] Refine 라운드에서 구조/전체 섹션을 다시 만들지 않고,
+Reviewer가 지목한 섹션(JudgeResult.target_sections)만 다시 작성하기 위한 공용 함수
+
+- Refiner: target_sections → 실제 초안 섹션명 매핑 (refine_targets)
+- Writer: refine_targets만 병렬 재작성, 나머지 섹션은 그대로 유지 (changed_sections 기록)
+- Reviewer: 변경된 섹션 본문 + 나머지 섹션 개요로 재심사
+"""
+import re
+from typing import List
+
+from graph.state import ensure_dict
+
+# 구조(목차) 자체를 다시 설계해야 하는 지적 키워드 → 전체 재작성 경로
+STRUCTURE_ISSUE_KEYWORDS = ["목차", "섹션 구성", "전체 구조", "구조 재설계", "structure"]
+
+# 지목된 섹션이 전체의 이 비율을 넘으면 전체 재작성이 더 효율적
+MAX_INCREMENTAL_RATIO = 0.6
+
+# 개요에 포함할 섹션별 본문 앞부분 길이
+OUTLINE_PREVIEW_CHARS = 150
+
+
+# 섹션명 앞 번호 ("2. 시장 분석", "섹션 3) 수익 모델", "1.2 개요")
+SECTION_NUMBER_PREFIX = re.compile(r"^\s*(?:섹션\s*)?\d+(?:\.\d+)*(?:[.)]\s*|\s+)")
+
+
+def _section_names(draft_dict: dict) -> List[str]:
+    return [ensure_dict(sec).get("name", "") for sec in draft_dict.get("sections", [])]
+
+
+def match_section_name(target: str, names: List[str], by_number: bool = True) -> str:
+    """
+    섹션 지목(이름 또는 번호)을 names 중 실제 섹션명으로 매핑 (없으면 빈 문자열)
+
+    - 이름 일치 → 부분 일치(양방향, 앞 번호 제거 후 재시도) → 번호 순서로 판단
+    - by_number=False면 번호만으로는 매핑하지 않음 (새 섹션 이름의 숫자 오인 방지)
+    """
+    target = str(target).strip()
+    if not target:
+        return ""
+    if target in names:
+        return target
+    stripped = SECTION_NUMBER_PREFIX.sub("", target).strip()
+    for candidate in dict.fromkeys(filter(None, (target, stripped))):
+        partial = [name for name in names if name and (candidate in name or name in candidate)]
+        if partial:
+            return partial[0]
+    number = re.match(r"^\D*?(\d+)", target) if by_number else None
+    if number and 1 <= int(number.group(1)) <= len(names):
+        return names[int(number.group(1)) - 1]
+    return ""
+
+
+def resolve_target_sections(target_sections: List[str], draft_dict: dict) -> List[str]:
+    """
+    Reviewer가 지목한 섹션(이름 또는 ID)을 초안의 실제 섹션명으로 매핑
+
+    - 이름 일치 → 부분 일치(양방향) → 번호("3", "섹션 3", "3. 시장 분석") 순서로 판단
+    - 매핑되지 않는 항목은 제외, 결과는 초안 목차 순서
+    """
+    names = _section_names(draft_dict)
+    resolved = {match_section_name(target, names) for target in target_sections or []}
+    return [name for name in names if name in resolved]
+
+
+def structure_flagged(review_dict: dict) -> bool:
+    """Reviewer가 목차/구조 자체를 지적했는지 여부"""
+    texts = (
+        list(review_dict.get("target_sections", []))
+        + list(review_dict.get("critical_issues", []))
+        + list(review_dict.get("action_items", []))
+    )
+    return any(kw in str(text) for text in texts for kw in STRUCTURE_ISSUE_KEYWORDS)
+
+
+def decide_refine_targets(review_dict: dict, draft) -> List[str]:
+    """
+    부분 재작성 대상 섹션 결정 (빈 리스트면 기존처럼 structure부터 전체 재작성)
+
+    Args:
+        review_dict: JudgeResult 딕셔너리
+        draft: 현재 초안
+
+    Returns:
+        List[str]: 다시 작성할 섹션명 (초안 목차 순서)
+    """
+    if not draft or structure_flagged(review_dict):
+        return []
+
+    draft_dict = ensure_dict(draft)
+    targets = resolve_target_sections(review_dict.get("target_sections", []), draft_dict)
+    total = len(draft_dict.get("sections", []))
+    if not targets or len(targets) > total * MAX_INCREMENTAL_RATIO:
+        return []
+    return targets
+
+
+def build_section_outline(draft_dict: dict, exclude: List[str] = ()) -> str:
+    """섹션 개요 (이름 + 본문 앞부분) - 변경되지 않은 섹션의 흐름 확인용"""
+    lines = []
+    for i, sec in enumerate(draft_dict.get("sections", []), 1):
+        sec = ensure_dict(sec)
+        if sec.get("name", "") in exclude:
+            continue
+        preview = " ".join(sec.get("content", "").split())[:OUTLINE_PREVIEW_CHARS]
+        lines.append(f"{i}. {sec.get('name', '')}: {preview}")
+    return "\n".join(lines)
@@ -3,8 +3,12 @@ Prompt Builder Helper
 """
 from utils.file_logger import get_file_logger
 from graph.state import ensure_dict, PlanCraftState
-from prompts.writer_prompt import WRITER_SYSTEM_PROMPT, WRITER_USER_PROMPT
-from prompts.business_plan_prompt import BUSINESS_PLAN_SYSTEM_PROMPT, BUSINESS_PLAN_USER_PROMPT
+from prompts.writer_prompt import WRITER_SYSTEM_PROMPT, WRITER_USER_INSTRUCTIONS, WRITER_USER_PROMPT
+from prompts.business_plan_prompt import (
+    BUSINESS_PLAN_SYSTEM_PROMPT,
+    BUSINESS_PLAN_USER_INSTRUCTIONS,
+    BUSINESS_PLAN_USER_PROMPT,
+)
 
 def get_prompts_by_doc_type(state: PlanCraftState) -> tuple:
     """
@@ -29,6 +33,25 @@ def get_prompts_by_doc_type(state: PlanCraftState) -> tuple:
         return WRITER_SYSTEM_PROMPT, WRITER_USER_PROMPT
 
 
+def get_user_instructions_by_doc_type(state: PlanCraftState) -> str:
+    """
+    [NEW] doc_type에 따른 정적 작성 지침 템플릿 반환
+
+    user 메시지 앞부분(캐시 가능한 접두부)에 배치됩니다.
+    {visual_instruction} 외의 요청별 값은 포함하지 않습니다.
+
+    Args:
+        state: 현재 워크플로우 상태
+
+    Returns:
+        str: 작성 지침 템플릿
+    """
+    doc_type = ensure_dict(state.get("analysis")).get("doc_type", "web_app_plan")
+    if doc_type == "business_plan":
+        return BUSINESS_PLAN_USER_INSTRUCTIONS
+    return WRITER_USER_INSTRUCTIONS
+
+
 def build_review_context(state: PlanCraftState, refine_count: int) -> str:
     """
     Reviewer 피드백을 컨텍스트 문자열로 변환
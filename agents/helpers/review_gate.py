@@ -0,0 +1,169 @@
+"""
+Review Gate Helper
+
+[NEW] LLM 심사 전 규칙 기반 사전 심사 (Pre-Review Gate)
+
+섹션 개수 부족, Mermaid 다이어그램 누락, 빈 섹션, 핵심 기능 미반영처럼
+로컬에서 확인 가능한 결함만으로도 결론이 REVISE인 초안이 많습니다.
+이런 초안은 gpt-4o 심사 없이 구체적인 action_items와 함께 REVISE를 바로 반환합니다.
+
+- revise: 기계적 결함 → LLM 호출 없이 JudgeResult(REVISE) 생성, 토론 없이 Refine
+- mini: 결함이 없고 모든 섹션이 충분히 긴 초안 → 프리셋의 경량 모델로 심사
+- full: 그 외 → 기존 LLM 심사
+
+프리셋별 적중률은 review_gate_stats (/metrics/reviewer)로 확인합니다.
+"""
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from graph.state import ensure_dict
+from utils.schemas import JudgeResult
+from utils.settings import QualityThresholds
+from agents.helpers.validator import diagnose_draft
+from agents.helpers.draft_repair import select_repair_targets, find_section
+
+GATE_REVISE = "revise"
+GATE_MINI = "mini"
+GATE_FULL = "full"
+
+# 이 길이 미만(공백 제외)이면 빈 섹션
+EMPTY_SECTION_CHARS = 20
+
+# 경량 모델 심사 대상: 모든 섹션이 이 길이 이상
+CLEAN_MIN_SECTION_CHARS = 300
+
+# 핵심 기능은 2자 이상 단어의 절반 이상이 본문에 있으면 반영된 것으로 판단
+# (3자 이상 한글 단어는 끝 글자(조사/접미사)를 떼고 비교: "기능들" → "기능")
+FEATURE_TERM_RATIO = 0.5
+FEATURE_SECTION_KEYWORDS = ["핵심 기능", "주요 기능", "기능", "서비스"]
+
+# 규칙 기반 REVISE 점수 (5-8점 범위, 토론 없이 Refine으로 라우팅)
+GATE_REVISE_SCORE = QualityThresholds.FALLBACK_SCORE
+
+
+@dataclass
+class GateResult:
+    """사전 심사 결과 (review는 outcome이 revise일 때만 존재)"""
+    outcome: str
+    issues: List[str] = field(default_factory=list)
+    review: Optional[dict] = None
+
+
+def _feature_term(term: str) -> str:
+    return term[:-1] if len(term) >= 3 and "가" <= term[-1] <= "힣" else term
+
+
+def missing_key_features(key_features: List[str], full_text: str) -> List[str]:
+    """분석 단계의 핵심 기능 중 초안 본문에 반영되지 않은 기능"""
+    missing = []
+    for feature in key_features or []:
+        terms = [_feature_term(t) for t in re.findall(r"[\w]+", str(feature)) if len(t) >= 2]
+        if not terms:
+            continue
+        found = sum(1 for t in terms if t in full_text)
+        if found < len(terms) * FEATURE_TERM_RATIO:
+            missing.append(str(feature))
+    return missing
+
+
+def _is_clean(sections: List[dict]) -> bool:
+    return bool(sections) and all(
+        len(sec.get("content", "").strip()) >= CLEAN_MIN_SECTION_CHARS for sec in sections
+    )
+
+
+def pre_review_gate(draft_dict: dict, preset, key_features: List[str] = ()) -> GateResult:
+    """
+    규칙 기반 사전 심사
+
+    Args:
+        draft_dict: 심사할 초안
+        preset: 프리셋 설정 (min_sections, include_diagrams/charts, review_clean_model)
+        key_features: 분석 단계의 핵심 기능 목록 (state["analysis"]["key_features"])
+
+    Returns:
+        GateResult: revise(JudgeResult 포함) / mini / full
+    """
+    sections = [ensure_dict(sec) for sec in draft_dict.get("sections", [])]
+    full_text = "\n".join(sec.get("content", "") for sec in sections)
+
+    # 섹션 개수/부실 섹션/다이어그램/차트는 Writer 자체 검증과 같은 기준 (Specialist 키워드 검사는 제외)
+    diagnosis = diagnose_draft(draft_dict, preset, specialist_context="", refine_count=0)
+    targets = select_repair_targets(draft_dict, diagnosis)
+    issues = list(diagnosis.issues)
+    action_items = []
+
+    empty = [sec.get("name", "") for sec in sections if len(sec.get("content", "").strip()) < EMPTY_SECTION_CHARS]
+    if empty:
+        issues.append(f"빈 섹션 ({', '.join(empty)})")
+        for name in empty:
+            targets.setdefault(name, []).append("본문 작성")
+
+    missing_features = missing_key_features(key_features, full_text)
+    if missing_features:
+        issues.append(f"핵심 기능 미반영 ({', '.join(missing_features)})")
+        name = find_section(sections, FEATURE_SECTION_KEYWORDS) or (sections[0].get("name", "") if sections else "")
+        if name:
+            targets.setdefault(name, []).append(f"핵심 기능 설명 추가: {', '.join(missing_features)}")
+
+    if not issues:
+        outcome = GATE_MINI if getattr(preset, "review_clean_model", None) and _is_clean(sections) else GATE_FULL
+        return GateResult(outcome=outcome)
+
+    # 섹션 추가는 부분 재작성으로 해결할 수 없으므로 "섹션 구성" 지적 → 전체 재작성 경로
+    if diagnosis.missing_section_count > 0:
+        action_items.append(
+            f"섹션 구성 보완: 최소 {preset.min_sections}개 섹션 필요 "
+            f"(현재 {len(sections)}개, {diagnosis.missing_section_count}개 추가)"
+        )
+    action_items.extend(f"[{name}] {reason}" for name, reasons in targets.items() for reason in reasons)
+
+    summary = f"규칙 기반 사전 심사: {', '.join(issues)}"
+    review = JudgeResult(
+        overall_score=GATE_REVISE_SCORE,
+        verdict="REVISE",
+        critical_issues=[],
+        strengths=[],
+        weaknesses=issues,
+        action_items=action_items,
+        target_sections=list(targets),
+        reasoning=summary,
+        feedback_summary=summary,
+    ).model_dump()
+    return GateResult(outcome=GATE_REVISE, issues=issues, review=review)
+
+
+class ReviewGateStats:
+    """프리셋별 사전 심사 결과 카운터 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, preset: str, outcome: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(preset, {"checked": 0, GATE_REVISE: 0, GATE_MINI: 0, GATE_FULL: 0})
+            stats["checked"] += 1
+            stats[outcome] = stats.get(outcome, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """프리셋별 {checked, revise, mini, full, revise_rate, mini_rate}"""
+        with self._lock:
+            return {
+                preset: {
+                    **stats,
+                    "revise_rate": round(stats[GATE_REVISE] / stats["checked"], 3),
+                    "mini_rate": round(stats[GATE_MINI] / stats["checked"], 3),
+                }
+                for preset, stats in self._stats.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# 전역 사전 심사 통계 (/metrics/reviewer 노출)
+review_gate_stats = ReviewGateStats()
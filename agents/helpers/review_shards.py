@@ -0,0 +1,188 @@
+"""
+Review Shards Helper
+
+[NEW] 긴 초안의 섹션 분할 심사 (Map-Reduce Reviewer)
+
+단일 심사는 모든 섹션 + RAG/웹 컨텍스트 + 전문 에이전트 통합 결과를 한 번에 보내므로
+긴 Quality 초안에서 컨텍스트 한도에 가까워지고 그래프에서 가장 긴 꼬리 지연이 됩니다.
+
+- Map: 섹션마다 해당 섹션 본문 + 전체 목차 + 관련 근거만으로 SectionReview를 병렬 생성
+  (전문 에이전트 결과는 agents.yaml 키워드로 매핑된 것만, 웹/RAG 근거는 섹션과 겹치는 항목만)
+- Reduce: 섹션 점수/문제를 결정적으로 집계하여 기존과 같은 JudgeResult 생성
+  (LLM 호출 없음, target_sections = 재작성 필요 섹션)
+"""
+import json
+from typing import Any, Dict, Optional
+
+from graph.state import ensure_dict
+from utils.schemas import JudgeResult, SectionReview
+from utils.settings import QualityThresholds, settings
+from utils.evidence_bundle import get_evidence_bundle
+from agents.helpers.incremental_refine import build_section_outline
+
+# 섹션당 근거 항목 상한 / 근거 질의에 쓰는 본문 앞부분 길이
+MAX_EVIDENCE_ITEMS = 4
+EVIDENCE_QUERY_CHARS = 200
+
+# 전체 점수 = 평균과 최저 점수의 가중합 (약한 섹션 하나가 전체 품질을 끌어내림)
+MEAN_WEIGHT = 0.7
+
+# 이 비율 미만의 섹션만 심사에 성공하면 단일 심사로 Fallback
+MIN_SUCCESS_RATIO = 0.5
+
+# 집계 결과에 포함할 섹션별 수정 지시 수
+ACTION_ITEMS_PER_SECTION = 2
+
+
+def should_shard_review(draft_dict: dict, preset) -> bool:
+    """프리셋 기준 글자 수 이상인 초안만 분할 심사"""
+    min_chars = getattr(preset, "review_shard_min_chars", None)
+    if not min_chars:
+        return False
+    sections = [ensure_dict(sec) for sec in draft_dict.get("sections", [])]
+    return len(sections) > 1 and sum(len(sec.get("content", "")) for sec in sections) >= min_chars
+
+
+def _integrate_specialist(results: Dict[str, Any]) -> str:
+    """전문 에이전트 결과 일부를 Writer/Supervisor와 같은 마크다운 형식으로 변환"""
+    try:
+        from agents.supervisor import integrate_specialist_results
+        return integrate_specialist_results(results)
+    except Exception:
+        return json.dumps(results, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_section_evidence(section: dict, specialist_analysis: dict, bundle) -> str:
+    """섹션 관련 근거만 모은 텍스트 (매핑된 전문 에이전트 결과 + 겹치는 웹/RAG 항목)"""
+    from agents.agent_config import map_sections_to_result_keys
+
+    parts = []
+    keys = map_sections_to_result_keys([section])[0]
+    related = {key: specialist_analysis[key] for key in keys if specialist_analysis.get(key)}
+    if related:
+        parts.append(_integrate_specialist(related))
+
+    if bundle:
+        query = f"{section.get('name', '')} {section.get('content', '')[:EVIDENCE_QUERY_CHARS]}"
+        evidence = bundle.relevant(query, limit=MAX_EVIDENCE_ITEMS).render("reviewer:section")
+        if evidence:
+            parts.append(evidence)
+
+    return "\n\n".join(parts) if parts else "없음"
+
+
+def _review_section(llm, messages: list, name: str, logger) -> Optional[dict]:
+    """섹션 1개 심사 (실패하면 None → 집계에서 제외)"""
+    try:
+        return ensure_dict(llm.invoke(messages))
+    except Exception as e:
+        logger.warning(f"[Reviewer Shard] '{name}' 섹션 심사 실패: {e}")
+        return None
+
+
+def reduce_section_reviews(reviews: Dict[str, dict]) -> dict:
+    """
+    섹션별 심사 결과를 하나의 JudgeResult로 집계 (결정적)
+
+    - overall_score: 평균 × 0.7 + 최저 × 0.3 (반올림, 1-10)
+    - verdict: P0 문제가 있으면 FAIL, 아니면 QualityThresholds 기준 (재작성 필요 섹션이 있으면 PASS 불가)
+    - target_sections: 재작성 필요 섹션 (점수 낮은 순)
+
+    Args:
+        reviews: 섹션명 → SectionReview 딕셔너리 (목차 순서)
+
+    Returns:
+        dict: JudgeResult 딕셔너리
+    """
+    scores = {name: review.get("score", QualityThresholds.FALLBACK_SCORE) for name, review in reviews.items()}
+    mean = sum(scores.values()) / len(scores)
+    worst = min(scores, key=scores.get)
+    overall = max(1, min(10, round(MEAN_WEIGHT * mean + (1 - MEAN_WEIGHT) * scores[worst])))
+
+    targets = sorted(
+        (name for name, review in reviews.items()
+         if review.get("needs_revision") or review.get("p0_issues") or not QualityThresholds.is_pass(scores[name])),
+        key=lambda name: scores[name]
+    )
+    critical = [f"[{name}] {issue}" for name, review in reviews.items() for issue in review.get("p0_issues", [])]
+
+    if critical or QualityThresholds.is_fail(overall):
+        verdict = "FAIL"
+    elif QualityThresholds.is_pass(overall) and not targets:
+        verdict = "PASS"
+    else:
+        verdict = "REVISE"
+
+    reasoning = (
+        f"섹션 {len(reviews)}개 분할 심사: 평균 {mean:.1f}점, 최저 {scores[worst]}점 ({worst}), "
+        f"재작성 필요 {len(targets)}개"
+    )
+    weaknesses = [f"[{name}] {issue}" for name, review in reviews.items() for issue in review.get("issues", [])]
+
+    return JudgeResult(
+        overall_score=overall,
+        verdict=verdict,
+        critical_issues=critical,
+        strengths=[f"[{name}] {s}" for name, review in reviews.items() for s in review.get("strengths", [])[:1]],
+        weaknesses=weaknesses,
+        action_items=[
+            f"[{name}] {item}" for name in targets
+            for item in reviews[name].get("action_items", [])[:ACTION_ITEMS_PER_SECTION]
+        ],
+        target_sections=targets,
+        reasoning=reasoning,
+        feedback_summary=reasoning + (f" / 주요 문제: {'; '.join(weaknesses[:3])}" if weaknesses else ""),
+    ).model_dump()
+
+
+def run_sharded_review(state: dict, draft_dict: dict, preset, build_messages, logger,
+                       model_type: Optional[str] = None) -> dict:
+    """
+    섹션별 병렬 심사(Map) 후 JudgeResult로 집계(Reduce)
+
+    Args:
+        state: 워크플로우 상태 (specialist_analysis, evidence_bundle 또는 web/rag 컨텍스트)
+        draft_dict: 심사할 초안
+        preset: 프리셋 설정
+        build_messages: 섹션 프롬프트(dynamic_content) → 메시지 목록 (Reviewer의 정적 접두부 공유)
+        logger: 로거
+        model_type: 심사 모델 (None이면 preset.model_type)
+
+    Returns:
+        dict: JudgeResult 딕셔너리
+
+    Raises:
+        RuntimeError: 심사에 성공한 섹션이 MIN_SUCCESS_RATIO 미만 (호출부에서 단일 심사로 Fallback)
+    """
+    from utils.llm import get_llm
+    from agents.specialist_executor import run_bounded
+    from prompts.reviewer_prompt import REVIEWER_SECTION_PROMPT
+
+    sections = [ensure_dict(sec) for sec in draft_dict.get("sections", [])]
+    outline = build_section_outline(draft_dict)
+    specialist_analysis = ensure_dict(state.get("specialist_analysis") or {})
+    bundle = get_evidence_bundle(state)
+
+    llm = get_llm(model_type=model_type or preset.model_type, temperature=0.1).with_structured_output(SectionReview)
+
+    calls = []
+    for sec in sections:
+        messages = build_messages(REVIEWER_SECTION_PROMPT.format(
+            name=sec.get("name", ""),
+            content=sec.get("content", ""),
+            outline=outline,
+            evidence=build_section_evidence(sec, specialist_analysis, bundle),
+        ))
+        calls.append((_review_section, llm, messages, sec.get("name", ""), logger))
+
+    logger.info(f"[Reviewer Shard] 섹션 {len(calls)}개 분할 심사 시작")
+    thread_id = state.get("thread_id")
+    results = run_bounded(f"{thread_id}:reviewer" if thread_id else None, calls, settings.REVIEWER_SHARD_PARALLELISM)
+
+    reviews = {sec.get("name", ""): result for sec, result in zip(sections, results) if result}
+    if len(reviews) < len(sections) * MIN_SUCCESS_RATIO:
+        raise RuntimeError(f"섹션 심사 성공 {len(reviews)}/{len(sections)}개")
+
+    review = reduce_section_reviews(reviews)
+    logger.info(f"[Reviewer Shard] 집계 완료: {review['verdict']} ({review['overall_score']}점), 대상 {review['target_sections']}")
+    return review
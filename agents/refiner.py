@@ -17,6 +17,8 @@ from utils.schemas import RefinementStrategy
 from utils.settings import settings, get_preset  # [NEW] get_preset 추가
 from prompts.refiner_prompt import REFINER_SYSTEM_PROMPT, REFINER_USER_PROMPT
 from utils.file_logger import get_file_logger
+from utils.prompt_budget import PromptAssembler, PRIORITY_LOW, PRIORITY_REQUIRED
+from agents.helpers.incremental_refine import decide_refine_targets
 
 def run(state: PlanCraftState) -> PlanCraftState:
     """
@@ -57,7 +59,8 @@ def run(state: PlanCraftState) -> PlanCraftState:
         return update_state(
             state,
             current_step="refine",
-            refined=False # 더 이상 개선 안함
+            refined=False, # 더 이상 개선 안함
+            refine_targets=[]
         )
         
     # 2. 개선 전략 수립 (LLM 호출)
@@ -80,6 +83,16 @@ def run(state: PlanCraftState) -> PlanCraftState:
         temperature=0.4
     ).with_structured_output(RefinementStrategy)
     
+    action_items = "\n".join([f"- {i}" for i in review_dict.get("action_items", [])])
+
+    # [NEW] 구성 요소별 토큰 측정 + Refiner 예산 맞춤 (초안 요약부터 자름)
+    parts = (PromptAssembler("refiner")
+        .add("system", REFINER_SYSTEM_PROMPT, PRIORITY_REQUIRED)
+        .add("template", REFINER_USER_PROMPT, PRIORITY_REQUIRED)
+        .add("feedback", f"{feedback}\n{issues}\n{action_items}", PRIORITY_REQUIRED)
+        .add("draft", draft_summary, PRIORITY_LOW)
+        .fit())
+
     messages = [
         {"role": "system", "content": REFINER_SYSTEM_PROMPT},
         {"role": "user", "content": REFINER_USER_PROMPT.format(
@@ -88,8 +101,8 @@ def run(state: PlanCraftState) -> PlanCraftState:
             feedback=feedback,
             issues=issues if issues else "(없음)",
             target_sections=", ".join(review_dict.get("target_sections", [])) or "(모든 섹션 검토)",
-            action_items="\n".join([f"- {i}" for i in review_dict.get("action_items", [])]) or "(없음)",
-            draft_summary=draft_summary
+            action_items=action_items or "(없음)",
+            draft_summary=parts["draft"] or "초안 데이터 없음"
         )}
     ]
     
@@ -123,11 +136,19 @@ def run(state: PlanCraftState) -> PlanCraftState:
             for s in sections
         ])
 
+    # [NEW] 부분 재작성 대상: 구조 지적이 없고 지목 섹션이 초안에 있으면 해당 섹션만 재작성
+    refine_targets = decide_refine_targets(review_dict, draft)
+    if refine_targets:
+        logger.info(f"[Refiner] 부분 재작성 대상: {refine_targets}")
+    else:
+        logger.info("[Refiner] 전체 재작성 (구조 지적 또는 대상 섹션 불명확)")
+
     return update_state(
         state,
         refine_count=current_count + 1,
         previous_plan=previous_text,
         refinement_guideline=strategy_data, # [NEW] 전략 전달
         current_step="refine",
-        refined=True
+        refined=True,
+        refine_targets=refine_targets
     )
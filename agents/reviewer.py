@@ -5,7 +5,21 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from utils.llm import get_llm
 from utils.schemas import JudgeResult
 from graph.state import PlanCraftState, update_state, ensure_dict
-from prompts.reviewer_prompt import REVIEWER_SYSTEM_PROMPT, REVIEWER_USER_PROMPT
+from prompts.reviewer_prompt import (
+    REVIEWER_SYSTEM_PROMPT,
+    REVIEWER_USER_INSTRUCTIONS,
+    REVIEWER_USER_PROMPT,
+    REVIEWER_INCREMENTAL_PROMPT,
+    REVIEWER_SECTION_INSTRUCTIONS,
+)
+from agents.helpers.incremental_refine import build_section_outline
+from agents.helpers.review_shards import should_shard_review, run_sharded_review
+from agents.helpers.review_gate import GATE_MINI, pre_review_gate, review_gate_stats
+from utils.prompt_layout import build_cacheable_messages
+from utils.prompt_budget import (
+    NODE_PROMPT_TOKEN_BUDGETS, PromptAssembler, PRIORITY_LOW, PRIORITY_MEDIUM, PRIORITY_REQUIRED,
+)
+from utils.evidence_bundle import estimate_tokens
 from utils.file_logger import get_file_logger
 
 # LLM은 함수 내에서 동적으로 생성 (프리셋 적용)
@@ -36,6 +50,15 @@ def run(state: PlanCraftState) -> PlanCraftState:
     draft_dict = ensure_dict(draft)
     sections = draft_dict.get("sections", [])
 
+    # [NEW] 규칙 기반 사전 심사: 기계적 결함은 LLM 호출 없이 REVISE, 깨끗한 초안은 경량 모델로 심사
+    analysis = ensure_dict(state.get("analysis") or {})
+    gate = pre_review_gate(draft_dict, preset, analysis.get("key_features", []))
+    review_gate_stats.record(generation_preset, gate.outcome)
+    if gate.review:
+        get_file_logger().info(f"[Reviewer] 사전 심사 REVISE (LLM 생략): {gate.issues}")
+        return update_state(state, review=gate.review, review_gate=gate.outcome, current_step="review")
+    review_model = preset.review_clean_model if gate.outcome == GATE_MINI else preset.model_type
+
     full_text = "\n\n".join([
         f"## {ensure_dict(s).get('name', '')}\n{ensure_dict(s).get('content', '')}"
         for s in sections
@@ -48,26 +71,90 @@ def run(state: PlanCraftState) -> PlanCraftState:
     specialist_analysis = ensure_dict(state.get("specialist_analysis", {}))
     specialist_context = specialist_analysis.get("integrated_context", "")
     
-    context = f"{rag_context}\n{web_context}"
-    if specialist_context:
-        context += f"\n\n=== [전문 에이전트 분석 결과 (Fact Check 기준)] ===\n{specialist_context}"
-    
     # 2. 프롬프트 구성
     # REVIEWER_USER_PROMPT는 {draft}, {context}를 요구함
-    
-    messages = [
-        {"role": "system", "content": REVIEWER_SYSTEM_PROMPT},
-        {"role": "user", "content": REVIEWER_USER_PROMPT.format(
-            draft=full_text,
+    changed_sections = state.get("changed_sections")
+    previous_review = ensure_dict(state.get("review") or {})
+    incremental = bool(changed_sections and previous_review)
+
+    # [NEW] 초안은 자르지 않으므로, 단일 심사 프롬프트 예산을 넘는 초안도 분할 심사로 전환
+    draft_over_budget = sum(
+        estimate_tokens(text) for text in (REVIEWER_SYSTEM_PROMPT, REVIEWER_USER_INSTRUCTIONS, full_text)
+    ) > NODE_PROMPT_TOKEN_BUDGETS["reviewer"]
+
+    # [NEW] 긴 초안: 섹션별 관련 근거만으로 병렬 심사 후 JudgeResult로 집계 (실패 시 단일 심사)
+    if not incremental and (should_shard_review(draft_dict, preset) or draft_over_budget):
+        def section_messages(dynamic_content: str) -> list:
+            return build_cacheable_messages(
+                system_prompt=REVIEWER_SYSTEM_PROMPT,
+                static_instructions=REVIEWER_SECTION_INSTRUCTIONS,
+                dynamic_content=dynamic_content,
+                include_time=False,
+            )
+
+        try:
+            review_dict = run_sharded_review(
+                state, draft_dict, preset, section_messages, get_file_logger(), model_type=review_model
+            )
+            return update_state(state, review=review_dict, review_gate=gate.outcome, current_step="review")
+        except Exception as e:
+            get_file_logger().warning(f"[Reviewer] 분할 심사 실패, 단일 심사로 진행: {e}")
+
+    # [NEW] 부분 재작성 직후: 변경된 섹션만 재채점 + 나머지 섹션 개요로 전체 흐름 확인
+    changed_text = ""
+    if incremental:
+        changed_text = "\n\n".join([
+            f"## {ensure_dict(s).get('name', '')}\n{ensure_dict(s).get('content', '')}"
+            for s in sections if ensure_dict(s).get("name", "") in changed_sections
+        ])
+
+    # [NEW] 구성 요소별 토큰 측정 + Reviewer 예산 맞춤 (근거 자료 → 전문 분석 → 개요 순으로 자름)
+    # 심사 대상 초안은 잘리면 잘린 초안을 채점하게 되므로 필수 요소로 보존
+    parts = (PromptAssembler("reviewer")
+        .add("system", REVIEWER_SYSTEM_PROMPT, PRIORITY_REQUIRED)
+        .add("instructions", REVIEWER_USER_INSTRUCTIONS, PRIORITY_REQUIRED)
+        .add("draft", changed_text if incremental else full_text, PRIORITY_REQUIRED)
+        .add("outline", build_section_outline(draft_dict, exclude=changed_sections) if incremental else "",
+             PRIORITY_MEDIUM)
+        .add("specialist", specialist_context, PRIORITY_MEDIUM, min_tokens=300)
+        .add("rag", rag_context, PRIORITY_LOW)
+        .add("web", web_context, PRIORITY_LOW)
+        .fit())
+
+    context = f"{parts['rag']}\n{parts['web']}"
+    if parts["specialist"]:
+        context += f"\n\n=== [전문 에이전트 분석 결과 (Fact Check 기준)] ===\n{parts['specialist']}"
+
+    if incremental:
+        dynamic_content = REVIEWER_INCREMENTAL_PROMPT.format(
+            previous_verdict=previous_review.get("verdict", ""),
+            previous_score=previous_review.get("overall_score", ""),
+            previous_issues=", ".join(previous_review.get("critical_issues", [])) or "없음",
+            previous_actions=", ".join(previous_review.get("action_items", [])) or "없음",
+            changed=parts["draft"],
+            outline=parts["outline"] or "(없음)",
             context=context if context.strip() else "없음"
-        )}
-    ]
+        )
+        get_file_logger().info(f"[Reviewer] 부분 재심사: {changed_sections}")
+    else:
+        dynamic_content = REVIEWER_USER_PROMPT.format(
+            draft=parts["draft"],
+            context=context if context.strip() else "없음"
+        )
+
+    # [NEW] 정적 체크리스트를 앞에, 초안/컨텍스트를 뒤에 배치 (Prompt Prefix Cache 적중)
+    messages = build_cacheable_messages(
+        system_prompt=REVIEWER_SYSTEM_PROMPT,
+        static_instructions=REVIEWER_USER_INSTRUCTIONS,
+        dynamic_content=dynamic_content,
+        include_time=False,
+    )
     
     # 3. LLM 호출
     try:
         # 동적 LLM 생성 (프리셋 모델 적용)
         reviewer_llm = get_llm(
-            model_type=preset.model_type, 
+            model_type=review_model,
             temperature=0.1  # Reviewer는 항상 엄격하게
         ).with_structured_output(JudgeResult)
 
@@ -79,6 +166,7 @@ def run(state: PlanCraftState) -> PlanCraftState:
         return update_state(
             state,
             review=review_dict,
+            review_gate=gate.outcome,
             current_step="review"
         )
         
@@ -94,4 +182,4 @@ def run(state: PlanCraftState) -> PlanCraftState:
             "weaknesses": ["자동 심사 실패로 인한 기본값 적용"],
             "action_items": ["전반적인 내용 검토 필요"]
         }
-        return update_state(state, review=fallback_review, error=f"Reviewer Error: {str(e)}")
+        return update_state(state, review=fallback_review, review_gate=gate.outcome, error=f"Reviewer Error: {str(e)}")
@@ -0,0 +1,312 @@
+"""
+PlanCraft - 섹션 단위 초안 캐시 (Content-Addressed, TTL)
+
+Reviewer가 analyze(재시작)나 structure(재작성)로 되돌리면 Writer는 입력이 바뀌지 않은
+섹션까지 다시 생성합니다. 섹션별 프롬프트 입력의 해시를 키로 작성 결과를 저장해 두고,
+Writer가 생성 전에 조회하여 입력이 같은 섹션은 LLM 호출 없이 재사용합니다.
+
+섹션 키 = sha256(요청 공통 입력, 섹션 명세, 목차 내 위치, 관련 전문 에이전트 결과, 적용 지침)
+- 요청 공통 입력: 모델 + temperature, 시스템 프롬프트/정적 작성 지침 해시, user_input,
+  사용자 제약조건, Writer에 렌더링된 웹/RAG 근거, 기획서 제목
+- 섹션 명세: Structurer 섹션 (name, description, key_points; 번호 제외)
+- 목차 내 위치: 섹션 순서와 앞/뒤 섹션명 (섹션 간 연결 문장이 달라지므로 목차 순서가 바뀌면 무효화)
+- 관련 전문 에이전트 결과: agents.yaml 키워드로 섹션에 매핑된 결과만
+  (map_sections_to_result_keys, 다른 에이전트 결과가 바뀌어도 키 유지)
+- 적용 지침 (refine_count > 0): 심사가 이 섹션을 지목했거나(target_sections) 지목 섹션이 없으면
+  심사 피드백/Refiner 지침 전체, 그 외 섹션은 섹션명을 언급한 항목만
+
+작성된 섹션은 정확한 키와 함께 "지침 없는 키(base)"에도 저장합니다.
+지목되어 다시 작성된 섹션도 이후 루프에서 지목되지 않으면 최신 작성본이 재사용됩니다.
+
+설정 (utils/settings.py):
+    SECTION_CACHE_TTL_SEC (PLANCRAFT_SECTION_CACHE_TTL, 0이면 비활성화)
+    SECTION_CACHE_MAX_ENTRIES
+
+사용 예시:
+    from agents.section_cache import start_section_reuse
+
+    reuse = start_section_reuse(state, preset, prompt_prefix, evidence_text)
+    cached = reuse.lookup(idx, specialist_analysis)   # None이면 생성
+    reuse.store_sections(draft_dict["sections"])
+    reuse.summary()  # {"hits": 9, "lookups": 13, "reuse_ratio": 0.692}
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from graph.state import ensure_dict
+from agents.specialist_cache import SpecialistResultCache, _normalize
+
+# 섹션 명세 중 키에서 제외하는 필드 (목차 번호는 병합 시 다시 매김)
+_SPEC_EXCLUDED_FIELDS = ("id",)
+
+
+def _digest(payload: Any) -> str:
+    raw = json.dumps(_normalize(payload), ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _section_name(section: Any) -> str:
+    if isinstance(section, dict):
+        return str(section.get("name") or section.get("title") or "")
+    return str(getattr(section, "name", "") or section)
+
+
+def _name_key(name: str) -> str:
+    return "".join(str(name).split())
+
+
+def _section_spec(section: Any) -> Any:
+    section = ensure_dict(section) if not isinstance(section, str) else section
+    if isinstance(section, dict):
+        return {k: v for k, v in section.items() if k not in _SPEC_EXCLUDED_FIELDS}
+    return section
+
+
+class SectionDraftCache(SpecialistResultCache):
+    """
+    섹션 작성 결과 캐시 (프로세스 전역, 세션 간 공유) + 프리셋별 재사용 비율
+
+    저장/만료/LRU 정책은 전문 에이전트 결과 캐시와 같고 설정만 분리되어 있습니다.
+    """
+
+    def __init__(self, ttl_sec: Optional[float] = None, max_entries: Optional[int] = None):
+        super().__init__(ttl_sec=ttl_sec, max_entries=max_entries)
+        self._reuse: Dict[str, Dict[str, int]] = {}
+        self._reuse_lock = threading.Lock()
+
+    @property
+    def ttl_sec(self) -> float:
+        if self._ttl_sec is not None:
+            return self._ttl_sec
+        from utils.settings import settings
+        return settings.SECTION_CACHE_TTL_SEC
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        from utils.settings import settings
+        return settings.SECTION_CACHE_MAX_ENTRIES
+
+    def record_reuse(self, preset: str, hits: int, lookups: int) -> None:
+        """Writer 실행 1회의 섹션 재사용 결과 기록"""
+        if lookups <= 0:
+            return
+        with self._reuse_lock:
+            stats = self._reuse.setdefault(preset, {"writes": 0, "lookups": 0, "hits": 0, "full_reuse": 0})
+            stats["writes"] += 1
+            stats["lookups"] += lookups
+            stats["hits"] += hits
+            stats["full_reuse"] += int(hits == lookups)
+
+    def reuse_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """프리셋별 {writes, lookups, hits, full_reuse, reuse_ratio}"""
+        with self._reuse_lock:
+            return {
+                preset: {**stats, "reuse_ratio": round(stats["hits"] / stats["lookups"], 3)}
+                for preset, stats in self._reuse.items()
+            }
+
+    def clear(self) -> None:
+        super().clear()
+        with self._reuse_lock:
+            self._reuse.clear()
+
+
+# 전역 섹션 캐시 인스턴스 (/metrics/writer 노출)
+section_cache = SectionDraftCache()
+
+
+def _review_guidance(state: dict) -> Tuple[List[str], List[str], bool]:
+    """
+    Writer 프롬프트에 들어가는 심사/Refiner 지침을 항목 단위로 분해
+
+    Returns:
+        (전체 지침 항목, 지목 섹션 목록, 지목 여부)
+    """
+    refine_count = state.get("refine_count", 0)
+    if refine_count <= 0:
+        return [], [], False
+
+    items = [f"refine_count:{refine_count}"]
+    review = ensure_dict(state.get("review") or {})
+    if review:
+        items.append(f"verdict:{review.get('verdict', '')}")
+        items.append(f"summary:{review.get('feedback_summary', '')}")
+        items.extend(f"critical:{issue}" for issue in review.get("critical_issues", []) or [])
+        items.extend(f"action:{item}" for item in review.get("action_items", []) or [])
+
+    guideline = ensure_dict(state.get("refinement_guideline") or {})
+    if guideline:
+        items.append(f"direction:{guideline.get('overall_direction', '')}")
+        items.extend(f"guideline:{g}" for g in guideline.get("specific_guidelines", []) or [])
+
+    targets = [str(t) for t in review.get("target_sections", []) or []]
+    return items, targets, bool(targets)
+
+
+@dataclass
+class SectionReuse:
+    """
+    Writer 실행 1회의 섹션별 캐시 조회/저장
+
+    lookup()은 섹션 인덱스별로 키를 계산해 두고, store_sections()는 작성된 섹션을
+    목차의 섹션명으로 찾아 같은 키로 저장합니다.
+    """
+    preset: str
+    sections: List[Any]
+    request_digest: str
+    guidance: List[str] = field(default_factory=list)
+    targets: List[str] = field(default_factory=list)
+    localized: bool = False
+    cache: SectionDraftCache = field(default=None, repr=False)
+    hits: int = 0
+    lookups: int = 0
+    _keys: Dict[int, Tuple[str, str]] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        if self.cache is None:
+            self.cache = section_cache
+        self._index = {_name_key(_section_name(sec)): idx for idx, sec in enumerate(self.sections)}
+
+    def applicable_guidance(self, idx: int) -> List[str]:
+        """섹션에 적용되는 지침 항목 (지목 섹션/비지목 리뷰면 전체, 그 외는 섹션명 언급 항목만)"""
+        if not self.guidance:
+            return []
+        name = _section_name(self.sections[idx])
+        if not self.localized or any(_name_key(t) == _name_key(name) for t in self.targets):
+            return list(self.guidance)
+        return [item for item in self.guidance if name and name in item]
+
+    def keys(self, idx: int, specialist_results: Optional[dict] = None) -> Tuple[str, str]:
+        """(정확한 키, 지침 없는 키) 계산 후 기억"""
+        from agents.agent_config import map_sections_to_result_keys
+
+        section = self.sections[idx]
+        results = ensure_dict(specialist_results or {})
+        related = {
+            key: results[key] for key in map_sections_to_result_keys([section])[0] if results.get(key)
+        }
+        neighbours = [
+            _section_name(self.sections[i]) if 0 <= i < len(self.sections) else None for i in (idx - 1, idx + 1)
+        ]
+        base = {
+            "request": self.request_digest,
+            "section": _section_spec(section),
+            "position": {"index": idx, "neighbours": neighbours},
+            "specialist": related,
+        }
+        guidance = self.applicable_guidance(idx)
+        base_key = _digest(base)
+        keys = (_digest({**base, "guidance": guidance}) if guidance else base_key, base_key)
+        self._keys[idx] = keys
+        return keys
+
+    def lookup(self, idx: int, specialist_results: Optional[dict] = None) -> Optional[dict]:
+        """섹션 캐시 조회 (적중 시 섹션 dict, 번호는 목차 순서로 보정)"""
+        key, _ = self.keys(idx, specialist_results)
+        self.lookups += 1
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        self.hits += 1
+        return {**cached, "id": idx + 1}
+
+    def lookup_all(self, specialist_results: Optional[dict] = None) -> Dict[int, dict]:
+        """모든 섹션 조회 → 적중한 섹션 인덱스 → 섹션"""
+        found = {}
+        for idx in range(len(self.sections)):
+            cached = self.lookup(idx, specialist_results)
+            if cached is not None:
+                found[idx] = cached
+        return found
+
+    def drop_hits(self) -> None:
+        """적중한 섹션을 쓰지 못하고 다시 작성하는 경우 (작성 경로 Fallback) 재사용으로 집계하지 않음"""
+        self.hits = 0
+
+    def store_sections(self, sections: List[Any], specialist_results: Optional[dict] = None) -> int:
+        """
+        작성된 섹션을 목차의 섹션명으로 찾아 저장 (목차에 없는 섹션은 저장하지 않음)
+
+        Returns:
+            int: 저장된 섹션 수
+        """
+        stored = 0
+        for section in sections or []:
+            section = ensure_dict(section)
+            idx = self._index.get(_name_key(section.get("name", "")))
+            if idx is None or not str(section.get("content", "")).strip():
+                continue
+            key, base_key = self._keys.get(idx) or self.keys(idx, specialist_results)
+            entry = copy.deepcopy(section)
+            if self.cache.put(key, entry):
+                stored += 1
+                if base_key != key:
+                    self.cache.put(base_key, entry)
+        return stored
+
+    def summary(self) -> Dict[str, Any]:
+        """{hits, lookups, reuse_ratio} (조회가 없으면 reuse_ratio 0.0)"""
+        ratio = round(self.hits / self.lookups, 3) if self.lookups else 0.0
+        return {"hits": self.hits, "lookups": self.lookups, "reuse_ratio": ratio}
+
+    def finish(self) -> Dict[str, Any]:
+        """전역 통계에 기록 후 summary 반환"""
+        self.cache.record_reuse(self.preset, self.hits, self.lookups)
+        return self.summary()
+
+
+def assemble_cached_draft(structure: Any, cached: Dict[int, dict]) -> dict:
+    """모든 섹션이 적중했을 때 목차 순서로 초안 구성 (Writer DraftResult와 같은 형식)"""
+    structure_dict = ensure_dict(structure)
+    return {
+        "title": structure_dict.get("title", "Business Plan"),
+        "sections": [cached[idx] for idx in sorted(cached)],
+    }
+
+
+def start_section_reuse(state: dict, preset, prompt_prefix: str, evidence_text: str = "",
+                        cache: Optional[SectionDraftCache] = None) -> Optional[SectionReuse]:
+    """
+    Writer 실행 1회의 섹션 재사용 컨텍스트 생성
+
+    Args:
+        state: 워크플로우 상태 (structure, user_input, analysis, review, refinement_guideline)
+        preset: 프리셋 설정 (model_type, temperature)
+        prompt_prefix: 시스템 프롬프트 + 정적 작성 지침 (바뀌면 모든 섹션 무효화)
+        evidence_text: Writer에 렌더링된 웹/RAG 근거
+        cache: 사용할 캐시 (None이면 전역 section_cache)
+
+    Returns:
+        SectionReuse | None: 캐시 비활성화 또는 목차 없음
+    """
+    cache = cache or section_cache
+    sections = ensure_dict(state.get("structure") or {}).get("sections", [])
+    if not cache.enabled or not sections:
+        return None
+
+    analysis = ensure_dict(state.get("analysis") or {})
+    request_digest = _digest({
+        "title": ensure_dict(state.get("structure") or {}).get("title", ""),
+        "model": f"{preset.model_type}@{preset.temperature}",
+        "prompt": hashlib.sha256(prompt_prefix.encode("utf-8")).hexdigest(),
+        "user_input": state.get("user_input", ""),
+        "user_constraints": analysis.get("user_constraints", []),
+        "evidence": evidence_text,
+    })
+    guidance, targets, localized = _review_guidance(state)
+    return SectionReuse(
+        preset=getattr(preset, "name", ""),
+        sections=list(sections),
+        request_digest=request_digest,
+        guidance=guidance,
+        targets=targets,
+        localized=localized,
+        cache=cache,
+    )
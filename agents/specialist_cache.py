@@ -0,0 +1,207 @@
+"""
+PlanCraft - 전문 에이전트 결과 캐시 (Content-Addressed, TTL)
+
+전문 에이전트(market, bm, financial, ...)는 그래프에서 가장 비용이 큰 fan-out입니다.
+다음 경우에 동일한 입력으로 재계산되는 것을 방지합니다.
+
+- Reviewer → analyze 재시작 (restart_count)
+- 같은 주제를 다루는 다른 스레드(세션)
+- Writer ReAct의 request_specialist_analysis 도구 반복 호출 (별도 네임스페이스)
+
+캐시 키 = sha256(네임스페이스, agent_id, 정규화된 실행 컨텍스트, 모델, 프롬프트 버전)
+- 네임스페이스: 호출자별 입력 모양 구분 (Supervisor 항목과 Writer 도구 질의는 서로 적중하지 않음)
+- 실행 컨텍스트: Supervisor._prepare_agent_context() 결과 (의존 에이전트 결과 포함)
+- 모델: 에이전트 LLM의 배포명/모델명 + temperature
+- 프롬프트 버전: 에이전트 모듈 + prompts/specialist_prompts 파일 내용 해시 (수정 시 자동 무효화)
+
+설정 (utils/settings.py):
+    SPECIALIST_CACHE_TTL_SEC (PLANCRAFT_SPECIALIST_CACHE_TTL, 0이면 비활성화)
+    SPECIALIST_CACHE_MAX_ENTRIES
+
+사용 예시:
+    from agents.specialist_cache import specialist_cache
+
+    key = specialist_cache.make_key("market", agent, agent_context)
+    result = specialist_cache.get(key)
+    if result is None:
+        result = agent.run(**agent_context)
+        specialist_cache.put(key, result)
+"""
+
+import copy
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 에이전트 내부 Fallback 결과 표시 (캐시 저장 금지)
+UNCACHEABLE_KEY = "_uncacheable"
+
+# 캐시 키 네임스페이스 (호출자별 입력 컨텍스트 모양이 달라 서로 적중하지 않음)
+NAMESPACE_SUPERVISOR = "supervisor"    # Supervisor._prepare_agent_context 결과
+NAMESPACE_WRITER_TOOL = "writer_tool"  # Writer ReAct request_specialist_analysis 질의
+
+_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts" / "specialist_prompts"
+
+
+def mark_uncacheable(result: Dict[str, Any]) -> Dict[str, Any]:
+    """LLM 실패 등으로 생성된 임시 결과를 캐시 대상에서 제외"""
+    result[UNCACHEABLE_KEY] = True
+    return result
+
+
+def strip_cache_marker(result: Any) -> Any:
+    """결과에서 캐시 제외 표시 제거 (하위 노드로 전달하기 전 호출)"""
+    if isinstance(result, dict):
+        result.pop(UNCACHEABLE_KEY, None)
+    return result
+
+
+def _normalize(value: Any) -> Any:
+    """키 계산용 정규화: 공백 정리, dict 키 정렬은 json.dumps(sort_keys)에서 처리"""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def _describe_model(agent: Any) -> str:
+    """에이전트 LLM 식별자 (배포명/모델명 + temperature)"""
+    llm = getattr(agent, "llm", None)
+    if llm is None:
+        return "none"
+    name = getattr(llm, "deployment_name", None) or getattr(llm, "model_name", None) or type(llm).__name__
+    return f"{name}@{getattr(llm, 'temperature', None)}"
+
+
+@lru_cache(maxsize=32)
+def _prompt_version(agent_id: str, agent_class: type) -> str:
+    """에이전트 모듈과 전용 프롬프트 파일 내용으로 계산한 버전 해시"""
+    digest = hashlib.sha256()
+    paths = []
+    try:
+        paths.append(Path(inspect.getfile(agent_class)))
+    except (TypeError, OSError):
+        digest.update(agent_class.__qualname__.encode("utf-8"))
+    paths.append(_PROMPTS_DIR / f"{agent_id}_prompt.py")
+
+    for path in paths:
+        if path.is_file():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+class SpecialistResultCache:
+    """
+    스레드 안전 LRU + TTL 메모리 캐시 (프로세스 전역, 세션 간 공유)
+
+    결과는 deepcopy로 저장/반환하여 하위 노드의 변경이 캐시에 전파되지 않습니다.
+    """
+
+    def __init__(self, ttl_sec: Optional[float] = None, max_entries: Optional[int] = None):
+        self._ttl_sec = ttl_sec
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, result)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ttl_sec(self) -> float:
+        if self._ttl_sec is not None:
+            return self._ttl_sec
+        from utils.settings import settings
+        return settings.SPECIALIST_CACHE_TTL_SEC
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        from utils.settings import settings
+        return settings.SPECIALIST_CACHE_MAX_ENTRIES
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_sec > 0 and self.max_entries > 0
+
+    def make_key(
+        self, agent_id: str, agent: Any, agent_context: Dict[str, Any], namespace: str = NAMESPACE_SUPERVISOR
+    ) -> str:
+        """
+        (네임스페이스, agent_id, 정규화 컨텍스트, 모델, 프롬프트 버전) → 캐시 키
+
+        입력 컨텍스트의 모양이 다른 호출자(Writer ReAct 도구 등)는 별도 네임스페이스를 사용합니다.
+        """
+        payload = {
+            "namespace": namespace,
+            "agent_id": agent_id,
+            "context": _normalize(agent_context),
+            "model": _describe_model(agent),
+            "prompt_version": _prompt_version(agent_id, type(agent)),
+        }
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (만료/미존재 시 None)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, key: str, result: Any) -> bool:
+        """
+        결과 저장 (dict이고 에러/Fallback이 아닌 경우만)
+
+        Returns:
+            bool: 저장 여부
+        """
+        if not self.enabled or not isinstance(result, dict) or not result:
+            return False
+        if result.get(UNCACHEABLE_KEY) or result.get("fallback_used") or "error" in result:
+            return False
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_sec, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def contains(self, key: str) -> bool:
+        """[NEW] 유효한 항목 존재 여부 (적중/미적중 통계에 반영하지 않음, 라우팅 비용 추정용)"""
+        if not self.enabled:
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# 전역 캐시 인스턴스 (Supervisor, Writer ReAct 도구 공유)
+specialist_cache = SpecialistResultCache()
@@ -0,0 +1,298 @@
+"""
+PlanCraft - 전문 에이전트 공용 실행기 (프로세스 전역, 세션 간 공정 분배)
+
+세션(요청)마다 ThreadPoolExecutor를 만들면 동시 세션 N개에서 스레드 수가
+N × MAX_PARALLEL_AGENTS로 늘어납니다. 이 모듈은 고정 크기 워커 풀 하나를 공유하고,
+세션별 대기열을 라운드 로빈으로 처리하여 한 세션이 풀을 독점하지 못하게 합니다.
+
+- 워커 수: settings.SPECIALIST_POOL_WORKERS (PLANCRAFT_SPECIALIST_WORKERS)
+- 세션당 동시 실행 상한: settings.MAX_PARALLEL_AGENTS (Supervisor에서 적용)
+- 반환값: concurrent.futures.Future (wait/FIRST_COMPLETED와 호환)
+- 지표: metrics() → 대기열 깊이, 실행 중 작업 수, 평균/최대 대기 시간
+
+[NEW] 용도별 풀 분리: 타임아웃으로 버려진 작업도 끝날 때까지 워커를 점유하므로,
+한 단계가 느려져도 다른 단계가 굶지 않도록 fan-out 종류마다 별도 풀을 사용합니다.
+    - specialist : 전문 에이전트 (SPECIALIST_POOL_WORKERS)
+    - fanout     : Writer 분할 작성/부분 재작성, Reviewer 분할 심사 (FANOUT_POOL_WORKERS)
+    - tools      : Writer ReAct 도구 호출 (TOOL_POOL_WORKERS)
+    - background : 응답 이후 후처리 (Formatter 요약 다듬기 등, BACKGROUND_POOL_WORKERS)
+    - prefetch   : 구조 설계와 병렬로 시작하는 전문 에이전트 선행 실행 (PREFETCH_POOL_WORKERS)
+                   (작업이 specialist 풀 완료를 기다리므로 다른 풀과 분리)
+
+[NEW] 세션 토큰은 호출마다 고유하게 만듭니다 (new_session). 같은 스레드의 동시 호출이
+cancel_session()으로 서로의 대기 작업을 취소하지 않도록 하기 위함입니다.
+
+사용 예시:
+    from agents.specialist_executor import get_specialist_executor, new_session
+
+    executor = get_specialist_executor()
+    session = new_session("thread-123")
+    future = executor.submit(session, agent.run, **kwargs)
+    executor.metrics()  # {"queued": 3, "busy": 8, ...}
+"""
+
+import contextvars
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.file_logger import get_file_logger
+
+logger = get_file_logger()
+
+
+class SpecialistExecutor:
+    """
+    고정 크기 워커 풀 + 세션별 FIFO 대기열 (라운드 로빈 공정 분배)
+
+    Args:
+        max_workers: 워커 스레드 수 (None이면 settings.SPECIALIST_POOL_WORKERS)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, name: str = "specialist"):
+        if max_workers is None:
+            from utils.settings import settings
+            max_workers = settings.SPECIALIST_POOL_WORKERS
+        self.max_workers = max(1, int(max_workers))
+        self.name = name
+
+        # session_id -> deque[(future, fn, args, kwargs, enqueued_at)]
+        self._queues: "OrderedDict[str, deque]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._workers = []
+        self._shutdown = False
+
+        # 지표
+        self._busy = 0
+        self._submitted = 0
+        self._completed = 0
+        self._max_queue_depth = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+
+    # -------------------------------------------------------------------------
+    # 작업 제출 / 처리
+    # -------------------------------------------------------------------------
+
+    def submit(self, session_id: str, fn: Callable, *args, **kwargs) -> Future:
+        """세션 대기열에 작업 추가 (워커는 필요 시 지연 생성)"""
+        future: Future = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("SpecialistExecutor가 종료되었습니다.")
+            queue = self._queues.setdefault(session_id, deque())
+            queue.append((future, fn, args, kwargs, time.perf_counter()))
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued_count())
+            if len(self._workers) < self.max_workers and self._busy + self._queued_count() > len(self._workers):
+                self._start_worker()
+            self._cond.notify()
+        return future
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name=f"{self.name}-worker-{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _queued_count(self) -> int:
+        return sum(len(q) for q in self._queues.values())
+
+    def _next_task(self):
+        """라운드 로빈: 가장 앞 세션에서 1개를 꺼내고 그 세션을 맨 뒤로 보냄"""
+        for session_id in list(self._queues):
+            queue = self._queues[session_id]
+            if not queue:
+                del self._queues[session_id]
+                continue
+            task = queue.popleft()
+            if queue:
+                self._queues.move_to_end(session_id)
+            else:
+                del self._queues[session_id]
+            return task
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                task = self._next_task()
+                while task is None:
+                    if self._shutdown:
+                        return
+                    self._cond.wait()
+                    task = self._next_task()
+                future, fn, args, kwargs, enqueued_at = task
+                wait_ms = (time.perf_counter() - enqueued_at) * 1000
+                self._total_wait_ms += wait_ms
+                self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+                self._busy += 1
+
+            try:
+                # 대기 중 취소된 작업(타임아웃 Fallback 등)은 실행하지 않음
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                with self._cond:
+                    self._busy -= 1
+                    self._completed += 1
+
+    def cancel_session(self, session_id: str) -> int:
+        """세션의 대기 중 작업 취소 (실행 중 작업은 영향 없음)"""
+        with self._cond:
+            queue = self._queues.pop(session_id, None) or deque()
+        for future, *_ in queue:
+            future.cancel()
+        return len(queue)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """워커 종료 (대기 중 작업은 취소)"""
+        with self._cond:
+            self._shutdown = True
+            sessions = list(self._queues)
+            self._cond.notify_all()
+        for session_id in sessions:
+            self.cancel_session(session_id)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    # -------------------------------------------------------------------------
+    # 지표
+    # -------------------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        """대기열/워커 지표 스냅샷"""
+        with self._cond:
+            started = self._completed + self._busy
+            return {
+                "pool": self.name,
+                "max_workers": self.max_workers,
+                "workers": len(self._workers),
+                "busy": self._busy,
+                "queued": self._queued_count(),
+                "queued_by_session": {sid: len(q) for sid, q in self._queues.items()},
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "max_queue_depth": self._max_queue_depth,
+                "avg_queue_wait_ms": round(self._total_wait_ms / started, 2) if started else 0.0,
+                "max_queue_wait_ms": round(self._max_wait_ms, 2),
+            }
+
+
+# =============================================================================
+# 전역 인스턴스
+# =============================================================================
+
+POOL_SPECIALIST = "specialist"
+POOL_FANOUT = "fanout"
+POOL_TOOLS = "tools"
+POOL_BACKGROUND = "background"
+POOL_PREFETCH = "prefetch"
+
+# 풀 이름 → 워커 수 설정 필드
+_POOL_WORKER_SETTINGS = {
+    POOL_SPECIALIST: "SPECIALIST_POOL_WORKERS",
+    POOL_FANOUT: "FANOUT_POOL_WORKERS",
+    POOL_TOOLS: "TOOL_POOL_WORKERS",
+    POOL_BACKGROUND: "BACKGROUND_POOL_WORKERS",
+    POOL_PREFETCH: "PREFETCH_POOL_WORKERS",
+}
+
+_executors: Dict[str, SpecialistExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def get_executor(pool: str = POOL_SPECIALIST) -> SpecialistExecutor:
+    """용도별 프로세스 전역 실행기 반환 (최초 호출 시 생성)"""
+    if pool not in _POOL_WORKER_SETTINGS:
+        raise ValueError(f"알 수 없는 실행기 풀: {pool}")
+    with _executor_lock:
+        executor = _executors.get(pool)
+        if executor is None:
+            from utils.settings import settings
+            executor = SpecialistExecutor(getattr(settings, _POOL_WORKER_SETTINGS[pool]), name=pool)
+            _executors[pool] = executor
+            logger.info(f"[SpecialistExecutor] {pool} 워커 풀 생성 (max_workers={executor.max_workers})")
+        return executor
+
+
+def get_specialist_executor() -> SpecialistExecutor:
+    """전문 에이전트 실행기 반환 (최초 호출 시 생성)"""
+    return get_executor(POOL_SPECIALIST)
+
+
+def executor_metrics() -> Dict[str, Dict[str, Any]]:
+    """생성된 모든 풀의 지표 스냅샷 {풀 이름: metrics()}"""
+    with _executor_lock:
+        executors = dict(_executors)
+    return {pool: executor.metrics() for pool, executor in executors.items()}
+
+
+def reset_specialist_executor() -> None:
+    """전역 실행기(모든 풀) 종료 후 초기화 (설정 변경/테스트용)"""
+    with _executor_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=False)
+        _executors.clear()
+
+
+def new_session(owner: Optional[str] = None) -> str:
+    """호출 단위 고유 세션 토큰 (owner는 지표 식별용 접두사, 보통 thread_id:단계)"""
+    suffix = uuid.uuid4().hex[:8]
+    return f"{owner}:{suffix}" if owner else suffix
+
+
+# =============================================================================
+# [NEW] 동시 실행 헬퍼 (Writer 분할 작성 / Reviewer 섹션 심사 등 요청 내부 fan-out)
+# =============================================================================
+
+def run_bounded(
+    session_id: Optional[str], calls: List[tuple], parallelism: int, pool: str = POOL_FANOUT
+) -> List[Any]:
+    """
+    용도별 실행기로 호출들을 동시에 실행 (최대 parallelism개씩, 완료되는 대로 다음 호출 제출)
+
+    Args:
+        session_id: 세션 토큰 접두사 (호출마다 고유 토큰을 붙이므로 동시 호출끼리 취소하지 않음)
+        calls: (fn, *args) 튜플 목록
+        parallelism: 동시 실행 상한
+        pool: 실행기 풀 (기본값: fanout - 전문 에이전트 풀과 분리)
+
+    Returns:
+        List[Any]: 입력 순서대로 정렬된 결과
+
+    Raises:
+        Exception: 실패한 호출의 예외 (아직 시작하지 않은 호출은 취소)
+    """
+    executor = get_executor(pool)
+    session = new_session(session_id)
+    parallelism = max(1, min(parallelism, len(calls)))
+    results: Dict[int, Any] = {}
+    running: Dict[Future, int] = {}
+    next_call = 0
+    try:
+        while next_call < len(calls) or running:
+            while next_call < len(calls) and len(running) < parallelism:
+                fn, *args = calls[next_call]
+                future = executor.submit(session, contextvars.copy_context().run, fn, *args)
+                running[future] = next_call
+                next_call += 1
+
+            completed, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in completed:
+                results[running.pop(future)] = future.result()
+    finally:
+        # 실패 시 아직 시작하지 않은 호출은 취소
+        executor.cancel_session(session)
+
+    return [results[i] for i in range(len(calls))]
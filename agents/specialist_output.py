@@ -0,0 +1,224 @@
+"""
+PlanCraft - 전문 에이전트 Structured Output 호출 및 부분 파싱
+
+전문 에이전트는 자유형식 응답에서 ```json 블록을 정규식으로 찾아 json.loads 하던 방식 대신
+스키마에 바인딩된 호출(with_structured_output, function calling)로 결과를 받습니다.
+
+처리 순서:
+    1. 스키마 파서 성공 → 검증된 결과 사용 (structured)
+    2. 파서 실패 → 같은 응답(도구 호출 인자 → 본문 순)에서 부분 JSON 복구 (partial)
+       - 잘린 JSON, 코드 펜스, 앞뒤 설명 문장 허용 (langchain_core parse_json_markdown)
+       - 검증에 실패한 최상위 필드만 에이전트 Fallback 값으로 채움 → 캐시 제외
+    3. 복구 불가 → 에이전트 Fallback 전체 사용 (failed, 캐시 제외)
+
+파싱 실패는 재요청하지 않습니다. 같은 프롬프트 재호출은 왕복 비용만 늘리고,
+응답의 대부분은 부분 복구로 살릴 수 있기 때문입니다.
+
+function calling 방식을 사용하는 이유: BMAgent.revenue_mix 같은 자유 키 dict는
+strict json_schema 모드에서 표현할 수 없습니다.
+
+지표:
+    specialist_parse_stats.snapshot() → 에이전트별 structured/partial/failed 횟수
+    결과의 PARSE_STATUS_KEY → Supervisor가 AgentExecutionStats.parse_status로 기록
+
+사용 예시:
+    from agents.specialist_output import invoke_structured
+
+    result = invoke_structured(
+        self.llm, MarketAnalysis, messages,
+        agent_name=self.name,
+        fallback=lambda: self._get_fallback_analysis(service_overview),
+    )
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.runnables import RunnableSequence
+from langchain_core.utils.json import parse_json_markdown
+from pydantic import BaseModel, ValidationError
+
+from agents.specialist_cache import mark_uncacheable
+from utils.deadline import invoke_with_deadline
+from utils.file_logger import get_file_logger
+
+logger = get_file_logger()
+
+# 결과 dict에 남기는 파싱 상태 표시 (Supervisor가 pop_parse_status로 제거)
+PARSE_STATUS_KEY = "_parse_status"
+
+PARSE_STRUCTURED = "structured"
+PARSE_PARTIAL = "partial"
+PARSE_FAILED = "failed"
+
+
+class SpecialistParseStats:
+    """에이전트별 파싱 결과 카운터 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent_name: str, status: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(
+                agent_name, {PARSE_STRUCTURED: 0, PARSE_PARTIAL: 0, PARSE_FAILED: 0}
+            )
+            counts[status] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """에이전트별 {structured, partial, failed, parse_failures}"""
+        with self._lock:
+            return {
+                name: {**counts, "parse_failures": counts[PARSE_PARTIAL] + counts[PARSE_FAILED]}
+                for name, counts in self._counts.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+# 전역 파싱 통계 (/metrics/specialists 노출)
+specialist_parse_stats = SpecialistParseStats()
+
+
+def pop_parse_status(result: Any) -> Optional[str]:
+    """결과에서 파싱 상태 표시를 제거하고 반환 (표시가 없으면 None)"""
+    if isinstance(result, dict):
+        return result.pop(PARSE_STATUS_KEY, None)
+    return None
+
+
+# =============================================================================
+# 내부 헬퍼
+# =============================================================================
+
+def _split_structured_runnable(structured) -> Tuple[Any, Any]:
+    """with_structured_output 결과를 (모델 호출, 파서)로 분리 (파서 실패 시 원본 응답 확보용)"""
+    if isinstance(structured, RunnableSequence) and len(structured.steps) >= 2:
+        rest = structured.steps[1:]
+        return structured.steps[0], rest[0] if len(rest) == 1 else RunnableSequence(*rest)
+    return structured, None
+
+
+def _candidate_payloads(message: Any) -> List[Any]:
+    """부분 복구 후보: 도구 호출 인자 → 잘못된 도구 호출 인자(문자열) → 본문"""
+    candidates: List[Any] = []
+    for call in getattr(message, "tool_calls", None) or []:
+        candidates.append(call.get("args"))
+    for call in getattr(message, "invalid_tool_calls", None) or []:
+        candidates.append(call.get("args"))
+
+    content = getattr(message, "content", message)
+    if isinstance(content, list):
+        content = "".join(
+            part.get("text", "") if isinstance(part, dict) else str(part) for part in content
+        )
+    candidates.append(content)
+    return candidates
+
+
+def _parse_partial(payload: Any) -> Optional[Dict[str, Any]]:
+    """잘린/코드 펜스/설명 문장이 섞인 JSON 문자열에서 최상위 객체 복구"""
+    if isinstance(payload, dict):
+        return payload or None
+    if not isinstance(payload, str) or "{" not in payload:
+        return None
+
+    for text in (payload, payload[payload.find("{"):]):
+        try:
+            data = parse_json_markdown(text)
+        except Exception:
+            continue
+        if isinstance(data, dict) and data:
+            return data
+    return None
+
+
+def _merge_with_fallback(
+    schema: type, data: Dict[str, Any], fallback: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    부분 결과 검증: 누락/무효 최상위 필드만 Fallback 값으로 대체
+
+    Returns:
+        (결과 dict, Fallback으로 채운 필드 목록)
+    """
+    try:
+        return schema.model_validate(data).model_dump(), []
+    except ValidationError as e:
+        invalid = {err["loc"][0] for err in e.errors() if err.get("loc")}
+
+    merged = {k: v for k, v in data.items() if k in schema.model_fields and k not in invalid}
+    filled = []
+    for name in schema.model_fields:
+        if name not in merged and name in fallback:
+            merged[name] = fallback[name]
+            filled.append(name)
+    return merged, filled
+
+
+# =============================================================================
+# 공개 API
+# =============================================================================
+
+def invoke_structured(
+    llm,
+    schema: type,
+    messages: List[Any],
+    agent_name: str,
+    fallback: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    스키마 바인딩 호출 + 부분 파싱 (현재 마감시간을 요청 timeout으로 전달)
+
+    Args:
+        llm: Chat 모델 (AzureChatOpenAI / FakeChatModel)
+        schema: 출력 Pydantic 스키마
+        messages: 프롬프트 메시지
+        agent_name: 통계/로그용 에이전트 이름
+        fallback: 복구 불가 필드를 채울 Fallback 결과 생성 함수
+
+    Returns:
+        Dict: 결과 (부분 복구/Fallback이면 PARSE_STATUS_KEY 포함)
+
+    Raises:
+        DeadlineExceeded 및 LLM 호출 오류는 호출자(에이전트)에게 그대로 전파됩니다.
+    """
+    structured = llm.with_structured_output(schema, method="function_calling")
+    model_step, parser = _split_structured_runnable(structured)
+    raw = invoke_with_deadline(model_step, messages)
+
+    parsed = raw
+    if parser is not None:
+        try:
+            parsed = parser.invoke(raw)
+        except Exception as e:
+            logger.warning(f"[{agent_name}] Structured Output 파싱 실패, 부분 복구 시도: {e}")
+            parsed = None
+
+    if isinstance(parsed, BaseModel):
+        specialist_parse_stats.record(agent_name, PARSE_STRUCTURED)
+        return parsed.model_dump()
+
+    # 부분 복구 (재요청 없음)
+    for payload in _candidate_payloads(raw):
+        data = _parse_partial(payload)
+        if data is None:
+            continue
+        result, filled = _merge_with_fallback(schema, data, fallback())
+        specialist_parse_stats.record(agent_name, PARSE_PARTIAL)
+        if filled:
+            logger.warning(f"[{agent_name}] 부분 복구: Fallback으로 채운 필드 {filled}")
+            mark_uncacheable(result)
+        else:
+            logger.warning(f"[{agent_name}] 부분 복구: 응답 본문에서 전체 필드 복구")
+        result[PARSE_STATUS_KEY] = PARSE_PARTIAL
+        return result
+
+    logger.error(f"[{agent_name}] 응답에서 JSON을 찾지 못해 Fallback 사용")
+    specialist_parse_stats.record(agent_name, PARSE_FAILED)
+    result = mark_uncacheable(fallback())
+    result[PARSE_STATUS_KEY] = PARSE_FAILED
+    return result
@@ -0,0 +1,180 @@
+"""
+PlanCraft - 전문 에이전트 결과 스트림 (Supervisor → Writer 파이프라인)
+
+Supervisor가 에이전트 결과를 모두 모은 뒤 Writer가 시작하는 2단계 직렬 실행 대신,
+에이전트가 끝날 때마다 결과를 스트림에 게시하고 Writer는 섹션에 필요한 결과가
+준비되는 대로 해당 섹션부터 작성합니다. (예: financial이 실행 중이어도 시장 분석 섹션 작성)
+
+- 게시: NativeSupervisor._execute_plan (성공/캐시 적중/Fallback 시점)
+- 소비: agents/writer.py _write_with_specialist_stream → _write_sections_as_ready
+        (섹션 → 필요 결과 키: agent_config.map_sections_to_result_keys)
+- 종료: supervisor_node가 전체 결과(integrated_context 포함)로 finish() 또는 fail()
+
+그래프 상태에는 직렬화 가능한 stream_id(specialist_stream_id)만 저장하고,
+스트림 객체는 프로세스 내 레지스트리에서 조회합니다. (프로세스 재시작 등으로 스트림이 없으면
+run_specialists 노드가 기존처럼 동기 실행)
+
+사용 예시:
+    from agents.specialist_stream import open_specialist_stream, get_specialist_stream
+
+    stream = open_specialist_stream()
+    supervisor.run(..., result_stream=stream)        # 백그라운드
+    stream.finish(results)
+
+    stream = get_specialist_stream(stream_id)         # Writer
+    if stream.wait_ready(["market_analysis"], timeout=60):
+        partial = stream.snapshot(["market_analysis"])
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from utils.file_logger import get_file_logger
+
+logger = get_file_logger()
+
+# 레지스트리 상한 (Writer까지 진행하지 못한 세션의 스트림 누수 방지)
+MAX_OPEN_STREAMS = 64
+
+
+class SpecialistResultStream:
+    """
+    에이전트 결과를 완료 순서대로 게시/대기하는 스레드 안전 스트림
+
+    결과 키가 "준비됨"인 경우:
+    - 해당 키의 결과가 게시됨
+    - 계획(set_planned)에 없는 키 (실행되지 않으므로 기다릴 필요 없음)
+    - 스트림이 종료됨 (finish/fail)
+    """
+
+    def __init__(self, stream_id: Optional[str] = None):
+        self.stream_id = stream_id or f"stream-{uuid.uuid4().hex[:12]}"
+        self._cond = threading.Condition()
+        self._results: Dict[str, Any] = {}
+        self._planned: Optional[set] = None
+        self._final: Optional[Dict[str, Any]] = None
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._version = 0  # 게시/계획/종료 시 증가 (변경 대기용)
+
+    # -------------------------------------------------------------------------
+    # 게시 (Supervisor)
+    # -------------------------------------------------------------------------
+
+    def set_planned(self, result_keys: Iterable[str]) -> None:
+        """실행 계획에 포함된 결과 키 (계획 밖의 키는 즉시 준비됨으로 간주)"""
+        with self._cond:
+            self._planned = set(result_keys)
+            self._version += 1
+            self._cond.notify_all()
+
+    def publish(self, result_key: str, result: Any) -> None:
+        with self._cond:
+            self._results[result_key] = result
+            self._version += 1
+            self._cond.notify_all()
+
+    def finish(self, final_results: Dict[str, Any]) -> None:
+        """전체 결과로 스트림 종료 (specialist_analysis 형식)"""
+        with self._cond:
+            self._final = final_results
+            self._closed = True
+            self._version += 1
+            self._cond.notify_all()
+
+    def fail(self, error: BaseException) -> None:
+        with self._cond:
+            self._error = error
+            self._closed = True
+            self._version += 1
+            self._cond.notify_all()
+
+    # -------------------------------------------------------------------------
+    # 소비 (Writer)
+    # -------------------------------------------------------------------------
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def _is_ready(self, key: str) -> bool:
+        if self._closed or key in self._results:
+            return True
+        return self._planned is not None and key not in self._planned
+
+    def ready(self, result_keys: Iterable[str]) -> bool:
+        with self._cond:
+            return all(self._is_ready(k) for k in result_keys)
+
+    def wait_ready(self, result_keys: Iterable[str], timeout: Optional[float] = None) -> bool:
+        """모든 키가 준비될 때까지 대기 (timeout 초과 시 False)"""
+        keys = list(result_keys)
+        with self._cond:
+            return self._cond.wait_for(lambda: all(self._is_ready(k) for k in keys), timeout)
+
+    def wait_for_change(self, version: int, timeout: Optional[float] = None) -> bool:
+        """version 이후 게시/계획/종료 변경이 생길 때까지 대기 (timeout 초과 시 False)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._version != version, timeout)
+
+    def snapshot(self, result_keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """게시된 결과 (키 지정 시 해당 키만)"""
+        with self._cond:
+            if result_keys is None:
+                return dict(self._results)
+            return {k: self._results[k] for k in result_keys if k in self._results}
+
+    def result(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        전체 결과 대기
+
+        Returns:
+            finish()로 전달된 결과, 실패/시간 초과 시 None
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._closed, timeout):
+                logger.warning(f"[SpecialistStream] {self.stream_id} 전체 결과 대기 시간 초과")
+                return None
+            if self._error is not None:
+                logger.warning(f"[SpecialistStream] {self.stream_id} 실패: {self._error}")
+                return None
+            return self._final
+
+
+# =============================================================================
+# 프로세스 내 레지스트리 (상태에는 stream_id만 저장)
+# =============================================================================
+
+_streams: "OrderedDict[str, SpecialistResultStream]" = OrderedDict()
+_streams_lock = threading.Lock()
+
+
+def open_specialist_stream() -> SpecialistResultStream:
+    """새 스트림 생성 및 등록 (상한 초과 시 가장 오래된 스트림 제거)"""
+    stream = SpecialistResultStream()
+    with _streams_lock:
+        _streams[stream.stream_id] = stream
+        while len(_streams) > MAX_OPEN_STREAMS:
+            _streams.popitem(last=False)
+    return stream
+
+
+def get_specialist_stream(stream_id: Optional[str]) -> Optional[SpecialistResultStream]:
+    if not stream_id:
+        return None
+    with _streams_lock:
+        return _streams.get(stream_id)
+
+
+def release_specialist_stream(stream_id: Optional[str]) -> None:
+    """소비 완료된 스트림 등록 해제"""
+    if not stream_id:
+        return
+    with _streams_lock:
+        _streams.pop(stream_id, None)
@@ -10,6 +10,11 @@ PlanCraft - Business Model Agent (비즈니스 모델 에이전트)
 from typing import Dict, Any, List
 from pydantic import BaseModel, Field
 from utils.llm import get_llm
+from utils.deadline import DeadlineExceeded
+from utils.error_handler import is_retryable_error
+from agents.specialist_cache import mark_uncacheable
+from agents.specialist_output import invoke_structured
+from utils.evidence_bundle import format_evidence_section
 from utils.file_logger import get_file_logger
 
 logger = get_file_logger()
@@ -42,7 +47,7 @@ class BusinessModelAnalysis(BaseModel):
     primary_model: RevenueModel = Field(description="메인 수익 모델")
     secondary_models: List[RevenueModel] = Field(description="보조 수익 모델들")
     pricing_tiers: List[PricingTier] = Field(description="가격 계층")
-    revenue_mix: Dict[str, int] = Field(description="수익 믹스 (1년차/3년차)")
+    revenue_mix: Dict[str, Dict[str, int]] = Field(description="수익 믹스 (year1/year3 → 수익원별 비중 %)")
     moat: str = Field(description="해자 (경쟁 우위)")
 
 
@@ -65,7 +70,8 @@ class BMAgent:
         self,
         service_overview: str,
         target_users: str,
-        competitors: List[Dict[str, Any]] = None
+        competitors: List[Dict[str, Any]] = None,
+        evidence: str = ""  # [NEW] 근거 번들 렌더링
     ) -> Dict[str, Any]:
         """
         비즈니스 모델을 분석합니다.
@@ -74,6 +80,7 @@ class BMAgent:
             service_overview: 서비스 개요
             target_users: 타겟 사용자
             competitors: 경쟁사 정보 (Market Agent 출력)
+            evidence: 근거 자료 (Supervisor가 근거 번들을 에이전트 예산으로 렌더링)
             
         Returns:
             BusinessModelAnalysis dict
@@ -95,6 +102,7 @@ class BMAgent:
             target_users=target_users,
             competitors_info=competitors_str or "(경쟁사 정보 없음)"
         )
+        user_prompt += format_evidence_section(evidence)  # [NEW] 근거 번들
         
         messages = [
             {"role": "system", "content": BM_SYSTEM_PROMPT},
@@ -102,29 +110,28 @@ class BMAgent:
         ]
         
         try:
-            response = self.llm.invoke(messages)
-            content = response.content if hasattr(response, 'content') else str(response)
-            
-            import json
-            import re
-            
-            json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = content
-            
-            result = json.loads(json_str)
-            
+            # [NEW] 스키마 바인딩 호출 + 부분 파싱 (파싱 실패 시 재요청 없이 부분 복구/Fallback)
+            result = invoke_structured(
+                self.llm, BusinessModelAnalysis, messages,
+                agent_name=self.name,
+                fallback=lambda: self._get_fallback_bm(service_overview),
+            )
+
             logger.info(f"[{self.name}] 비즈니스 모델 분석 완료")
             logger.debug(f"  - 메인 모델: {result.get('primary_model', {}).get('name', 'N/A')}")
             logger.debug(f"  - 가격 계층: {len(result.get('pricing_tiers', []))}개")
             
             return result
             
+        except DeadlineExceeded:
+            # [NEW] 마감시간 초과는 Supervisor가 Fallback 처리 (내부 Fallback 생략)
+            raise
         except Exception as e:
+            # [NEW] LLM/네트워크 오류는 Supervisor 에러 분류/재시도로 전달 (그 외만 자체 Fallback)
+            if is_retryable_error(e):
+                raise
             logger.error(f"[{self.name}] 비즈니스 모델 분석 실패: {e}")
-            return self._get_fallback_bm(service_overview)
+            return mark_uncacheable(self._get_fallback_bm(service_overview))
     
     def _get_fallback_bm(self, service_overview: str) -> Dict[str, Any]:
         """Fallback 비즈니스 모델"""
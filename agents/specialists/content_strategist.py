@@ -19,6 +19,11 @@ from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 from langchain_core.messages import SystemMessage, HumanMessage
 from utils.llm import get_llm
+from utils.deadline import DeadlineExceeded
+from utils.error_handler import is_retryable_error
+from agents.specialist_cache import mark_uncacheable
+from agents.specialist_output import invoke_structured
+from utils.evidence_bundle import format_evidence_section
 from utils.file_logger import get_file_logger
 import json
 
@@ -107,7 +112,8 @@ class ContentStrategistAgent:
         self,
         service_overview: str,
         target_users: str = "",
-        market_analysis: Dict[str, Any] = None
+        market_analysis: Dict[str, Any] = None,
+        evidence: str = ""  # [NEW] 근거 번들 렌더링
     ) -> Dict[str, Any]:
         """
         콘텐츠/브랜딩 전략을 수립합니다.
@@ -116,6 +122,7 @@ class ContentStrategistAgent:
             service_overview: 서비스 개요
             target_users: 타겟 사용자
             market_analysis: Market Agent 출력 (타겟 정보)
+            evidence: 근거 자료 (Supervisor가 근거 번들을 에이전트 예산으로 렌더링)
 
         Returns:
             ContentStrategy dict
@@ -135,7 +142,7 @@ class ContentStrategistAgent:
 
 ## 시장 배경
 {market_context or "(시장 분석 데이터 없음)"}
-
+{format_evidence_section(evidence)}
 위 내용을 바탕으로 매력적인 콘텐츠 및 브랜딩 전략을 수립해주세요.
 반드시 JSON 형식으로 출력하세요.
 """
@@ -146,18 +153,12 @@ class ContentStrategistAgent:
         ]
 
         try:
-            response = self.llm.invoke(messages)
-            content = response.content if hasattr(response, 'content') else str(response)
-
-            # JSON 파싱
-            import re
-            json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = content
-
-            result = json.loads(json_str)
+            # [NEW] 스키마 바인딩 호출 + 부분 파싱 (파싱 실패 시 재요청 없이 부분 복구/Fallback)
+            result = invoke_structured(
+                self.llm, ContentStrategy, messages,
+                agent_name=self.name,
+                fallback=lambda: self._get_fallback_strategy(service_overview),
+            )
 
             logger.info(f"[{self.name}] 콘텐츠 전략 수립 완료")
             brand = result.get("brand_concept", {})
@@ -166,9 +167,15 @@ class ContentStrategistAgent:
 
             return result
 
+        except DeadlineExceeded:
+            # [NEW] 마감시간 초과는 Supervisor가 Fallback 처리 (내부 Fallback 생략)
+            raise
         except Exception as e:
+            # [NEW] LLM/네트워크 오류는 Supervisor 에러 분류/재시도로 전달 (그 외만 자체 Fallback)
+            if is_retryable_error(e):
+                raise
             logger.error(f"[{self.name}] 콘텐츠 전략 수립 실패: {e}")
-            return self._get_fallback_strategy(service_overview)
+            return mark_uncacheable(self._get_fallback_strategy(service_overview))
 
     def _get_fallback_strategy(self, service_overview: str) -> Dict[str, Any]:
         """Fallback 콘텐츠 전략"""
@@ -19,6 +19,11 @@ PlanCraft - Financial Agent (재무 시뮬레이션 에이전트)
 from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
 from utils.llm import get_llm
+from utils.deadline import DeadlineExceeded
+from utils.error_handler import is_retryable_error
+from agents.specialist_cache import mark_uncacheable
+from agents.specialist_output import invoke_structured
+from utils.evidence_bundle import format_evidence_section
 from utils.file_logger import get_file_logger
 
 logger = get_file_logger()
@@ -87,7 +92,8 @@ class FinancialAgent:
         market_analysis: Dict[str, Any],
         development_scope: str = "MVP 3개월",
         analysis_depth: str = "standard",  # [FIX] 추가된 인자
-        financial_requirements: str = ""   # [FIX] 심층 분석용 추가 요구사항
+        financial_requirements: str = "",  # [FIX] 심층 분석용 추가 요구사항
+        evidence: str = ""  # [NEW] 근거 번들 렌더링
     ) -> Dict[str, Any]:
         """
         재무 계획을 생성합니다.
@@ -99,6 +105,7 @@ class FinancialAgent:
             development_scope: 개발 범위 (MVP 3개월 등)
             analysis_depth: 분석 깊이 ("standard" 또는 "deep")
             financial_requirements: 심층 분석 시 추가 요구사항
+            evidence: 근거 자료 (Supervisor가 근거 번들을 에이전트 예산으로 렌더링)
             
         Returns:
             FinancialPlan dict
@@ -117,6 +124,7 @@ class FinancialAgent:
             market_analysis=str(market_analysis),
             development_scope=development_scope
         )
+        user_prompt += format_evidence_section(evidence)  # [NEW] 근거 번들
         
         messages = [
             {"role": "system", "content": FINANCIAL_SYSTEM_PROMPT},
@@ -124,24 +132,13 @@ class FinancialAgent:
         ]
         
         try:
-            # LLM 호출
-            response = self.llm.invoke(messages)
-            content = response.content if hasattr(response, 'content') else str(response)
-            
-            # JSON 파싱
-            import json
-            import re
-            
-            # JSON 블록 추출
-            json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # JSON 블록이 없으면 전체 내용 시도
-                json_str = content
-            
-            result = json.loads(json_str)
-            
+            # [NEW] 스키마 바인딩 호출 + 부분 파싱 (파싱 실패 시 재요청 없이 부분 복구/Fallback)
+            result = invoke_structured(
+                self.llm, FinancialPlan, messages,
+                agent_name=self.name,
+                fallback=lambda: self._get_fallback_plan(service_overview),
+            )
+
             logger.info(f"[{self.name}] 재무 계획 생성 완료")
             logger.debug(f"  - 총 투자금: {result.get('total_investment', 'N/A')}")
             logger.debug(f"  - 연간 매출: {result.get('annual_revenue', 'N/A')}")
@@ -149,9 +146,15 @@ class FinancialAgent:
             
             return result
             
+        except DeadlineExceeded:
+            # [NEW] 마감시간 초과는 Supervisor가 Fallback 처리 (내부 Fallback 생략)
+            raise
         except Exception as e:
+            # [NEW] LLM/네트워크 오류는 Supervisor 에러 분류/재시도로 전달 (그 외만 자체 Fallback)
+            if is_retryable_error(e):
+                raise
             logger.error(f"[{self.name}] 재무 계획 생성 실패: {e}")
-            return self._get_fallback_plan(service_overview)
+            return mark_uncacheable(self._get_fallback_plan(service_overview))
     
     def _get_fallback_plan(self, service_overview: str) -> Dict[str, Any]:
         """Fallback 재무 계획 (LLM 실패 시)"""
@@ -20,6 +20,10 @@ PlanCraft - Market Analysis Agent (시장 분석 에이전트)
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 from utils.llm import get_llm
+from utils.deadline import DeadlineExceeded
+from utils.error_handler import is_retryable_error
+from agents.specialist_cache import mark_uncacheable
+from agents.specialist_output import invoke_structured
 from utils.file_logger import get_file_logger
 
 logger = get_file_logger()
@@ -150,36 +154,25 @@ class MarketAgent:
         ]
         
         try:
-            # 3. 실행 (Direct LLM Call)
-            response = self.llm.invoke(messages)
-            content = response.content if hasattr(response, 'content') else str(response)
+            # [NEW] 스키마 바인딩 호출 + 부분 파싱 (파싱 실패 시 재요청 없이 부분 복구/Fallback)
+            result = invoke_structured(
+                self.llm, MarketAnalysis, messages,
+                agent_name=self.name,
+                fallback=lambda: self._get_fallback_analysis(service_overview),
+            )
 
-            # 4. JSON 파싱
-            import json
-            import re
-            
-            json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = content
-            
-            # JSON 파싱 시도 (실패 시 클린업)
-            try:
-                result = json.loads(json_str)
-            except json.JSONDecodeError:
-                # 가끔 마크다운이나 잡다한 텍스트가 섞일 수 있음
-                logger.warning(f"[{self.name}] JSON 파싱 1차 실패, 클린업 후 재시도")
-                json_str = re.sub(r'^[^{]*', '', json_str) # 첫 { 앞부분 제거
-                json_str = re.sub(r'[^}]*$', '', json_str) # 마지막 } 뒷부분 제거
-                result = json.loads(json_str)
-            
             logger.info(f"[{self.name}] 시장 분석 완료")
             return result
             
+        except DeadlineExceeded:
+            # [NEW] 마감시간 초과는 Supervisor가 Fallback 처리 (내부 Fallback 생략)
+            raise
         except Exception as e:
+            # [NEW] LLM/네트워크 오류는 Supervisor 에러 분류/재시도로 전달 (그 외만 자체 Fallback)
+            if is_retryable_error(e):
+                raise
             logger.error(f"[{self.name}] 시장 분석 실패: {e}")
-            return self._get_fallback_analysis(service_overview)
+            return mark_uncacheable(self._get_fallback_analysis(service_overview))
     
     def _get_fallback_analysis(self, service_overview: str) -> Dict[str, Any]:
         """Fallback 시장 분석"""
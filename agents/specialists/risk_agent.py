@@ -10,6 +10,11 @@ PlanCraft - Risk Analysis Agent (리스크 분석 에이전트)
 from typing import Dict, Any, List
 from pydantic import BaseModel, Field
 from utils.llm import get_llm
+from utils.deadline import DeadlineExceeded
+from utils.error_handler import is_retryable_error
+from agents.specialist_cache import mark_uncacheable
+from agents.specialist_output import invoke_structured
+from utils.evidence_bundle import format_evidence_section
 from utils.file_logger import get_file_logger
 
 logger = get_file_logger()
@@ -70,7 +75,8 @@ class RiskAgent:
         self,
         service_overview: str,
         business_model: Dict[str, Any],
-        tech_stack: str = None
+        tech_stack: str = None,
+        evidence: str = ""  # [NEW] 근거 번들 렌더링
     ) -> Dict[str, Any]:
         """
         리스크 분석을 수행합니다.
@@ -79,6 +85,7 @@ class RiskAgent:
             service_overview: 서비스 개요
             business_model: BM Agent 출력
             tech_stack: 기술 스택
+            evidence: 근거 자료 (Supervisor가 근거 번들을 에이전트 예산으로 렌더링)
             
         Returns:
             RiskAnalysis dict
@@ -95,6 +102,7 @@ class RiskAgent:
             business_model=str(business_model),
             tech_stack=tech_stack or "(기술 스택 미정)"
         )
+        user_prompt += format_evidence_section(evidence)  # [NEW] 근거 번들
         
         messages = [
             {"role": "system", "content": RISK_SYSTEM_PROMPT},
@@ -102,29 +110,28 @@ class RiskAgent:
         ]
         
         try:
-            response = self.llm.invoke(messages)
-            content = response.content if hasattr(response, 'content') else str(response)
-            
-            import json
-            import re
-            
-            json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = content
-            
-            result = json.loads(json_str)
-            
+            # [NEW] 스키마 바인딩 호출 + 부분 파싱 (파싱 실패 시 재요청 없이 부분 복구/Fallback)
+            result = invoke_structured(
+                self.llm, RiskAnalysis, messages,
+                agent_name=self.name,
+                fallback=lambda: self._get_fallback_analysis(service_overview),
+            )
+
             logger.info(f"[{self.name}] 리스크 분석 완료")
             logger.debug(f"  - 리스크 수: {len(result.get('risks', []))}")
             logger.debug(f"  - 전체 위험 수준: {result.get('overall_risk_level', 'N/A')}")
             
             return result
             
+        except DeadlineExceeded:
+            # [NEW] 마감시간 초과는 Supervisor가 Fallback 처리 (내부 Fallback 생략)
+            raise
         except Exception as e:
+            # [NEW] LLM/네트워크 오류는 Supervisor 에러 분류/재시도로 전달 (그 외만 자체 Fallback)
+            if is_retryable_error(e):
+                raise
             logger.error(f"[{self.name}] 리스크 분석 실패: {e}")
-            return self._get_fallback_analysis(service_overview)
+            return mark_uncacheable(self._get_fallback_analysis(service_overview))
     
     def _get_fallback_analysis(self, service_overview: str) -> Dict[str, Any]:
         """Fallback 리스크 분석"""
@@ -19,8 +19,12 @@ from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 from langchain_core.messages import SystemMessage, HumanMessage
 from utils.llm import get_llm
+from utils.deadline import DeadlineExceeded
+from utils.error_handler import is_retryable_error
+from agents.specialist_cache import mark_uncacheable
+from agents.specialist_output import invoke_structured
+from utils.evidence_bundle import format_evidence_section
 from utils.file_logger import get_file_logger
-import json
 
 logger = get_file_logger()
 
@@ -106,7 +110,8 @@ class TechArchitectAgent:
         target_users: str = "",
         user_constraints: List[str] = None,
         focus_area: str = "IT System Architecture & API Specification",  # [FIX] 추가된 인자
-        detail_level: str = "standard"  # [FIX] 심층 분석용 추가 인자
+        detail_level: str = "standard",  # [FIX] 심층 분석용 추가 인자
+        evidence: str = ""  # [NEW] 근거 번들 렌더링
     ) -> Dict[str, Any]:
         """
         기술 아키텍처를 설계합니다.
@@ -117,6 +122,7 @@ class TechArchitectAgent:
             user_constraints: 사용자 제약사항 (기술 스택 지정 등)
             focus_area: 집중 분석 영역
             detail_level: 분석 깊이 ("standard" 또는 "high")
+            evidence: 근거 자료 (Supervisor가 근거 번들을 에이전트 예산으로 렌더링)
 
         Returns:
             TechArchitecture dict
@@ -136,7 +142,7 @@ class TechArchitectAgent:
 
 ## 제약 사항
 {constraints_str or "(없음)"}
-
+{format_evidence_section(evidence)}
 위 내용을 바탕으로 기술 아키텍처를 설계해주세요.
 반드시 JSON 형식으로 출력하세요.
 """
@@ -147,18 +153,12 @@ class TechArchitectAgent:
         ]
 
         try:
-            response = self.llm.invoke(messages)
-            content = response.content if hasattr(response, 'content') else str(response)
-
-            # JSON 파싱
-            import re
-            json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                json_str = content
-
-            result = json.loads(json_str)
+            # [NEW] 스키마 바인딩 호출 + 부분 파싱 (파싱 실패 시 재요청 없이 부분 복구/Fallback)
+            result = invoke_structured(
+                self.llm, TechArchitecture, messages,
+                agent_name=self.name,
+                fallback=lambda: self._get_fallback_architecture(service_overview),
+            )
 
             logger.info(f"[{self.name}] 기술 아키텍처 설계 완료")
             stack = result.get("recommended_stack", {})
@@ -167,9 +167,15 @@ class TechArchitectAgent:
 
             return result
 
+        except DeadlineExceeded:
+            # [NEW] 마감시간 초과는 Supervisor가 Fallback 처리 (내부 Fallback 생략)
+            raise
         except Exception as e:
+            # [NEW] LLM/네트워크 오류는 Supervisor 에러 분류/재시도로 전달 (그 외만 자체 Fallback)
+            if is_retryable_error(e):
+                raise
             logger.error(f"[{self.name}] 기술 아키텍처 설계 실패: {e}")
-            return self._get_fallback_architecture(service_overview)
+            return mark_uncacheable(self._get_fallback_architecture(service_overview))
 
     def _get_fallback_architecture(self, service_overview: str) -> Dict[str, Any]:
         """Fallback 기술 아키텍처"""
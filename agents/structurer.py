@@ -14,9 +14,13 @@ PlanCraft Agent - Structurer Agent (구조 설계자)
 from langchain_core.messages import SystemMessage, HumanMessage
 from utils.llm import get_llm
 from utils.schemas import StructureResult
-from utils.time_context import get_time_context
+from utils.prompt_layout import build_cacheable_messages
 from graph.state import PlanCraftState, update_state, ensure_dict
-from prompts.structurer_prompt import STRUCTURER_SYSTEM_PROMPT, STRUCTURER_USER_PROMPT
+from prompts.structurer_prompt import (
+    STRUCTURER_SYSTEM_PROMPT,
+    STRUCTURER_USER_INSTRUCTIONS,
+    STRUCTURER_USER_PROMPT,
+)
 from utils.file_logger import get_file_logger
 
 # LLM 초기화 (run 함수 내에서 동적으로 생성함)
@@ -95,22 +99,26 @@ def run(state: PlanCraftState) -> PlanCraftState:
         temperature=target_temp
     ).with_structured_output(StructureResult)
 
-    # 2. 프롬프트 구성 (시간 컨텍스트 주입)
-    # min_sections를 프롬프트에 동적 전달
+    # 2. 프롬프트 구성
+    # min_sections/min_key_features는 프리셋 단위 값이므로 정적 지침에 포함
+    static_instructions = STRUCTURER_USER_INSTRUCTIONS.format(
+            min_sections=preset.min_sections,
+            min_key_features=preset.min_key_features  # [NEW] 핵심 기능 수 전달
+    )
     user_msg_content = STRUCTURER_USER_PROMPT.format(
             analysis=analysis_str,
             context=context if context else "없음",
-            min_sections=preset.min_sections,
-            min_key_features=preset.min_key_features  # [NEW] 핵심 기능 수 전달
     )
     
     if feedback_msg:
         user_msg_content += feedback_msg
 
-    messages = [
-        {"role": "system", "content": get_time_context() + STRUCTURER_SYSTEM_PROMPT},
-        {"role": "user", "content": user_msg_content}
-    ]
+    # [NEW] 정적 지침 → 요청별 데이터 → 시간 컨텍스트 순서 (Prompt Prefix Cache 적중)
+    messages = build_cacheable_messages(
+        system_prompt=STRUCTURER_SYSTEM_PROMPT,
+        static_instructions=static_instructions,
+        dynamic_content=user_msg_content,
+    )
     
     # 3. LLM 호출 + Self-Reflection (최소 섹션 검증)
     # [UPDATE] 프리셋 기반 동적 설정 적용
@@ -14,12 +14,16 @@ PlanCraft - LangGraph Native Supervisor (오케스트레이터)
    - 각 전문가가 산출한 데이터를 취합하여 Writer가 활용할 수 있는 단일 컨텍스트로 가공합니다.
 """
 
-from typing import Dict, Any, List, Optional, Literal, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Literal, Union, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime
 from pydantic import BaseModel, Field
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, CancelledError, wait
+import contextvars
+import sqlite3
+import threading
+import time
 
 from utils.llm import get_llm
 from utils.file_logger import get_file_logger
@@ -31,11 +35,15 @@ from agents.supervisor_types import (
     ExecutionStats,
     LambdaAgent,
     RoutingDecision,
+    apply_routing_budget,
     detect_required_agents,
     TECH_KEYWORDS,
     CONTENT_KEYWORDS,
 )
 
+# [NEW] 호출 측 취소 신호(cancel_event) 확인 주기 (초)
+CANCEL_POLL_SEC = 0.2
+
 
 
 
@@ -144,8 +152,9 @@ class NativeSupervisor:
 **주의**: 기획서 목적이면 financial, risk를 생략하지 마세요!
 """
 
-    def __init__(self, llm=None):
+    def __init__(self, llm=None, model_type: str = "gpt-4o"):
         self.llm = llm or get_llm(temperature=0.3)
+        self.model_type = model_type  # [NEW] 에이전트 기본 모델 (비용 모델/다운그레이드 기준)
         self.router_llm = self.llm.with_structured_output(RoutingDecision)
 
         # [REFACTOR] Config 기반 에이전트 로드 (Factory Registry 활용)
@@ -163,6 +172,9 @@ class NativeSupervisor:
         # 전문 에이전트 동적 초기화
         self.agents = {}
         self._init_agents()
+        # [NEW] 예산 초과 시 경량 모델로 실행할 에이전트 인스턴스 ((에이전트ID, 모델) -> 에이전트)
+        self._downgraded_agents: Dict[tuple, Any] = {}
+        self._downgraded_lock = threading.Lock()
 
         logger.info(f"[NativeSupervisor] 초기화 완료 (에이전트 {len(self.agents)}개)")
 
@@ -186,12 +198,54 @@ class NativeSupervisor:
             except Exception as e:
                 logger.error(f"  - {agent_id} 초기화 실패: {e}")
 
+    def _get_agent(self, agent_id: str, model_type: Optional[str] = None):
+        """
+        [NEW] 실행할 에이전트 인스턴스 (model_type 지정 시 해당 모델로 생성한 인스턴스를 재사용)
+
+        다운그레이드 인스턴스 생성에 실패하면 기본 인스턴스를 사용합니다.
+        """
+        if not model_type or model_type == self.model_type:
+            return self.agents[agent_id]
+        key = (agent_id, model_type)
+        with self._downgraded_lock:
+            agent = self._downgraded_agents.get(key)
+            if agent is None:
+                try:
+                    agent = self._create_agent(agent_id, llm=get_llm(model_type=model_type, temperature=0.3))
+                except Exception as e:
+                    logger.warning(f"[NativeSupervisor] {agent_id} {model_type} 인스턴스 생성 실패, 기본 모델 사용: {e}")
+                agent = agent or self.agents[agent_id]
+                self._downgraded_agents[key] = agent
+            return agent
+
+    def _cached_root_agents(self, context: Dict) -> List[str]:
+        """
+        [NEW] 결과 캐시 적중이 예상되는 루트 에이전트 (라우팅 비용 추정용)
+
+        의존 에이전트가 없는 에이전트만 실행 전에 캐시 키를 계산할 수 있습니다.
+        """
+        from agents.agent_config import get_dependency_graph
+        from agents.specialist_cache import specialist_cache
+
+        if not specialist_cache.enabled:
+            return []
+        cached = []
+        for agent_id, deps in get_dependency_graph().items():
+            if deps or agent_id not in self.agents:
+                continue
+            agent_context = self._prepare_agent_context(agent_id, context, {})
+            if specialist_cache.contains(specialist_cache.make_key(agent_id, self.agents[agent_id], agent_context)):
+                cached.append(agent_id)
+        return cached
+
     
     def decide_required_agents(
         self,
         service_overview: str,
         purpose: str = "기획서 작성",
-        use_llm_routing: bool = False  # [REFACTOR] 기본값 False로 변경
+        use_llm_routing: bool = False,  # [REFACTOR] 기본값 False로 변경
+        budget=None,  # [NEW] 실행 예산 (RoutingBudget)
+        cached_agents: List[str] = ()
     ) -> RoutingDecision:
         """
         필요한 에이전트 결정 (규칙 기반 기본, LLM 옵션)
@@ -204,15 +258,21 @@ class NativeSupervisor:
             service_overview: 서비스 개요
             purpose: 분석 목적
             use_llm_routing: True면 LLM 사용 (기본 False)
+            budget: 실행 예산 (초과 시 다운그레이드/생략, agents/agent_cost_model.py)
+            cached_agents: 결과 캐시 적중이 예상되는 에이전트
 
         Returns:
             RoutingDecision: 라우팅 결정
         """
+        from agents.agent_cost_model import agent_cost_model
         logger.info("[NativeSupervisor] 🧭 라우팅 결정 시작...")
 
         # 규칙 기반 라우팅 (기본)
         if not use_llm_routing:
-            decision = detect_required_agents(service_overview, purpose)
+            decision = detect_required_agents(
+                service_overview, purpose,
+                budget=budget, cost_model=agent_cost_model, cached_agents=cached_agents
+            )
             logger.info(f"[NativeSupervisor] 규칙 기반 라우팅: {decision.required_analyses}")
             logger.info(f"[NativeSupervisor] 결정 이유: {decision.reasoning}")
             return decision
@@ -233,13 +293,18 @@ class NativeSupervisor:
 
         try:
             decision = self.router_llm.invoke(messages)
+            if budget is not None:
+                decision = apply_routing_budget(decision, budget, agent_cost_model, cached_agents)
             logger.info(f"[NativeSupervisor] LLM 라우팅 결정: {decision.required_analyses}")
             logger.info(f"[NativeSupervisor] 결정 이유: {decision.reasoning}")
             return decision
         except Exception as e:
             logger.warning(f"[NativeSupervisor] LLM 라우팅 실패, 규칙 기반으로 전환: {e}")
             # LLM 실패 시 규칙 기반으로 Fallback
-            return detect_required_agents(service_overview, purpose)
+            return detect_required_agents(
+                service_overview, purpose,
+                budget=budget, cost_model=agent_cost_model, cached_agents=cached_agents
+            )
     
     
     def run(
@@ -249,13 +314,19 @@ class NativeSupervisor:
         target_users: str = "",
         tech_stack: str = "React Native + Node.js",
         development_scope: str = "MVP 3개월",
-        web_search_results: List[Dict[str, Any]] = None,
+        web_search_results: Union[str, List[Dict[str, Any]]] = None,
         purpose: str = "기획서 작성",
         force_all: bool = False,
         user_constraints: List[str] = None,
         use_llm_routing: bool = False,  # [NEW] 규칙 기반 라우팅이 기본
         deep_analysis_mode: bool = False, # [NEW] 심층 분석 모드
-        event_callback: callable = None  # [NEW] 이벤트 콜백
+        event_callback: callable = None,  # [NEW] 이벤트 콜백
+        session_id: str = None,  # [NEW] 공용 실행기 공정 분배 단위 (보통 thread_id)
+        result_stream=None,  # [NEW] 완료 즉시 결과 게시 (agents/specialist_stream.py)
+        routing_budget=None,  # [NEW] 실행 예산 (agents/agent_cost_model.RoutingBudget)
+        generation_preset: str = "",  # [NEW] 실행 이력 집계 단위 (agents/agent_stats_store.py)
+        cancel_event: threading.Event = None,  # [NEW] 호출 측 취소 신호 (선행 실행 중단)
+        evidence_bundle=None  # [NEW] 근거 번들 (utils/evidence_bundle.EvidenceBundle)
     ) -> Dict[str, Any]:
         """
         전문 에이전트 실행 (Plan-and-Execute DAG)
@@ -266,11 +337,16 @@ class NativeSupervisor:
             target_users: 타겟 사용자
             tech_stack: 기술 스택
             development_scope: 개발 범위
-            web_search_results: 웹 검색 결과
+            web_search_results: 웹 검색 결과 (근거 번들 렌더링 문자열 또는 결과 목록)
             purpose: 분석 목적
             force_all: True면 모든 필수 에이전트 실행
             user_constraints: 사용자 제약 조건
             use_llm_routing: True면 LLM 기반 라우팅 (기본 False)
+            result_stream: 에이전트 완료 시마다 결과를 게시할 SpecialistResultStream (Writer 파이프라인)
+            routing_budget: 실행 예산 (초과 시 에이전트 다운그레이드/생략, 사유는 _plan.reasoning)
+            generation_preset: 생성 프리셋 이름 (실행 이력 저장 시 기록)
+            cancel_event: set()되면 실행 중 에이전트를 취소하고 CancelledError 발생
+            evidence_bundle: 근거 번들 (market 외 에이전트에 에이전트별 예산으로 렌더링해 evidence로 전달)
 
         Returns:
             Dict: 에이전트 실행 결과
@@ -279,16 +355,37 @@ class NativeSupervisor:
         logger.info("[NativeSupervisor] 전문 에이전트 오케스트레이션 시작 (DAG)")
 
         results = {}
+        context = {
+            "service_overview": service_overview,
+            "target_market": target_market,
+            "target_users": target_users,
+            "tech_stack": tech_stack,
+            "development_scope": development_scope,
+            "web_search_results": web_search_results,
+            "user_constraints": user_constraints or [],
+            "deep_analysis_mode": deep_analysis_mode, # [NEW]
+            "on_event": event_callback, # [NEW] 이벤트 콜백 전달
+            "session_id": session_id,
+            "result_stream": result_stream,
+            "model_overrides": {},  # [NEW] 에이전트ID -> 다운그레이드 모델
+            "generation_preset": generation_preset,
+            "cancel_event": cancel_event,
+            "evidence_bundle": evidence_bundle,
+            "rendered_evidence": {},  # [NEW] 에이전트ID -> 렌더링된 근거 (실행당 1회 렌더링)
+        }
 
         if force_all:
             required = ["market", "bm", "financial", "risk"]
             reasoning = "강제 전체 분석"
         else:
+            cached_agents = self._cached_root_agents(context) if routing_budget is not None else []
             decision = self.decide_required_agents(
-                service_overview, purpose, use_llm_routing=use_llm_routing
+                service_overview, purpose, use_llm_routing=use_llm_routing,
+                budget=routing_budget, cached_agents=cached_agents
             )
             required = list(decision.required_analyses)
             reasoning = decision.reasoning
+            context["model_overrides"] = dict(decision.downgraded)
 
             # [NOTE] 규칙 기반 라우팅에서는 이미 기획서 필수 에이전트가 포함됨
             # LLM 라우팅 사용 시에만 추가 검증 필요
@@ -307,26 +404,35 @@ class NativeSupervisor:
         results["_plan"] = execution_plan
         
         # 단계별 병렬 실행
-        self._execute_plan(execution_plan, results, {
-            "service_overview": service_overview,
-            "target_market": target_market,
-            "target_users": target_users,
-            "tech_stack": tech_stack,
-            "development_scope": development_scope,
-            "web_search_results": web_search_results,
-            "user_constraints": user_constraints or [],
-            "deep_analysis_mode": deep_analysis_mode, # [NEW]
-            "on_event": event_callback # [NEW] 이벤트 콜백 전달
-        })
+        self._execute_plan(execution_plan, results, context)
         
-        results["integrated_context"] = self._integrate_results(results)
+        results["integrated_context"] = self.integrate_results(results)
         
         logger.info("[NativeSupervisor] 오케스트레이션 완료")
         return results
 
     def _execute_plan(self, plan, results: Dict, context: Dict):
         """
-        실행 계획에 따라 단계별 병렬 실행 (동적 Replan 지원)
+        실행 계획에 따른 이벤트 기반 DAG 실행 (동적 Replan 지원)
+
+        [NEW] Ready-Queue 스케줄러:
+        - 단계(Kahn layer) 배리어 없이, 각 에이전트의 depends_on(config/agents.yaml)이
+          모두 끝나는 즉시 실행합니다. (예: risk는 bm만 끝나면 tech/content를 기다리지 않음)
+        - 프로세스 공용 워커 풀(agents/specialist_executor.py)에서 실행하며,
+          세션당 동시 실행 수는 MAX_PARALLEL_AGENTS로 제한합니다.
+        - 에이전트별 마감시간(agents.yaml timeout_seconds, 계획 마감 PLAN_TIMEOUT_SEC 상한) 초과 시
+          결과를 기다리지 않고 Fallback 처리합니다.
+
+        [NEW] 마감시간 전파 / 협조적 취소 (utils/deadline.py):
+        - 마감시간은 에이전트 스레드의 LLM 요청 timeout으로 전달되어 멈춘 호출도 예산 내 종료됩니다.
+        - 타임아웃 시 Deadline.cancel()로 이후 LLM 호출을 중단시킵니다.
+        - 계획 마감시간이 지나면 아직 시작하지 못한 에이전트도 즉시 Fallback 처리합니다.
+        - [NEW] context["cancel_event"]가 set()되면 실행 중 에이전트를 취소하고 CancelledError를 발생시킵니다.
+
+        [NEW] 결과 캐시 (agents/specialist_cache.py):
+        - (agent_id, 준비된 컨텍스트, 모델, 프롬프트 버전)이 같으면 실행 없이 캐시 결과를 사용합니다.
+        - 재분석(restart), 같은 주제의 다른 세션, Writer ReAct 도구 호출 간에 공유됩니다.
+        - 실행 타임라인과 Critical Path를 실행 통계(schedule)에 기록합니다.
 
         [REFACTOR] 동적 Replan 패턴 적용:
         - 에이전트 실패 시 재시도 또는 대체 전략 수립
@@ -341,10 +447,19 @@ class NativeSupervisor:
         - 각 에이전트별 시작/종료 시간, 재시도 횟수, 에러 메시지 추적
         - 전체 실행 요약 로그 출력
         """
-        from utils.error_handler import categorize_error
+        from utils.error_handler import RETRYABLE_ERROR_CATEGORIES, categorize_error
+        from utils.deadline import Deadline
+        from agents.agent_config import get_dependency_graph
+        from agents.specialist_cache import specialist_cache, strip_cache_marker
+        from agents.specialist_output import pop_parse_status
+        from agents.specialist_executor import get_specialist_executor, new_session
+        from agents.agent_stats_store import critical_path_priority, get_agent_stats_store
 
         # [NEW] 이벤트 콜백 추출
         on_event = context.get("on_event")
+        result_stream = context.get("result_stream")
+        model_overrides = context.get("model_overrides") or {}
+        cancel_event = context.get("cancel_event")
 
         # 실패한 에이전트 추적 (Replan용)
         failed_agents = []
@@ -363,63 +478,256 @@ class NativeSupervisor:
         # 설정 로드
         from utils.settings import settings
         max_workers = settings.MAX_PARALLEL_AGENTS
-        timeout = settings.AGENT_TIMEOUT_SEC
+        default_timeout = settings.AGENT_TIMEOUT_SEC
 
-        for step in plan.steps:
-            logger.info(f"--- 단계 {step.step_id}: {step.description} ---")
-            
-            # [Event] 단계 시작
+        # [NEW] 계획 내 의존성만 추출 (계획에 없는 의존 에이전트는 무시)
+        plan_agents = plan.get_all_agents()
+        dep_graph = get_dependency_graph()
+        deps = {a: [d for d in dep_graph.get(a, []) if d in plan_agents] for a in plan_agents}
+        step_of = {agent_id: step for step in plan.steps for agent_id in step.agent_ids}
+
+        # [NEW] 실행 이력 기반 스케줄링 (agents/agent_stats_store.py)
+        #   - 타임아웃: 이력 p95 기반으로 단축 (agents.yaml timeout_seconds 이하)
+        #   - 순서: 남은 Critical Path가 긴 에이전트부터 (이력 p50, 없으면 사전 추정치)
+        stats_store = get_agent_stats_store()
+        agent_timeouts: Dict[str, float] = {}
+        expected_ms: Dict[str, float] = {}
+        for agent_id in plan_agents:
+            spec = self.agent_registry.get(agent_id)
+            model_type = model_overrides.get(agent_id) or self.model_type
+            agent_timeouts[agent_id] = stats_store.suggest_timeout_sec(
+                agent_id, spec.timeout_seconds if spec else default_timeout, model_type
+            )
+            expected_ms[agent_id] = stats_store.expected_latency_ms(agent_id, model_type) or (
+                spec.expected_latency_ms if spec else 0.0
+            )
+        path_priority = critical_path_priority(plan_agents, deps, expected_ms)
+
+        # 초기화되지 않은 에이전트는 실행 없이 완료 처리 (기존 동작: 스킵)
+        done = {a for a in plan_agents if a not in self.agents}
+        waiting = [a for a in plan_agents if a in self.agents]  # 계획 순서 유지
+        if result_stream is not None:
+            # [NEW] 계획 밖의 결과 키는 Writer가 기다리지 않음
+            result_stream.set_planned(self._get_result_key(a) for a in waiting)
+        running = {}  # future -> (agent_id, is_retry, Deadline)
+        cache_keys: Dict[str, str] = {}
+        agent_tokens: Dict[str, int] = {}  # [NEW] 에이전트별 실행 토큰 (_run_agent가 기록)
+        started_steps = set()
+        timeline: Dict[str, Dict[str, float]] = {}
+        plan_start = time.perf_counter()
+        plan_deadline = plan_start + settings.PLAN_TIMEOUT_SEC
+
+        def elapsed_ms() -> float:
+            return (time.perf_counter() - plan_start) * 1000
+
+        def agent_budget(agent_id: str) -> float:
+            # [NEW] 에이전트별 예산 (config/agents.yaml의 timeout_seconds, 이력이 있으면 p95 기반 단축)
+            return agent_timeouts.get(agent_id, default_timeout)
+
+        def submit(agent_id: str, is_retry: bool = False, agent_context: Dict = None):
+            # 실행 컨텍스트 준비 (의존 에이전트 결과 포함)
+            if agent_context is None:
+                agent_context = self._prepare_agent_context(agent_id, context, results)
+            deadline = Deadline.after(agent_budget(agent_id), cap=plan_deadline)
+            # [NEW] 컨텍스트 복사: 콜백(토큰 집계) 전파 + 에이전트 귀속
+            future = executor.submit(
+                session_id,
+                contextvars.copy_context().run,
+                self._run_agent, agent_id, agent_context, deadline,
+                model_overrides.get(agent_id), agent_tokens
+            )
+            running[future] = (agent_id, is_retry, deadline)
+
+        def timeout_message(deadline: Deadline) -> str:
+            if deadline.expires_at >= plan_deadline:
+                return f"계획 마감시간 초과 ({settings.PLAN_TIMEOUT_SEC}초)"
+            return f"실행 시간 초과 ({deadline.budget_sec}초)"
+
+        def finish(agent_id: str):
+            done.add(agent_id)
+            now_ms = elapsed_ms()
+            timeline.setdefault(agent_id, {"start_ms": now_ms})["end_ms"] = now_ms
+            # [NEW] 완료 즉시 게시 (성공/캐시 적중/Fallback 공통)
+            if result_stream is not None:
+                result_key = self._get_result_key(agent_id)
+                result_stream.publish(result_key, results.get(result_key))
+
+        def use_fallback(agent_id: str, error_msg: str, error_category: str):
+            agent_stats = stats.get_agent_stats(agent_id)
+            failed_agents.append(agent_id)
+            agent_stats.record_end(success=False)
+            agent_stats.fallback_used = True
+
+            # [NEW] Fallback 데이터 사용
+            fallback = self._get_fallback_result(agent_id, context)
+            results[self._get_result_key(agent_id)] = {
+                "error": error_msg,
+                "error_category": error_category,
+                "agent_id": agent_id,
+                "fallback_used": True,
+                "retry_count": agent_stats.retry_count,
+                **fallback
+            }
+            finish(agent_id)
+
+            # [Event] Fallback 사용
             if on_event:
                 on_event({
-                    "type": "step_start",
-                    "step_id": step.step_id,
-                    "description": step.description,
-                    "agents": step.agent_ids
+                    "type": "agent_fallback",
+                    "agent_id": agent_id,
+                    "reason": fallback.get("_fallback_reason")
                 })
 
-            # 병렬 실행을 위한 Future 목록
-            futures = {}
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                for agent_id in step.agent_ids:
-                    if agent_id in self.agents:
-                        # [NEW] 에이전트 통계 시작
-                        agent_stats = stats.get_agent_stats(agent_id)
-                        agent_stats.record_start()
-                        
-                        # [Event] 에이전트 시작
+        # [NEW] 공용 실행기 (세션별 라운드 로빈, 요청마다 스레드 풀 생성하지 않음)
+        #       세션 토큰은 실행마다 고유 (같은 스레드의 예측 실행/본 실행이 서로 취소하지 않도록)
+        executor = get_specialist_executor()
+        session_id = new_session(context.get("session_id") or stats.plan_id)
+        try:
+            while waiting or running:
+                cache_progress = False
+
+                # [NEW] 호출 측 취소 (예: 선행 실행 중 구조 설계 실패): 실행 중 에이전트 중단
+                if cancel_event is not None and cancel_event.is_set():
+                    for future, (_, _, deadline) in running.items():
+                        deadline.cancel()
+                        future.cancel()
+                    raise CancelledError("전문 에이전트 분석 취소 (호출 측 요청)")
+
+                # 0. [NEW] 계획 마감시간 초과: 시작하지 못한 에이전트는 즉시 Fallback
+                if waiting and time.perf_counter() >= plan_deadline:
+                    for agent_id in list(waiting):
+                        waiting.remove(agent_id)
+                        error_msg = f"계획 마감시간 초과 ({settings.PLAN_TIMEOUT_SEC}초), 실행 생략"
+                        logger.error(f"  ❌ [TIMEOUT_ERROR] {agent_id}: {error_msg}")
+                        use_fallback(agent_id, error_msg, "TIMEOUT_ERROR")
+                    continue
+
+                # 1. 의존성이 충족된 에이전트를 빈 워커 수만큼 시작
+                ready = [a for a in waiting if all(d in done for d in deps[a])]
+                ready.sort(key=lambda a: -path_priority.get(a, 0.0))  # [NEW] 긴 Critical Path 우선
+                for agent_id in ready[:max(0, max_workers - len(running))]:
+                    waiting.remove(agent_id)
+                    step = step_of[agent_id]
+
+                    # [Event] 단계 시작 (단계의 첫 에이전트 시작 시점, 하위호환)
+                    if step.step_id not in started_steps:
+                        started_steps.add(step.step_id)
+                        logger.info(f"--- 단계 {step.step_id}: {step.description} ---")
                         if on_event:
                             on_event({
-                                "type": "agent_start",
-                                "agent_id": agent_id,
-                                "timestamp": datetime.now().isoformat()
+                                "type": "step_start",
+                                "step_id": step.step_id,
+                                "description": step.description,
+                                "agents": step.agent_ids
                             })
 
-                        # 실행 컨텍스트 준비
-                        agent_context = self._prepare_agent_context(agent_id, context, results)
-
-                        # 비동기 제출
-                        future = executor.submit(self.agents[agent_id].run, **agent_context)
-                        futures[future] = agent_id
-                        logger.info(f"  🚀 [Running] {agent_id} (Timeout: {timeout}s)...")
+                    # [NEW] 에이전트 통계 시작
+                    agent_stats = stats.get_agent_stats(agent_id)
+                    agent_stats.record_start()
+                    agent_stats.model_type = model_overrides.get(agent_id) or self.model_type
+                    timeline[agent_id] = {"start_ms": elapsed_ms()}
+
+                    # [Event] 에이전트 시작
+                    if on_event:
+                        on_event({
+                            "type": "agent_start",
+                            "agent_id": agent_id,
+                            "timestamp": datetime.now().isoformat()
+                        })
+
+                    # [NEW] 결과 캐시 조회 (의존 에이전트 결과가 반영된 컨텍스트 기준)
+                    agent_context = self._prepare_agent_context(agent_id, context, results)
+                    cache_keys[agent_id] = specialist_cache.make_key(
+                        agent_id, self._get_agent(agent_id, model_overrides.get(agent_id)), agent_context
+                    )
+                    cached = specialist_cache.get(cache_keys[agent_id])
+                    if cached is not None:
+                        results[self._get_result_key(agent_id)] = cached
+                        agent_stats.cache_hit = True
+                        agent_stats.record_end(success=True)
+                        finish(agent_id)
+                        cache_progress = True
+                        logger.info(f"  ♻️ [Cached] {agent_id}")
+                        if on_event:
+                            on_event({
+                                "type": "agent_success",
+                                "agent_id": agent_id,
+                                "duration_ms": agent_stats.execution_time_ms,
+                                "cached": True
+                            })
+                        continue
+
+                    submit(agent_id, agent_context=agent_context)
+                    logger.info(f"  🚀 [Running] {agent_id} (Timeout: {agent_budget(agent_id)}s)...")
+
+                if not running:
+                    if cache_progress:
+                        continue  # 캐시 적중으로 새로 준비된 에이전트 시작
+                    # 의존성 순환 등으로 더 이상 진행 불가 (resolve_execution_plan_dag에서 방지됨)
+                    logger.error(f"[NativeSupervisor] 실행 불가 에이전트: {waiting}")
+                    break
+
+                # 2. 하나라도 끝나거나 가장 이른 마감시간이 될 때까지 대기
+                next_deadline = min(deadline.expires_at for _, _, deadline in running.values())
+                wait_sec = max(0.0, next_deadline - time.perf_counter())
+                if cancel_event is not None:
+                    wait_sec = min(wait_sec, CANCEL_POLL_SEC)  # [NEW] 취소 신호 확인
+                completed, _ = wait(list(running), timeout=wait_sec, return_when=FIRST_COMPLETED)
+
+                # 3. 타임아웃 처리: 결과를 기다리지 않고 Fallback
+                #    (스레드는 LLM 요청 timeout + cancel() 신호로 스스로 종료)
+                now = time.perf_counter()
+                for future in [f for f, (_, _, dl) in running.items() if f not in completed and dl.expires_at <= now]:
+                    agent_id, _, deadline = running.pop(future)
+                    deadline.cancel()
+                    future.cancel()
+                    error_msg = timeout_message(deadline)
+                    stats.get_agent_stats(agent_id).record_error(error_msg, "TIMEOUT_ERROR")
+                    logger.error(f"  ❌ [TIMEOUT_ERROR] {agent_id}: {error_msg}")
+                    if on_event:
+                        on_event({
+                            "type": "agent_error",
+                            "agent_id": agent_id,
+                            "error": error_msg,
+                            "category": "TIMEOUT_ERROR"
+                        })
+                    use_fallback(agent_id, error_msg, "TIMEOUT_ERROR")
 
-                # 완료 대기 및 결과 수집
-                for future in as_completed(futures):
-                    agent_id = futures[future]
+                # 4. 완료된 에이전트 결과 수집
+                for future in completed:
+                    agent_id, is_retry, _ = running.pop(future)
                     agent_stats = stats.get_agent_stats(agent_id)
 
                     try:
-                        # [IMPROVE] 타임아웃 적용
-                        result = future.result(timeout=timeout)
-                        
+                        result = future.result()
+
+                        # [NEW] Structured Output 파싱 상태 기록 (캐시 저장 전 표시 제거)
+                        agent_stats.parse_status = pop_parse_status(result) or "structured"
+
+                        # [NEW] 결과 캐시 저장 (에이전트 내부 Fallback 결과는 제외)
+                        specialist_cache.put(cache_keys[agent_id], result)
+                        strip_cache_marker(result)
+
                         # 결과 키 매핑 (Registry 기반)
-                        result_key = self._get_result_key(agent_id)
-                        results[result_key] = result
+                        results[self._get_result_key(agent_id)] = result
 
                         # [NEW] 성공 통계 기록
+                        agent_stats.total_tokens = agent_tokens.get(agent_id, 0)
                         agent_stats.record_end(success=True)
+                        finish(agent_id)
+
+                        if is_retry:
+                            logger.info(f"  🔄 [Retried] {agent_id} 재시도 성공 (시도 {agent_stats.retry_count}회)")
+                            # [Event] 재시도 성공
+                            if on_event:
+                                on_event({
+                                    "type": "agent_retry_success",
+                                    "agent_id": agent_id
+                                })
+                            continue
+
                         logger.info(f"  ✅ [Done] {agent_id} ({agent_stats.execution_time_ms:.0f}ms)")
-                        
+
                         # [Event] 에이전트 완료
                         if on_event:
                             on_event({
@@ -432,18 +740,18 @@ class NativeSupervisor:
                         # [REFACTOR] 에러 카테고리화 적용
                         error_category = categorize_error(e)
                         error_msg = str(e)
-                        
-                        # 타임아웃 구체화
-                        if isinstance(e, TimeoutError):
-                            error_category = "TIMEOUT_ERROR"
-                            error_msg = f"실행 시간 초과 ({timeout}초)"
 
                         # [NEW] 에러 통계 기록
                         agent_stats.record_error(error_msg, error_category)
 
+                        if is_retry:
+                            logger.warning(f"  ⚠️ [Retry Failed] {agent_id}: {error_msg}")
+                            use_fallback(agent_id, error_msg, error_category)
+                            continue
+
                         # 카테고리별 로깅
                         logger.error(f"  ❌ [{error_category}] {agent_id}: {error_msg}")
-                        
+
                         # [Event] 에이전트 에러
                         if on_event:
                             on_event({
@@ -453,93 +761,72 @@ class NativeSupervisor:
                                 "category": error_category
                             })
 
-                        # [NEW] 동적 Replan: 복구 가능한 에러는 재시도 (TIMEOUT은 재시도하지 않음)
-                        if error_category in ["LLM_ERROR", "NETWORK_ERROR"]:
-                            retry_result = self._retry_agent(agent_id, context, results, stats)
-                            if retry_result:
-                                results[self._get_result_key(agent_id)] = retry_result
-                                agent_stats.record_end(success=True)
-                                logger.info(f"  🔄 [Retried] {agent_id} 재시도 성공 (시도 {agent_stats.retry_count}회)")
-                                
-                                # [Event] 재시도 성공
-                                if on_event:
-                                    on_event({
-                                        "type": "agent_retry_success",
-                                        "agent_id": agent_id
-                                    })
-                                continue
-
-                        # 재시도 실패 또는 복구 불가 에러
-                        failed_agents.append(agent_id)
-                        agent_stats.record_end(success=False)
-                        agent_stats.fallback_used = True
-
-                        # [NEW] Fallback 데이터 사용
-                        fallback = self._get_fallback_result(agent_id, context)
-                        results[self._get_result_key(agent_id)] = {
-                            "error": error_msg,
-                            "error_category": error_category,
-                            "agent_id": agent_id,
-                            "fallback_used": True,
-                            "retry_count": agent_stats.retry_count,
-                            **fallback
-                        }
-                        
-                        # [Event] Fallback 사용
-                        if on_event:
-                            on_event({
-                                "type": "agent_fallback",
-                                "agent_id": agent_id,
-                                "reason": fallback.get("_fallback_reason")
-                            })
+                        # [NEW] 동적 Replan: 복구 가능한 에러는 1회 재시도 (다른 에이전트 실행은 계속됨)
+                        #       계획 마감시간이 지났으면 재시도하지 않음
+                        if error_category in RETRYABLE_ERROR_CATEGORIES and time.perf_counter() < plan_deadline:
+                            logger.info(f"  🔄 [Retry 1/1] {agent_id}...")
+                            submit(agent_id, is_retry=True)
+                            continue
+
+                        # 복구 불가 에러
+                        use_fallback(agent_id, error_msg, error_category)
+        finally:
+            # 타임아웃된 에이전트 스레드를 기다리지 않음 (대기 중 작업만 취소)
+            executor.cancel_session(session_id)
 
         # [NEW] 동적 Replan: 실패한 에이전트가 있으면 의존 에이전트 체크
         if failed_agents:
             self._handle_failed_dependencies(failed_agents, plan, results, context)
 
         # [NEW] 실행 통계 완료 및 로깅
+        stats.record_schedule(timeline, deps, [step.agent_ids for step in plan.steps])
         stats.record_end()
         logger.info(stats.to_summary())
 
 
         # 결과에 통계 포함
         results["_execution_stats"] = stats.to_dict()
+        results["_execution_stats"]["executor"] = executor.metrics()
+
+        # [NEW] 비용 모델 학습 (다음 라우팅의 예산 판단에 사용)
+        from agents.agent_cost_model import agent_cost_model
+        agent_cost_model.observe_execution_stats(results["_execution_stats"])
 
-    def _retry_agent(
+        # [NEW] 실행 이력 저장 (저장 실패는 실행 결과에 영향 없음)
+        try:
+            stats_store.record_execution_stats(
+                results["_execution_stats"], preset=context.get("generation_preset", "")
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"[NativeSupervisor] 실행 이력 저장 실패: {e}")
+
+    def _run_agent(
         self,
         agent_id: str,
-        context: Dict,
-        results: Dict,
-        stats: ExecutionStats = None,
-        max_retries: int = 1
-    ) -> Optional[Dict]:
+        agent_context: Dict,
+        deadline=None,
+        model_type: Optional[str] = None,
+        token_usage: Optional[Dict[str, int]] = None
+    ) -> Dict:
         """
-        실패한 에이전트 재시도 (동적 Replan 패턴)
+        에이전트 실행 (토큰 회계용 agent_scope + 마감시간 deadline_scope 적용)
 
-        Args:
-            agent_id: 재시도할 에이전트 ID
-            context: 실행 컨텍스트
-            results: 현재까지의 결과
-            stats: 실행 통계 (재시도 횟수 기록용)
-            max_retries: 최대 재시도 횟수
-
-        Returns:
-            성공 시 결과 Dict, 실패 시 None
+        agent_scope 내부의 LLM 호출은 TokenTrackingCallback에서
+        해당 agent_id로 집계됩니다.
+        [NEW] deadline_scope 내부의 LLM 호출은 남은 시간을 요청 timeout으로 사용합니다.
+        [NEW] model_type 지정 시 해당 모델 인스턴스로 실행하고, token_usage에 실행 토큰을 기록합니다.
         """
-        for attempt in range(max_retries):
+        from langchain_core.callbacks import get_usage_metadata_callback
+        from utils.deadline import deadline_scope
+        from utils.token_accounting import agent_scope
+
+        agent = self._get_agent(agent_id, model_type)
+        with agent_scope(agent_id), deadline_scope(deadline), get_usage_metadata_callback() as usage:
             try:
-                logger.info(f"  🔄 [Retry {attempt + 1}/{max_retries}] {agent_id}...")
-                agent_context = self._prepare_agent_context(agent_id, context, results)
-                result = self.agents[agent_id].run(**agent_context)
-                return result
-            except Exception as e:
-                error_msg = str(e)
-                logger.warning(f"  ⚠️ [Retry Failed] {agent_id}: {error_msg}")
-                # [NEW] 재시도 실패도 통계에 기록
-                if stats:
-                    from utils.error_handler import categorize_error
-                    stats.get_agent_stats(agent_id).record_error(error_msg, categorize_error(e))
-        return None
+                return agent.run(**agent_context)
+            finally:
+                if token_usage is not None:
+                    token_usage[agent_id] = sum(u.get("total_tokens", 0) for u in usage.usage_metadata.values())
 
     def _get_fallback_result(self, agent_id: str, context: Dict, error_msg: str = "") -> Dict:
         """
@@ -749,19 +1036,28 @@ class NativeSupervisor:
         elif agent_id == "content":
             ctx["target_users"] = base_context.get("target_users", "")
             ctx["market_analysis"] = current_results.get("market_analysis", {})
-            
+
+        # [NEW] 근거 번들을 에이전트별 예산으로 렌더링 (market은 web_search_results로 이미 전달)
+        if agent_id != "market" and base_context.get("evidence_bundle"):
+            rendered = base_context.setdefault("rendered_evidence", {})
+            if agent_id not in rendered:
+                rendered[agent_id] = base_context["evidence_bundle"].render(agent_id, kinds=("web",))
+            if rendered[agent_id]:
+                ctx["evidence"] = rendered[agent_id]
+
         return ctx
 
     # [REMOVED] _get_result_key 하드코딩 제거
     # 이제 __init__에서 agents.agent_config.get_result_key를 self._get_result_key로 바인딩
     # → AGENT_REGISTRY.result_key 필드를 사용하여 확장성 확보
         
-    def _integrate_results(self, results: Dict[str, Any]) -> str:
+    def integrate_results(self, results: Dict[str, Any]) -> str:
         """
         전문 에이전트 결과를 마크다운으로 통합 (Registry 기반 동적 통합)
         
         [REFACTOR] 하드코딩된 에이전트 순서 제거 → AGENT_REGISTRY 기반 반복 처리
         새로운 에이전트가 Registry에 추가되면 자동으로 결과에 포함됩니다.
+        [NEW] 공개 API: Writer/Reviewer 등 외부 모듈은 integrate_specialist_results() 사용
         """
         integrated = "## 전문 에이전트 분석 결과\n\n"
         
@@ -785,7 +1081,7 @@ class NativeSupervisor:
                 else:
                     # Fallback 포맷터
                     import json
-                    integrated += f"```json\n{json.dumps(result_data, ensure_ascii=False, indent=2)}\n```"
+                    integrated += f"```json\n{json.dumps(result_data, ensure_ascii=False, separators=(',', ':'))}\n```"
                 
                 integrated += "\n\n"
                 
@@ -802,7 +1098,7 @@ class NativeSupervisor:
         """
         [NEW] 비동기 실행 래퍼 (LangGraph 호환성)
         
-        NativeSupervisor.run()은 내부적으로 ThreadPoolExecutor를 사용하므로
+        NativeSupervisor.run()은 내부적으로 공용 워커 풀을 사용하므로
         CPU 바운드보다는 I/O 바운드 작업입니다. 
         asyncio.to_thread를 사용하여 메인 이벤트 루프를 차단하지 않고 실행합니다.
         """
@@ -813,5 +1109,49 @@ class NativeSupervisor:
 # 하위 호환성을 위해 alias 제공
 PlanSupervisor = NativeSupervisor
 
+
+# =============================================================================
+# [NEW] Supervisor 인스턴스 캐시
+# =============================================================================
+# 요청마다 NativeSupervisor()를 만들면 전체 에이전트 클래스 import/생성이 반복됩니다.
+# Supervisor와 에이전트는 실행 후 상태를 갖지 않으므로 (백엔드, 모델, temperature)별로 공유합니다.
+
+_SUPERVISOR_CACHE: Dict[tuple, NativeSupervisor] = {}
+_SUPERVISOR_CACHE_LOCK = threading.Lock()
+
+
+def get_supervisor(model_type: str = "gpt-4o", temperature: float = 0.3) -> NativeSupervisor:
+    """
+    캐싱된 NativeSupervisor 반환 (없으면 생성)
+
+    LLM 백엔드 전환(set_llm_backend) 시 새 인스턴스가 생성되도록 백엔드도 키에 포함합니다.
+    """
+    from utils.config import Config
+
+    key = (Config.LLM_BACKEND, model_type, int(temperature * 100))
+    with _SUPERVISOR_CACHE_LOCK:
+        supervisor = _SUPERVISOR_CACHE.get(key)
+        if supervisor is None:
+            supervisor = NativeSupervisor(
+                llm=get_llm(model_type=model_type, temperature=temperature), model_type=model_type
+            )
+            _SUPERVISOR_CACHE[key] = supervisor
+        return supervisor
+
+
+def integrate_specialist_results(results: Dict[str, Any]) -> str:
+    """
+    [NEW] 전문 에이전트 결과(일부만 있어도 됨)를 Supervisor와 같은 마크다운 형식으로 변환
+
+    캐싱된 Supervisor의 에이전트 포맷터(format_as_markdown)를 사용합니다.
+    """
+    return get_supervisor().integrate_results(results)
+
+
+def clear_supervisor_cache() -> None:
+    """Supervisor 인스턴스 캐시 초기화 (설정 변경/테스트용)"""
+    with _SUPERVISOR_CACHE_LOCK:
+        _SUPERVISOR_CACHE.clear()
+
 if __name__ == "__main__":
     supervisor = NativeSupervisor()
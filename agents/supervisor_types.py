@@ -26,6 +26,10 @@ class AgentExecutionStats:
     error_messages: List[str] = field(default_factory=list)
     error_category: str = ""
     fallback_used: bool = False
+    cache_hit: bool = False  # [NEW] 결과 캐시 적중 (실행 생략)
+    parse_status: str = ""  # [NEW] Structured Output 파싱 결과 (structured/partial/failed)
+    model_type: str = ""  # [NEW] 실행 모델 (예산 초과 시 다운그레이드 모델)
+    total_tokens: int = 0  # [NEW] 1회 실행 토큰 (비용 모델 학습용)
     execution_time_ms: float = 0.0
 
     def record_start(self):
@@ -52,6 +56,10 @@ class AgentExecutionStats:
             "error_messages": self.error_messages,
             "error_category": self.error_category,
             "fallback_used": self.fallback_used,
+            "cache_hit": self.cache_hit,
+            "parse_status": self.parse_status,
+            "model_type": self.model_type,
+            "total_tokens": self.total_tokens,
             "execution_time_ms": round(self.execution_time_ms, 2),
         }
 
@@ -67,7 +75,15 @@ class ExecutionStats:
     failed_agents: int = 0
     retried_agents: int = 0
     fallback_used_count: int = 0
+    cache_hit_count: int = 0  # [NEW] 결과 캐시 적중 에이전트 수
+    parse_failure_count: int = 0  # [NEW] Structured Output 파싱 실패 (부분 복구 + Fallback)
     agent_stats: Dict[str, AgentExecutionStats] = field(default_factory=dict)
+    # [NEW] DAG 스케줄 타이밍 (계획 시작 기준 ms)
+    agent_timeline: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    makespan_ms: float = 0.0
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_ms: float = 0.0
+    layered_estimate_ms: float = 0.0  # 단계별 배리어 방식이었다면 걸렸을 시간 (비교용)
 
     def record_start(self, plan_id: str, total_agents: int):
         self.plan_id = plan_id
@@ -86,6 +102,36 @@ class ExecutionStats:
                 self.retried_agents += 1
             if stats.fallback_used:
                 self.fallback_used_count += 1
+            if stats.cache_hit:
+                self.cache_hit_count += 1
+            if stats.parse_status in ("partial", "failed"):
+                self.parse_failure_count += 1
+
+    def record_schedule(self, timeline: Dict[str, Dict[str, float]], deps: Dict[str, List[str]], layers: List[List[str]]):
+        """
+        [NEW] DAG 스케줄 타이밍 기록
+
+        Args:
+            timeline: 에이전트별 {"start_ms", "end_ms"} (계획 시작 기준)
+            deps: 계획 내 에이전트 의존성 (에이전트ID -> 의존 에이전트ID 목록)
+            layers: Kahn 단계별 에이전트 목록 (배리어 방식 추정치 계산용)
+        """
+        self.agent_timeline = {
+            agent_id: {k: round(v, 1) for k, v in span.items()}
+            for agent_id, span in timeline.items()
+        }
+        if not timeline:
+            return
+
+        self.makespan_ms = round(max(span["end_ms"] for span in timeline.values()), 1)
+        self.critical_path = compute_critical_path(timeline, deps)
+        self.critical_path_ms = round(sum(
+            timeline[a]["end_ms"] - timeline[a]["start_ms"] for a in self.critical_path
+        ), 1)
+        self.layered_estimate_ms = round(sum(
+            max((timeline[a]["end_ms"] - timeline[a]["start_ms"] for a in layer if a in timeline), default=0.0)
+            for layer in layers
+        ), 1)
 
     def get_agent_stats(self, agent_id: str) -> AgentExecutionStats:
         if agent_id not in self.agent_stats:
@@ -107,8 +153,15 @@ class ExecutionStats:
             f"❌ 실패: {self.failed_agents}",
             f"🔄 재시도: {self.retried_agents}",
             f"⚠️ Fallback: {self.fallback_used_count}",
+            f"♻️ 캐시 적중: {self.cache_hit_count}",
+            f"🧩 파싱 실패: {self.parse_failure_count}",
             f"⏱️ 총 소요시간: {duration:.2f}초",
         ]
+        if self.critical_path:
+            lines.append(
+                f"🧭 Critical Path: {' → '.join(self.critical_path)} "
+                f"({self.critical_path_ms / 1000:.2f}초 / 배리어 방식 추정 {self.layered_estimate_ms / 1000:.2f}초)"
+            )
 
         # 실패한 에이전트 상세
         failed = [s for s in self.agent_stats.values() if not s.success]
@@ -152,10 +205,41 @@ class ExecutionStats:
             "failed_agents": self.failed_agents,
             "retried_agents": self.retried_agents,
             "fallback_used_count": self.fallback_used_count,
+            "cache_hit_count": self.cache_hit_count,
+            "parse_failure_count": self.parse_failure_count,
             "agent_stats": {k: v.to_dict() for k, v in self.agent_stats.items()},
+            "schedule": {
+                "agent_timeline": self.agent_timeline,
+                "makespan_ms": self.makespan_ms,
+                "critical_path": self.critical_path,
+                "critical_path_ms": self.critical_path_ms,
+                "layered_estimate_ms": self.layered_estimate_ms,
+            },
         }
 
 
+def compute_critical_path(timeline: Dict[str, Dict[str, float]], deps: Dict[str, List[str]]) -> List[str]:
+    """
+    실제 실행 타임라인 기준 Critical Path 계산
+
+    가장 늦게 끝난 에이전트에서 출발하여, 각 단계마다 가장 늦게 끝난 의존 에이전트를
+    역추적합니다. (이 경로의 에이전트가 빨라져야 전체 시간이 줄어듦)
+
+    Returns:
+        List[str]: 실행 순서대로 정렬된 Critical Path 에이전트 ID 목록
+    """
+    if not timeline:
+        return []
+
+    path = [max(timeline, key=lambda a: timeline[a]["end_ms"])]
+    while True:
+        preds = [d for d in deps.get(path[-1], []) if d in timeline]
+        if not preds:
+            break
+        path.append(max(preds, key=lambda d: timeline[d]["end_ms"]))
+    return list(reversed(path))
+
+
 # =============================================================================
 # Helper Function Wrapper
 # =============================================================================
@@ -205,6 +289,15 @@ class RoutingDecision(BaseModel):
         default_factory=list,
         description="실행 우선순위 (의존성 고려)"
     )
+    # [NEW] 예산 적용 결과 (agents/agent_cost_model.py)
+    downgraded: Dict[str, str] = Field(
+        default_factory=dict,
+        description="경량 모델로 실행할 에이전트 (에이전트ID -> 모델)"
+    )
+    skipped: List[str] = Field(
+        default_factory=list,
+        description="예산 초과로 생략한 에이전트"
+    )
 
 
 # =============================================================================
@@ -229,7 +322,10 @@ CONTENT_KEYWORDS = frozenset([
 
 def detect_required_agents(
     service_overview: str,
-    purpose: str = "기획서 작성"
+    purpose: str = "기획서 작성",
+    budget=None,
+    cost_model=None,
+    cached_agents=()
 ) -> RoutingDecision:
     """
     규칙 기반 에이전트 결정 (Deterministic)
@@ -241,10 +337,14 @@ def detect_required_agents(
         2. 아이디어 검증: market, bm만 필요
         3. tech: 기술 관련 키워드 포함 시 추가
         4. content: 마케팅/콘텐츠 관련 키워드 포함 시 추가
+        5. [NEW] budget 지정 시: 예상 비용이 예산을 넘으면 다운그레이드/생략 (agent_cost_model)
 
     Args:
         service_overview: 서비스 개요 텍스트
         purpose: 분석 목적 ("기획서 작성" | "아이디어 검증" | ...)
+        budget: 실행 예산 (RoutingBudget, None이면 규칙 결과 그대로)
+        cost_model: 에이전트 비용 모델 (None이면 전역 agent_cost_model)
+        cached_agents: 결과 캐시 적중이 예상되는 에이전트 (비용 0으로 계산)
 
     Returns:
         RoutingDecision: 결정론적 라우팅 결과
@@ -278,8 +378,39 @@ def detect_required_agents(
         required.append("content")
         reasons.append(f"콘텐츠 키워드 감지: {content_matches[:3]}")
 
-    return RoutingDecision(
+    decision = RoutingDecision(
         required_analyses=required,
         reasoning=" | ".join(reasons),
         priority_order=required
     )
+    if budget is not None:
+        decision = apply_routing_budget(decision, budget, cost_model, cached_agents)
+    return decision
+
+
+def apply_routing_budget(
+    decision: RoutingDecision,
+    budget,
+    cost_model=None,
+    cached_agents=()
+) -> RoutingDecision:
+    """
+    [NEW] 라우팅 결정에 실행 예산 적용 (규칙/LLM 라우팅 공용)
+
+    다운그레이드/생략 사유는 reasoning에 덧붙입니다.
+    """
+    from agents.agent_cost_model import plan_within_budget
+
+    if not budget.limited:
+        return decision
+    plan = plan_within_budget(list(decision.required_analyses), budget, cost_model, cached_agents)
+    reasoning = decision.reasoning
+    if plan.reasons:
+        reasoning += " | 예산 적용: " + ", ".join(plan.reasons)
+    return decision.model_copy(update={
+        "required_analyses": plan.required,
+        "priority_order": [a for a in decision.priority_order if a not in plan.skipped],
+        "reasoning": reasoning,
+        "downgraded": plan.downgraded,
+        "skipped": plan.skipped,
+    })
@@ -15,11 +15,20 @@ PlanCraft Agent - Writer Agent (작가)
 3. 능동적 데이터 통합:
    - RAG(Vector DB) 및 실시간 웹 검색(Active Search) 결과를 본문에 자연스럽게 녹여냅니다.
    - Mermaid 다이어그램 및 시각 자료 코드를 생성하여 문서의 가독성을 높입니다.
+4. [NEW] 전문 에이전트 파이프라인 (Quality, specialist_stream_id):
+   - 전문 에이전트 결과가 모두 모이기를 기다리지 않고, 필요한 결과가 준비된 섹션부터 작성합니다.
 """
+import contextvars
+import threading
+import time
+
 from langchain_core.messages import SystemMessage, HumanMessage
 from utils.llm import get_llm
 from utils.schemas import DraftResult
-from utils.time_context import get_time_context, get_time_instruction
+from utils.prompt_layout import build_cacheable_messages
+from utils.prompt_budget import (
+    PromptAssembler, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_MEDIUM, PRIORITY_REQUIRED,
+)
 from graph.state import PlanCraftState, update_state, ensure_dict
 from utils.settings import settings
 from utils.file_logger import get_file_logger
@@ -27,12 +36,14 @@ from utils.file_logger import get_file_logger
 # 헬퍼 함수 임포트 (Refactored)
 from agents.writer_helpers import (
     get_prompts_by_doc_type,
+    get_user_instructions_by_doc_type,
     execute_web_search,
     build_visual_instruction,
-    build_visual_feedback,
     build_review_context,
     build_refinement_context,
     validate_draft,
+    diagnose_draft,  # [NEW] 검증 실패 대상 구조화
+    repair_draft,  # [NEW] 실패 섹션만 부분 수리
     get_specialist_context,  # [NEW] Supervisor 노드 결과 활용
 )
 
@@ -61,6 +72,18 @@ def run(state: PlanCraftState) -> PlanCraftState:
     preset = get_preset(active_preset)
     refine_count = state.get("refine_count", 0)
 
+    # [NEW] 부분 재작성 대상 (Refiner가 지목 섹션을 확정한 경우만, 구조/전문 분석은 재사용)
+    refine_targets = list(state.get("refine_targets") or []) if refine_count > 0 and state.get("draft") else []
+    state = update_state(state, refine_targets=[], changed_sections=None, writer_tool_calls=None, section_reuse=None)
+
+    # [NEW] 전문 에이전트 결과 스트림 (run_specialists 노드가 기다리지 않고 넘긴 경우)
+    from agents.specialist_stream import get_specialist_stream
+    stream_id = state.get("specialist_stream_id")
+    stream = get_specialist_stream(stream_id)
+    if stream_id and stream is None:
+        logger.warning(f"[Writer] 전문 에이전트 결과 스트림 없음 ({stream_id}), 분석 결과 없이 작성")
+        state = update_state(state, specialist_stream_id=None)
+
     # 3. 컨텍스트 구성 (헬퍼 함수 위임)
     rag_context = state.get("rag_context", "")
     web_context = state.get("web_context", "")
@@ -70,6 +93,13 @@ def run(state: PlanCraftState) -> PlanCraftState:
     if not web_context:
         web_context = ""
 
+    # [NEW] 근거 번들: 중복 제거 + Writer 토큰 예산 내 렌더링 (원문 web_context/rag_context 대신)
+    from utils.evidence_bundle import KIND_RAG, KIND_WEB, get_evidence_bundle
+    evidence = get_evidence_bundle(state)
+    if evidence:
+        rag_context = evidence.render("writer:rag", kinds=(KIND_RAG,))
+        web_context = evidence.render("writer:web", kinds=(KIND_WEB,))
+
     # [REFACTOR] 전문 에이전트 분석 결과 가져오기 (Supervisor 노드에서 이미 실행됨)
     # 기존: Writer 내부에서 execute_specialist_agents() 호출
     # 변경: workflow의 run_specialists 노드에서 실행된 결과를 state에서 가져옴
@@ -77,6 +107,7 @@ def run(state: PlanCraftState) -> PlanCraftState:
 
     # 4. 프롬프트 구성
     system_prompt, user_prompt_template = get_prompts_by_doc_type(state)
+    user_instructions_template = get_user_instructions_by_doc_type(state)
     visual_instruction = build_visual_instruction(preset, logger)
 
     # User Constraints 추출
@@ -92,33 +123,8 @@ def run(state: PlanCraftState) -> PlanCraftState:
     web_urls = state.get("web_urls", [])
     web_urls_str = "\n".join([f"- {url}" for url in web_urls]) if web_urls else "없음"
 
-    try:
-        formatted_prompt = user_prompt_template.format(
-            user_input=user_input,
-            structure=str(structure),
-            web_context=web_context if web_context else "없음",
-            web_urls=web_urls_str,
-            context=rag_context if rag_context else "없음",
-            visual_instruction=visual_instruction,
-            user_constraints=user_constraints_str
-        )
-        
-        # [NEW] Quality 모드 전용 추가 지침 (양적 풍성함 강화)
-        if preset.name == "quality":
-            quality_instruction = """
-\n=====================================================================
-👑 **[Quality Mode] 최고 품질 작성 지침**
-1. **핵심 기능(Key Features)**: 반드시 **6개 이상**의 핵심 기능을 상세히 기술하세요.
-2. **섹션 분량**: 각 섹션은 최소 500자 이상, 깊이 있는 내용을 담으세요.
-3. **참고 자료**: 인용된 모든 출처를 마지막에 '참고 자료' 섹션으로 정리하세요.
-=====================================================================\n
-"""
-            formatted_prompt += quality_instruction
-
-    except KeyError as e:
-        return update_state(state, error=f"프롬프트 포맷 오류: {str(e)}")
-
     # 전문 에이전트 결과 주입
+    specialist_header = ""
     if specialist_context:
         specialist_header = f"""
 =====================================================================
@@ -127,11 +133,11 @@ def run(state: PlanCraftState) -> PlanCraftState:
 {specialist_context}
 =====================================================================
 """
-        formatted_prompt = specialist_header + formatted_prompt
 
     # Refinement 컨텍스트 추가
     review_context = build_review_context(state, refine_count)
-    refinement_context = build_refinement_context(refine_count, preset.min_sections)
+    # 부분 재작성 시에는 "전체 새로 작성" 지침 대신 섹션별 지침 사용 (_rewrite_target_sections)
+    refinement_context = "" if refine_targets else build_refinement_context(refine_count, preset.min_sections)
 
     # Refinement Strategy
     strategy_msg = ""
@@ -143,14 +149,89 @@ def run(state: PlanCraftState) -> PlanCraftState:
             else getattr(refinement_guideline, "specific_guidelines", [])
         strategy_msg = f"🚀 방향: {direction}\n지침: {chr(10).join([f'- {g}' for g in guidelines])}\n"
 
-    prepend_msg = strategy_msg + review_context + refinement_context
-    formatted_prompt = prepend_msg + formatted_prompt + get_time_instruction()
+    try:
+        # [NEW] 프리셋 단위 정적 지침 (user 메시지 앞부분 = 캐시 가능한 접두부)
+        static_instructions = user_instructions_template.format(
+            visual_instruction=visual_instruction
+        )
+
+        # [NEW] Quality 모드 전용 추가 지침 (양적 풍성함 강화)
+        if preset.name == "quality":
+            quality_instruction = """
+\n=====================================================================
+👑 **[Quality Mode] 최고 품질 작성 지침**
+1. **핵심 기능(Key Features)**: 반드시 **6개 이상**의 핵심 기능을 상세히 기술하세요.
+2. **섹션 분량**: 각 섹션은 최소 500자 이상, 깊이 있는 내용을 담으세요.
+3. **참고 자료**: 인용된 모든 출처를 마지막에 '참고 자료' 섹션으로 정리하세요.
+=====================================================================\n
+"""
+            static_instructions += quality_instruction
+
+        # [NEW] 구성 요소별 토큰 측정 + Writer 예산 맞춤 (참고 자료 → 전문 분석 순으로 자름)
+        # 구조는 작성할 섹션 목록이므로 자르지 않음 (잘리면 섹션이 빠진 초안이 생성됨)
+        parts = (PromptAssembler("writer")
+            .add("system", system_prompt, PRIORITY_REQUIRED)
+            .add("instructions", static_instructions, PRIORITY_REQUIRED)
+            .add("template", user_prompt_template, PRIORITY_REQUIRED)
+            .add("user_input", user_input, PRIORITY_REQUIRED)
+            .add("constraints", user_constraints_str, PRIORITY_REQUIRED)
+            .add("structure", str(structure), PRIORITY_REQUIRED)
+            .add("guidelines", strategy_msg + review_context + refinement_context, PRIORITY_HIGH)
+            .add("specialist", specialist_header, PRIORITY_MEDIUM, min_tokens=500)
+            .add("web_urls", web_urls_str, PRIORITY_LOW)
+            .add("rag", rag_context, PRIORITY_LOW, min_tokens=200)
+            .add("web", web_context, PRIORITY_LOW, min_tokens=200)
+            .fit())
+
+        formatted_prompt = user_prompt_template.format(
+            user_input=user_input,
+            structure=parts["structure"],
+            web_context=parts["web"] or "없음",
+            web_urls=parts["web_urls"] or "없음",
+            context=parts["rag"] or "없음",
+            user_constraints=user_constraints_str
+        )
+    except KeyError as e:
+        return update_state(state, error=f"프롬프트 포맷 오류: {str(e)}")
+
+    formatted_prompt += parts["specialist"]
+
+    # [NEW] Refine 피드백은 회차마다 바뀌므로 요청별 데이터 중에서도 가장 뒤에 배치
+    formatted_prompt += parts["guidelines"]
 
     # 5. LLM 호출
-    messages = [
-        {"role": "system", "content": get_time_context() + system_prompt},
-        {"role": "user", "content": formatted_prompt}
-    ]
+    # [NEW] 정적 시스템 프롬프트 → 정적 작성 지침 → 요청별 데이터 → 시간 컨텍스트 순서
+    # (재시도/Refine/Chunk 호출 간 수천 토큰의 접두부를 Prompt Cache로 재사용)
+    messages = build_cacheable_messages(
+        system_prompt=system_prompt,
+        static_instructions=static_instructions,
+        dynamic_content=formatted_prompt,
+    )
+
+    # [NEW] 섹션 단위 캐시: 프롬프트 입력이 바뀌지 않은 섹션은 다시 생성하지 않음 (agents/section_cache.py)
+    from agents.section_cache import assemble_cached_draft, start_section_reuse
+    reuse = start_section_reuse(
+        state, preset, system_prompt + static_instructions,
+        evidence_text="\n".join([rag_context or "", web_context or "", web_urls_str]),
+    )
+
+    # [NEW] 부분 재작성: 지목된 섹션만 병렬 재작성, 나머지 섹션은 그대로 유지
+    if refine_targets:
+        rewritten = _rewrite_target_sections(state, messages, preset, refine_targets, logger)
+        if rewritten is not None:
+            changed = set(rewritten.get("changed_sections") or [])
+            patches = [
+                sec for sec in ensure_dict(rewritten.get("draft")).get("sections", [])
+                if ensure_dict(sec).get("name", "") in changed
+            ]
+            return _finish_section_reuse(rewritten, reuse, logger, sections=patches)
+        logger.warning("[Writer] 부분 재작성 실패, 전체 재작성으로 진행")
+        messages = _chunk_messages(messages, build_refinement_context(refine_count, preset.min_sections))
+
+    # [NEW] 파이프라인 모드: 준비된 전문 에이전트 결과로 섹션 단위 작성
+    if stream is not None:
+        logger.info(f"[Writer] 🧩 전문 에이전트 결과 스트림 연동 작성 ({stream.stream_id})")
+        return _write_with_specialist_stream(state, stream, messages, preset, logger, reuse)
 
     # [NEW] ReAct 모드 판단 (Balanced/Quality에서 활성화)
     # 1. 프리셋 설정 확인 (enable_writer_react)
@@ -160,11 +241,28 @@ def run(state: PlanCraftState) -> PlanCraftState:
         refine_count == 0 and                          # 첫 작성 시에만
         state.get("enable_writer_react", True)         # state에서 비활성화 가능
     )
+    # Quality 모드 + ReAct 비활성화 시: 분할 작성 (Chunk Writing)
+    use_chunk_mode = active_preset == "quality" and bool(structure) and not use_react_mode
+
+    # [NEW] 섹션 캐시 재사용 (프리셋의 작성 경로는 바꾸지 않음)
+    # - 모든 섹션 적중: LLM 호출 없이 초안 구성 (분할 작성 외 경로는 Self-Check 통과 시에만)
+    # - 일부 적중: 분할 작성 경로에서만 나머지 섹션만 작성 (ReAct/통 작성은 자체 검증/수리를 위해 전체 작성)
+    cached = reuse.lookup_all(state.get("specialist_analysis")) if reuse is not None else {}
+    if cached and len(cached) == len(reuse.sections):
+        draft = assemble_cached_draft(structure, cached)
+        diagnosis = None if use_chunk_mode else diagnose_draft(draft, preset, specialist_context, refine_count)
+        if not diagnosis:
+            logger.info(f"[Writer] ♻️ 모든 섹션({len(cached)}개) 입력 동일 - 캐시 재사용 (LLM 호출 없음)")
+            return _finish_section_reuse(update_state(state, draft=draft, current_step="write"), reuse, logger)
+        logger.info(f"[Writer] 캐시 초안 검증 실패({', '.join(diagnosis.issues)}) - 전체 작성")
+    if cached and not use_chunk_mode:
+        reuse.drop_hits()
+        cached = {}
 
     if use_react_mode:
         logger.info(f"[Writer] 🔄 ReAct 모드 활성화 (preset={active_preset})")
-        return _run_with_react_loop(
-            state, messages, preset, specialist_context, logger
+        return _finish_section_reuse(
+            _run_with_react_loop(state, messages, preset, specialist_context, logger), reuse, logger
         )
 
     # Standard Mode (Fast 또는 ReAct 비활성화 시)
@@ -179,14 +277,20 @@ def run(state: PlanCraftState) -> PlanCraftState:
     last_error = None
 
     # Quality 모드 + ReAct 비활성화 시: 분할 작성 (Chunk Writing)
-    if active_preset == "quality" and structure and not use_react_mode:
-        logger.info("[Writer] 👑 Quality Mode: Chunk Writing 시작 (섹션별 상세 작성)")
+    # [NEW] 캐시 적중 섹션이 있으면 나머지 섹션만 분할 작성
+    if use_chunk_mode:
+        if cached:
+            logger.info(f"[Writer] ♻️ 섹션 {len(cached)}/{len(reuse.sections)}개 캐시 재사용, 나머지 섹션만 분할 작성")
+        else:
+            logger.info("[Writer] 👑 Quality Mode: Chunk Writing 시작 (섹션별 상세 작성)")
         try:
             final_draft_dict = _write_in_chunks(
-                writer_llm, 
-                messages, 
-                structure, 
-                logger
+                writer_llm,
+                messages,
+                structure,
+                logger,
+                session_id=state.get("thread_id"),
+                cached=cached,
             )
             # Chunk Writing 결과는 이미 Quality가 확보되었다고 가정하고 loop break
             # 단, 기본적인 포맷 검증은 한 번 수행
@@ -194,34 +298,35 @@ def run(state: PlanCraftState) -> PlanCraftState:
             if issues:
                 logger.warning(f"[Writer] Chunk Writing 검증 이슈(무시됨): {issues}")
             
-            return update_state(state, draft=final_draft_dict, current_step="write")
+            return _finish_section_reuse(
+                update_state(state, draft=final_draft_dict, current_step="write"), reuse, logger
+            )
         except Exception as e:
             logger.error(f"[Writer] Chunk Writing 실패: {e}, Fallback to Standard Mode")
-            # 실패 시 아래 표준 모드로 진행 (Fallback)
+            # 실패 시 아래 표준 모드로 진행 (Fallback, 적중 섹션도 다시 작성)
+            if reuse is not None:
+                reuse.drop_hits()
 
     # [Standard Mode] 통으로 작성 (Fast/Balanced or Quality Fallback)
+    # [NEW] 검증 실패 시 전체 재작성 대신 실패 섹션/누락 요소만 수리하여 기존 초안에 병합
+    # (피드백 메시지를 누적하지 않으므로 재시도마다 입력이 늘어나지 않음)
+    diagnosis = None
     for current_try in range(max_retries):
         try:
-            logger.info(f"[Writer] 초안 작성 시도 ({current_try + 1}/{max_retries})...")
-            draft_result = writer_llm.invoke(messages)
-            draft_dict = ensure_dict(draft_result)
+            if last_draft_dict is not None and diagnosis:
+                logger.info(f"[Writer] 초안 부분 수리 시도 ({current_try + 1}/{max_retries})...")
+                draft_dict = repair_draft(writer_llm, messages, last_draft_dict, diagnosis, preset, logger)
+            else:
+                logger.info(f"[Writer] 초안 작성 시도 ({current_try + 1}/{max_retries})...")
+                draft_dict = ensure_dict(writer_llm.invoke(messages))
             last_draft_dict = draft_dict
 
             # Self-Reflection 검증 (헬퍼 함수 위임)
-            validation_issues = validate_draft(
-                draft_dict, preset, specialist_context, refine_count, logger
-            )
-
-            if validation_issues:
-                logger.warning(f"[Writer] 검증 실패: {', '.join(validation_issues)}")
+            diagnosis = diagnose_draft(draft_dict, preset, specialist_context, refine_count)
 
-                # 시각적 요소 누락 시 구체적인 예시 피드백 추가
-                visual_feedback = build_visual_feedback(validation_issues, preset)
-                base_feedback = f"[검증 실패] {', '.join(validation_issues)}. 모든 섹션을 완전히 작성하세요."
-                feedback = base_feedback + visual_feedback if visual_feedback else base_feedback
-
-                messages.append({"role": "user", "content": feedback})
-                last_error = f"검증 실패: {', '.join(validation_issues)}"
+            if diagnosis:
+                logger.warning(f"[Writer] 검증 실패: {', '.join(diagnosis.issues)}")
+                last_error = f"검증 실패: {', '.join(diagnosis.issues)}"
                 continue
 
             # 통과
@@ -234,92 +339,387 @@ def run(state: PlanCraftState) -> PlanCraftState:
             logger.error(f"[Writer Error] {e}")
             last_error = str(e)
 
-    # 6. 결과 반환
+    # 6. 결과 반환 (검증을 통과한 초안만 섹션 캐시에 저장)
     if final_draft_dict:
-        return update_state(state, draft=final_draft_dict, current_step="write")
+        return _finish_section_reuse(update_state(state, draft=final_draft_dict, current_step="write"), reuse, logger)
     elif last_draft_dict:
         logger.warning("[Writer] ⚠️ 부분 결과 사용")
-        return update_state(state, draft=last_draft_dict, current_step="write")
+        return _finish_section_reuse(
+            update_state(state, draft=last_draft_dict, current_step="write"), reuse, logger, store=False
+        )
     else:
-        return update_state(state, error=f"Writer 실패: {last_error}")
+        return _finish_section_reuse(update_state(state, error=f"Writer 실패: {last_error}"), reuse, logger)
+
+
+def _finish_section_reuse(new_state: PlanCraftState, reuse, logger, sections: list = None,
+                          store: bool = True) -> PlanCraftState:
+    """
+    [NEW] 작성된 섹션을 섹션 캐시에 저장하고 재사용 비율을 section_reuse에 기록
+
+    Args:
+        new_state: 작성 결과 상태
+        reuse: SectionReuse (None이면 캐시 비활성화)
+        logger: 로거
+        sections: 저장할 섹션 (None이면 초안 전체, 부분 재작성은 다시 작성된 섹션만)
+        store: False면 저장하지 않음 (검증 실패 초안)
+    """
+    if reuse is None:
+        return new_state
+    if store and new_state.get("draft") and not new_state.get("error"):
+        if sections is None:
+            sections = ensure_dict(new_state.get("draft")).get("sections", [])
+        reuse.store_sections(sections, new_state.get("specialist_analysis"))
+
+    summary = reuse.finish()
+    if not summary["lookups"]:
+        return new_state
+    logger.info(f"[Writer] 섹션 캐시 재사용 {summary['hits']}/{summary['lookups']}개 ({summary['reuse_ratio']:.0%})")
+    return update_state(new_state, section_reuse=summary)
+
+
+# [NEW] 분할 작성 설정: 청크당 섹션 수 / 청크별 재시도 횟수
+CHUNK_SIZE = 3
+CHUNK_MAX_RETRIES = 1
+
+
+def _chunk_messages(base_messages: list, instruction: str) -> list:
+    """
+    기본 메시지의 마지막 유저 메시지에 지시문을 덧붙인 새 메시지 목록
+
+    청크마다 deepcopy하지 않고 마지막 메시지만 새 dict로 교체합니다.
+    (시스템 프롬프트/정적 지침 접두부는 공유되므로 Prompt Cache 적중에도 영향 없음)
+    """
+    if not base_messages:
+        return [{"role": "user", "content": instruction}]
+    last = base_messages[-1]
+    return [*base_messages[:-1], {**last, "content": last["content"] + instruction}]
+
+
+def _invoke_with_retry(llm, messages: list, label, logger, max_retries: int = CHUNK_MAX_RETRIES) -> dict:
+    """Writer 부분 호출 1회 (실패 시 max_retries회 재시도, 모두 실패하면 마지막 예외 전파)"""
+    last_error = None
+    for attempt in range(max_retries + 1):
+        try:
+            return ensure_dict(llm.invoke(messages))
+        except Exception as e:
+            last_error = e
+            logger.warning(f"[Writer] {label} 작성 실패 ({attempt + 1}/{max_retries + 1}): {e}")
+    raise last_error
 
 
-def _write_in_chunks(llm, base_messages, structure_obj, logger):
+def _run_bounded(session_id: str, calls: list) -> list:
+    """Writer 부분 호출 동시 실행 (요청당 최대 settings.WRITER_CHUNK_PARALLELISM개, 결과는 입력 순서)"""
+    from agents.specialist_executor import run_bounded
+    return run_bounded(f"{session_id}:writer" if session_id else None, calls, settings.WRITER_CHUNK_PARALLELISM)
+
+
+def _write_in_chunks(llm, base_messages, structure_obj, logger, session_id: str = None, cached: dict = None):
     """
-    [Quality Mode 전용] 섹션을 나누어 작성한 후 병합합니다.
-    
+    [Quality Mode 전용] 섹션을 나누어 동시에 작성한 후 목차 순서로 병합합니다.
+
+    청크끼리는 서로의 출력을 사용하지 않으므로 전문 에이전트 공용 실행기
+    (agents/specialist_executor.py)에서 최대 settings.WRITER_CHUNK_PARALLELISM개씩 동시에 실행합니다.
+    작성 시간은 청크 수 × 1회 호출에서 약 1회 호출 수준으로 줄어듭니다.
+
     Args:
         llm: Writer LLM
         base_messages: 기본 시스템/유저 메시지
         structure_obj: Structurer 출력 객체 (sections 리스트 포함)
         logger: 로거
-        
+        session_id: 공용 실행기 공정 분배 단위 (보통 thread_id)
+        cached: [NEW] 섹션 캐시 적중분 (섹션 인덱스 → 섹션, 작성하지 않고 해당 위치에 병합)
+
     Returns:
-        dict: 합쳐진 DraftResult 딕셔너리
-    """
-    import copy
-    from graph.state import ensure_dict
+        dict: 합쳐진 DraftResult 딕셔너리 (title/key_features/executive_summary는 첫 청크 결과)
 
+    Raises:
+        Exception: 재시도 후에도 실패한 청크가 있으면 해당 예외 (호출부에서 표준 모드로 Fallback)
+    """
     structure_dict = ensure_dict(structure_obj)
     sections = structure_dict.get("sections", [])
     if not sections:
         raise ValueError("구조에 섹션 정보가 없습니다.")
 
-    full_draft = {
-        "title": structure_dict.get("title", "Business Plan"),
-        "sections": [],
-        "key_features": []  # 나중에 첫 청크에서 가져옴
-    }
-    
-    # 청크 사이즈: 3개 섹션씩
-    chunk_size = 3
+    cached = cached or {}
+    pending = [idx for idx in range(len(sections)) if idx not in cached]
+    chunks = [pending[i:i + CHUNK_SIZE] for i in range(0, len(pending), CHUNK_SIZE)]
     total_sections = len(sections)
-    
-    # 사용자 프롬프트(base_messages[-1])에서 기본 지시사항 추출
-    base_user_content = base_messages[-1]["content"] if base_messages else ""
-    
-    for i in range(0, total_sections, chunk_size):
-        chunk_sections = sections[i : i + chunk_size]
-        chunk_titles = [s.get("title", s) if isinstance(s, dict) else str(s) for s in chunk_sections]
-        
-        logger.info(f"[Writer Chunk] 섹션 {i+1}~{min(i+chunk_size, total_sections)} 작성 중: {chunk_titles}")
-        
-        chunk_instruction = f"""
+
+    def chunk_instruction(chunk_no: int) -> str:
+        chunk_titles = [s.get("title", s) if isinstance(s, dict) else str(s) for s in (sections[i] for i in chunks[chunk_no])]
+        numbers = [idx + 1 for idx in chunks[chunk_no]]
+        logger.info(f"[Writer Chunk] 섹션 {numbers} 작성 요청: {chunk_titles}")
+        # 기획서 제목/핵심 기능/요약은 첫 청크만 작성 (나머지 청크는 섹션 본문만)
+        metadata_rule = (
+            "기획서 제목, 핵심 기능(key_features), 요약(executive_summary)도 함께 작성하세요."
+            if chunk_no == 0 else
+            "기획서 제목, 핵심 기능, 요약은 다른 단계에서 작성하므로 생략하세요."
+        )
+        return f"""
 \n=====================================================================
-🧩 **[Section Writing Phase {i//chunk_size + 1}]**
+🧩 **[Section Writing Phase {chunk_no + 1}/{len(chunks)}]**
 전체 비즈니스 기획서 중 아래 섹션들만 집중적으로 작성하세요.
 절대 다른 섹션을 건너뛰거나 합치지 마세요.
 
 **작성 대상 섹션**:
 {chr(10).join([f'- {t}' for t in chunk_titles])}
 
+다른 섹션은 별도로 동시에 작성되므로, 전체 목차 흐름에 맞춰 대상 섹션만 완결성 있게 작성하세요.
+{metadata_rule}
+=====================================================================
+"""
+
+    # 공용 실행기로 동시 실행 (결과는 청크 순서)
+    results = _run_bounded(session_id, [
+        (_invoke_with_retry, llm, _chunk_messages(base_messages, chunk_instruction(chunk_no)),
+         f"{chunk_no + 1}번 청크", logger)
+        for chunk_no in range(len(chunks))
+    ])
+
+    # 목차 순서로 병합 (완료 순서와 무관), 메타데이터는 첫 청크에서만
+    # 섹션 수가 맞으면 섹션별 위치에, 아니면 청크 첫 섹션 위치에 배치
+    placed = {idx: [section] for idx, section in cached.items()}
+    for chunk, result in zip(chunks, results):
+        generated = result.get("sections", [])
+        if len(generated) == len(chunk):
+            placed.update({idx: [section] for idx, section in zip(chunk, generated)})
+        else:
+            placed[chunk[0]] = generated
+
+    first = results[0] if results else {}
+    full_draft = {
+        "title": first.get("title", structure_dict.get("title", "Business Plan")),
+        "sections": [section for idx in sorted(placed) for section in placed[idx]],
+        "key_features": first.get("key_features", []),
+        "executive_summary": first.get("executive_summary", ""),
+    }
+
+    logger.info(
+        f"[Writer Chunk] 병합 완료: 총 {len(full_draft['sections'])}/{total_sections}개 섹션 "
+        f"({len(chunks)}개 청크, 캐시 재사용 {len(cached)}개)"
+    )
+    return full_draft
+
+
+# =============================================================================
+# [NEW] Incremental Refine (지목 섹션만 재작성)
+# =============================================================================
+
+def _rewrite_section(llm, messages: list, name: str, logger):
+    """섹션 1개 재작성 (재시도 후에도 실패하면 None → 기존 내용 유지)"""
+    try:
+        result = _invoke_with_retry(llm, messages, f"'{name}' 섹션", logger)
+    except Exception as e:
+        logger.error(f"[Writer Refine] '{name}' 섹션 재작성 실패, 기존 내용 유지: {e}")
+        return None
+    sections = result.get("sections", [])
+    return {**ensure_dict(sections[0]), "name": name} if sections else None
+
+
+def _rewrite_target_sections(state: PlanCraftState, base_messages: list, preset,
+                             targets: list, logger):
+    """
+    Refiner가 지목한 섹션만 동시에 다시 작성하여 기존 초안에 병합
+
+    나머지 섹션은 변경하지 않으며(개요만 전달), 다시 작성된 섹션명을 changed_sections에 기록하여
+    Reviewer가 변경분만 재심사하도록 합니다.
+
+    Returns:
+        PlanCraftState | None: 병합된 상태 (모든 섹션 재작성이 실패하면 None)
+    """
+    from agents.helpers.draft_repair import splice_repair
+    from agents.helpers.incremental_refine import build_section_outline
+
+    draft_dict = ensure_dict(state.get("draft"))
+    current = {ensure_dict(sec).get("name", ""): ensure_dict(sec) for sec in draft_dict.get("sections", [])}
+    outline = build_section_outline(draft_dict, exclude=targets)
+
+    writer_llm = get_llm(
+        model_type=preset.model_type,
+        temperature=preset.temperature
+    ).with_structured_output(DraftResult)
+
+    def section_instruction(name: str) -> str:
+        return f"""
+\n=====================================================================
+✂️ **[Incremental Refine]** 심사 피드백을 반영하여 아래 섹션 1개만 다시 작성하세요.
+섹션명은 그대로 유지하고, sections 배열에 이 섹션 하나만 포함하세요.
+
+**다시 작성할 섹션**: {name}
+**현재 내용**:
+{current.get(name, {}).get("content", "")}
+
+**변경되지 않는 다른 섹션 (흐름 연결/중복 방지용)**:
+{outline or "(없음)"}
+=====================================================================
+"""
+
+    logger.info(f"[Writer Refine] ✂️ 부분 재작성 시작: {targets} (유지 {len(current) - len(targets)}개)")
+    patches = _run_bounded(state.get("thread_id"), [
+        (_rewrite_section, writer_llm, _chunk_messages(base_messages, section_instruction(name)), name, logger)
+        for name in targets
+    ])
+
+    changed = [patch["name"] for patch in patches if patch]
+    if not changed:
+        return None
+
+    merged = splice_repair(draft_dict, {"sections": [patch for patch in patches if patch]}, {name: [] for name in changed})
+    logger.info(f"[Writer Refine] 병합 완료: {len(changed)}/{len(targets)}개 섹션 변경")
+    return update_state(state, draft=merged, changed_sections=changed, current_step="write")
+
+
+# =============================================================================
+# [NEW] Specialist Stream Pipeline (섹션 단위 준비 상태 기반 작성)
+# =============================================================================
+
+def _write_with_specialist_stream(state: PlanCraftState, stream, messages: list, preset, logger,
+                                  reuse=None) -> PlanCraftState:
+    """
+    전문 에이전트 결과 스트림과 파이프라인으로 초안 작성
+
+    작성이 끝나면 전체 결과를 specialist_analysis로 반영하고 스트림을 해제합니다.
+    작성 실패 시 전체 결과를 반영한 상태로 표준 경로(run)를 다시 실행합니다.
+    [NEW] reuse(SectionReuse)가 있으면 결과가 준비된 섹션마다 섹션 캐시를 먼저 조회합니다.
+    """
+    from agents.specialist_stream import release_specialist_stream
+
+    writer_llm = get_llm(
+        model_type=preset.model_type,
+        temperature=preset.temperature
+    ).with_structured_output(DraftResult)
+
+    draft_dict = None
+    try:
+        draft_dict = _write_sections_as_ready(writer_llm, messages, state.get("structure"), stream, logger, reuse)
+    except Exception as e:
+        logger.error(f"[Writer] 파이프라인 작성 실패: {e}, 전체 분석 결과로 재작성")
+
+    specialist_results = stream.result(timeout=settings.PLAN_TIMEOUT_SEC)
+    release_specialist_stream(stream.stream_id)
+    new_state = update_state(state, specialist_analysis=specialist_results, specialist_stream_id=None)
+
+    if draft_dict is None:
+        return run(new_state)
+
+    specialist_context = get_specialist_context(new_state, logger)
+    issues = validate_draft(draft_dict, preset, specialist_context, 0, logger)
+    if issues:
+        logger.warning(f"[Writer] 파이프라인 작성 검증 이슈(무시됨): {issues}")
+    return _finish_section_reuse(update_state(new_state, draft=draft_dict, current_step="write"), reuse, logger)
+
+
+def _wait_ready_sections(pending: list, section_keys: list, stream, logger) -> list:
+    """필요한 결과가 모두 준비된 섹션 인덱스 (하나도 없으면 결과가 게시될 때까지 대기)"""
+    while True:
+        version = stream.version
+        ready = [idx for idx in pending if stream.ready(section_keys[idx])]
+        if ready:
+            return ready
+        if not stream.wait_for_change(version, timeout=settings.AGENT_TIMEOUT_SEC):
+            logger.warning("[Writer Stream] 전문 에이전트 결과 대기 시간 초과, 게시된 결과로 작성")
+            return list(pending)
+
+
+def _write_sections_as_ready(llm, base_messages, structure_obj, stream, logger, reuse=None):
+    """
+    필요한 전문 에이전트 결과가 준비된 섹션부터 묶어서 작성한 후 목차 순서로 병합합니다.
+
+    섹션별 필요 결과 키는 agents.yaml의 provides/section_keywords로 판단하며,
+    호출마다 그 시점에 준비된 섹션을 모두 작성합니다. (모두 준비되어 있으면 1회 호출)
+
+    Args:
+        llm: Writer LLM (DraftResult 구조화 출력)
+        base_messages: 기본 시스템/유저 메시지
+        structure_obj: Structurer 출력 객체 (sections 리스트 포함)
+        stream: SpecialistResultStream
+        logger: 로거
+        reuse: [NEW] SectionReuse (준비된 섹션 중 캐시 적중분은 작성하지 않음)
+
+    Returns:
+        dict: 합쳐진 DraftResult 딕셔너리 (title/key_features/executive_summary는 첫 섹션 작성 결과)
+    """
+    from agents.agent_config import map_sections_to_result_keys
+    from agents.supervisor import integrate_specialist_results
+
+    structure_dict = ensure_dict(structure_obj)
+    sections = structure_dict.get("sections", [])
+    if not sections:
+        raise ValueError("구조에 섹션 정보가 없습니다.")
+
+    section_keys = map_sections_to_result_keys(sections)
+
+    full_draft = {"title": structure_dict.get("title", "Business Plan"), "key_features": []}
+    written = {}  # 섹션 인덱스 -> 작성된 섹션 목록
+    pending = list(range(len(sections)))
+    phase = 0
+
+    while pending:
+        batch = _wait_ready_sections(pending, section_keys, stream, logger)
+        pending = [idx for idx in pending if idx not in batch]
+
+        # [NEW] 섹션 캐시 적중분은 작성하지 않고 해당 위치에 배치
+        if reuse is not None:
+            for idx in list(batch):
+                cached = reuse.lookup(idx, stream.snapshot(section_keys[idx]) if section_keys[idx] else {})
+                if cached is not None:
+                    written[idx] = [cached]
+                    batch.remove(idx)
+            if not batch:
+                continue
+        phase += 1
+
+        titles = [
+            s.get("name") or s.get("title") or str(s) if isinstance(s, dict) else str(s)
+            for s in (sections[idx] for idx in batch)
+        ]
+        keys = sorted({key for idx in batch for key in section_keys[idx]})
+        logger.info(f"[Writer Stream] Phase {phase}: {titles} (전문 결과: {keys or '불필요'})")
+
+        # 이 섹션들에 필요한 결과만 주입 (나머지 에이전트는 아직 실행 중일 수 있음)
+        specialist_instruction = ""
+        partial_results = stream.snapshot(keys) if keys else {}
+        if partial_results:
+            specialist_instruction = f"""
+=====================================================================
+🤖 전문 에이전트 분석 결과 (반드시 활용할 것!)
+=====================================================================
+{integrate_specialist_results(partial_results)}
+=====================================================================
+"""
+
+        batch_instruction = f"""
+\n=====================================================================
+🧩 **[Section Writing Phase {phase}]**
+전체 비즈니스 기획서 중 아래 섹션들만 집중적으로 작성하세요.
+절대 다른 섹션을 건너뛰거나 합치지 마세요.
+
+**작성 대상 섹션**:
+{chr(10).join([f'- {t}' for t in titles])}
+
 이전 섹션 내용과 문맥이 이어지도록 자연스럽게 작성하세요.
 =====================================================================
 """
-        # 메시지 복사 후 지시사항 추가
-        current_messages = copy.deepcopy(base_messages)
-        # 기존 유저 메시지에 청크 지시 추가
-        current_messages[-1]["content"] = base_user_content + chunk_instruction
-        
-        # LLM 호출
-        result = llm.invoke(current_messages)
-        result_dict = ensure_dict(result)
-        
-        # 결과 병합
-        generated_sections = result_dict.get("sections", [])
-        
-        # 첫 번째 청크에서 메타데이터(Key Features 등) 가져오기
-        if i == 0:
+        current_messages = _chunk_messages(base_messages, specialist_instruction + batch_instruction)
+
+        result_dict = ensure_dict(llm.invoke(current_messages))
+        generated = result_dict.get("sections", [])
+
+        # 메타데이터는 첫 섹션을 작성한 호출에서 가져옴
+        if 0 in batch:
             full_draft["title"] = result_dict.get("title", full_draft["title"])
             full_draft["key_features"] = result_dict.get("key_features", [])
             full_draft["executive_summary"] = result_dict.get("executive_summary", "")
-            
-        full_draft["sections"].extend(generated_sections)
-        
-        # (선택) 다음 청크를 위한 컨텍스트 업데이트 로직이 필요할 수 있으나, 
-        # 현재는 독립적으로 작성하되 전체 구조를 LLM이 알고 있으므로 넘어감.
-        
-    logger.info(f"[Writer Chunk] 병합 완료: 총 {len(full_draft['sections'])}개 섹션")
+
+        # 섹션 수가 맞으면 섹션별로, 아니면 묶음 첫 섹션 위치에 배치
+        if len(generated) == len(batch):
+            for idx, section in zip(batch, generated):
+                written[idx] = [section]
+        else:
+            written[batch[0]] = generated
+
+    full_draft["sections"] = [section for idx in sorted(written) for section in written[idx]]
+    logger.info(f"[Writer Stream] 병합 완료: 총 {len(full_draft['sections'])}개 섹션 ({phase}회 호출)")
     return full_draft
 
 
@@ -331,6 +731,14 @@ def _write_in_chunks(llm, base_messages, structure_obj, logger):
 REACT_MAX_TOOL_CALLS = 3  # 최대 도구 호출 횟수
 REACT_MAX_ITERATIONS = 5  # 최대 루프 반복 횟수
 
+# [NEW] 도구별 실행 타임아웃 (초): 같은 턴의 도구 호출은 동시에 실행하고 도구별로 마감
+REACT_TOOL_TIMEOUT_SEC = {
+    "search_rag_documents": 15,
+    "search_web": 20,
+    "request_specialist_analysis": 60,
+}
+REACT_DEFAULT_TOOL_TIMEOUT_SEC = 30
+
 
 def _run_with_react_loop(
     state: PlanCraftState,
@@ -387,6 +795,7 @@ def _run_with_react_loop(
     tool_call_count = 0
     iteration = 0
     tool_results_context = []  # 도구 호출 결과 누적
+    tool_log = []  # [NEW] 도구별 지연시간/상태 (step_history 기록용)
 
     while iteration < REACT_MAX_ITERATIONS:
         iteration += 1
@@ -400,38 +809,27 @@ def _run_with_react_loop(
                 # AIMessage 추가
                 messages.append(response)
 
-                # 이미 응답한 tool_call_ids 추적
-                responded_tool_call_ids = set()
-                limit_reached = False
-
-                for tool_call in response.tool_calls:
-                    if tool_call_count >= REACT_MAX_TOOL_CALLS:
-                        logger.warning(f"[Writer ReAct] 최대 도구 호출 횟수 도달 ({REACT_MAX_TOOL_CALLS})")
-                        # [FIX] 모든 남은 tool_calls에 대해 LIMIT 응답 추가 (OpenAI API 규약)
-                        # 병렬 tool_call 시 응답 누락으로 인한 400 에러 방지
-                        for remaining_tc in response.tool_calls:
-                            if remaining_tc['id'] not in responded_tool_call_ids:
-                                messages.append(ToolMessage(
-                                    content="[LIMIT] 도구 호출 횟수 제한에 도달했습니다. 현재까지의 정보로 작성을 완료하세요.",
-                                    tool_call_id=remaining_tc['id']
-                                ))
-                                responded_tool_call_ids.add(remaining_tc['id'])
-                        limit_reached = True
-                        break
-
-                    tool_name = tool_call['name']
-                    tool_args = tool_call['args']
-
-                    logger.info(f"[Writer ReAct] Tool 호출: {tool_name}({list(tool_args.keys())})")
-
-                    # Tool 실행
-                    result = _execute_react_tool(tool_name, tool_args, tool_map, logger)
-                    tool_call_count += 1
+                # [NEW] 남은 호출 한도만큼 같은 턴의 도구를 동시에 실행 (결과는 원래 순서대로 전달)
+                allowed = response.tool_calls[:max(0, REACT_MAX_TOOL_CALLS - tool_call_count)]
+                over_limit = response.tool_calls[len(allowed):]
+
+                for tool_call in allowed:
+                    logger.info(f"[Writer ReAct] Tool 호출: {tool_call['name']}({list(tool_call['args'].keys())})")
+
+                records = _execute_react_tools(allowed, tool_map, logger, state.get("thread_id")) if allowed else []
+                tool_call_count += len(allowed)
+
+                for tool_call, record in zip(allowed, records):
+                    result = record["result"]
+                    tool_log.append({
+                        "tool": record["tool"], "status": record["status"],
+                        "elapsed_ms": record["elapsed_ms"], "turn": iteration,
+                    })
 
                     # 결과 저장
                     tool_results_context.append({
-                        "tool": tool_name,
-                        "query": tool_args.get("query", tool_args.get("specialist_type", "")),
+                        "tool": record["tool"],
+                        "query": tool_call['args'].get("query", tool_call['args'].get("specialist_type", "")),
                         "result_preview": result[:200] + "..." if len(result) > 200 else result
                     })
 
@@ -440,10 +838,16 @@ def _run_with_react_loop(
                         content=result,
                         tool_call_id=tool_call['id']
                     ))
-                    responded_tool_call_ids.add(tool_call['id'])
 
-                # 제한 도달 시 루프 종료, 아니면 계속
-                if limit_reached:
+                if over_limit:
+                    logger.warning(f"[Writer ReAct] 최대 도구 호출 횟수 도달 ({REACT_MAX_TOOL_CALLS})")
+                    # [FIX] 모든 남은 tool_calls에 대해 LIMIT 응답 추가 (OpenAI API 규약)
+                    # 병렬 tool_call 시 응답 누락으로 인한 400 에러 방지
+                    for remaining_tc in over_limit:
+                        messages.append(ToolMessage(
+                            content="[LIMIT] 도구 호출 횟수 제한에 도달했습니다. 현재까지의 정보로 작성을 완료하세요.",
+                            tool_call_id=remaining_tc['id']
+                        ))
                     logger.info("[Writer ReAct] 도구 호출 제한으로 최종 작성 단계로 진입")
                     break
 
@@ -505,11 +909,82 @@ def _run_with_react_loop(
         section_count = len(draft_dict.get("sections", []))
         logger.info(f"[Writer ReAct] ✅ 작성 완료 (섹션 {section_count}개, 도구 호출 {tool_call_count}회)")
 
-        return update_state(state, draft=draft_dict, current_step="write")
+        return update_state(state, draft=draft_dict, writer_tool_calls=tool_log, current_step="write")
 
     except Exception as e:
         logger.error(f"[Writer ReAct] 최종 작성 실패: {e}")
-        return update_state(state, error=f"Writer ReAct 실패: {str(e)}")
+        return update_state(state, writer_tool_calls=tool_log, error=f"Writer ReAct 실패: {str(e)}")
+
+
+def _timed_react_tool(tool_name: str, tool_args: dict, tool_map: dict, logger) -> tuple:
+    """도구 실행 + 소요 시간 (ms)"""
+    started = time.perf_counter()
+    result = _execute_react_tool(tool_name, tool_args, tool_map, logger)
+    return result, round((time.perf_counter() - started) * 1000, 1)
+
+
+def _execute_react_tools(tool_calls: list, tool_map: dict, logger, session_id: str = None) -> list:
+    """
+    [NEW] 같은 턴의 도구 호출을 도구 전용 실행기에서 동시에 실행
+
+    - 도구별 마감시간: 실제 실행 시작 시점 + REACT_TOOL_TIMEOUT_SEC (초과 시 [TIMEOUT] 결과로 대체, 작업은 버림)
+      (도구 풀 대기 시간은 포함하지 않음, 대기는 이번 턴의 가장 긴 타임아웃까지만 하고 시작 전이면 취소)
+    - 멈춘 도구는 취소할 수 없어 워커를 점유하지만, 도구 전용 풀(POOL_TOOLS)이라 전문 에이전트에는 영향 없음
+    - 결과는 tool_calls 순서대로 반환 (ToolMessage 순서 유지)
+
+    Args:
+        tool_calls: AIMessage.tool_calls 일부 ({"name", "args", "id"})
+        tool_map: 도구 이름 → 도구 객체 맵
+        logger: 로거
+        session_id: 공정 분배 단위 (thread_id)
+
+    Returns:
+        list: [{"tool", "result", "status"(ok/error/timeout), "elapsed_ms"}]
+    """
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+    from agents.specialist_executor import POOL_TOOLS, get_executor, new_session
+
+    executor = get_executor(POOL_TOOLS)
+    session = new_session(f"{session_id}:writer_tools" if session_id else "writer_tools")
+    started = time.perf_counter()
+    # 도구별 실제 실행 시작 시각 (워커가 집어 든 시점부터 타임아웃 계산)
+    starts = [{"event": threading.Event(), "at": None} for _ in tool_calls]
+
+    def run_tool(start: dict, tool_name: str, tool_args: dict) -> tuple:
+        start["at"] = time.perf_counter()
+        start["event"].set()
+        return _timed_react_tool(tool_name, tool_args, tool_map, logger)
+
+    futures = [
+        executor.submit(session, contextvars.copy_context().run, run_tool, start, tc["name"], tc["args"])
+        for tc, start in zip(tool_calls, starts)
+    ]
+
+    timeouts = [REACT_TOOL_TIMEOUT_SEC.get(tc["name"], REACT_DEFAULT_TOOL_TIMEOUT_SEC) for tc in tool_calls]
+    queue_deadline = started + max(timeouts, default=0)
+
+    records = []
+    for tc, timeout, start, future in zip(tool_calls, timeouts, starts, futures):
+        try:
+            if not start["event"].wait(max(0.0, queue_deadline - time.perf_counter())):
+                raise FutureTimeoutError()  # 도구 풀이 가득 차 시작하지 못함
+            result, elapsed_ms = future.result(timeout=max(0.0, start["at"] + timeout - time.perf_counter()))
+            status = "error" if str(result).startswith("[ERROR]") else "ok"
+        except FutureTimeoutError:
+            future.cancel()  # 시작 전이면 실행하지 않음
+            reason = "응답 시간 초과" if start["at"] is not None else "실행 대기 시간 초과"
+            logger.warning(f"[Writer ReAct] Tool '{tc['name']}' 타임아웃 ({timeout}초, {reason})")
+            result = f"[TIMEOUT] {tc['name']} {reason} ({timeout}초). 가정으로 진행하세요."
+            status = "timeout"
+            elapsed_ms = round((time.perf_counter() - (start["at"] or started)) * 1000, 1)
+        records.append({"tool": tc["name"], "result": result, "status": status, "elapsed_ms": elapsed_ms})
+
+    logger.info(
+        f"[Writer ReAct] 도구 {len(tool_calls)}개 동시 실행 완료 "
+        f"({(time.perf_counter() - started) * 1000:.0f}ms): "
+        + ", ".join(f"{r['tool']} {r['elapsed_ms']:.0f}ms({r['status']})" for r in records)
+    )
+    return records
 
 
 def _execute_react_tool(
@@ -7,6 +7,7 @@ This ensures backward compatibility while the codebase is refactored into modula
 # Re-export modules
 from agents.helpers.prompt_builder import (
     get_prompts_by_doc_type,
+    get_user_instructions_by_doc_type,
     build_review_context,
     build_refinement_context,
     build_visual_instruction,
@@ -16,7 +17,8 @@ from agents.helpers.executors import (
     execute_web_search,
     execute_specialist_agents  # [DEPRECATED] Supervisor 노드로 이동됨
 )
-from agents.helpers.validator import validate_draft
+from agents.helpers.validator import validate_draft, diagnose_draft, DraftDiagnosis
+from agents.helpers.draft_repair import repair_draft
 
 
 def get_specialist_context(state: dict, logger) -> str:
@@ -47,11 +49,11 @@ def get_specialist_context(state: dict, logger) -> str:
             logger.info("[Writer] ✓ 전문 에이전트 분석 결과 로드됨")
             return integrated_context
 
-        # integrated_context가 없으면 _integrate_results 호출
+        # integrated_context가 없으면 integrate_results 호출
         try:
-            from agents.supervisor import NativeSupervisor
-            supervisor = NativeSupervisor()
-            integrated_context = supervisor._integrate_results(specialist_analysis)
+            from agents.supervisor import get_supervisor
+            supervisor = get_supervisor()
+            integrated_context = supervisor.integrate_results(specialist_analysis)
             logger.info("[Writer] ✓ 전문 에이전트 분석 결과 통합됨")
             return integrated_context
         except Exception as e:
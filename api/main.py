@@ -4,9 +4,10 @@ import logging
 import threading
 import time
 from contextlib import asynccontextmanager
+from typing import Optional
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
 from api.routers import workflow_router
@@ -62,6 +63,71 @@ async def health_check():
     return {"status": "healthy", "service": "plancraft-api"}
 
 
+@app.get("/metrics/specialists")
+async def specialist_metrics():
+    """전문 에이전트 공용 워커 풀 대기열 지표 (용도별 풀 포함), 결과 캐시 통계, 파싱 실패 통계, 근거 번들 토큰 통계, 비용 모델"""
+    from agents.agent_cost_model import agent_cost_model
+    from agents.specialist_cache import specialist_cache
+    from agents.specialist_executor import executor_metrics, get_specialist_executor
+    from agents.specialist_output import specialist_parse_stats
+    from utils.evidence_bundle import evidence_token_stats
+
+    return {
+        "executor": get_specialist_executor().metrics(),
+        "executor_pools": executor_metrics(),
+        "cache": specialist_cache.stats(),
+        "parsing": specialist_parse_stats.snapshot(),
+        "evidence": evidence_token_stats.snapshot(),
+        "cost_model": agent_cost_model.snapshot(),
+    }
+
+
+@app.get("/metrics/reviewer")
+async def reviewer_metrics():
+    """Reviewer 규칙 기반 사전 심사 프리셋별 적중률 (LLM 생략 / 경량 모델 / 전체 심사), 토론 모드별 비용"""
+    from agents.helpers.review_gate import review_gate_stats
+    from graph.subgraphs import discussion_stats
+
+    return {"gate": review_gate_stats.snapshot(), "discussion": discussion_stats.snapshot()}
+
+
+@app.get("/metrics/writer")
+async def writer_metrics():
+    """Writer 섹션 단위 초안 캐시 통계, 프리셋별 섹션 재사용 비율"""
+    from agents.section_cache import section_cache
+
+    return {"section_cache": section_cache.stats(), "reuse": section_cache.reuse_snapshot()}
+
+
+@app.get("/metrics/prompts")
+async def prompt_metrics(limit: int = 20):
+    """노드/구성 요소별 프롬프트 토큰 통계, 최근 호출별 분석 (예산 맞춤으로 생략된 토큰 포함)"""
+    from utils.prompt_budget import prompt_size_stats
+
+    return {"nodes": prompt_size_stats.snapshot(), "recent": prompt_size_stats.recent(limit)}
+
+
+@app.get("/metrics/agents")
+async def agent_history_metrics(
+    agent_id: Optional[str] = None,
+    model_type: Optional[str] = None,
+    preset: Optional[str] = None,
+    group_by: str = "agent_id",
+):
+    """
+    전문 에이전트 실행 이력 집계 (지연시간 백분위수, 재시도/Fallback 비율, 토큰)
+
+    group_by: 쉼표 구분 컬럼 (agent_id 필수, model_type/preset 추가 가능)
+    """
+    from agents.agent_stats_store import get_agent_stats_store
+
+    columns = tuple(c.strip() for c in group_by.split(",") if c.strip())
+    try:
+        return get_agent_stats_store().summarize(agent_id, model_type, preset, group_by=columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 def start_api_server(host: str = "127.0.0.1", start_port: int = 8000, max_retries: int = 5, timeout: float = 10.0) -> int:
     """
     Start API server in background thread (Thread-safe)
@@ -72,14 +72,32 @@ class InterruptPayloadResponse(BaseModel):
     input_schema_name: Optional[str] = None
 
 
+class UsageBreakdown(BaseModel):
+    """Per-node / per-agent token usage"""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    cache_hit_ratio: float = 0.0
+    total_tokens: int = 0
+    llm_calls: int = 0
+    llm_errors: int = 0  # [NEW] failed calls included in llm_calls
+    latency_ms: float = 0.0
+    estimated_cost_usd: float = 0.0
+
+
 class TokenUsage(BaseModel):
     """Token usage statistics"""
     input_tokens: int = 0
     output_tokens: int = 0
+    cached_tokens: int = 0  # [NEW] Prompt cache hit tokens
+    cache_hit_ratio: float = 0.0  # [NEW] cached_tokens / input_tokens
     total_tokens: int = 0
     llm_calls: int = 0
+    llm_errors: int = 0  # [NEW] failed calls (incl. rate-limit retries) included in llm_calls
     estimated_cost_usd: float = 0.0
     estimated_cost_krw: float = 0.0
+    by_node: Dict[str, UsageBreakdown] = {}  # [NEW] keyed by LangGraph node
+    by_agent: Dict[str, UsageBreakdown] = {}  # [NEW] keyed by specialist agent_id
 
 
 class WorkflowRunResponse(BaseModel):
@@ -119,5 +137,6 @@ class WorkflowStatusResponse(BaseModel):
     current_step: Optional[str] = None
     step_history: List[Dict[str, Any]] = []
     has_pending_interrupt: bool = False
+    chat_summary: Optional[str] = None  # [NEW] 백그라운드에서 다듬은 요약이 있으면 그 값, 없으면 규칙 기반 요약
     result: Optional[Dict[str, Any]] = None  # 완료/중단 시 전체 상태 반환
     token_usage: Optional[TokenUsage] = None  # [NEW] Token usage tracking
@@ -208,12 +208,19 @@ class WorkflowService:
         # Extract token usage if available
         token_usage = self._extract_token_usage(state.get("token_usage"))
 
+        # [NEW] Formatter가 백그라운드로 다듬은 채팅 요약 우선 (없으면 규칙 기반 요약)
+        from agents.formatter import get_polished_summary
+        chat_summary = get_polished_summary(thread_id) or state.get("chat_summary")
+        if result_data is not None and chat_summary:
+            result_data["chat_summary"] = chat_summary
+
         return WorkflowStatusResponse(
             thread_id=thread_id,
             status=status,
             current_step=state.get("current_step"),
             step_history=state.get("step_history", []),
             has_pending_interrupt=has_interrupt,
+            chat_summary=chat_summary,
             result=result_data,
             token_usage=token_usage,
         )
@@ -227,10 +234,15 @@ class WorkflowService:
             return TokenUsage(
                 input_tokens=usage_data.get("input_tokens", 0),
                 output_tokens=usage_data.get("output_tokens", 0),
+                cached_tokens=usage_data.get("cached_tokens", 0),
+                cache_hit_ratio=usage_data.get("cache_hit_ratio", 0.0),
                 total_tokens=usage_data.get("total_tokens", 0),
                 llm_calls=usage_data.get("llm_calls", 0),
+                llm_errors=usage_data.get("llm_errors", 0),
                 estimated_cost_usd=usage_data.get("estimated_cost_usd", 0.0),
                 estimated_cost_krw=usage_data.get("estimated_cost_krw", 0.0),
+                by_node=usage_data.get("by_node") or {},
+                by_agent=usage_data.get("by_agent") or {},
             )
         except Exception as e:
             logger.warning(f"[Workflow] Failed to extract token usage: {e}")
@@ -0,0 +1,11 @@
+"""
+PlanCraft - 워크플로우 벤치마크 패키지
+
+오프라인 Fake LLM/검색 백엔드로 run_plancraft를 프리셋별로 실행하여
+노드 지연시간, LLM 호출 수, 프롬프트 토큰, 메모리, 체크포인트 크기를 측정하고
+저장된 Baseline과 비교합니다.
+
+실행 방법:
+    python -m benchmarks.run_benchmark                    # 측정 + Baseline 비교
+    python -m benchmarks.run_benchmark --update-baseline  # Baseline 갱신
+"""
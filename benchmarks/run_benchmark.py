@@ -0,0 +1,406 @@
+"""
+PlanCraft - End-to-End 워크플로우 벤치마크
+
+오프라인 Fake LLM/검색 백엔드(utils/fake_llm.py, PLANCRAFT_SEARCH_BACKEND=fake)로
+run_plancraft를 프리셋 × 입력 코퍼스만큼 실행하고 다음 지표를 수집합니다.
+
+    - 노드별 지연시간 백분위수 (p50/p95/max)
+    - 실행당 LLM 호출 수 / 프롬프트 토큰 / 출력 토큰
+    - 실행당 Python 힙 최대 사용량 (tracemalloc) 및 프로세스 Peak RSS
+    - 실행당 체크포인트 기록 바이트 (In-Memory Checkpointer 기준)
+
+저장된 Baseline(benchmarks/baseline.json)과 비교하여 임계값을 넘는 회귀가 있으면
+종료 코드 1을 반환합니다. (LLM 왕복 추가, State 크기 급증 등을 조기에 감지)
+
+실행 방법:
+    python -m benchmarks.run_benchmark
+    python -m benchmarks.run_benchmark --presets fast,balanced --repeat 2
+    python -m benchmarks.run_benchmark --latency-ms 300 --output reports/bench.json
+    python -m benchmarks.run_benchmark --update-baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import resource
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_CORPUS_PATH = BENCHMARK_DIR / "corpus.json"
+DEFAULT_BASELINE_PATH = BENCHMARK_DIR / "baseline.json"
+DEFAULT_PRESETS = ["fast", "balanced", "quality"]
+
+# 회귀 판정 임계값 (Baseline 대비 허용 증가율)
+# - LLM 호출 수는 Fake 백엔드에서 결정론적이므로 증가 자체를 회귀로 판정
+DEFAULT_THRESHOLDS: Dict[str, float] = {
+    "llm_calls_mean": 0.0,
+    "prompt_tokens_mean": 0.10,
+    "checkpoint_bytes_mean": 0.25,
+    "peak_traced_mb_max": 0.50,
+    "wall_ms_p95": 0.50,
+    "node_p95_ms": 0.50,
+}
+# 지연시간 지표의 절대 허용 오차 (ms 단위 노이즈 무시)
+LATENCY_ABS_SLACK_MS = 50.0
+
+
+# =============================================================================
+# 측정 도구
+# =============================================================================
+
+class NodeTimingCallback(BaseCallbackHandler):
+    """LangGraph 노드 단위 실행 시간 수집 콜백 (metadata["langgraph_node"] 기준)"""
+
+    def __init__(self):
+        self._starts: Dict[Any, tuple] = {}
+        self.durations_ms: Dict[str, List[float]] = {}
+
+    def on_chain_start(self, serialized, inputs, **kwargs: Any) -> None:
+        node = (kwargs.get("metadata") or {}).get("langgraph_node")
+        # 노드 자체 실행만 기록 (노드 내부의 하위 체인 제외)
+        if node and kwargs.get("name") == node:
+            self._starts[kwargs.get("run_id")] = (node, time.perf_counter())
+
+    def _finish(self, run_id) -> None:
+        started = self._starts.pop(run_id, None)
+        if started:
+            node, start = started
+            self.durations_ms.setdefault(node, []).append((time.perf_counter() - start) * 1000)
+
+    def on_chain_end(self, outputs, **kwargs: Any) -> None:
+        self._finish(kwargs.get("run_id"))
+
+    def on_chain_error(self, error, **kwargs: Any) -> None:
+        self._finish(kwargs.get("run_id"))
+
+
+def _typed_len(value: Any) -> int:
+    """Checkpointer 직렬화 값((type, bytes) 또는 bytes)의 바이트 길이"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], (bytes, bytearray)):
+        return len(value[1])
+    return 0
+
+
+def checkpoint_bytes(checkpointer: Any, thread_id: str) -> Optional[int]:
+    """
+    스레드가 In-Memory Checkpointer에 기록한 직렬화 바이트 합계
+
+    Checkpointer가 In-Memory 계열이 아니면 None을 반환합니다.
+    """
+    storage = getattr(checkpointer, "storage", None)
+    if storage is None:
+        return None
+
+    total = 0
+    for checkpoints in storage.get(thread_id, {}).values():
+        for checkpoint, metadata, _parent in checkpoints.values():
+            total += _typed_len(checkpoint) + _typed_len(metadata)
+    for key, writes in getattr(checkpointer, "writes", {}).items():
+        if key[0] == thread_id:
+            total += sum(_typed_len(w[2]) for w in writes.values())
+    for key, blob in getattr(checkpointer, "blobs", {}).items():
+        if key[0] == thread_id:
+            total += _typed_len(blob)
+    return total
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _peak_rss_mb() -> float:
+    """프로세스 Peak RSS (MB) - Linux는 KB, macOS는 bytes 단위"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# =============================================================================
+# 실행
+# =============================================================================
+
+def setup_offline_backends(latency_ms: float = 0.0, **fake_overrides) -> None:
+    """Fake LLM/Embedding/검색 백엔드 활성화 (시간 동기화 포함 네트워크 미사용)"""
+    from utils.config import Config
+    from utils.fake_llm import configure_fake_backend
+    from utils.llm import set_llm_backend
+
+    # Reranker 등 HuggingFace 모델은 로컬 캐시만 사용 (네트워크 재시도로 인한 지연 왜곡 방지)
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    configure_fake_backend(
+        latency_ms_mean=latency_ms,
+        latency_ms_std=latency_ms * 0.25,
+        **fake_overrides,
+    )
+    set_llm_backend("fake")
+    Config.SEARCH_BACKEND = "fake"
+    Config.TIME_SYNC_MODE = "off"
+
+
+def run_single(user_input: str, preset: str, quiet: bool = True) -> Dict[str, Any]:
+    """워크플로우 1회 실행 후 지표 반환 (콜드 요청 기준: 전문 에이전트 결과/섹션 캐시 초기화)"""
+    from agents.section_cache import section_cache
+    from agents.specialist_cache import specialist_cache
+    from graph.workflow import app, run_plancraft
+    from utils.streamlit_callback import TokenTrackingCallback
+
+    specialist_cache.clear()
+    section_cache.clear()
+    thread_id = f"bench-{preset}-{uuid.uuid4().hex[:8]}"
+    token_cb = TokenTrackingCallback()
+    timing_cb = NodeTimingCallback()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    sink = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(sink) if quiet else contextlib.nullcontext():
+        result = run_plancraft(
+            user_input=user_input,
+            thread_id=thread_id,
+            generation_preset=preset,
+            callbacks=[token_cb, timing_cb],
+        )
+    wall_ms = (time.perf_counter() - start) * 1000
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    usage = token_cb.get_usage_summary()
+    return {
+        "preset": preset,
+        "user_input": user_input,
+        "status": (
+            "error" if result.get("error") else
+            "interrupted" if result.get("__interrupt__") else
+            "completed" if result.get("final_output") else "incomplete"
+        ),
+        "wall_ms": wall_ms,
+        "llm_calls": usage["llm_calls"],
+        "prompt_tokens": usage["input_tokens"],
+        "completion_tokens": usage["output_tokens"],
+        "checkpoint_bytes": checkpoint_bytes(app.checkpointer, thread_id),
+        "peak_traced_mb": peak_traced / (1024 * 1024),
+        "node_ms": timing_cb.durations_ms,
+    }
+
+
+def aggregate(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """프리셋 단위 지표 집계"""
+    def mean(key):
+        values = [r[key] for r in runs if r.get(key) is not None]
+        return round(sum(values) / len(values), 1) if values else None
+
+    node_samples: Dict[str, List[float]] = {}
+    for r in runs:
+        for node, durations in r["node_ms"].items():
+            node_samples.setdefault(node, []).extend(durations)
+
+    walls = [r["wall_ms"] for r in runs]
+    return {
+        "runs": len(runs),
+        "statuses": {s: sum(1 for r in runs if r["status"] == s) for s in {r["status"] for r in runs}},
+        "llm_calls_mean": mean("llm_calls"),
+        "prompt_tokens_mean": mean("prompt_tokens"),
+        "completion_tokens_mean": mean("completion_tokens"),
+        "checkpoint_bytes_mean": mean("checkpoint_bytes"),
+        "peak_traced_mb_max": round(max(r["peak_traced_mb"] for r in runs), 2),
+        "wall_ms_p50": round(percentile(walls, 50), 1),
+        "wall_ms_p95": round(percentile(walls, 95), 1),
+        "nodes": {
+            node: {
+                "count": len(samples),
+                "p50_ms": round(percentile(samples, 50), 1),
+                "p95_ms": round(percentile(samples, 95), 1),
+                "max_ms": round(max(samples), 1),
+            }
+            for node, samples in sorted(node_samples.items())
+        },
+    }
+
+
+def run_benchmark(
+    presets: List[str] = None,
+    corpus: List[str] = None,
+    repeat: int = 1,
+    latency_ms: float = 0.0,
+    warmup: int = 1,
+    quiet: bool = True,
+) -> Dict[str, Any]:
+    """
+    프리셋 × 코퍼스 벤치마크 실행
+
+    프리셋마다 warmup 횟수만큼 먼저 실행하고 결과에서 제외합니다.
+    (모델 Lazy Loading, LRU 캐시 초기화 비용 분리)
+
+    Returns:
+        dict: {"config": ..., "presets": {preset: 집계 지표}, "peak_rss_mb": float}
+    """
+    presets = presets or DEFAULT_PRESETS
+    corpus = corpus if corpus is not None else load_json(DEFAULT_CORPUS_PATH)
+    setup_offline_backends(latency_ms=latency_ms)
+
+    report = {
+        "config": {"presets": presets, "corpus_size": len(corpus), "repeat": repeat,
+                   "warmup": warmup, "latency_ms": latency_ms},
+        "presets": {},
+    }
+    for preset in presets:
+        for user_input in corpus[:warmup]:
+            run_single(user_input, preset, quiet=quiet)
+        runs = [
+            run_single(user_input, preset, quiet=quiet)
+            for _ in range(repeat)
+            for user_input in corpus
+        ]
+        report["presets"][preset] = aggregate(runs)
+    report["peak_rss_mb"] = round(_peak_rss_mb(), 1)
+    return report
+
+
+# =============================================================================
+# Baseline 비교
+# =============================================================================
+
+def _exceeds(metric: str, current: float, base: float, tolerance: float) -> bool:
+    if current is None or base is None:
+        return False
+    if current <= base * (1 + tolerance):
+        return False
+    if metric.endswith("_ms") or "_ms_" in metric:
+        return current - base > LATENCY_ABS_SLACK_MS
+    return True
+
+
+def compare_with_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    thresholds: Dict[str, float] = None,
+) -> List[str]:
+    """
+    Baseline 대비 회귀 목록 반환 (빈 리스트면 통과)
+
+    Baseline에 없는 프리셋/노드는 비교하지 않습니다.
+    """
+    thresholds = {**DEFAULT_THRESHOLDS, **(baseline.get("thresholds") or {}), **(thresholds or {})}
+    regressions = []
+
+    for preset, current in report.get("presets", {}).items():
+        base = (baseline.get("presets") or {}).get(preset)
+        if not base:
+            continue
+
+        for metric in ("llm_calls_mean", "prompt_tokens_mean", "checkpoint_bytes_mean",
+                       "peak_traced_mb_max", "wall_ms_p95"):
+            if _exceeds(metric, current.get(metric), base.get(metric), thresholds[metric]):
+                regressions.append(
+                    f"[{preset}] {metric}: {base.get(metric)} → {current.get(metric)} "
+                    f"(허용 +{thresholds[metric]:.0%})"
+                )
+
+        for node, stats in current.get("nodes", {}).items():
+            base_node = (base.get("nodes") or {}).get(node)
+            if base_node and _exceeds("node_p95_ms", stats["p95_ms"], base_node["p95_ms"], thresholds["node_p95_ms"]):
+                regressions.append(
+                    f"[{preset}] node '{node}' p95: {base_node['p95_ms']}ms → {stats['p95_ms']}ms"
+                )
+
+    return regressions
+
+
+def load_json(path: Path) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """콘솔 출력용 요약 테이블"""
+    lines = [f"Peak RSS: {report.get('peak_rss_mb')} MB"]
+    for preset, stats in report["presets"].items():
+        lines.append(
+            f"\n== {preset} ({stats['runs']} runs, {stats['statuses']}) ==\n"
+            f"  LLM calls/run: {stats['llm_calls_mean']}  prompt tokens/run: {stats['prompt_tokens_mean']}  "
+            f"checkpoint bytes/run: {stats['checkpoint_bytes_mean']}\n"
+            f"  wall p50/p95: {stats['wall_ms_p50']}/{stats['wall_ms_p95']} ms  "
+            f"peak heap: {stats['peak_traced_mb_max']} MB"
+        )
+        for node, n in stats["nodes"].items():
+            lines.append(f"    {node:<20} n={n['count']:<3} p50={n['p50_ms']:>8}ms p95={n['p95_ms']:>8}ms")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="PlanCraft 워크플로우 벤치마크 (오프라인 Fake 백엔드)")
+    parser.add_argument("--presets", default=",".join(DEFAULT_PRESETS), help="쉼표 구분 프리셋 목록")
+    parser.add_argument("--corpus", default=str(DEFAULT_CORPUS_PATH), help="입력 코퍼스 JSON 경로")
+    parser.add_argument("--repeat", type=int, default=1, help="코퍼스 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=1, help="프리셋별 워밍업 실행 횟수 (집계 제외)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fake LLM 평균 지연 (ms)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="Baseline JSON 경로")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과로 Baseline 갱신")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--verbose", action="store_true", help="워크플로우 stdout 출력")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        presets=[p.strip() for p in args.presets.split(",") if p.strip()],
+        corpus=load_json(Path(args.corpus)),
+        repeat=args.repeat,
+        latency_ms=args.latency_ms,
+        warmup=args.warmup,
+        quiet=not args.verbose,
+    )
+    print(format_report(report))
+
+    if args.output:
+        save_json(Path(args.output), report)
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        previous = load_json(baseline_path) if baseline_path.exists() else {}
+        report["thresholds"] = previous.get("thresholds", DEFAULT_THRESHOLDS)
+        save_json(baseline_path, report)
+        print(f"\n[Benchmark] Baseline 갱신: {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"\n[Benchmark] Baseline 없음 ({baseline_path}) - 비교 생략")
+        return 0
+
+    regressions = compare_with_baseline(report, load_json(baseline_path))
+    if regressions:
+        print("\n[Benchmark] ❌ 회귀 감지:")
+        for r in regressions:
+            print(f"  - {r}")
+        return 1
+
+    print("\n[Benchmark] ✅ Baseline 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("PLANCRAFT_LLM_BACKEND", "fake")
+    os.environ.setdefault("PLANCRAFT_SEARCH_BACKEND", "fake")
+    os.environ.setdefault("PLANCRAFT_AGENT_STATS_DB", ":memory:")  # 실행마다 동일한 이력 조건
+    sys.exit(main())
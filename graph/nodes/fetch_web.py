@@ -6,6 +6,7 @@ from graph.nodes.common import update_step_history
 from tools.web_search_executor import execute_web_search
 from utils.tracing import trace_node
 from utils.error_handler import handle_node_error
+from utils.evidence_bundle import build_evidence_bundle
 
 @trace_node("context", tags=["web", "search", "tavily"])
 @handle_node_error
@@ -18,6 +19,9 @@ def fetch_web_context(state: PlanCraftState) -> PlanCraftState:
     - balanced: 3개 쿼리, basic depth
     - quality: 5개 쿼리, advanced depth
 
+    [NEW] 검색 결과 + RAG 문서로 근거 번들(evidence_bundle)을 한 번 생성하여
+    전문 에이전트와 Writer가 공유합니다. (utils/evidence_bundle.py)
+
     Side-Effect: 외부 웹 API 호출 (Tavily Search)
     - 실패 시 재시도 안전함 (조회 전용, 멱등성 보장)
     - 검색 결과 캐싱으로 중복 호출 방지
@@ -37,7 +41,10 @@ def fetch_web_context(state: PlanCraftState) -> PlanCraftState:
     if not preset.web_search_enabled:
         print(f"[FetchWeb] 웹 검색 비활성화 (preset={preset_key})")
         return update_step_history(
-            update_state(state, web_context=None, web_urls=[], web_sources=[]),
+            update_state(
+                state, web_context=None, web_urls=[], web_sources=[],
+                evidence_bundle=build_evidence_bundle(rag_context=state.get("rag_context")).to_dict()
+            ),
             "fetch_web", "SKIPPED", "웹 검색 비활성화됨",
             start_time=start_time
         )
@@ -110,6 +117,7 @@ def fetch_web_context(state: PlanCraftState) -> PlanCraftState:
             web_context=final_context,
             web_urls=final_urls,
             web_sources=final_sources,
+            evidence_bundle=build_evidence_bundle(final_sources, rag_context, final_context).to_dict(),
             current_step="fetch_web"
         )
 
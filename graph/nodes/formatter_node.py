@@ -17,12 +17,12 @@ def run_formatter_node(state: PlanCraftState) -> PlanCraftState:
 
     LangSmith: run_name="📋 최종 포맷팅", tags=["agent", "output", "final"]
 
-    Side-Effect: LLM 호출 (Azure OpenAI)
+    Side-Effect: LLM 호출 (Azure OpenAI, preset.chat_summary_polish가 sync/background일 때만)
 
     처리 단계:
     1. Draft → Final Output 변환 (마크다운 조합)
     2. 웹 출처 링크 추가 (참고 자료 섹션)
-    3. Formatter Agent 호출 (chat_summary 생성)
+    3. Formatter Agent 호출 (chat_summary 규칙 기반 생성, LLM 다듬기는 선택)
     4. refine_count 리셋 (사용자 수정 기회 3회 부여)
 
     재시도 안전: 포맷팅만 수행, 외부 상태 변경 없음
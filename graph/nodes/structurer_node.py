@@ -4,6 +4,11 @@ Structurer Node
 from agents.structurer import run
 from graph.state import PlanCraftState
 from graph.nodes.common import update_step_history
+from graph.nodes.supervisor_node import (
+    cancel_speculative_specialists,
+    join_speculative_specialists,
+    start_speculative_specialists,
+)
 from utils.tracing import trace_node
 from utils.error_handler import handle_node_error
 from utils.decorators import require_state_keys
@@ -23,8 +28,17 @@ def run_structurer_node(state: PlanCraftState) -> PlanCraftState:
     """
     import time
     start_time = time.time()
-    
-    new_state = run(state)
+
+    # [NEW] 전문 에이전트 분석을 구조 설계와 병렬로 시작 (preset.speculative_specialists)
+    prefetch = start_speculative_specialists(state)
+
+    # 구조 설계가 실패하면 선행 실행을 취소 (백그라운드 에이전트가 남지 않도록)
+    try:
+        new_state = run(state)
+    except BaseException:
+        cancel_speculative_specialists(prefetch)
+        raise
+    new_state = join_speculative_specialists(prefetch, new_state)
     structure = new_state.get("structure")
     count = 0
     if structure:
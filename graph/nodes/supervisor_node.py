@@ -8,6 +8,17 @@ structure 노드 후, write 노드 전에 실행됩니다.
 - use_specialist_agents=True (기본값)
 - refine_count == 0 (첫 작성 시에만)
 
+[NEW] 선행 실행 (preset.speculative_specialists, Balanced/Quality)
+- 전문 에이전트는 structure 결과를 사용하지 않으므로 structure 노드가 시작할 때
+  start_speculative_specialists()로 함께 시작하고, 구조 설계 후 join합니다.
+- 이 경우 run_specialists 노드는 specialist_prefetched 표시를 확인하고 재실행하지 않습니다.
+
+[NEW] Writer 파이프라인 (preset.stream_specialists_to_writer, Quality)
+- 백그라운드 실행 결과를 에이전트 완료 즉시 SpecialistResultStream에 게시하고
+  상태에는 specialist_stream_id만 기록한 채 join 없이 다음 노드로 진행합니다.
+- Writer는 섹션에 필요한 결과가 준비되는 대로 작성하고, 마지막에 전체 결과를
+  specialist_analysis로 반영합니다. (agents/specialist_stream.py)
+
 [출력]
 - specialist_analysis: 전문 에이전트 분석 결과 딕셔너리
 
@@ -16,8 +27,11 @@ structure 노드 후, write 노드 전에 실행됩니다.
 - supervisor_agent_complete: 개별 에이전트 완료
 - supervisor_complete: 전문가 분석 완료
 """
+import contextvars
+import threading
 import time
-from typing import List
+from concurrent.futures import CancelledError, Future
+from typing import List, Optional, Tuple
 from graph.state import PlanCraftState, update_state, ensure_dict
 from graph.nodes.common import update_step_history
 from utils.tracing import trace_node
@@ -60,11 +74,33 @@ def run_supervisor_node(state: PlanCraftState) -> PlanCraftState:
     logger = get_file_logger()
     start_time = time.time()
 
-    refine_count = state.get("refine_count", 0)
-    use_specialist_agents = state.get("use_specialist_agents", True)
+    # [NEW] 실행 중인 결과 스트림이 있으면 Writer가 섹션별로 소비 (대기하지 않음)
+    stream_id = state.get("specialist_stream_id")
+    if stream_id:
+        from agents.specialist_stream import get_specialist_stream
+        if get_specialist_stream(stream_id) is not None:
+            logger.info(f"[Supervisor Node] 결과 스트리밍 중 - Writer와 파이프라인 실행 ({stream_id})")
+            return update_step_history(
+                state, "run_specialists", "SUCCESS",
+                summary="전문가 분석 스트리밍 (Writer와 파이프라인 실행)",
+                start_time=start_time
+            )
+        # 스트림 유실 (프로세스 재시작 등): 아래에서 순차 실행
+        logger.warning(f"[Supervisor Node] 결과 스트림 없음, 순차 실행으로 전환 ({stream_id})")
+        state = update_state(state, specialist_stream_id=None)
+
+    # [NEW] structure 노드에서 병렬 선행 실행된 결과 사용
+    if state.get("specialist_prefetched"):
+        agent_count = len(_executed_agents(state.get("specialist_analysis") or {}))
+        logger.info(f"[Supervisor Node] 구조 설계와 병렬 실행된 결과 사용 ({agent_count}개 에이전트)")
+        return update_step_history(
+            update_state(state, specialist_prefetched=False), "run_specialists", "SUCCESS",
+            summary=f"전문가 {agent_count}명 분석 완료 (구조 설계와 병렬 실행)",
+            start_time=start_time
+        )
 
     # 조건 체크: 개선 시에는 기존 결과 유지 (스킵)
-    if refine_count > 0:
+    if state.get("refine_count", 0) > 0:
         logger.info("[Supervisor Node] 개선 모드 - 기존 분석 결과 유지")
         return update_step_history(
             state, "run_specialists", "SKIPPED",
@@ -73,7 +109,7 @@ def run_supervisor_node(state: PlanCraftState) -> PlanCraftState:
         )
 
     # 조건 체크: Specialist 비활성화 시 스킵
-    if not use_specialist_agents:
+    if not state.get("use_specialist_agents", True):
         logger.info("[Supervisor Node] 전문 에이전트 비활성화됨")
         return update_step_history(
             state, "run_specialists", "SKIPPED",
@@ -81,90 +117,24 @@ def run_supervisor_node(state: PlanCraftState) -> PlanCraftState:
             start_time=start_time
         )
 
-    # 입력 준비
-    user_input = state.get("user_input", "")
-    web_context = state.get("web_context", "")
-
-    analysis_dict = state.get("analysis", {})
-    if hasattr(analysis_dict, "model_dump"):
-        analysis_dict = analysis_dict.model_dump()
-    elif not isinstance(analysis_dict, dict):
-        analysis_dict = {}
-
-    target_market = analysis_dict.get("target_market", "일반 시장")
-    target_users = analysis_dict.get("target_user", "일반 사용자")
-    tech_stack = analysis_dict.get("tech_stack", "React Native + Node.js + PostgreSQL")
-    user_constraints = analysis_dict.get("user_constraints", [])
-
-    # 웹 컨텍스트를 검색 결과 형태로 변환
-    web_search_list = []
-    if web_context:
-        for line in web_context.split("\n"):
-            if line.strip():
-                web_search_list.append({"title": "", "content": line[:500]})
-
-    try:
-        from agents.supervisor import NativeSupervisor
-
-        logger.info("[Supervisor Node] 🤖 전문 에이전트 분석 시작...")
-
-        # [LangGraph Event] 전문가 분석 시작
-        _emit_event("supervisor_start", {
-            "service_overview": user_input[:100],
-            "target_market": target_market,
-            "timestamp": time.time()
-        })
-
-        # 에이전트 이벤트 콜백 (LangGraph 이벤트로 브릿지)
-        def on_agent_event(event: dict):
-            event_type = event.get("type", "")
-            if event_type == "agent_success":
-                _emit_event("supervisor_agent_complete", {
-                    "agent_id": event.get("agent_id"),
-                    "duration_ms": event.get("duration_ms"),
-                    "success": True
-                })
-            elif event_type == "agent_error":
-                _emit_event("supervisor_agent_complete", {
-                    "agent_id": event.get("agent_id"),
-                    "error": event.get("error"),
-                    "success": False
-                })
-
-        supervisor = NativeSupervisor()
-        specialist_results = supervisor.run(
-            service_overview=user_input,
-            target_market=target_market,
-            target_users=target_users,
-            tech_stack=tech_stack,
-            development_scope="MVP 3개월",
-            web_search_results=web_search_list,
-            user_constraints=user_constraints,
-            deep_analysis_mode=state.get("deep_analysis_mode", False),
-            event_callback=on_agent_event  # [NEW] 이벤트 콜백 연결
+    # [NEW] 선행 실행 없이 파이프라인만 켜진 프리셋: 여기서 백그라운드 시작
+    from utils.settings import get_preset
+    if get_preset(state.get("generation_preset", "balanced")).stream_specialists_to_writer:
+        future = _start_in_background(state, stream=True)
+        logger.info("[Supervisor Node] 전문 에이전트 결과 스트리밍 시작 (Writer와 파이프라인 실행)")
+        return update_step_history(
+            update_state(state, specialist_stream_id=future.stream_id), "run_specialists", "SUCCESS",
+            summary="전문가 분석 스트리밍 (Writer와 파이프라인 실행)",
+            start_time=start_time
         )
 
-        # 실행된 에이전트 수 계산
-        executed_agents: List[str] = []
-        for key in ["market_analysis", "business_model", "financial_plan", "risk_analysis", "tech_analysis", "content_strategy"]:
-            if specialist_results.get(key):
-                executed_agents.append(key.split("_")[0])
-
-        agent_count = len(executed_agents)
-        logger.info(f"[Supervisor Node] ✓ 전문 에이전트 분석 완료 ({agent_count}개 에이전트)")
-
-        # [LangGraph Event] 전문가 분석 완료
-        _emit_event("supervisor_complete", {
-            "agent_count": agent_count,
-            "executed_agents": executed_agents,
-            "duration_sec": time.time() - start_time
-        })
-
+    try:
+        specialist_results, executed_agents = _run_specialist_analysis(state, start_time)
         new_state = update_state(state, specialist_analysis=specialist_results)
 
         return update_step_history(
             new_state, "run_specialists", "SUCCESS",
-            summary=f"전문가 {agent_count}명 분석 완료",
+            summary=f"전문가 {len(executed_agents)}명 분석 완료",
             start_time=start_time
         )
 
@@ -182,3 +152,234 @@ def run_supervisor_node(state: PlanCraftState) -> PlanCraftState:
             summary=f"분석 오류: {str(e)[:50]}",
             start_time=start_time
         )
+
+
+def _executed_agents(specialist_results: dict) -> List[str]:
+    """결과가 있는 에이전트 목록"""
+    executed_agents: List[str] = []
+    for key in ["market_analysis", "business_model", "financial_plan", "risk_analysis", "tech_analysis", "content_strategy"]:
+        if specialist_results.get(key):
+            executed_agents.append(key.split("_")[0])
+    return executed_agents
+
+
+def _run_specialist_analysis(
+    state: PlanCraftState,
+    start_time: float,
+    result_stream=None,
+    cancel_event: Optional[threading.Event] = None
+) -> Tuple[dict, List[str]]:
+    """
+    입력 준비 → Supervisor 실행 → 이벤트 발송 (노드 실행 / 선행 실행 공용)
+
+    Args:
+        result_stream: 에이전트 완료 즉시 결과를 게시할 스트림 (Writer 파이프라인)
+        cancel_event: set()되면 Supervisor가 실행 중 에이전트를 취소하고 중단 (선행 실행 취소)
+
+    Returns:
+        Tuple[dict, List[str]]: (specialist_results, 실행된 에이전트 목록)
+    """
+    logger = get_file_logger()
+
+    # 입력 준비
+    user_input = state.get("user_input", "")
+
+    analysis_dict = state.get("analysis", {})
+    if hasattr(analysis_dict, "model_dump"):
+        analysis_dict = analysis_dict.model_dump()
+    elif not isinstance(analysis_dict, dict):
+        analysis_dict = {}
+
+    target_market = analysis_dict.get("target_market", "일반 시장")
+    target_users = analysis_dict.get("target_user", "일반 사용자")
+    tech_stack = analysis_dict.get("tech_stack", "React Native + Node.js + PostgreSQL")
+    user_constraints = analysis_dict.get("user_constraints", [])
+
+    # [NEW] 근거 번들을 시장 분석 예산 내로 렌더링 (web_context 줄 단위 분할 대신)
+    #       나머지 전문 에이전트는 Supervisor가 에이전트별 예산으로 렌더링 (evidence_bundle)
+    from utils.evidence_bundle import get_evidence_bundle
+    evidence_bundle = get_evidence_bundle(state)
+    market_evidence = evidence_bundle.render("market", kinds=("web",))
+
+    from agents.supervisor import get_supervisor
+
+    logger.info("[Supervisor Node] 🤖 전문 에이전트 분석 시작...")
+
+    # [LangGraph Event] 전문가 분석 시작
+    _emit_event("supervisor_start", {
+        "service_overview": user_input[:100],
+        "target_market": target_market,
+        "timestamp": time.time()
+    })
+
+    # 에이전트 이벤트 콜백 (LangGraph 이벤트로 브릿지)
+    def on_agent_event(event: dict):
+        event_type = event.get("type", "")
+        if event_type == "agent_success":
+            _emit_event("supervisor_agent_complete", {
+                "agent_id": event.get("agent_id"),
+                "duration_ms": event.get("duration_ms"),
+                "success": True
+            })
+        elif event_type == "agent_error":
+            _emit_event("supervisor_agent_complete", {
+                "agent_id": event.get("agent_id"),
+                "error": event.get("error"),
+                "success": False
+            })
+
+    # [NEW] 프리셋 실행 예산 (빠른 생성: 초과 시 경량 모델 다운그레이드/저효용 에이전트 생략)
+    from agents.agent_cost_model import RoutingBudget
+    from utils.settings import get_preset
+    routing_budget = RoutingBudget.from_preset(get_preset(state.get("generation_preset", "balanced")))
+
+    # [NEW] 캐싱된 Supervisor 재사용 (요청마다 에이전트 재생성하지 않음)
+    supervisor = get_supervisor()
+    specialist_results = supervisor.run(
+        service_overview=user_input,
+        target_market=target_market,
+        target_users=target_users,
+        tech_stack=tech_stack,
+        development_scope="MVP 3개월",
+        web_search_results=market_evidence,
+        user_constraints=user_constraints,
+        deep_analysis_mode=state.get("deep_analysis_mode", False),
+        event_callback=on_agent_event,  # [NEW] 이벤트 콜백 연결
+        session_id=state.get("thread_id"),  # [NEW] 공용 실행기 공정 분배 단위
+        result_stream=result_stream,  # [NEW] 완료 즉시 Writer에 게시
+        routing_budget=routing_budget,  # [NEW] 예산 기반 에이전트 선택
+        generation_preset=state.get("generation_preset", ""),  # [NEW] 실행 이력 집계 단위
+        cancel_event=cancel_event,  # [NEW] 선행 실행 취소 신호
+        evidence_bundle=evidence_bundle  # [NEW] 전문 에이전트별 근거 렌더링
+    )
+
+    # 실행된 에이전트 수 계산
+    executed_agents = _executed_agents(specialist_results)
+    agent_count = len(executed_agents)
+    logger.info(f"[Supervisor Node] ✓ 전문 에이전트 분석 완료 ({agent_count}개 에이전트)")
+
+    # [LangGraph Event] 전문가 분석 완료
+    _emit_event("supervisor_complete", {
+        "agent_count": agent_count,
+        "executed_agents": executed_agents,
+        "duration_sec": time.time() - start_time
+    })
+
+    return specialist_results, executed_agents
+
+
+# =============================================================================
+# [NEW] 선행 실행 (structure 노드와 병렬)
+# =============================================================================
+
+def start_speculative_specialists(state: PlanCraftState) -> Optional[Future]:
+    """
+    구조 설계와 동시에 전문 에이전트 분석을 백그라운드로 시작합니다.
+
+    전문 에이전트는 analysis/web_context만 사용하므로 structure 결과를 기다릴 필요가 없습니다.
+    프리셋(speculative_specialists)이 꺼져 있거나 run_specialists가 스킵될 조건이면 None을 반환합니다.
+
+    Returns:
+        Optional[Future]: (specialist_results, executed_agents) Future
+    """
+    from utils.settings import get_preset
+
+    preset = get_preset(state.get("generation_preset", "balanced"))
+    if not preset.speculative_specialists:
+        return None
+    if state.get("refine_count", 0) > 0 or not state.get("use_specialist_agents", True):
+        return None
+
+    future = _start_in_background(state, stream=preset.stream_specialists_to_writer)
+    get_file_logger().info("[Supervisor Node] 전문 에이전트 분석을 구조 설계와 병렬로 시작")
+    return future
+
+
+def _start_in_background(state: PlanCraftState, stream: bool = False) -> Future:
+    """
+    전문 에이전트 분석을 선행 실행 풀(POOL_PREFETCH)에서 실행합니다.
+
+    요청마다 스레드를 만들지 않고 용도별 공용 풀에 제출하므로 동시 요청 수와 무관하게
+    스레드 수가 제한되고, executor_metrics()/cancel_session()으로 관리됩니다.
+
+    Args:
+        stream: True면 결과 스트림을 열어 에이전트 완료 즉시 게시 (future.stream_id)
+
+    Returns:
+        Future: (specialist_results, executed_agents) Future
+                (cancel_speculative_specialists()로 취소할 수 있도록 future.cancel_event 보관)
+    """
+    from agents.specialist_executor import POOL_PREFETCH, get_executor, new_session
+    from agents.specialist_stream import open_specialist_stream
+
+    result_stream = open_specialist_stream() if stream else None
+    cancel_event = threading.Event()
+    start_time = time.time()
+
+    def _prefetch():
+        try:
+            outcome = _run_specialist_analysis(state, start_time, result_stream, cancel_event=cancel_event)
+        except BaseException as e:
+            if result_stream is not None:
+                result_stream.fail(e)
+            raise
+        if result_stream is not None:
+            result_stream.finish(outcome[0])
+        return outcome
+
+    # 콜백(토큰 집계, 커스텀 이벤트) 전파를 위해 현재 컨텍스트 복사
+    session_id = new_session(f"{state.get('thread_id')}:prefetch")
+    future = get_executor(POOL_PREFETCH).submit(session_id, contextvars.copy_context().run, _prefetch)
+    future.session_id = session_id
+    future.stream_id = result_stream.stream_id if result_stream else None
+    future.cancel_event = cancel_event
+    if result_stream is not None:
+        # 시작 전에 취소되면(풀 종료, cancel_session 등) Writer가 스트림을 기다리지 않도록 실패 처리
+        future.add_done_callback(
+            lambda f: result_stream.fail(CancelledError("전문 에이전트 선행 실행 취소")) if f.cancelled() else None
+        )
+    return future
+
+
+def join_speculative_specialists(future: Optional[Future], state: PlanCraftState) -> PlanCraftState:
+    """
+    선행 실행 결과를 기다려 상태에 반영합니다.
+
+    실패 시 상태를 그대로 반환하여 run_specialists 노드가 순차 실행하도록 합니다.
+    [NEW] 결과 스트림이 열려 있으면 기다리지 않고 specialist_stream_id만 기록합니다.
+    """
+    if future is None:
+        return state
+
+    if getattr(future, "stream_id", None):
+        return update_state(state, specialist_stream_id=future.stream_id)
+
+    try:
+        specialist_results, _ = future.result()
+    except Exception as e:
+        get_file_logger().warning(f"[Supervisor Node] 선행 실행 실패, run_specialists에서 재실행: {e}")
+        return state
+
+    return update_state(state, specialist_analysis=specialist_results, specialist_prefetched=True)
+
+
+def cancel_speculative_specialists(future: Optional[Future]) -> None:
+    """
+    선행 실행을 취소합니다. (구조 설계 실패 등으로 결과를 사용하지 않을 때)
+
+    시작 전이면 실행하지 않고, 실행 중이면 Supervisor가 에이전트 마감시간을 취소한 뒤 중단합니다.
+    결과 스트림은 등록 해제하여 Writer가 소비하지 않도록 합니다.
+    """
+    if future is None:
+        return
+
+    future.cancel()
+    cancel_event = getattr(future, "cancel_event", None)
+    if cancel_event is not None:
+        cancel_event.set()
+
+    stream_id = getattr(future, "stream_id", None)
+    if stream_id:
+        from agents.specialist_stream import release_specialist_stream
+        release_specialist_stream(stream_id)
+    get_file_logger().info("[Supervisor Node] 구조 설계 실패로 선행 실행 취소")
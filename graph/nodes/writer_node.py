@@ -49,7 +49,29 @@ def run_writer_node(state: PlanCraftState) -> PlanCraftState:
         sections = draft_dict.get("sections", [])
         if sections:
             draft_len = sum(len(ensure_dict(s).get("content", "")) for s in sections)
+
+    # [NEW] ReAct 도구 호출 지연시간 기록 (턴별 동시 실행이므로 턴 소요 = 가장 느린 도구)
+    tool_calls = new_state.get("writer_tool_calls") or []
+    if tool_calls:
+        turns = {}
+        for call in tool_calls:
+            turns[call.get("turn")] = max(turns.get(call.get("turn"), 0.0), call.get("elapsed_ms", 0.0))
+        wall_sec = sum(turns.values()) / 1000
+        summary = ", ".join(
+            f"{c.get('tool')} {c.get('elapsed_ms', 0.0) / 1000:.2f}s"
+            + ("" if c.get("status") == "ok" else f"({c.get('status')})")
+            for c in tool_calls
+        )
+        new_state = update_step_history(
+            new_state, "write_tools", "SUCCESS",
+            summary=f"도구 {len(tool_calls)}회 ({len(turns)}턴 동시 실행): {summary}",
+            start_time=time.time() - wall_sec
+        )
     
-    return update_step_history(
-        new_state, "write", "SUCCESS", summary=f"초안 작성 완료 ({draft_len}자)", start_time=start_time
-    )
+    # [NEW] 섹션 캐시 재사용 비율 (Refine/재시작 루프에서 입력이 같은 섹션은 생성 생략)
+    summary = f"초안 작성 완료 ({draft_len}자)"
+    reuse = new_state.get("section_reuse")
+    if reuse and reuse.get("hits"):
+        summary += f", 섹션 재사용 {reuse['hits']}/{reuse['lookups']}개"
+
+    return update_step_history(new_state, "write", "SUCCESS", summary=summary, start_time=start_time)
@@ -136,7 +136,7 @@ class PlanCraftOutput(TypedDict, total=False):
     need_more_info: bool
     
     # [NEW] 토큰 사용량 및 비용 추적
-    token_usage: Optional[dict]  # {input_tokens, output_tokens, total_tokens}
+    token_usage: Optional[dict]  # {input_tokens, output_tokens, cached_tokens, total_tokens, by_node, by_agent}
     estimated_cost: Optional[float]  # 예상 비용 (USD)
 
 
@@ -202,6 +202,7 @@ class PlanCraftState(TypedDict, total=False):
     web_context: Optional[str]
     web_urls: Optional[List[str]]
     web_sources: Optional[List[dict]]  # [{"title": "...", "url": "..."}] 제목+URL
+    evidence_bundle: Optional[dict]  # [NEW] 중복 제거된 근거 항목 (utils/evidence_bundle.py)
     
     # Analysis (stored as dict to avoid Pydantic dependency)
     analysis: Optional[dict]
@@ -228,7 +229,13 @@ class PlanCraftState(TypedDict, total=False):
     discussion_round: int  # 현재 대화 라운드 (0부터 시작)
     consensus_reached: bool  # 합의 도달 여부
     agreed_action_items: List[str]  # 합의된 개선 사항 목록
+    discussion_metrics: Optional[dict]  # [NEW] 토론 비용 {mode, llm_calls, rounds, elapsed_ms, stop_reason}
     refinement_guideline: Optional[dict]  # Refiner가 생성한 전략 (기존)
+    refine_targets: List[str]  # [NEW] 부분 재작성 대상 섹션 (비어 있으면 structure부터 전체 재작성)
+    changed_sections: Optional[List[str]]  # [NEW] 직전 Writer가 다시 작성한 섹션 (None이면 전체 작성)
+    writer_tool_calls: Optional[List[dict]]  # [NEW] Writer ReAct 도구 호출 {tool, status, elapsed_ms, turn}
+    section_reuse: Optional[dict]  # [NEW] Writer 섹션 캐시 재사용 {hits, lookups, reuse_ratio}
+    review_gate: Optional[str]  # [NEW] 규칙 기반 사전 심사 결과 (revise/mini/full)
 
     # Metadata & Operations
     current_step: str
@@ -267,6 +274,8 @@ class PlanCraftState(TypedDict, total=False):
     # [NEW] Multi-Agent 분석 결과 (전문 에이전트 출력)
     specialist_analysis: Optional[dict]  # {market_analysis, business_model, financial_plan, risk_analysis}
     use_specialist_agents: bool  # 전문 에이전트 사용 여부 (기본 True)
+    specialist_prefetched: bool  # [NEW] structure 노드에서 병렬 선행 실행 완료 (run_specialists 스킵)
+    specialist_stream_id: Optional[str]  # [NEW] 실행 중인 전문 에이전트 결과 스트림 (Writer가 섹션별로 소비)
 
     # [NEW] Dynamic Q&A (Writer ↔ Specialist 동적 질의응답)
     data_gap_analysis: Optional[dict]  # DataGapAnalysis 결과
@@ -323,6 +332,7 @@ def create_initial_state(
         "web_context": None,
         "web_urls": None,
         "web_sources": None,  # [{"title": "...", "url": "..."}]
+        "evidence_bundle": None,  # [NEW] fetch_web에서 생성
         "analysis": None,
         "input_schema_name": None,
         "need_more_info": False,
@@ -340,7 +350,13 @@ def create_initial_state(
         "discussion_round": 0,
         "consensus_reached": False,
         "agreed_action_items": [],
+        "discussion_metrics": None,
         "refinement_guideline": None,
+        "refine_targets": [],
+        "changed_sections": None,
+        "writer_tool_calls": None,
+        "section_reuse": None,
+        "review_gate": None,
         "current_step": "start",
         "step_status": "RUNNING",
         "last_error": None,
@@ -502,19 +518,21 @@ AGENT_CONTEXT_SCHEMAS: Dict[str, AgentContextSchema] = {
     "writer": {
         "agent_name": "Writer",
         "input_fields": [
-            "analysis", "structure", "rag_context", "web_context",
-            "refinement_guideline", "specialist_analysis", "generation_preset"
+            "analysis", "structure", "rag_context", "web_context", "evidence_bundle",
+            "refinement_guideline", "specialist_analysis", "generation_preset",
+            "refine_targets"
         ],
-        "output_fields": ["draft", "final_output", "generated_plan"],
+        "output_fields": ["draft", "final_output", "generated_plan", "changed_sections", "writer_tool_calls", "section_reuse"],
         "required_fields": ["analysis", "structure"]
     },
     "reviewer": {
         "agent_name": "Reviewer",
         "input_fields": [
             "draft", "rag_context", "web_context",
-            "specialist_analysis", "generation_preset"
+            "specialist_analysis", "generation_preset",
+            "changed_sections", "analysis"
         ],
-        "output_fields": ["review"],
+        "output_fields": ["review", "review_gate"],
         "required_fields": ["draft"]
     },
     "refiner": {
@@ -522,7 +540,7 @@ AGENT_CONTEXT_SCHEMAS: Dict[str, AgentContextSchema] = {
         "input_fields": [
             "review", "draft", "refine_count", "generation_preset"
         ],
-        "output_fields": ["refinement_guideline", "refine_count", "previous_plan", "refined"],
+        "output_fields": ["refinement_guideline", "refine_count", "previous_plan", "refined", "refine_targets"],
         "required_fields": ["review"]
     }
 }
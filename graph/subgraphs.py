@@ -30,6 +30,9 @@ SubGraph 내부에서 interrupt()가 호출되면, Resume 시:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 
+import threading
+from typing import Any, Dict
+
 from langgraph.graph import StateGraph, END
 from graph.state import PlanCraftState
 from agents import analyzer, structurer, writer, reviewer, refiner, formatter
@@ -129,15 +132,15 @@ def create_qa_subgraph() -> StateGraph:
 # Discussion Sub-graph: 에이전트 간 대화 (Reviewer ↔ Writer)
 # =============================================================================
 
-def create_discussion_subgraph() -> StateGraph:
+def create_discussion_subgraph(compact: bool = None) -> StateGraph:
     """
     Discussion Sub-graph 생성
 
     책임: Reviewer와 Writer가 대화하며 개선 방향 합의
     입력: draft, review
-    출력: discussion_messages, agreed_action_items
+    출력: discussion_messages, agreed_action_items, discussion_metrics
 
-    대화 흐름:
+    대화 흐름 (기본, 라운드당 LLM 3회):
         reviewer_speak → writer_respond → check_consensus
                               ↑                │
                               └────── NO ──────┘
@@ -145,11 +148,42 @@ def create_discussion_subgraph() -> StateGraph:
                                       YES
                                        ↓
                                       END
+
+    [NEW] Compact 흐름 (settings.DISCUSSION_COMPACT, 라운드당 LLM 2회):
+        reviewer_speak(초기 피드백, LLM 없음) → writer_respond → reviewer_turn
+                                                    ↑                │
+                                                    └────── NO ──────┘
+        reviewer_turn: Reviewer 응답 + 합의 판정을 DiscussionTurn 단일 호출로,
+        합의 사항이 직전 라운드와 같아지면(수렴) 조기 종료
+
+    Args:
+        compact: Compact 모드 여부 (None이면 settings.DISCUSSION_COMPACT)
     """
-    from graph.state import update_state
+    from utils.settings import settings
+
+    if compact is None:
+        compact = settings.DISCUSSION_COMPACT
 
     subgraph = StateGraph(PlanCraftState)
 
+    if compact:
+        subgraph.add_node("reviewer_speak", _reviewer_speak_node)
+        subgraph.add_node("writer_respond", _writer_respond_node)
+        subgraph.add_node("reviewer_turn", _reviewer_turn_node)
+
+        subgraph.set_entry_point("reviewer_speak")
+        subgraph.add_edge("reviewer_speak", "writer_respond")
+        subgraph.add_edge("writer_respond", "reviewer_turn")
+        subgraph.add_conditional_edges(
+            "reviewer_turn",
+            _should_continue_discussion,
+            {
+                "continue": "writer_respond",  # Reviewer 응답은 이미 기록됨
+                "end": END
+            }
+        )
+        return subgraph
+
     # 노드 등록
     subgraph.add_node("reviewer_speak", _reviewer_speak_node)
     subgraph.add_node("writer_respond", _writer_respond_node)
@@ -222,6 +256,7 @@ Writer의 개선 계획을 검토하고, 추가 조언이나 확인이 필요하
         ]
 
         response = llm.invoke(messages)
+        state = update_state(state, discussion_metrics=_count_llm_call(state))
 
         discussion_messages.append({
             "role": "reviewer",
@@ -284,6 +319,7 @@ Reviewer의 피드백에 대해 구체적인 개선 계획을 제시하세요.
     return update_state(
         state,
         discussion_messages=discussion_messages,
+        discussion_metrics=_count_llm_call(state),
         current_step="discussion_writer"
     )
 
@@ -336,6 +372,7 @@ def _check_consensus_node(state: PlanCraftState) -> PlanCraftState:
             ]
 
             result: ConsensusResult = consensus_llm.invoke(messages)
+            state = update_state(state, discussion_metrics=_count_llm_call(state))
 
             consensus_reached = result.consensus_reached
             agreed_items = result.agreed_items
@@ -371,9 +408,14 @@ def _check_consensus_node(state: PlanCraftState) -> PlanCraftState:
                 consensus_keywords = ["합의", "동의", "좋습니다", "진행", "승인", "완료"]
                 consensus_reached = any(kw in last_reviewer_msg for kw in consensus_keywords)
 
+    metrics = dict(state.get("discussion_metrics") or {})
+    if consensus_reached:
+        metrics["stop_reason"] = "consensus"
+
     # 최대 라운드 도달 시 강제 합의
     if discussion_round >= max_rounds and not consensus_reached:
         consensus_reached = True
+        metrics["stop_reason"] = "max_rounds"
         discussion_messages.append({
             "role": "system",
             "content": f"[최대 대화 라운드({max_rounds}회) 도달. 현재 논의 내용을 바탕으로 진행합니다.]",
@@ -382,11 +424,7 @@ def _check_consensus_node(state: PlanCraftState) -> PlanCraftState:
 
         # 최대 라운드 도달 시에도 합의 사항 추출 시도
         if not agreed_items:
-            for msg in discussion_messages:
-                if msg.get("role") == "writer":
-                    content = msg.get("content", "")
-                    if any(kw in content for kw in ["수정", "추가", "보완", "개선"]):
-                        agreed_items.append(content[:150])
+            agreed_items = _extract_writer_items(discussion_messages)
 
     return update_state(
         state,
@@ -394,10 +432,145 @@ def _check_consensus_node(state: PlanCraftState) -> PlanCraftState:
         discussion_messages=discussion_messages,
         consensus_reached=consensus_reached,
         agreed_action_items=agreed_items,
+        discussion_metrics=metrics,
         current_step="discussion_check"
     )
 
 
+def _extract_writer_items(discussion_messages: list) -> list:
+    """Writer 발언 중 개선 계획으로 보이는 내용 (합의 사항 추출 Fallback)"""
+    return [
+        msg.get("content", "")[:150] for msg in discussion_messages
+        if msg.get("role") == "writer"
+        and any(kw in msg.get("content", "") for kw in ["수정", "추가", "보완", "개선"])
+    ]
+
+
+def _count_llm_call(state: PlanCraftState) -> dict:
+    """토론 LLM 호출 수 1 증가한 discussion_metrics"""
+    metrics = dict(state.get("discussion_metrics") or {})
+    metrics["llm_calls"] = metrics.get("llm_calls", 0) + 1
+    return metrics
+
+
+# 합의 사항 목록이 이 유사도 이상 겹치면 추가 라운드의 효용이 없다고 판단
+DISCUSSION_CONVERGENCE_JACCARD = 0.8
+
+
+def _normalize_item(item: str) -> str:
+    return "".join(str(item).split()).lower()
+
+
+def _items_converged(previous: list, current: list) -> bool:
+    """
+    [NEW] 합의 사항 수렴 여부
+
+    이번 라운드 합의 사항이 모두 직전 라운드에 이미 있었거나(새 합의 없음),
+    두 목록의 Jaccard 유사도가 DISCUSSION_CONVERGENCE_JACCARD 이상이면 수렴으로 판단
+    """
+    prev = {_normalize_item(i) for i in previous or [] if str(i).strip()}
+    curr = {_normalize_item(i) for i in current or [] if str(i).strip()}
+    if not prev or not curr:
+        return False
+    return curr <= prev or len(prev & curr) / len(prev | curr) >= DISCUSSION_CONVERGENCE_JACCARD
+
+
+def _reviewer_turn_node(state: PlanCraftState) -> PlanCraftState:
+    """
+    [NEW] Compact 모드 Reviewer 턴: 응답 + 합의 판정을 단일 Structured 호출로 생성
+
+    종료 조건 (stop_reason):
+        - consensus: 신뢰도 기준 이상의 합의
+        - converged: 합의 사항이 직전 라운드와 수렴 (새 합의 없음)
+        - max_rounds: 최대 라운드 도달
+        - error: LLM 실패 (Writer 발언에서 합의 사항 추출 후 종료)
+    """
+    from graph.state import update_state, ensure_dict
+    from utils.settings import settings, QualityThresholds
+    from utils.llm import get_llm
+    from utils.schemas import DiscussionTurn
+    from utils.file_logger import get_file_logger
+    from prompts.discussion_prompt import REVIEWER_TURN_SYSTEM_PROMPT, REVIEWER_TURN_USER_PROMPT
+
+    discussion_round = state.get("discussion_round", 0) + 1
+    discussion_messages = list(state.get("discussion_messages", []))
+    previous_items = state.get("agreed_action_items") or []
+    max_rounds = settings.DISCUSSION_MAX_ROUNDS
+
+    consensus_reached = False
+    stop_reason = None
+    agreed_items = list(previous_items)
+
+    context = "\n".join([
+        f"[{m['role'].upper()} - 라운드 {m.get('round', '?')}]: {m['content']}"
+        for m in discussion_messages[-4:]
+    ])
+
+    try:
+        llm = get_llm(temperature=0.2).with_structured_output(DiscussionTurn)
+        result = ensure_dict(llm.invoke([
+            {"role": "system", "content": REVIEWER_TURN_SYSTEM_PROMPT},
+            {"role": "user", "content": REVIEWER_TURN_USER_PROMPT.format(
+                discussion_history=context,
+                agreed_items="\n".join(f"- {item}" for item in previous_items) or "없음",
+                current_round=discussion_round,
+                max_rounds=max_rounds
+            )}
+        ]))
+        state = update_state(state, discussion_metrics=_count_llm_call(state))
+
+        discussion_messages.append({
+            "role": "reviewer",
+            "content": result.get("reply", ""),
+            "round": discussion_round
+        })
+        agreed_items = result.get("agreed_items") or agreed_items
+
+        if result.get("consensus_reached") and \
+                result.get("confidence", 0.0) >= QualityThresholds.CONSENSUS_CONFIDENCE_THRESHOLD:
+            consensus_reached, stop_reason = True, "consensus"
+            discussion_messages.append({
+                "role": "system",
+                "content": f"[합의 완료] 신뢰도: {result.get('confidence', 0.0):.0%}\n합의 사항: {', '.join(agreed_items[:3])}",
+                "round": discussion_round
+            })
+        elif _items_converged(previous_items, result.get("agreed_items")):
+            consensus_reached, stop_reason = True, "converged"
+            discussion_messages.append({
+                "role": "system",
+                "content": f"[합의 사항 수렴] 새 합의 없음. 합의 사항 {len(agreed_items)}개로 진행합니다.",
+                "round": discussion_round
+            })
+
+    except Exception as e:
+        get_file_logger().warning(f"[Discussion] Reviewer 턴 실패, 토론 종료: {e}")
+        consensus_reached, stop_reason = True, "error"
+        agreed_items = agreed_items or _extract_writer_items(discussion_messages)
+
+    if not consensus_reached and discussion_round >= max_rounds:
+        consensus_reached, stop_reason = True, "max_rounds"
+        discussion_messages.append({
+            "role": "system",
+            "content": f"[최대 대화 라운드({max_rounds}회) 도달. 현재 논의 내용을 바탕으로 진행합니다.]",
+            "round": discussion_round
+        })
+        agreed_items = agreed_items or _extract_writer_items(discussion_messages)
+
+    metrics = dict(state.get("discussion_metrics") or {})
+    if stop_reason:
+        metrics["stop_reason"] = stop_reason
+
+    return update_state(
+        state,
+        discussion_round=discussion_round,
+        discussion_messages=discussion_messages,
+        consensus_reached=consensus_reached,
+        agreed_action_items=agreed_items,
+        discussion_metrics=metrics,
+        current_step="discussion_reviewer_turn"
+    )
+
+
 def _should_continue_discussion(state: PlanCraftState) -> str:
     """대화를 계속할지 결정하는 조건 함수"""
     if state.get("consensus_reached", False):
@@ -567,9 +740,54 @@ def run_qa_subgraph(state: PlanCraftState) -> PlanCraftState:
     return s3
 
 
-def get_discussion_app():
+def get_discussion_app(compact: bool = None):
     """Discussion Sub-graph 컴파일된 앱 반환"""
-    return create_discussion_subgraph().compile()
+    return create_discussion_subgraph(compact).compile()
+
+
+class DiscussionStats:
+    """[NEW] 토론 모드별 비용 통계 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, metrics: dict) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(metrics.get("mode", "full"), {
+                "discussions": 0, "llm_calls": 0, "rounds": 0,
+                "elapsed_ms": 0.0, "max_elapsed_ms": 0.0, "stop_reasons": {},
+            })
+            stats["discussions"] += 1
+            stats["llm_calls"] += metrics.get("llm_calls", 0)
+            stats["rounds"] += metrics.get("rounds", 0)
+            stats["elapsed_ms"] += metrics.get("elapsed_ms", 0.0)
+            stats["max_elapsed_ms"] = max(stats["max_elapsed_ms"], metrics.get("elapsed_ms", 0.0))
+            reason = metrics.get("stop_reason") or "unknown"
+            stats["stop_reasons"][reason] = stats["stop_reasons"].get(reason, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """모드별 {discussions, avg_llm_calls, avg_rounds, avg_elapsed_ms, max_elapsed_ms, stop_reasons}"""
+        with self._lock:
+            return {
+                mode: {
+                    "discussions": stats["discussions"],
+                    "avg_llm_calls": round(stats["llm_calls"] / stats["discussions"], 2),
+                    "avg_rounds": round(stats["rounds"] / stats["discussions"], 2),
+                    "avg_elapsed_ms": round(stats["elapsed_ms"] / stats["discussions"], 1),
+                    "max_elapsed_ms": round(stats["max_elapsed_ms"], 1),
+                    "stop_reasons": dict(stats["stop_reasons"]),
+                }
+                for mode, stats in self._stats.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# 전역 토론 비용 통계 (/metrics/reviewer 노출)
+discussion_stats = DiscussionStats()
 
 
 def run_discussion_subgraph(state: PlanCraftState) -> PlanCraftState:
@@ -590,10 +808,12 @@ def run_discussion_subgraph(state: PlanCraftState) -> PlanCraftState:
     → docs/HITL_GUIDE.md 참조
     """
     from graph.state import update_state
+    from utils.settings import settings
     import time
 
     print("[Discussion SubGraph] 에이전트 간 대화 시작")
     start_time = time.time()
+    mode = "compact" if settings.DISCUSSION_COMPACT else "full"
 
     # 대화 상태 초기화 (기존 대화 이력이 없거나, 새 세션인 경우만)
     # Resume 시에는 기존 상태를 유지해야 함 (Idempotency 보장)
@@ -605,23 +825,39 @@ def run_discussion_subgraph(state: PlanCraftState) -> PlanCraftState:
             consensus_reached=False,
             agreed_action_items=[]
         )
+    # [NEW] 토론 비용은 토론 1회 단위로 기록
+    state = update_state(state, discussion_metrics={"mode": mode, "llm_calls": 0})
 
     # 서브그래프 실행
-    discussion_app = get_discussion_app()
+    discussion_app = get_discussion_app(mode == "compact")
     result = discussion_app.invoke(state)
 
     elapsed = time.time() - start_time
     round_count = result.get("discussion_round", 0)
     msg_count = len(result.get("discussion_messages", []))
 
-    print(f"[Discussion SubGraph] 대화 완료 ({elapsed:.2f}초, {round_count}라운드, {msg_count}메시지)")
+    metrics = {
+        **(result.get("discussion_metrics") or {}),
+        "mode": mode,
+        "rounds": round_count,
+        "elapsed_ms": round(elapsed * 1000, 1),
+    }
+    discussion_stats.record(metrics)
+
+    print(
+        f"[Discussion SubGraph] 대화 완료 ({elapsed:.2f}초, {round_count}라운드, {msg_count}메시지, "
+        f"LLM {metrics.get('llm_calls', 0)}회, {mode}, 종료: {metrics.get('stop_reason')})"
+    )
 
     # step_history에 대화 요약 추가
     current_history = result.get("step_history", []) or []
     discussion_summary = {
         "step": "discussion",
         "status": "SUCCESS",
-        "summary": f"Reviewer-Writer 대화 {round_count}라운드 완료, 합의: {result.get('consensus_reached', False)}",
+        "summary": (
+            f"Reviewer-Writer 대화 {round_count}라운드 완료, 합의: {result.get('consensus_reached', False)}, "
+            f"LLM {metrics.get('llm_calls', 0)}회"
+        ),
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
         "execution_time": f"{elapsed:.2f}s"
     }
@@ -629,6 +865,7 @@ def run_discussion_subgraph(state: PlanCraftState) -> PlanCraftState:
     return update_state(
         result,
         step_history=current_history + [discussion_summary],
+        discussion_metrics=metrics,
         current_step="discussion"
     )
 
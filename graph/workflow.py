@@ -102,7 +102,7 @@ AnalyzerRoutes = Literal["option_pause", "general_response", "structure"]
 ReviewerRoutes = Literal["discussion", "refine", "format", "analyze"]
 
 # Refiner 분기 후 가능한 목적지
-RefinerRoutes = Literal["structure", "format"]
+RefinerRoutes = Literal["structure", "write", "format"]
 
 # Dynamic Q&A 분기 후 가능한 목적지
 DynamicQARoutes = Literal["request_specialist", "write"]
@@ -146,11 +146,13 @@ class RouteKey(str, Enum):
 
     # Refiner 분기
     RETRY = "retry"
+    INCREMENTAL = "incremental"  # [NEW] 지목된 섹션만 부분 재작성 → write
 
     # Dynamic Q&A 분기 (Writer ↔ Specialist)
     REQUEST_SPECIALIST = "request_specialist"
     WRITE = "write"
 from agents import analyzer, structurer, writer, reviewer, refiner, formatter
+from agents.helpers.review_gate import GATE_REVISE
 from utils.config import Config
 from utils.tracing import trace_node
 from utils.error_handler import handle_node_error
@@ -660,6 +662,7 @@ def create_workflow() -> StateGraph:
         ├──────────────┼──────────────┼──────────────────┼───────────────────────┤
         │ 품질 통과    │ score >= 9   │ RouteKey.COMPLETE│ format (즉시 완료)    │
         │ 최대 재시작  │ restart >= 2 │ RouteKey.SKIP    │ refine (무한루프 방지)│
+        │ 규칙 REVISE  │ 사전 심사    │ RouteKey.SKIP    │ refine (토론 불필요)  │
         │ 품질 실패    │ score < 5    │ RouteKey.RESTART │ analyze (재분석)      │
         │ 중간 품질    │ 7 <= s < 9   │ RouteKey.SKIP    │ refine (토론 스킵)    │
         │ 낮은 품질    │ 5 <= s < 7   │ RouteKey.DISCUSS │ discussion (토론 필요)│
@@ -684,6 +687,11 @@ def create_workflow() -> StateGraph:
             logger.info(f"[ROUTING] 최대 재시작 횟수 도달 ({restart_count}회), Refine으로 진행")
             return RouteKey.SKIP_TO_REFINE
 
+        # [NEW] 규칙 기반 사전 심사 REVISE: 수정 지시가 이미 구체적이므로 토론 없이 Refine
+        if state.get("review_gate") == GATE_REVISE:
+            logger.info(f"[ROUTING] 사전 심사 결함 ({score}점), Discussion 스킵 → Refine")
+            return RouteKey.SKIP_TO_REFINE
+
         # FAIL 판정: Analyzer 복귀
         if QualityThresholds.is_fail(score) or verdict == "FAIL":
             logger.info(f"[ROUTING] 품질 부족 ({score}점), Analyzer 복귀")
@@ -718,7 +726,7 @@ def create_workflow() -> StateGraph:
         """
         Refiner 후 다음 단계 결정 (Graceful End-of-Loop 패턴 적용)
 
-        Return Type: RefinerRoutes = Literal["structure", "format"]
+        Return Type: RefinerRoutes = Literal["structure", "write", "format"]
 
         ┌─────────────────────────────────────────────────────────────────────────┐
         │                     판정표 (Decision Table)                             │
@@ -727,6 +735,7 @@ def create_workflow() -> StateGraph:
         ├────────────────────────┼─────────────────┼──────────────────────────────┤
         │ remaining_steps <= 5   │ RouteKey.COMPLETE│ 스텝 부족 → 안전 종료       │
         │ refine_count >= MAX    │ RouteKey.COMPLETE│ 최대 루프 도달 → 종료       │
+        │ refine_targets 있음    │ RouteKey.INCREMENTAL│ 지목 섹션만 → write 재실행│
         │ refined == True        │ RouteKey.RETRY  │ 개선 필요 → structure 재실행│
         │ refined == False       │ RouteKey.COMPLETE│ 개선 완료 → format          │
         └────────────────────────┴─────────────────┴──────────────────────────────┘
@@ -758,6 +767,9 @@ def create_workflow() -> StateGraph:
 
         # 개선 필요 여부
         if refined:
+            # [NEW] 구조 지적이 없고 대상 섹션이 명확하면 구조/전문 분석 재사용, 해당 섹션만 재작성
+            if state.get("refine_targets"):
+                return RouteKey.INCREMENTAL
             return RouteKey.RETRY
         return RouteKey.COMPLETE
 
@@ -766,6 +778,7 @@ def create_workflow() -> StateGraph:
         should_refine_again,
         {
             RouteKey.RETRY: "structure",      # 재작성 루프
+            RouteKey.INCREMENTAL: "write",    # [NEW] 부분 재작성 루프
             RouteKey.COMPLETE: "format"       # 완료
         }
     )
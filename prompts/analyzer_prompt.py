@@ -232,9 +232,19 @@ ANALYZER_SYSTEM_PROMPT = """당신은 10년 경력의 **시니어 기획 컨설
    - ✅ (정답) `need_more_info: true`, `clarification_questions` 포함
 """
 
-ANALYZER_USER_PROMPT = """다음 사용자 입력을 분석하세요:
+# [NEW] Prefix Cache 친화 구조: 정적 지시(ANALYZER_USER_INSTRUCTIONS)를 user 메시지 앞에,
+# 요청별 데이터(ANALYZER_USER_PROMPT)를 뒤에 배치합니다. (utils/prompt_layout.py)
+ANALYZER_USER_INSTRUCTIONS = """아래 입력 데이터의 사용자 입력을 분석하세요.
 
----
+**지시:**
+1. **언어**: 모든 분석 결과(topic, purpose, features, options 등)는 반드시 **한국어**로 출력하세요. (사용자가 영어를 써도 한국어로 답변)
+2. **잡담**이면 `is_general_query: true`로 답하세요.
+3. **새로운 빈약한 요청**이면 내용을 대폭 **보강(살 붙이기)**한 후, `need_more_info: true`로 설정하여 사용자에게 **진행 여부를 물어보세요(옵션 제공)**.
+   - 옵션 제목은 "Proceed" 같은 영어가 아니라 **"네, 진행합니다"**, **"아니요, 수정합니다"** 처럼 한국어로 작성하세요.
+4. **제안에 대한 승인**이면 `need_more_info: false`로 설정하여 즉시 진행하세요.
+"""
+
+ANALYZER_USER_PROMPT = """---
 **사용자 입력:**
 {user_input}
 ---
@@ -254,11 +264,4 @@ ANALYZER_USER_PROMPT = """다음 사용자 입력을 분석하세요:
 **리뷰 피드백:**
 {review_data}
 ---
-
-**지시:**
-1. **언어**: 모든 분석 결과(topic, purpose, features, options 등)는 반드시 **한국어**로 출력하세요. (사용자가 영어를 써도 한국어로 답변)
-2. **잡담**이면 `is_general_query: true`로 답하세요.
-3. **새로운 빈약한 요청**이면 내용을 대폭 **보강(살 붙이기)**한 후, `need_more_info: true`로 설정하여 사용자에게 **진행 여부를 물어보세요(옵션 제공)**.
-   - 옵션 제목은 "Proceed" 같은 영어가 아니라 **"네, 진행합니다"**, **"아니요, 수정합니다"** 처럼 한국어로 작성하세요.
-4. **제안에 대한 승인**이면 `need_more_info: false`로 설정하여 즉시 진행하세요.
 """
@@ -239,9 +239,23 @@ graph LR
 
 """
 
-BUSINESS_PLAN_USER_PROMPT = """다음 정보를 바탕으로 사업 계획서를 작성해주세요:
+# [NEW] Prefix Cache 친화 구조: 정적 작성 지침과 요청별 데이터 분리 (writer_prompt.py 참고)
+BUSINESS_PLAN_USER_INSTRUCTIONS = """아래 입력 데이터를 바탕으로 사업 계획서를 작성해주세요.
+*전략적 시장 조사 결과(Web Context)는 [1.시장성, 2.수익성, 3.리스크] 관점에서 엄선된 핵심 출처입니다. 이를 적극 반영하세요.*
 
----
+**지시:**
+1. 입력 데이터를 바탕으로 **실행 가능한 사업 계획서**를 작성하세요.
+2. **Fact Check**: `전략적 시장 조사 결과`의 데이터를 최우선으로 인용하세요.
+3. **섹션 강제 작성 (Mandatory)**: 입력된 `structure`에 없더라도 **[8. 리스크], [9. 기대 효과 및 KPI], [10. 참고 자료]**는 반드시 별도 섹션으로 분리하여 작성하세요.
+4. **SOM vs 매출 로드맵 (필수!!!)**: 
+   - 1년차 예상 매출이 SOM 목표와 같거나 달라도, 반드시 **"SOM 달성률: XX%"**라고 명시하세요.
+   - 100% 미만이면 차년도 확대 전략을, 100%면 달성 근거를 서술하세요. (생략 금지)
+5. **리스크 필수 포함**: 리스크 테이블 작성 시 **[경쟁]**와 **[규제]** 항목을 반드시 포함하세요. (없다고 생각되면 "잠재적 경쟁", "위생법 규제"라도 적으세요)
+6. 모든 수치에는 반드시 **계산 근거**를 포함하세요.
+7. 응답은 JSON 형식으로만 제출하세요.
+"""
+
+BUSINESS_PLAN_USER_PROMPT = """---
 **사용자 원본 요청:**
 {user_input}
 ---
@@ -256,20 +270,8 @@ BUSINESS_PLAN_USER_PROMPT = """다음 정보를 바탕으로 사업 계획서를
 
 **전략적 시장 조사 결과 (Web Context):**
 {web_context}
-*위 자료는 [1.시장성, 2.수익성, 3.리스크] 관점에서 엄선된 5개 핵심 출처입니다. 이를 적극 반영하세요.*
 
 **참고 URL:**
 {web_urls}
 ---
-
-**지시:**
-1. 위 정보를 바탕으로 **실행 가능한 사업 계획서**를 작성하세요.
-2. **Fact Check**: `전략적 시장 조사 결과`의 데이터를 최우선으로 인용하세요.
-3. **섹션 강제 작성 (Mandatory)**: 입력된 `structure`에 없더라도 **[8. 리스크], [9. 기대 효과 및 KPI], [10. 참고 자료]**는 반드시 별도 섹션으로 분리하여 작성하세요.
-4. **SOM vs 매출 로드맵 (필수!!!)**: 
-   - 1년차 예상 매출이 SOM 목표와 같거나 달라도, 반드시 **"SOM 달성률: XX%"**라고 명시하세요.
-   - 100% 미만이면 차년도 확대 전략을, 100%면 달성 근거를 서술하세요. (생략 금지)
-5. **리스크 필수 포함**: 리스크 테이블 작성 시 **[경쟁]**와 **[규제]** 항목을 반드시 포함하세요. (없다고 생각되면 "잠재적 경쟁", "위생법 규제"라도 적으세요)
-6. 모든 수치에는 반드시 **계산 근거**를 포함하세요.
-7. 응답은 JSON 형식으로만 제출하세요.
 """
@@ -1,11 +1,12 @@
 """
 PlanCraft Agent - Discussion Prompts
 
-Version: 1.1.0
+Version: 1.2.0
 Last Updated: 2025-01-06
 Author: PlanCraft Team
 
 Changelog:
+- v1.2.0: Compact 토론 모드 (Reviewer 응답 + 합의 판정 단일 호출)
 - v1.1.0 (2025-01-06): Co-authoring 패턴 도입, LLM 기반 합의 로직
 - v1.0.0 (2025-01-05): 초기 버전 (Reviewer ↔ Writer 대화)
 
@@ -127,6 +128,33 @@ confidence는 판정의 확신도입니다 (0.0~1.0).
 """
 
 
+# =============================================================================
+# [NEW] Compact 토론 모드: Reviewer 응답 + 합의 판정 (단일 Structured 호출)
+# =============================================================================
+
+REVIEWER_TURN_SYSTEM_PROMPT = REVIEWER_DISCUSSION_PROMPT + """
+## 합의 판정 (응답과 함께 출력)
+- reply: Writer에게 보낼 응답 (3-5문장)
+- consensus_reached: Writer의 개선 계획을 구체적인 '방법'까지 수용하면 true
+  (개선 '의지'만 표현했거나 새로운 지적 사항이 있으면 false)
+- confidence: 판정 확신도 (0.0~1.0)
+- agreed_items: 지금까지 합의된 개선 사항 전체 목록 (이전 라운드 합의 포함, 짧은 명령문)
+- unresolved_items: 아직 해결되지 않은 사항
+"""
+
+REVIEWER_TURN_USER_PROMPT = """## 이전 대화
+{discussion_history}
+
+## 지금까지 합의된 사항
+{agreed_items}
+
+## 현재 라운드
+{current_round}라운드 (최대 {max_rounds}라운드)
+
+Writer의 개선 계획을 검토하여 응답하고, 합의 여부를 판정하세요.
+"""
+
+
 # =============================================================================
 # Dynamic Q&A 프롬프트 (Writer → Specialist)
 # =============================================================================
@@ -1,12 +1,13 @@
 """
 PlanCraft Agent - Formatter 프롬프트
 
-Version: 1.0.0
-Last Updated: 2024-12-27
+Version: 1.1.0
+Last Updated: 2026-10-18
 Author: PlanCraft Team
 
 Changelog:
 - v1.0.0 (2024-12-27): 초기 버전 (핵심 요약 + 전체 기획서 출력)
+- v1.1.0 (2026-10-18): 규칙 기반 요약(draft_summary)을 다듬는 방식으로 변경
 
 Description:
 최종 기획서를 사용자 친화적인 채팅 응답으로 변환합니다.
@@ -74,9 +75,13 @@ FORMATTER_USER_PROMPT = """다음 기획서 정보를 사용자 친화적인 채
 **하이라이트:**
 - 강점: {strengths}
 
+**규칙 기반 요약 초안:**
+{draft_summary}
+
 ---
 
-위 정보를 바탕으로 사용자에게 전달할 채팅 요약을 작성하세요.
+위 정보를 바탕으로 요약 초안의 사실(기능, 섹션, 수치)은 유지하면서
+사용자에게 전달할 자연스러운 채팅 요약으로 다듬어 작성하세요.
 마크다운 형식으로 출력하세요.
 
 **중요**: 점수나 내부 검토 결과는 절대 포함하지 마세요.
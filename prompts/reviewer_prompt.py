@@ -1,11 +1,13 @@
 """
 PlanCraft Agent - Reviewer(Judge) 프롬프트
 
-Version: 1.3.0
-Last Updated: 2025-01-06
+Version: 1.5.0
+Last Updated: 2026-10-18
 Author: PlanCraft Team
 
 Changelog:
+- v1.5.0 (2026-10-18): 섹션 분할 심사 프롬프트(REVIEWER_SECTION_*) 추가
+- v1.4.0 (2026-10-18): 부분 재작성 후 재심사 프롬프트(REVIEWER_INCREMENTAL_PROMPT) 추가
 - v1.3.0 (2025-01-06): target_sections 필드 추가, actionable 피드백 강화
 - v1.2.0 (2025-01-05): P0/P1/P2 우선순위 체계 도입, 엄격한 FAIL 로직
 - v1.1.0 (2025-01-04): 품질 검증 강화, RAG 연동 피드백
@@ -172,16 +174,9 @@ REVIEWER_SYSTEM_PROMPT = """당신은 **기획서 품질 심사관(Judge)**입
 - **REVISE가 가장 흔함**: 완벽하지 않지만 개선 가능한 경우
 """
 
-REVIEWER_USER_PROMPT = """다음 기획서를 냉정하게 심사해주세요:
-
----
-**기획서 초안:**
-{draft}
----
-
-**참고 자료 (RAG):**
-{context}
----
+# [NEW] Prefix Cache 친화 구조: 정적 체크리스트를 앞에, 초안/RAG 데이터를 뒤에 배치합니다.
+# (utils/prompt_layout.py)
+REVIEWER_USER_INSTRUCTIONS = """아래 입력 데이터의 기획서를 냉정하게 심사해주세요.
 
 ## 🔍 심사 요청 (체크리스트 기반)
 
@@ -228,3 +223,69 @@ REVIEWER_USER_PROMPT = """다음 기획서를 냉정하게 심사해주세요:
 
 """
 
+REVIEWER_USER_PROMPT = """---
+**기획서 초안:**
+{draft}
+---
+
+**참고 자료 (RAG):**
+{context}
+---
+"""
+
+# [NEW] 부분 재작성(Incremental Refine) 후 재심사용: 변경된 섹션 본문 + 나머지 섹션 개요만 전달합니다.
+# (정적 체크리스트 접두부는 전체 심사와 동일하게 유지하여 Prompt Cache 재사용)
+REVIEWER_INCREMENTAL_PROMPT = """---
+**[부분 재심사]** 직전 심사 이후 아래 섹션만 다시 작성되었습니다.
+나머지 섹션은 변경되지 않았으므로 직전 심사 결과를 그대로 유효한 것으로 보고,
+1) 변경된 섹션이 직전 지적 사항을 해결했는지 채점하고
+2) 변경된 섹션이 나머지 섹션 개요와 논리적으로 이어지는지(중복/모순 여부) 확인한 뒤
+전체 점수와 판정을 다시 내려주세요.
+
+**직전 심사 결과:** {previous_verdict} ({previous_score}점)
+- 치명적 문제: {previous_issues}
+- 수정 지시: {previous_actions}
+
+**변경된 섹션 (전체 본문):**
+{changed}
+
+**변경되지 않은 섹션 (개요):**
+{outline}
+---
+
+**참고 자료 (RAG):**
+{context}
+---
+"""
+
+# [NEW] 섹션 분할 심사 (Map 단계): 섹션 하나와 해당 섹션 관련 근거만 전달합니다.
+# 결과는 결정적 집계(Reduce)로 JudgeResult가 되므로, 전체 판정 대신 섹션 점수만 요청합니다.
+REVIEWER_SECTION_INSTRUCTIONS = """아래 입력 데이터는 기획서 전체 중 **섹션 하나**입니다.
+이 섹션만 냉정하게 채점하세요. (다른 섹션은 별도로 심사됩니다)
+
+## 🔍 섹션 심사 기준
+- 논리성: 주장에 근거(데이터, 사례, 전문 에이전트 분석)가 있는가?
+- 정확성: 수치/사실이 제공된 근거 자료와 모순되지 않는가? (모순이면 p0_issues)
+- 구체성: "부족하다" 수준이 아니라 실행 가능한 수준으로 작성되었는가?
+- 완결성: 섹션 제목이 약속한 내용을 모두 다루는가?
+
+## 채점
+- 9-10: 바로 사용 가능 / 7-8: 일부 보완 필요 / 5-6: 상당한 보완 필요 / 1-4: 재작성 필요
+- needs_revision: 8점 이하이거나 p0_issues가 있으면 true
+- action_items: Writer가 이 섹션에 바로 적용할 수 있는 구체적 지시
+
+"""
+
+REVIEWER_SECTION_PROMPT = """---
+**심사 대상 섹션:** {name}
+{content}
+---
+
+**기획서 전체 목차 (흐름 확인용):**
+{outline}
+---
+
+**이 섹션 관련 근거 자료:**
+{evidence}
+---
+"""
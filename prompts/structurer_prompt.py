@@ -153,16 +153,9 @@ STRUCTURER_SYSTEM_PROMPT = """당신은 **기획서 구조 설계 전문가**입
 - **일관된 구조**: 모든 섹션이 동일한 형식으로 정의
 """
 
-STRUCTURER_USER_PROMPT = """다음 분석 결과를 바탕으로 기획서 구조를 설계해주세요:
-
----
-**분석 결과:**
-{analysis}
----
-
-**참고 가이드:**
-{context}
----
+# [NEW] Prefix Cache 친화 구조: 정적 설계 지시(프리셋 단위 값만 포함)를 앞에,
+# 요청별 데이터(STRUCTURER_USER_PROMPT)를 뒤에 배치합니다. (utils/prompt_layout.py)
+STRUCTURER_USER_INSTRUCTIONS = """아래 입력 데이터의 분석 결과를 바탕으로 기획서 구조를 설계해주세요.
 
 ## 설계 지시
 
@@ -189,3 +182,13 @@ STRUCTURER_USER_PROMPT = """다음 분석 결과를 바탕으로 기획서 구
 
 3. 위의 추론 과정(Step 1~4)을 따라 설계한 후, **JSON 형식으로만** 출력하세요.
 """
+
+STRUCTURER_USER_PROMPT = """---
+**분석 결과:**
+{analysis}
+---
+
+**참고 가이드:**
+{context}
+---
+"""
@@ -460,33 +460,11 @@ graph TB
 
 
 
-WRITER_USER_PROMPT = """다음 정보를 바탕으로 전문적인 기획서를 작성해주세요:
-
----
-**사용자 원본 요청:**
-{user_input}
----
-
-**기획서 구조 (Structure):**
-{structure}
----
-
-**사용자 제약사항 (Constraints):**
-{user_constraints}
----
-
-**참고 자료 (RAG):**
-{context}
----
-
-**전략적 시장 조사 결과 (Web Context):**
-{web_context}
-*위 자료는 [1.시장성, 2.수익성, 3.리스크] 관점에서 엄선된 5개 핵심 출처입니다. 이를 적극 반영하세요.*
-
-**참고 URL:**
-{web_urls}
----
-
+# [NEW] Prefix Cache 친화 구조: 정적 작성 지침(프리셋 단위)과 요청별 데이터를 분리
+# - WRITER_USER_INSTRUCTIONS: user 메시지 앞부분 (요청 간 동일 → 캐시 접두부)
+# - WRITER_USER_PROMPT: user 메시지 뒷부분 (요청별 데이터)
+WRITER_USER_INSTRUCTIONS = """아래 입력 데이터를 바탕으로 전문적인 기획서를 작성해주세요.
+*전략적 시장 조사 결과(Web Context)는 [1.시장성, 2.수익성, 3.리스크] 관점에서 엄선된 핵심 출처입니다. 이를 적극 반영하세요.*
 
 5. **섹션 강제 작성 (필수)**:
    - 입력된 `structure`에 없더라도, 다음 섹션은 반드시 별도로 생성하여 작성하세요:
@@ -515,7 +493,7 @@ WRITER_USER_PROMPT = """다음 정보를 바탕으로 전문적인 기획서를
    - **## Title** 형태(H2)를 사용하세요. (# H1 사용 금지)
 
 10. **JSON Output**:
-   - 위 내용을 바탕으로 `sections` 리스트를 담은 JSON 하나만 출력하세요.
+   - 입력 데이터를 바탕으로 `sections` 리스트를 담은 JSON 하나만 출력하세요.
 
 ---
 🚨🚨🚨 **[최우선 필수] 시각적 요소 - 반드시 포함!** 🚨🚨🚨
@@ -527,6 +505,31 @@ WRITER_USER_PROMPT = """다음 정보를 바탕으로 전문적인 기획서를
 ⚠️ ASCII 차트는 '수익 모델' 또는 '성장 전략' 섹션에 포함하세요.
 """
 
+WRITER_USER_PROMPT = """---
+**사용자 원본 요청:**
+{user_input}
+---
+
+**기획서 구조 (Structure):**
+{structure}
+---
+
+**사용자 제약사항 (Constraints):**
+{user_constraints}
+---
+
+**참고 자료 (RAG):**
+{context}
+---
+
+**전략적 시장 조사 결과 (Web Context):**
+{web_context}
+
+**참고 URL:**
+{web_urls}
+---
+"""
+
 
 # =============================================================================
 # ReAct Pattern Instruction
@@ -4,10 +4,15 @@ PlanCraft Test Configuration
 테스트 간 격리 및 공통 fixture 설정.
 """
 
+import os
+
 import pytest
 import sys
 import importlib
 
+# 실행 이력 저장소는 테스트 간 공유하지 않음 (./data/agent_stats.db에 기록하지 않음)
+os.environ.setdefault("PLANCRAFT_AGENT_STATS_DB", ":memory:")
+
 
 @pytest.fixture(autouse=True)
 def reset_module_cache():
@@ -41,6 +46,15 @@ def clear_lru_cache():
         pass
 
 
+@pytest.fixture(autouse=True)
+def reset_agent_stats_store():
+    """전문 에이전트 실행 이력 초기화 (이력 기반 타임아웃/순서가 다른 테스트에 영향 주지 않도록)"""
+    yield
+
+    from agents.agent_stats_store import reset_agent_stats_store as reset
+    reset()
+
+
 @pytest.fixture
 def mock_llm():
     """
@@ -0,0 +1,178 @@
+"""
+PlanCraft - 예산 기반 에이전트 선택 (Adaptive Routing) 테스트
+
+실행 방법:
+    pytest tests/test_adaptive_routing.py -v
+
+테스트 항목:
+    - 비용 모델 학습 (EWMA, 실제 실행된 에이전트만 반영)
+    - 예산 이내 계획은 그대로 / 초과 시 다운그레이드 → 생략 순서
+    - 필수 에이전트(routing_skippable=False)와 의존 대상은 생략하지 않음
+    - 캐시 적중 예상 에이전트는 비용 0
+    - 계획 1회 동안 에이전트×모델 추정치(이력 저장소 조회)는 한 번만 계산
+    - Supervisor가 다운그레이드 모델 인스턴스로 실행하고 실행 통계를 학습
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.agent_config import resolve_execution_plan_dag
+from agents.agent_cost_model import AgentCostModel, RoutingBudget, agent_cost_model, plan_within_budget
+from agents.supervisor import NativeSupervisor
+from agents.supervisor_types import detect_required_agents
+from utils.settings import get_preset
+
+PLAN_AGENTS = ["market", "bm", "financial", "risk"]
+
+
+@pytest.fixture(autouse=True)
+def clear_global_state():
+    from agents.specialist_cache import specialist_cache
+
+    specialist_cache.clear()
+    agent_cost_model.clear()
+    yield
+    specialist_cache.clear()
+    agent_cost_model.clear()
+
+
+@pytest.fixture
+def cost_model():
+    """모든 에이전트가 기본 모델 10초 / 3000 토큰, 경량 모델 2초 / 3000 토큰으로 관측된 모델"""
+    model = AgentCostModel()
+    for agent_id in ["market", "bm", "financial", "risk", "tech", "content"]:
+        model.observe(agent_id, 10000, 3000, "gpt-4o")
+        model.observe(agent_id, 2000, 3000, "gpt-4o-mini")
+    return model
+
+
+class TestCostModel:
+    """비용 모델 학습"""
+
+    def test_ewma_and_prior(self):
+        model = AgentCostModel(alpha=0.5)
+        prior = model.estimate("market")
+        assert prior.samples == 0
+        assert prior.latency_ms == 12000  # agents.yaml expected_latency_ms
+        assert model.estimate("market", "gpt-4o-mini").latency_ms < prior.latency_ms
+
+        model.observe("market", 1000, 100)
+        model.observe("market", 3000, 300)
+        assert model.estimate("market").latency_ms == 2000
+        assert model.estimate("market").tokens == 200
+
+    def test_observe_only_executed_agents(self):
+        model = AgentCostModel()
+        observed = model.observe_execution_stats({"agent_stats": {
+            "market": {"success": True, "execution_time_ms": 800, "total_tokens": 500, "model_type": "gpt-4o-mini"},
+            "bm": {"success": True, "cache_hit": True, "execution_time_ms": 0},
+            "risk": {"success": False, "fallback_used": True, "execution_time_ms": 90000},
+        }})
+        assert observed == 1
+        assert set(model.snapshot()) == {"market@gpt-4o-mini"}
+
+
+class TestBudgetPlanning:
+    """예산 적용"""
+
+    def test_within_budget_unchanged(self, cost_model):
+        decision = detect_required_agents(
+            "카페 창업", "기획서 작성",
+            budget=RoutingBudget(latency_ms=60000, tokens=20000, downgrade_model="gpt-4o-mini"),
+            cost_model=cost_model,
+        )
+        assert decision.required_analyses == PLAN_AGENTS
+        assert decision.downgraded == {}
+        assert "예산" not in decision.reasoning
+
+    def test_no_budget_keeps_rule_result(self):
+        assert detect_required_agents("카페 창업", "기획서 작성").downgraded == {}
+
+    def test_downgrade_before_skip(self, cost_model):
+        # 경로 market→bm→financial(또는 risk) = 30초 > 20초
+        decision = detect_required_agents(
+            "카페 창업", "기획서 작성",
+            budget=RoutingBudget(latency_ms=20000, downgrade_model="gpt-4o-mini"),
+            cost_model=cost_model,
+        )
+        assert decision.required_analyses == PLAN_AGENTS
+        assert decision.skipped == []
+        # 공통 경로(market→bm)를 먼저 다운그레이드: 2 + 2 + 10 = 14초
+        assert decision.downgraded == {"market": "gpt-4o-mini", "bm": "gpt-4o-mini"}
+        assert "다운그레이드" in decision.reasoning
+
+    def test_skip_low_benefit_without_downgrade_model(self, cost_model):
+        # 토큰 12000 > 7000: 다운그레이드 없이 효용이 낮은 순으로 생략, market/bm은 유지
+        plan = plan_within_budget(PLAN_AGENTS, RoutingBudget(tokens=7000), cost_model)
+        assert plan.skipped == ["risk", "financial"]
+        assert plan.required == ["market", "bm"]
+        assert plan.tokens <= 7000
+
+    def test_required_agents_never_skipped(self, cost_model):
+        plan = plan_within_budget(["market", "bm"], RoutingBudget(tokens=1000), cost_model)
+        assert plan.required == ["market", "bm"]
+        assert "예산 초과 유지" in plan.reasons[-1]
+
+    def test_cached_agent_costs_nothing(self, cost_model):
+        budget = RoutingBudget(latency_ms=25000, downgrade_model="gpt-4o-mini")
+        assert plan_within_budget(PLAN_AGENTS, budget, cost_model).downgraded
+
+        plan = plan_within_budget(PLAN_AGENTS, budget, cost_model, cached_agents=["market"])
+        assert plan.downgraded == {}
+        assert "캐시 적중 예상" in plan.reasons[0]
+
+    def test_estimates_loaded_once_per_plan(self, monkeypatch):
+        from agents.agent_stats_store import get_agent_stats_store
+
+        summarize_calls = []
+        store = get_agent_stats_store()
+        original = store.summarize
+
+        def counting_summarize(*args, **kwargs):
+            summarize_calls.append((kwargs.get("agent_id"), kwargs.get("model_type")))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(store, "summarize", counting_summarize)
+        # 콜드 EWMA: 모든 추정치가 이력 저장소 → 사전 추정치로 계산됨
+        plan = plan_within_budget(
+            PLAN_AGENTS, RoutingBudget(latency_ms=1000, downgrade_model="gpt-4o-mini"), AgentCostModel()
+        )
+
+        assert plan.downgraded
+        # 에이전트×모델(기본/경량) 조합당 1회
+        assert summarize_calls and len(summarize_calls) == len(set(summarize_calls))
+
+    def test_fast_preset_budget(self):
+        assert RoutingBudget.from_preset(get_preset("quality")) is None
+        budget = RoutingBudget.from_preset(get_preset("fast"))
+        assert budget.downgrade_model == "gpt-4o-mini"
+
+        decision = detect_required_agents("카페 창업", "기획서 작성", budget=budget)
+        assert decision.downgraded  # 사전 추정치 기준 기본 모델 계획은 예산 초과
+
+
+class TestSupervisorDowngrade:
+    """Supervisor 다운그레이드 실행"""
+
+    def test_runs_downgraded_instance_and_learns(self, monkeypatch):
+        supervisor = NativeSupervisor(llm=MagicMock())
+        base = MagicMock()
+        base.run.return_value = {"from": "base"}
+        mini = MagicMock()
+        mini.run.return_value = {"from": "mini"}
+        supervisor.agents = {"market": base}
+        monkeypatch.setattr(supervisor, "_create_agent", lambda agent_id, llm=None: mini)
+        monkeypatch.setattr("agents.supervisor.get_llm", lambda **kwargs: MagicMock())
+
+        results = {}
+        supervisor._execute_plan(resolve_execution_plan_dag(["market"], "test"), results, {
+            "service_overview": "카페 창업",
+            "model_overrides": {"market": "gpt-4o-mini"},
+        })
+
+        assert results["market_analysis"] == {"from": "mini"}
+        base.run.assert_not_called()
+        agent_stats = results["_execution_stats"]["agent_stats"]["market"]
+        assert agent_stats["model_type"] == "gpt-4o-mini"
+        assert "market@gpt-4o-mini" in agent_cost_model.snapshot()
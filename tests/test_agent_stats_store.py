@@ -0,0 +1,247 @@
+"""
+PlanCraft - 전문 에이전트 실행 이력 저장소 테스트
+
+실행 방법:
+    pytest tests/test_agent_stats_store.py -v
+
+테스트 항목:
+    - ExecutionStats 기록 / 에이전트별 보관 상한
+    - 백분위수·재시도/Fallback 비율·토큰 집계 (모델/프리셋 그룹)
+    - 이력 기반 타임아웃 (설정값 이하로만 단축, 타임아웃 건 포함 p95) / 남은 Critical Path 우선순위
+    - DB 조회 실패 시 설정 타임아웃/사전 추정치로 스케줄링 (실행 중단 없음)
+    - 파일 DB 영속성 (재시작 후 조회) / 이전 스키마 마이그레이션
+    - Supervisor가 실행 이력을 저장하고 긴 Critical Path부터 시작
+"""
+
+import sqlite3
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.agent_config import resolve_execution_plan_dag
+from agents.agent_stats_store import (
+    MIN_TIMEOUT_SEC,
+    AgentStatsStore,
+    critical_path_priority,
+    get_agent_stats_store,
+    reset_agent_stats_store,
+)
+
+
+def _stats(agent_stats, plan_id="plan_test"):
+    return {"plan_id": plan_id, "agent_stats": agent_stats}
+
+
+def _run(latency_ms, tokens=100, model="gpt-4o", **flags):
+    return {
+        "success": not flags.get("fallback_used", False),
+        "execution_time_ms": latency_ms,
+        "total_tokens": tokens,
+        "model_type": model,
+        **flags,
+    }
+
+
+@pytest.fixture
+def store():
+    return AgentStatsStore(":memory:")
+
+
+class TestRecordAndSummarize:
+    """기록 및 집계"""
+
+    def test_percentiles_and_rates(self, store):
+        for latency in range(1000, 11000, 1000):  # 1초 ~ 10초
+            store.record_execution_stats(_stats({"market": _run(latency, tokens=200)}), preset="fast")
+        store.record_execution_stats(_stats({"market": _run(0, cache_hit=True)}))
+        store.record_execution_stats(_stats({"market": _run(90000, fallback_used=True, retry_count=1)}))
+
+        summary = store.summarize()["market"]
+        assert summary["runs"] == 12
+        assert summary["executed"] == 10  # 캐시 적중/Fallback은 지연시간 집계 제외
+        assert summary["latency_p50_ms"] == 5500
+        assert summary["latency_p95_ms"] == pytest.approx(9550)
+        assert summary["fallback_rate"] == round(1 / 12, 3)
+        assert summary["retry_rate"] == round(1 / 12, 3)
+        assert summary["cache_hit_rate"] == round(1 / 12, 3)
+        assert summary["avg_tokens"] == 200
+
+    def test_group_by_model_and_preset(self, store):
+        store.record_execution_stats(_stats({"bm": _run(1000, model="gpt-4o")}), preset="balanced")
+        store.record_execution_stats(_stats({"bm": _run(300, model="gpt-4o-mini")}), preset="fast")
+
+        grouped = store.summarize(group_by=("agent_id", "model_type", "preset"))
+        assert set(grouped) == {"bm@gpt-4o/balanced", "bm@gpt-4o-mini/fast"}
+        assert store.summarize(model_type="gpt-4o-mini")["bm"]["latency_p50_ms"] == 300
+
+        with pytest.raises(ValueError):
+            store.summarize(group_by=("model_type",))
+
+    def test_rolling_window(self):
+        store = AgentStatsStore(":memory:", max_rows_per_agent=3)
+        for latency in [100, 200, 300, 400, 500]:
+            store.record_execution_stats(_stats({"risk": _run(latency)}))
+        assert store.summarize()["risk"]["runs"] == 3
+        assert store.summarize()["risk"]["latency_p50_ms"] == 400
+
+    def test_persists_across_instances(self, tmp_path):
+        db_path = str(tmp_path / "stats" / "agent_stats.db")
+        AgentStatsStore(db_path).record_execution_stats(_stats({"tech": _run(1500)}))
+        assert AgentStatsStore(db_path).summarize()["tech"]["runs"] == 1
+
+    def test_migrates_schema_without_timed_out(self, tmp_path):
+        import sqlite3
+
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE agent_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, recorded_at REAL NOT NULL, plan_id TEXT,
+                agent_id TEXT NOT NULL, model_type TEXT NOT NULL DEFAULT '', preset TEXT NOT NULL DEFAULT '',
+                success INTEGER NOT NULL, retry_count INTEGER NOT NULL DEFAULT 0,
+                fallback_used INTEGER NOT NULL DEFAULT 0, cache_hit INTEGER NOT NULL DEFAULT 0,
+                execution_time_ms REAL NOT NULL DEFAULT 0, total_tokens INTEGER NOT NULL DEFAULT 0
+            );
+            INSERT INTO agent_runs (recorded_at, agent_id, success, execution_time_ms) VALUES (0, 'tech', 1, 1500);
+        """)
+        conn.commit()
+        conn.close()
+
+        store = AgentStatsStore(db_path)
+        store.record_execution_stats(_stats({"tech": _run(2500)}))
+        assert store.summarize()["tech"]["runs"] == 2
+        assert store.summarize()["tech"]["timeout_rate"] == 0
+
+
+class TestSchedulingHints:
+    """이력 기반 스케줄링 값"""
+
+    def test_timeout_needs_history_and_never_grows(self, store):
+        assert store.suggest_timeout_sec("market", 90) == 90  # 이력 없음
+
+        for _ in range(5):
+            store.record_execution_stats(_stats({"market": _run(20000)}))
+        assert store.suggest_timeout_sec("market", 90) == 40  # p95 20초 × 2
+        assert store.suggest_timeout_sec("market", 30) == 30  # 설정값보다 늘리지 않음
+
+        for _ in range(5):
+            store.record_execution_stats(_stats({"bm": _run(100)}))
+        assert store.suggest_timeout_sec("bm", 60) == MIN_TIMEOUT_SEC
+
+    def test_timeouts_count_toward_p95(self, store):
+        timeout = {"fallback_used": True, "error_category": "TIMEOUT_ERROR"}
+        for _ in range(8):
+            store.record_execution_stats(_stats({"market": _run(10000)}))
+        assert store.suggest_timeout_sec("market", 90) == MIN_TIMEOUT_SEC  # p95 10초 × 2
+
+        # 단축된 타임아웃(20초)에 걸린 실행은 중단 시점 20초로 p95에 포함 → 제안값이 다시 늘어남
+        for _ in range(2):
+            store.record_execution_stats(_stats({"market": _run(20000, **timeout)}))
+        # 계획 마감시간으로 시작 전 생략된 건(0ms)은 지연시간에서 제외
+        store.record_execution_stats(_stats({"market": _run(0, **timeout)}))
+
+        summary = store.summarize()["market"]
+        assert summary["executed"] == 8
+        assert summary["timeout_rate"] == round(3 / 11, 3)
+        assert summary["latency_p95_ms"] == 20000
+        assert store.suggest_timeout_sec("market", 90) == 40
+
+    def test_db_errors_fall_back_to_priors(self, store):
+        from agents.agent_config import AGENT_REGISTRY
+        from agents.agent_cost_model import AgentCostModel
+
+        for _ in range(5):
+            store.record_execution_stats(_stats({"market": _run(20000)}))
+        store._conn = MagicMock()
+        store._conn.execute.side_effect = sqlite3.OperationalError("database is locked")
+        reset_agent_stats_store(store)
+        try:
+            assert store.suggest_timeout_sec("market", 90) == 90
+            assert store.expected_latency_ms("market") is None
+            estimate = AgentCostModel().estimate("market", "gpt-4o")
+            assert estimate.samples == 0
+            assert estimate.tokens == AGENT_REGISTRY["market"].expected_tokens
+        finally:
+            reset_agent_stats_store()
+
+    def test_critical_path_priority(self):
+        deps = {"market": [], "bm": ["market"], "financial": ["bm"], "tech": []}
+        latency = {"market": 1000, "bm": 1000, "financial": 5000, "tech": 4000}
+
+        priority = critical_path_priority(deps, deps, latency)
+
+        assert priority["financial"] == 5000
+        assert priority["market"] == 7000  # market → bm → financial
+        assert priority["market"] > priority["tech"]
+
+
+class TestSupervisorIntegration:
+    """Supervisor 실행 이력 저장 / 긴 Critical Path 우선"""
+
+    def test_records_history_and_orders_by_critical_path(self, monkeypatch):
+        from agents.supervisor import NativeSupervisor
+        from utils.settings import settings
+
+        store = AgentStatsStore(":memory:")
+        reset_agent_stats_store(store)
+        # 과거 이력: 사전 추정치와 반대로 tech(30초)가 market 체인(market → bm, 2초)보다 김
+        for _ in range(5):
+            store.record_execution_stats(_stats({
+                "tech": _run(30000), "market": _run(1000), "bm": _run(1000),
+            }))
+
+        started = []
+        lock = threading.Lock()
+
+        class RecordingAgent:
+            def __init__(self, agent_id):
+                self.agent_id = agent_id
+
+            def run(self, **kwargs):
+                with lock:
+                    started.append(self.agent_id)
+                time.sleep(0.01)
+                return {"agent": self.agent_id}
+
+        supervisor = NativeSupervisor(llm=MagicMock())
+        supervisor.agents = {a: RecordingAgent(a) for a in ["tech", "market", "bm"]}
+        monkeypatch.setattr(settings, "MAX_PARALLEL_AGENTS", 1)
+
+        results = {}
+        supervisor._execute_plan(resolve_execution_plan_dag(["tech", "market", "bm"], "test"), results, {
+            "service_overview": "러닝 앱",
+            "generation_preset": "fast",
+        })
+
+        assert started[0] == "tech"  # 계획 순서/사전 추정치와 무관하게 이력상 긴 체인부터
+        assert get_agent_stats_store() is store
+        assert store.summarize(preset="fast")["tech"]["runs"] == 1
+        assert store.summarize()["market"]["runs"] == 6
+        assert results["_execution_stats"]["agent_stats"]["tech"]["success"]
+
+    def test_broken_db_does_not_abort_plan(self, monkeypatch):
+        from agents.supervisor import NativeSupervisor
+
+        store = AgentStatsStore(":memory:")
+        store._conn = MagicMock()
+        store._conn.execute.side_effect = sqlite3.OperationalError("disk I/O error")
+        reset_agent_stats_store(store)
+
+        class EchoAgent:
+            def run(self, **kwargs):
+                return {"ok": True}
+
+        supervisor = NativeSupervisor(llm=MagicMock())
+        supervisor.agents = {a: EchoAgent() for a in ["market", "bm"]}
+        try:
+            results = {}
+            supervisor._execute_plan(resolve_execution_plan_dag(["market", "bm"], "test"), results, {
+                "service_overview": "러닝 앱",
+            })
+        finally:
+            reset_agent_stats_store()
+
+        agent_stats = results["_execution_stats"]["agent_stats"]
+        assert agent_stats["market"]["success"] and agent_stats["bm"]["success"]
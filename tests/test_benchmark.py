@@ -0,0 +1,100 @@
+"""
+PlanCraft - 워크플로우 벤치마크 테스트
+
+실행 방법:
+    pytest tests/test_benchmark.py -v
+
+테스트 항목:
+    - Baseline 비교 (회귀 판정 임계값)
+    - 백분위수 / 체크포인트 바이트 계산
+    - Fake 백엔드 E2E 1회 실행 리포트 구조
+"""
+
+import pytest
+
+from benchmarks.run_benchmark import (
+    DEFAULT_THRESHOLDS,
+    checkpoint_bytes,
+    compare_with_baseline,
+    percentile,
+    run_benchmark,
+)
+
+
+def _report(**overrides):
+    stats = {
+        "llm_calls_mean": 11.0,
+        "prompt_tokens_mean": 20000.0,
+        "checkpoint_bytes_mean": 300000.0,
+        "peak_traced_mb_max": 1.0,
+        "wall_ms_p95": 200.0,
+        "nodes": {"write": {"count": 1, "p50_ms": 30.0, "p95_ms": 30.0, "max_ms": 30.0}},
+    }
+    stats.update(overrides)
+    return {"presets": {"fast": stats}}
+
+
+class TestCompareWithBaseline:
+    """Baseline 회귀 판정 테스트"""
+
+    def test_identical_passes(self):
+        assert compare_with_baseline(_report(), _report()) == []
+
+    def test_extra_llm_call_is_regression(self):
+        regressions = compare_with_baseline(_report(llm_calls_mean=12.0), _report())
+        assert len(regressions) == 1 and "llm_calls_mean" in regressions[0]
+
+    def test_prompt_tokens_within_tolerance(self):
+        grown = 20000.0 * (1 + DEFAULT_THRESHOLDS["prompt_tokens_mean"] / 2)
+        assert compare_with_baseline(_report(prompt_tokens_mean=grown), _report()) == []
+        assert compare_with_baseline(_report(prompt_tokens_mean=30000.0), _report())
+
+    def test_small_latency_noise_ignored(self):
+        """상대 증가율이 커도 절대 차이가 작으면 회귀 아님"""
+        noisy = _report(nodes={"write": {"count": 1, "p50_ms": 30.0, "p95_ms": 70.0, "max_ms": 70.0}})
+        assert compare_with_baseline(noisy, _report()) == []
+
+    def test_unknown_preset_skipped(self):
+        report = {"presets": {"quality": _report()["presets"]["fast"]}}
+        assert compare_with_baseline(report, _report()) == []
+
+
+class TestHelpers:
+    """측정 헬퍼 테스트"""
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile([], 95) == 0.0
+
+    def test_checkpoint_bytes_non_memory_saver(self):
+        assert checkpoint_bytes(object(), "thread") is None
+
+
+class TestEndToEnd:
+    """Fake 백엔드 E2E 벤치마크 테스트"""
+
+    @pytest.fixture
+    def restore_backends(self):
+        from utils.config import Config
+        from utils.fake_llm import configure_fake_backend
+        from utils.llm import set_llm_backend
+
+        previous = (Config.LLM_BACKEND, Config.SEARCH_BACKEND, Config.TIME_SYNC_MODE)
+        yield
+        set_llm_backend(previous[0])
+        Config.SEARCH_BACKEND = previous[1]
+        Config.TIME_SYNC_MODE = previous[2]
+        configure_fake_backend()
+
+    def test_single_run_report(self, restore_backends):
+        report = run_benchmark(presets=["fast"], corpus=["점심 메뉴 추천 앱"], warmup=0)
+
+        stats = report["presets"]["fast"]
+        assert stats["statuses"] == {"completed": 1}
+        assert stats["llm_calls_mean"] > 0
+        assert stats["prompt_tokens_mean"] > 0
+        assert stats["checkpoint_bytes_mean"] > 0
+        assert {"analyze", "write", "review"} <= set(stats["nodes"])
+        assert report["peak_rss_mb"] > 0
@@ -0,0 +1,121 @@
+"""
+PlanCraft - 실행 마감시간(Deadline) 전파 테스트
+
+실행 방법:
+    pytest tests/test_deadline.py -v
+
+테스트 항목:
+    - 상위 마감시각(cap) 적용, 만료/취소 판정
+    - 컨텍스트 변수 기반 deadline_scope
+    - LLM 요청 timeout 전달 및 DeadlineExceeded 변환
+    - 전문 에이전트: LLM/네트워크 오류는 Supervisor로 전파, 그 외 오류만 자체 Fallback
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    deadline_scope,
+    get_current_deadline,
+    invoke_with_deadline,
+)
+from utils.error_handler import categorize_error
+
+
+class TestDeadline:
+    """Deadline 객체 테스트"""
+
+    def test_cap_limits_expiry(self):
+        cap = time.perf_counter() + 1
+        deadline = Deadline.after(60, cap=cap)
+        assert deadline.expires_at == cap
+        assert deadline.remaining() <= 1
+
+    def test_expired_and_cancel(self):
+        assert Deadline.after(0).expired()
+
+        deadline = Deadline.after(60)
+        assert not deadline.expired()
+        deadline.cancel()
+        assert deadline.expired() and deadline.cancelled
+        with pytest.raises(DeadlineExceeded):
+            deadline.check()
+
+    def test_categorized_as_timeout(self):
+        with pytest.raises(DeadlineExceeded) as exc_info:
+            Deadline.after(0).check()
+        assert categorize_error(exc_info.value) == "TIMEOUT_ERROR"
+
+
+class TestDeadlineScope:
+    """deadline_scope / invoke_with_deadline 테스트"""
+
+    def test_scope_sets_and_resets(self):
+        deadline = Deadline.after(60)
+        with deadline_scope(deadline):
+            assert get_current_deadline() is deadline
+            check_deadline()
+        assert get_current_deadline() is None
+        check_deadline()  # 마감시간 없으면 무시
+
+    def test_invoke_without_deadline_passes_no_timeout(self):
+        llm = MagicMock()
+        invoke_with_deadline(llm, ["msg"])
+        llm.invoke.assert_called_once_with(["msg"])
+
+    def test_invoke_passes_remaining_as_timeout(self):
+        llm = MagicMock()
+        with deadline_scope(Deadline.after(30)):
+            invoke_with_deadline(llm, ["msg"])
+        timeout = llm.invoke.call_args.kwargs["timeout"]
+        assert 29 < timeout <= 30
+
+    def test_invoke_after_cancel_skips_call(self):
+        llm = MagicMock()
+        deadline = Deadline.after(30)
+        deadline.cancel()
+        with deadline_scope(deadline), pytest.raises(DeadlineExceeded):
+            invoke_with_deadline(llm, ["msg"])
+        llm.invoke.assert_not_called()
+
+    def test_request_timeout_becomes_deadline_exceeded(self):
+        from utils.fake_llm import FakeChatModel, configure_fake_backend
+
+        configure_fake_backend(latency_ms_mean=2000)
+        try:
+            start = time.perf_counter()
+            with deadline_scope(Deadline.after(0.2)), pytest.raises(DeadlineExceeded):
+                invoke_with_deadline(FakeChatModel(), "안녕하세요")
+            assert time.perf_counter() - start < 1.0
+        finally:
+            configure_fake_backend()
+
+
+class TestSpecialistErrorPropagation:
+    """전문 에이전트 에러 전파"""
+
+    def _run_bm(self, monkeypatch, error):
+        import agents.specialists.bm_agent as bm_agent
+
+        def fail(*args, **kwargs):
+            raise error
+
+        monkeypatch.setattr(bm_agent, "invoke_structured", fail)
+        return bm_agent.BMAgent(llm=MagicMock()).run(service_overview="러닝 앱", target_users="러너")
+
+    def test_llm_error_reaches_supervisor(self, monkeypatch):
+        with pytest.raises(RuntimeError) as exc_info:
+            self._run_bm(monkeypatch, RuntimeError("OpenAI API error 500"))
+        assert categorize_error(exc_info.value) == "LLM_ERROR"
+
+    def test_other_error_uses_agent_fallback(self, monkeypatch):
+        from agents.specialist_cache import UNCACHEABLE_KEY
+
+        result = self._run_bm(monkeypatch, KeyError("revenue_mix"))
+        assert result[UNCACHEABLE_KEY] is True
+        assert result["primary_model"]
@@ -0,0 +1,166 @@
+"""
+PlanCraft - Compact 토론 모드 테스트
+
+실행 방법:
+    pytest tests/test_discussion_compact.py -v
+
+테스트 항목:
+    - Compact 서브그래프 구성 (reviewer_turn 단일 호출 노드)
+    - 합의 / 합의 사항 수렴 / 최대 라운드 / 실패 시 조기 종료
+    - 토론 1회당 LLM 호출 수, 지연시간, 종료 사유 기록 (state + 전역 통계)
+    - 기존 3단계 모드 호출 수 기록
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from graph.subgraphs import (
+    DiscussionStats,
+    _items_converged,
+    create_discussion_subgraph,
+    run_discussion_subgraph,
+)
+from utils.schemas import DiscussionTurn
+
+
+def _turn(consensus=False, confidence=0.9, items=("시장 규모 출처 추가",)):
+    return DiscussionTurn(
+        reply="계획을 검토했습니다.", consensus_reached=consensus,
+        confidence=confidence, agreed_items=list(items),
+    )
+
+
+@pytest.fixture
+def discussion_state():
+    return {
+        "draft": {"sections": [{"name": "시장 분석", "content": "..."}]},
+        "review": {"feedback_summary": "근거 부족", "critical_issues": [], "action_items": ["TAM 출처"]},
+    }
+
+
+@pytest.fixture
+def patch_llm(monkeypatch):
+    """get_llm Mock: 일반 호출은 Writer 응답, DiscussionTurn/ConsensusResult는 turns 순서대로"""
+    calls = {"text": 0, "structured": 0}
+
+    def install(turns):
+        llm = MagicMock()
+
+        def invoke(messages):
+            calls["text"] += 1
+            return MagicMock(content="시장 규모 출처를 추가하겠습니다.")
+
+        def structured_invoke(messages):
+            calls["structured"] += 1
+            turn = turns[min(calls["structured"], len(turns)) - 1]
+            if isinstance(turn, Exception):
+                raise turn
+            return turn
+
+        llm.invoke.side_effect = invoke
+        llm.with_structured_output.return_value.invoke.side_effect = structured_invoke
+        monkeypatch.setattr("utils.llm.get_llm", lambda **kwargs: llm)
+        return calls
+
+    return install
+
+
+class TestCompactGraph:
+    """서브그래프 구성"""
+
+    def test_nodes_by_mode(self):
+        assert "reviewer_turn" in create_discussion_subgraph(compact=True).nodes
+        assert "check_consensus" not in create_discussion_subgraph(compact=True).nodes
+        assert "check_consensus" in create_discussion_subgraph(compact=False).nodes
+
+    def test_items_converged(self):
+        assert _items_converged(["TAM 출처 추가", "BEP 계산"], ["TAM  출처 추가"])
+        assert not _items_converged(["TAM 출처 추가"], ["TAM 출처 추가", "경쟁사 3개 분석"])
+        assert not _items_converged([], ["TAM 출처 추가"])
+
+
+class TestCompactDiscussion:
+    """Compact 토론 종료 조건 및 비용 기록"""
+
+    @pytest.fixture(autouse=True)
+    def compact_settings(self, monkeypatch):
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "DISCUSSION_COMPACT", True)
+        monkeypatch.setattr(settings, "DISCUSSION_MAX_ROUNDS", 5)
+
+    def test_consensus_in_one_round(self, patch_llm, discussion_state):
+        calls = patch_llm([_turn(consensus=True)])
+
+        result = run_discussion_subgraph(discussion_state)
+
+        metrics = result["discussion_metrics"]
+        assert calls == {"text": 1, "structured": 1}
+        assert metrics["llm_calls"] == 2
+        assert metrics["mode"] == "compact"
+        assert metrics["stop_reason"] == "consensus"
+        assert metrics["elapsed_ms"] >= 0
+        assert result["agreed_action_items"] == ["시장 규모 출처 추가"]
+        assert [m["role"] for m in result["discussion_messages"][:3]] == ["reviewer", "writer", "reviewer"]
+
+    def test_stops_when_agreed_items_converge(self, patch_llm, discussion_state):
+        calls = patch_llm([_turn(), _turn(confidence=0.3)])
+
+        result = run_discussion_subgraph(discussion_state)
+
+        assert result["discussion_round"] == 2
+        assert result["discussion_metrics"]["stop_reason"] == "converged"
+        assert calls["structured"] == 2
+        assert result["discussion_metrics"]["llm_calls"] == 4
+
+    def test_max_rounds_bound(self, patch_llm, discussion_state, monkeypatch):
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "DISCUSSION_MAX_ROUNDS", 3)
+        patch_llm([_turn(items=[f"항목 {i}" for i in range(n)]) for n in (1, 3, 6)])
+
+        result = run_discussion_subgraph(discussion_state)
+
+        assert result["discussion_round"] == 3
+        assert result["discussion_metrics"]["stop_reason"] == "max_rounds"
+        assert result["discussion_metrics"]["llm_calls"] == 6  # 라운드당 2회
+
+    def test_error_ends_discussion(self, patch_llm, discussion_state):
+        patch_llm([RuntimeError("timeout")])
+
+        result = run_discussion_subgraph(discussion_state)
+
+        assert result["consensus_reached"] is True
+        assert result["discussion_metrics"]["stop_reason"] == "error"
+        assert result["agreed_action_items"] == ["시장 규모 출처를 추가하겠습니다."]
+
+
+class TestDiscussionMetrics:
+    """기존 모드 호출 수 및 전역 통계"""
+
+    def test_full_mode_counts_calls(self, patch_llm, discussion_state, monkeypatch):
+        from utils.schemas import ConsensusResult
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "DISCUSSION_COMPACT", False)
+        monkeypatch.setattr(settings, "DISCUSSION_MAX_ROUNDS", 2)
+        patch_llm([ConsensusResult(consensus_reached=False, confidence=0.5)] * 2)
+
+        result = run_discussion_subgraph(discussion_state)
+
+        # 라운드 0: Writer + 합의 판정, 라운드 1: Reviewer + Writer + 합의 판정
+        assert result["discussion_metrics"]["llm_calls"] == 5
+        assert result["discussion_metrics"]["mode"] == "full"
+        assert result["discussion_metrics"]["stop_reason"] == "max_rounds"
+
+    def test_stats_snapshot(self):
+        stats = DiscussionStats()
+        stats.record({"mode": "compact", "llm_calls": 2, "rounds": 1, "elapsed_ms": 100.0, "stop_reason": "consensus"})
+        stats.record({"mode": "compact", "llm_calls": 4, "rounds": 2, "elapsed_ms": 300.0, "stop_reason": "converged"})
+
+        snapshot = stats.snapshot()["compact"]
+        assert snapshot["discussions"] == 2
+        assert snapshot["avg_llm_calls"] == 3.0
+        assert snapshot["max_elapsed_ms"] == 300.0
+        assert snapshot["stop_reasons"] == {"consensus": 1, "converged": 1}
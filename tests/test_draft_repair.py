@@ -0,0 +1,185 @@
+"""
+PlanCraft - Writer 초안 부분 수리 (Section Repair) 테스트
+
+실행 방법:
+    pytest tests/test_draft_repair.py -v
+
+테스트 항목:
+    - 검증 결과 구조화 (diagnose_draft) / 기존 validate_draft 문자열 유지
+    - 수리 대상 선택 (부실 섹션, 누락 요소를 추가할 관련 섹션)
+    - 수리 결과 병합 (대상만 교체, 새 섹션은 참고 자료 앞에 추가)
+    - 번호/이름이 바뀐 수리 결과는 대상 섹션에 매핑, 요청하지 않은 새 섹션은 부족 개수까지만 추가
+    - 수리 프롬프트: 목차 + 대상 섹션 본문만 전달
+    - Writer 재시도 시 전체 재작성 대신 부분 수리
+"""
+
+from unittest.mock import MagicMock
+
+from agents.helpers.draft_repair import (
+    build_repair_prompt,
+    repair_draft,
+    select_repair_targets,
+    splice_repair,
+)
+from agents.helpers.validator import diagnose_draft, validate_draft
+from utils.settings import get_preset
+
+LONG = "충분히 긴 본문 " * 20
+
+
+def _preset(min_sections=3, diagrams=0, charts=0):
+    preset = MagicMock()
+    preset.min_sections = min_sections
+    preset.include_diagrams = diagrams
+    preset.include_charts = charts
+    return preset
+
+
+def _draft(*sections):
+    return {"sections": [{"id": i, "name": name, "content": content} for i, (name, content) in enumerate(sections, 1)]}
+
+
+class TestDiagnosis:
+    """검증 결과 구조화"""
+
+    def test_structured_targets(self):
+        draft = _draft(("개요", "짧음"), ("시장 분석", "짧음"), ("수익 모델", "짧음"), ("서비스 구조", LONG))
+
+        diagnosis = diagnose_draft(draft, _preset(min_sections=6, diagrams=1, charts=1), "", 0)
+
+        assert diagnosis.missing_section_count == 2
+        assert diagnosis.short_sections == ["개요", "시장 분석", "수익 모델"]
+        assert diagnosis.missing_diagram and diagnosis.missing_chart
+        assert validate_draft(draft, _preset(min_sections=6, diagrams=1, charts=1), "", 0, MagicMock()) == diagnosis.issues
+
+    def test_pass(self):
+        diagnosis = diagnose_draft(_draft(("a", LONG), ("b", LONG), ("c", LONG)), _preset(), "", 0)
+        assert not diagnosis
+        assert diagnosis.issues == []
+
+
+class TestRepairTargets:
+    """수리 대상 선택 및 병합"""
+
+    def test_missing_elements_go_to_related_sections(self):
+        draft = _draft(("개요", LONG), ("서비스 구조", LONG), ("수익 모델", LONG), ("리스크", LONG))
+        diagnosis = diagnose_draft(draft, _preset(diagrams=1, charts=1), "전문 분석", 0)
+
+        targets = select_repair_targets(draft, diagnosis)
+
+        assert targets["서비스 구조"] == ["Mermaid 다이어그램 추가"]
+        assert "ASCII 차트 추가" in targets["수익 모델"]
+        assert "개요" not in targets
+        # 관련 섹션이 없으면 새 섹션으로 추가
+        assert "TAM/SAM/SOM" in targets
+
+    def test_splice_replaces_targets_only(self):
+        draft = _draft(("개요", LONG), ("시장 분석", "짧음"), ("참고 자료", "- 출처"))
+        patch = {"sections": [
+            {"id": 1, "name": "시장 분석", "content": "보강된 시장 분석"},
+            {"id": 2, "name": "개요", "content": "요청하지 않은 재작성"},
+            {"id": 3, "name": "성장 전략", "content": "새 섹션"},
+        ]}
+
+        repaired = splice_repair(draft, patch, {"시장 분석": ["내용 보강"]}, max_new_sections=1)
+
+        assert [s["name"] for s in repaired["sections"]] == ["개요", "시장 분석", "성장 전략", "참고 자료"]
+        assert [s["id"] for s in repaired["sections"]] == [1, 2, 3, 4]
+        assert repaired["sections"][0]["content"] == LONG
+        assert repaired["sections"][1]["content"] == "보강된 시장 분석"
+        assert draft["sections"][1]["content"] == "짧음"  # 원본 초안 비변경
+
+    def test_splice_maps_renumbered_target(self):
+        draft = _draft(("개요", LONG), ("시장 분석", "짧음"), ("참고 자료", "- 출처"))
+        patch = {"sections": [{"id": 2, "name": "2. 시장 분석", "content": "보강된 시장 분석"}]}
+
+        repaired = splice_repair(draft, patch, {"시장 분석": ["내용 보강"]})
+
+        assert [s["name"] for s in repaired["sections"]] == ["개요", "시장 분석", "참고 자료"]
+        assert repaired["sections"][1]["content"] == "보강된 시장 분석"
+
+    def test_splice_maps_requested_new_section(self):
+        draft = _draft(("개요", LONG), ("참고 자료", "- 출처"))
+        patch = {"sections": [{"id": 2, "name": "3) 서비스 구조", "content": "```mermaid 구조```"}]}
+
+        repaired = splice_repair(draft, patch, {"서비스 구조": ["Mermaid 다이어그램 추가"]})
+
+        assert [s["name"] for s in repaired["sections"]] == ["개요", "서비스 구조", "참고 자료"]
+
+    def test_splice_caps_unrequested_sections(self):
+        draft = _draft(("개요", LONG), ("시장 분석", "짧음"), ("참고 자료", "- 출처"))
+        patch = {"sections": [
+            {"id": 2, "name": "시장 분석", "content": "보강된 시장 분석"},
+            {"id": 3, "name": "성장 전략", "content": "요청하지 않은 섹션"},
+            {"id": 4, "name": "팀 구성", "content": "요청하지 않은 섹션"},
+        ]}
+        targets = {"시장 분석": ["내용 보강"]}
+
+        # 섹션 개수가 부족하지 않으면 새 섹션을 추가하지 않음
+        assert [s["name"] for s in splice_repair(draft, patch, targets)["sections"]] == ["개요", "시장 분석", "참고 자료"]
+        # 부족한 개수만큼만 추가
+        repaired = splice_repair(draft, patch, targets, max_new_sections=1)
+        assert [s["name"] for s in repaired["sections"]] == ["개요", "시장 분석", "성장 전략", "참고 자료"]
+
+    def test_prompt_contains_only_target_bodies(self):
+        draft = _draft(("개요", "개요 본문 " * 30), ("서비스 구조", "구조 본문"), ("수익 모델", "수익 본문 " * 30))
+        diagnosis = diagnose_draft(draft, _preset(min_sections=5, diagrams=1), "", 0)
+        targets = select_repair_targets(draft, diagnosis)
+
+        prompt = build_repair_prompt(draft, diagnosis, targets, _preset(diagrams=1))
+
+        assert "구조 본문" in prompt
+        assert "개요 본문" not in prompt  # 대상이 아닌 섹션은 목차만
+        assert "1. 개요" in prompt
+        assert "2개 이상 새로 작성" in prompt
+        assert "```mermaid" in prompt
+
+
+class TestWriterRepairLoop:
+    """Writer 재시도 시 부분 수리"""
+
+    def test_repair_instead_of_full_rewrite(self, monkeypatch):
+        import agents.writer as writer
+
+        sections = [(f"섹션{i}", LONG) for i in range(1, 10)]
+        sections[2] = ("서비스 구조", LONG)
+        sections[5] = ("수익 모델", LONG + " ▓▓▓░░")
+        first_draft = _draft(*sections)
+        calls = []
+
+        class StubLLM:
+            def invoke(self, messages):
+                calls.append(messages)
+                if len(calls) == 1:
+                    return first_draft
+                return {"sections": [{"id": 3, "name": "서비스 구조", "content": LONG + "\n```mermaid\ngraph TB\nA-->B\n```"}]}
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value = StubLLM()
+        monkeypatch.setattr(writer, "get_llm", lambda **kwargs: llm)
+
+        state = writer.run({
+            "user_input": "러닝 앱",
+            "structure": {"title": "러닝 앱", "sections": [{"title": name} for name, _ in sections]},
+            "generation_preset": "balanced",
+            "enable_writer_react": False,
+        })
+
+        assert get_preset("balanced").writer_max_retries == 2
+        assert len(calls) == 2
+        assert len(calls[1]) == len(calls[0]) + 1  # 피드백 누적 없이 수리 요청 1개만 추가
+        assert "초안 부분 수리" in calls[1][-1]["content"]
+        assert "```mermaid" in state["draft"]["sections"][2]["content"]
+        assert len(state["draft"]["sections"]) == 9
+        assert not state.get("error")
+
+    def test_repair_draft_keeps_base_messages(self):
+        base = [{"role": "system", "content": "s"}, {"role": "user", "content": "u"}]
+        llm = MagicMock()
+        llm.invoke.return_value = {"sections": []}
+        draft = _draft(("a", "짧음"), ("b", "짧음"), ("c", "짧음"))
+
+        repaired = repair_draft(llm, base, draft, diagnose_draft(draft, _preset(), "", 0), _preset(), MagicMock())
+
+        assert len(base) == 2
+        assert repaired["sections"] == draft["sections"]
@@ -0,0 +1,180 @@
+"""
+PlanCraft - 근거 번들 (Evidence Bundle) 테스트
+
+실행 방법:
+    pytest tests/test_evidence_bundle.py -v
+
+테스트 항목:
+    - web_sources / URL 조회 본문 / RAG 문서 수집 및 중복 제거
+    - 소비자별 토큰 예산 내 렌더링 + 토큰 통계
+    - 상태 직렬화 (to_dict/from_dict) 및 상태 기반 생성
+    - 시장 분석 에이전트에 번들 렌더링 전달 (줄 단위 분할 제거)
+    - 나머지 전문 에이전트에 에이전트별 예산으로 렌더링한 근거 전달
+"""
+
+import pytest
+
+from utils.evidence_bundle import (
+    KIND_RAG,
+    KIND_WEB,
+    EvidenceBundle,
+    build_evidence_bundle,
+    estimate_tokens,
+    evidence_token_stats,
+    get_evidence_bundle,
+)
+
+WEB_SOURCES = [
+    {"title": "러닝 앱 시장 동향", "url": "https://a.example/run",
+     "content": "- [러닝 앱 시장 동향](https://a.example/run)\n  국내 러닝 앱 시장은 연 12% 성장"},
+    {"title": "중복 URL", "url": "https://a.example/run", "content": "다른 내용"},
+    {"title": "웨어러블 연동", "url": "https://b.example/wear",
+     "content": "- [웨어러블 연동](https://b.example/wear)\n  스마트워치 연동 수요 증가"},
+]
+WEB_CONTEXT = (
+    "- [러닝 앱 시장 동향](https://a.example/run)\n  국내 러닝 앱 시장은 연 12% 성장"
+    "\n\n---\n\n"
+    "[URL 참조: https://c.example/report]\n러닝 크루 보고서 본문"
+)
+RAG_CONTEXT = "사내 기획서 템플릿 안내\n\n---\n\n수익 모델 가이드\n\n---\n\n사내 기획서 템플릿 안내"
+
+
+@pytest.fixture(autouse=True)
+def clear_stats():
+    evidence_token_stats.clear()
+    yield
+    evidence_token_stats.clear()
+
+
+class TestBuild:
+    """근거 수집 및 중복 제거"""
+
+    def test_dedup_and_kinds(self):
+        bundle = build_evidence_bundle(WEB_SOURCES, RAG_CONTEXT, WEB_CONTEXT)
+
+        web = [item for item in bundle.items if item.kind == KIND_WEB]
+        rag = [item for item in bundle.items if item.kind == KIND_RAG]
+        assert [item.url for item in web] == [
+            "https://a.example/run", "https://b.example/wear", "https://c.example/report"
+        ]
+        # 검색 결과 머리줄("- [제목](URL)")은 제목/URL 필드로 분리
+        assert web[0].content == "국내 러닝 앱 시장은 연 12% 성장"
+        assert web[2].content == "러닝 크루 보고서 본문"
+        assert [item.content for item in rag] == ["사내 기획서 템플릿 안내", "수익 모델 가이드"]
+
+    def test_long_item_capped(self):
+        bundle = build_evidence_bundle(rag_context="가" * 5000)
+        assert len(bundle.items[0].content) <= 601
+
+    def test_empty_inputs(self):
+        assert not build_evidence_bundle()
+        assert build_evidence_bundle().render("market") == ""
+
+
+class TestRender:
+    """소비자별 토큰 예산"""
+
+    def test_budget_respected_and_recorded(self):
+        sources = [
+            {"title": f"출처 {i}", "url": f"https://x.example/{i}", "content": f"내용 {i} " + "데이터 " * 80}
+            for i in range(10)
+        ]
+        bundle = build_evidence_bundle(sources)
+
+        text = bundle.render("market", budget=300)
+
+        assert estimate_tokens(text) <= 300
+        assert text.startswith("[W1] 출처 0 (https://x.example/0)")
+        stats = evidence_token_stats.snapshot()["market"]
+        assert stats["renders"] == 1
+        assert stats["tokens"] == estimate_tokens(text)
+        assert stats["dropped_items"] > 0
+
+    def test_kind_filter(self):
+        bundle = build_evidence_bundle(WEB_SOURCES, RAG_CONTEXT)
+        rag_text = bundle.render("writer:rag", kinds=(KIND_RAG,))
+
+        assert "수익 모델 가이드" in rag_text
+        assert "러닝 앱 시장" not in rag_text
+        assert set(evidence_token_stats.snapshot()) == {"writer:rag"}
+
+
+class TestState:
+    """상태 저장/복원"""
+
+    def test_roundtrip(self):
+        bundle = build_evidence_bundle(WEB_SOURCES, RAG_CONTEXT)
+        restored = EvidenceBundle.from_dict(bundle.to_dict())
+        assert restored == bundle
+
+    def test_get_from_state(self):
+        stored = build_evidence_bundle(rag_context="저장된 번들").to_dict()
+        assert get_evidence_bundle({"evidence_bundle": stored}).items[0].content == "저장된 번들"
+
+        built = get_evidence_bundle({"web_sources": WEB_SOURCES, "rag_context": RAG_CONTEXT})
+        assert len(built.items) == 4
+
+
+class TestSpecialistHandoff:
+    """전문 에이전트 입력"""
+
+    def test_supervisor_node_passes_rendered_evidence(self, monkeypatch):
+        import agents.supervisor
+        import graph.nodes.supervisor_node as supervisor_node
+
+        captured = {}
+
+        class StubSupervisor:
+            def run(self, **kwargs):
+                captured.update(kwargs)
+                return {}
+
+        monkeypatch.setattr(agents.supervisor, "get_supervisor", lambda *args, **kwargs: StubSupervisor())
+        state = {
+            "user_input": "러닝 앱",
+            "web_context": WEB_CONTEXT,
+            "web_sources": WEB_SOURCES,
+            "rag_context": RAG_CONTEXT,
+        }
+
+        supervisor_node._run_specialist_analysis(state, 0.0)
+
+        evidence = captured["web_search_results"]
+        assert isinstance(evidence, str)
+        assert evidence.count("https://a.example/run") == 1
+        assert "사내 기획서" not in evidence  # 시장 분석에는 웹 근거만
+        assert "market" in evidence_token_stats.snapshot()
+        assert captured["evidence_bundle"].items
+
+    def test_supervisor_renders_evidence_per_specialist(self):
+        from unittest.mock import MagicMock
+
+        from agents.supervisor import NativeSupervisor
+
+        supervisor = NativeSupervisor(llm=MagicMock())
+        context = {
+            "service_overview": "러닝 앱",
+            "evidence_bundle": build_evidence_bundle(WEB_SOURCES, RAG_CONTEXT, WEB_CONTEXT),
+        }
+
+        for agent_id in ("bm", "financial", "risk", "tech", "content"):
+            ctx = supervisor._prepare_agent_context(agent_id, context, {})
+            assert "https://a.example/run" in ctx["evidence"], agent_id
+            assert "사내 기획서" not in ctx["evidence"]  # 웹 근거만
+        supervisor._prepare_agent_context("bm", context, {})
+
+        stats = evidence_token_stats.snapshot()
+        assert stats["bm"]["renders"] == 1  # 실행당 한 번만 렌더링
+        assert "evidence" not in supervisor._prepare_agent_context("market", context, {})
+        assert "evidence" not in supervisor._prepare_agent_context("bm", {"service_overview": "러닝 앱"}, {})
+
+    def test_specialist_prompt_includes_evidence(self):
+        from unittest.mock import MagicMock
+
+        from agents.specialists.risk_agent import RiskAgent
+
+        llm = MagicMock()
+        RiskAgent(llm=llm).run("러닝 앱", {}, evidence="[W1] 러닝 앱 시장 동향")
+
+        messages = llm.with_structured_output.return_value.invoke.call_args[0][0]
+        assert "[W1] 러닝 앱 시장 동향" in messages[-1]["content"]
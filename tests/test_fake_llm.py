@@ -0,0 +1,154 @@
+"""
+PlanCraft - 오프라인 Fake LLM / Embedding 백엔드 테스트
+
+실행 방법:
+    pytest tests/test_fake_llm.py -v
+
+테스트 항목:
+    - utils/schemas.py 전체 스키마에 대한 Structured Output 유효성
+    - 결정론적 응답 / 임베딩
+    - 토큰 사용량 보고 및 장애(429/5xx) 주입
+    - get_llm()/get_embeddings() 백엔드 전환
+"""
+
+import inspect
+
+import pytest
+from pydantic import BaseModel
+
+import utils.schemas as schemas_module
+from utils.fake_llm import (
+    FakeChatModel,
+    FakeEmbeddings,
+    configure_fake_backend,
+    get_fake_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_config():
+    configure_fake_backend()
+    yield
+    configure_fake_backend()
+
+
+def _all_schemas():
+    return [
+        cls for _, cls in inspect.getmembers(schemas_module, inspect.isclass)
+        if issubclass(cls, BaseModel) and cls is not BaseModel
+        and cls.__module__ == schemas_module.__name__
+    ]
+
+
+class TestStructuredOutput:
+    """with_structured_output 스키마 유효성 테스트"""
+
+    @pytest.mark.parametrize("schema", _all_schemas(), ids=lambda c: c.__name__)
+    def test_every_schema_is_valid(self, schema):
+        result = FakeChatModel().with_structured_output(schema).invoke("기획서 작성")
+        assert isinstance(result, schema)
+
+    def test_happy_path_fields(self):
+        from utils.schemas import AnalysisResult, DraftResult, JudgeResult
+
+        analysis = FakeChatModel().with_structured_output(AnalysisResult).invoke("앱")
+        assert analysis.need_more_info is False
+        assert len(analysis.key_features) >= 5
+
+        draft = FakeChatModel().with_structured_output(DraftResult).invoke("앱")
+        assert len(draft.sections) == get_fake_config().section_count
+        assert "```mermaid" in draft.sections[0].content
+
+        judge = FakeChatModel().with_structured_output(JudgeResult).invoke("앱")
+        assert judge.overall_score == 9 and judge.verdict == "PASS"
+
+    def test_judge_score_configurable(self):
+        from utils.schemas import JudgeResult
+
+        configure_fake_backend(judge_score=6)
+        judge = FakeChatModel().with_structured_output(JudgeResult).invoke("앱")
+        assert judge.overall_score == 6 and judge.verdict == "REVISE"
+
+    def test_deterministic(self):
+        from utils.schemas import StructureResult
+
+        a = FakeChatModel().with_structured_output(StructureResult).invoke("같은 입력")
+        configure_fake_backend()
+        b = FakeChatModel().with_structured_output(StructureResult).invoke("같은 입력")
+        assert a == b
+
+
+class TestUsageAndFaults:
+    """토큰 보고 및 장애 주입 테스트"""
+
+    def test_usage_reported(self):
+        configure_fake_backend(output_tokens_mean=100, output_tokens_std=0, cached_prompt_ratio=1.0)
+        message = FakeChatModel().invoke("가" * 3000)
+        usage = message.usage_metadata
+        assert usage["output_tokens"] == 100
+        assert usage["input_tokens"] > 1024
+        assert usage["input_token_details"]["cache_read"] % 128 == 0
+        assert usage["input_token_details"]["cache_read"] > 0
+
+    def test_rate_limit_injection(self):
+        from utils.error_handler import categorize_error
+
+        configure_fake_backend(rate_limit_rate=1.0)
+        with pytest.raises(Exception) as exc_info:
+            FakeChatModel().invoke("hello")
+        assert categorize_error(exc_info.value) == "RATE_LIMIT_ERROR"
+
+    def test_failure_injection(self):
+        configure_fake_backend(failure_rate=1.0)
+        with pytest.raises(Exception, match="500"):
+            FakeChatModel().invoke("hello")
+
+    def test_bind_tools_returns_no_tool_calls(self):
+        from langchain_core.tools import tool
+
+        @tool
+        def noop(x: str) -> str:
+            """noop"""
+            return x
+
+        response = FakeChatModel().bind_tools([noop]).invoke("hello")
+        assert not response.tool_calls
+
+
+class TestFakeEmbeddings:
+    """결정론적 임베딩 테스트"""
+
+    def test_deterministic_and_normalized(self):
+        emb = FakeEmbeddings(dim=64)
+        v1 = emb.embed_query("점심 메뉴 추천 앱")
+        assert v1 == emb.embed_query("점심 메뉴 추천 앱")
+        assert len(v1) == 64
+        assert abs(sum(v * v for v in v1) - 1.0) < 1e-6
+
+    def test_similar_texts_closer(self):
+        emb = FakeEmbeddings(dim=256)
+        base = emb.embed_query("점심 메뉴 추천 앱 기획")
+        near = emb.embed_query("점심 메뉴 추천 앱")
+        far = emb.embed_query("블록체인 물류 플랫폼")
+        dot = lambda a, b: sum(x * y for x, y in zip(a, b))
+        assert dot(base, near) > dot(base, far)
+
+
+class TestBackendSelection:
+    """get_llm()/get_embeddings() 백엔드 전환 테스트"""
+
+    def test_set_llm_backend(self):
+        from utils.llm import get_embeddings, get_llm, set_llm_backend
+
+        set_llm_backend("fake")
+        try:
+            assert isinstance(get_llm(model_type="gpt-4o-mini", temperature=0.2), FakeChatModel)
+            assert isinstance(get_embeddings(), FakeEmbeddings)
+        finally:
+            set_llm_backend("azure")
+
+    def test_invalid_backend(self):
+        from utils.llm import set_llm_backend
+
+        with pytest.raises(ValueError):
+            set_llm_backend("unknown")
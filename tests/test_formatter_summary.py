@@ -0,0 +1,207 @@
+"""
+PlanCraft - Formatter 규칙 기반 채팅 요약 테스트
+
+실행 방법:
+    pytest tests/test_formatter_summary.py -v
+
+테스트 항목:
+    - draft/review/specialist_analysis로 결정적 요약 생성 (점수/판정 비노출)
+    - off: LLM 호출 없음 / sync: 반환 전 다듬기, 실패 시 규칙 기반 유지
+    - background: 규칙 기반 요약을 먼저 반환하고 다듬은 요약은 thread_id별 보관
+      (호출 측 컨텍스트 전달, 이전 실행/discard 이후에 끝난 다듬기 결과는 무시)
+"""
+
+import contextvars
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.formatter import (
+    POLISH_BACKGROUND,
+    POLISH_OFF,
+    POLISH_SYNC,
+    FormatterAgent,
+    build_chat_summary,
+    get_polished_summary,
+    polished_summaries,
+)
+
+
+@pytest.fixture
+def plan_state():
+    return {
+        "thread_id": "fmt-test",
+        "generation_preset": "balanced",
+        "structure": {"title": "런메이트"},
+        "analysis": {
+            "topic": "러닝 앱", "purpose": "혼자 뛰는 러너에게 AI 코칭 제공",
+            "target_users": "20-30대 러너", "key_features": ["AI 코칭", "챌린지", "보험 할인", "기록 분석"],
+        },
+        "draft": {"sections": [{"id": i, "name": f"섹션 {i}", "content": "..."} for i in range(1, 11)]},
+        "review": {"overall_score": 9, "verdict": "PASS", "strengths": ["명확한 타겟", "수익 구조", "기타"]},
+        "specialist_analysis": {
+            "market_analysis": {"tam": {"value": "$12.5B", "value_krw": "16조 원", "cagr": "12%"}},
+            "business_model": {"primary_model": {"name": "프리미엄 구독"}},
+            "financial_plan": {"bep": {"bep_month": 14}},
+        },
+        "final_output": "# 런메이트",
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_polished():
+    polished_summaries.clear()
+    yield
+    polished_summaries.clear()
+
+
+def _patch_llm(monkeypatch, invoke):
+    import agents.formatter as formatter
+
+    llm = MagicMock()
+    llm.invoke.side_effect = invoke
+    monkeypatch.setattr(formatter, "get_llm", lambda **kwargs: llm)
+    return llm
+
+
+class TestBuildChatSummary:
+    """규칙 기반 요약"""
+
+    def test_structured_fields(self, plan_state):
+        summary = build_chat_summary(plan_state)
+
+        assert summary.startswith("## ✨ 런메이트 기획서 완성!")
+        assert "> 혼자 뛰는 러너에게 AI 코칭 제공" in summary
+        assert "3. **보험 할인**" in summary and "기록 분석" not in summary
+        assert "10개 섹션: 섹션 1 · " in summary and "외 2개" in summary
+        assert "- 명확한 타겟" in summary and "기타" not in summary
+        assert "전체 시장 규모 16조 원 (연 12% 성장)" in summary
+        assert "수익 모델: 프리미엄 구독" in summary
+        assert "출시 후 14개월 손익분기 목표" in summary
+        # 점수/판정은 사용자에게 노출하지 않음
+        assert "점" not in summary and "PASS" not in summary
+        assert build_chat_summary(plan_state) == summary
+
+    def test_minimal_state(self):
+        summary = build_chat_summary({"analysis": {"topic": "러닝 앱"}})
+        assert summary.startswith("## ✨ 러닝 앱 기획서 완성!")
+        assert "하이라이트" not in summary
+
+
+class TestPolishModes:
+    """LLM 다듬기 모드"""
+
+    def test_off_skips_llm(self, monkeypatch, plan_state):
+        _patch_llm(monkeypatch, lambda messages: pytest.fail("LLM 호출됨"))
+
+        state = FormatterAgent(polish=POLISH_OFF).run(plan_state)
+
+        assert state["chat_summary"] == build_chat_summary(plan_state)
+        assert state["refine_count"] == 0
+
+    def test_sync_polishes_and_falls_back(self, monkeypatch, plan_state):
+        prompts = []
+        _patch_llm(monkeypatch, lambda messages: prompts.append(messages) or MagicMock(content="```markdown\n다듬은 요약\n```"))
+
+        state = FormatterAgent(polish=POLISH_SYNC).run(plan_state)
+        assert state["chat_summary"] == "다듬은 요약"
+        assert "수익 모델: 프리미엄 구독" in prompts[0][-1]["content"]  # 규칙 기반 요약 전달
+
+        def fail(messages):
+            raise RuntimeError("timeout")
+
+        _patch_llm(monkeypatch, fail)
+        state = FormatterAgent(polish=POLISH_SYNC).run(plan_state)
+        assert state["chat_summary"] == build_chat_summary(plan_state)
+        assert "포맷팅 오류" in state["error"]
+
+    def test_background_returns_before_polish(self, monkeypatch, plan_state):
+        release = threading.Event()
+        done = threading.Event()
+
+        def invoke(messages):
+            release.wait(timeout=5)
+            done.set()
+            return MagicMock(content="다듬은 요약")
+
+        _patch_llm(monkeypatch, invoke)
+
+        state = FormatterAgent(polish=POLISH_BACKGROUND).run(plan_state)
+
+        assert state["chat_summary"] == build_chat_summary(plan_state)
+        assert get_polished_summary("fmt-test") is None
+        release.set()
+        assert done.wait(timeout=5)
+        for _ in range(100):
+            if get_polished_summary("fmt-test"):
+                break
+            time.sleep(0.01)
+        assert get_polished_summary("fmt-test") == "다듬은 요약"
+
+    def test_background_propagates_context(self, monkeypatch, plan_state):
+        request_id = contextvars.ContextVar("request_id", default=None)
+        seen = []
+        done = threading.Event()
+
+        def invoke(messages):
+            seen.append(request_id.get())
+            done.set()
+            return MagicMock(content="다듬은 요약")
+
+        _patch_llm(monkeypatch, invoke)
+        request_id.set("req-1")
+        FormatterAgent(polish=POLISH_BACKGROUND).run(plan_state)
+
+        assert done.wait(timeout=5)
+        assert seen == ["req-1"]
+
+    def test_stale_polish_is_ignored(self, monkeypatch, plan_state):
+        release_first = threading.Event()
+        first_done = threading.Event()
+        calls = []
+
+        def invoke(messages):
+            calls.append(messages)
+            if len(calls) == 1:
+                release_first.wait(timeout=5)
+                first_done.set()
+                return MagicMock(content="이전 실행 요약")
+            return MagicMock(content="새 실행 요약")
+
+        _patch_llm(monkeypatch, invoke)
+
+        FormatterAgent(polish=POLISH_BACKGROUND).run(plan_state)   # 첫 실행 (다듬기 지연)
+        FormatterAgent(polish=POLISH_BACKGROUND).run(plan_state)   # 같은 thread_id로 새 실행
+        for _ in range(100):
+            if get_polished_summary("fmt-test"):
+                break
+            time.sleep(0.01)
+        assert get_polished_summary("fmt-test") == "새 실행 요약"
+
+        release_first.set()
+        assert first_done.wait(timeout=5)
+        time.sleep(0.05)
+        assert get_polished_summary("fmt-test") == "새 실행 요약"
+
+    def test_put_after_discard_is_ignored(self):
+        run_id = polished_summaries.begin("fmt-test")
+        polished_summaries.discard("fmt-test")
+        assert polished_summaries.put("fmt-test", run_id, "늦은 요약") is False
+        assert get_polished_summary("fmt-test") is None
+
+        newer = polished_summaries.begin("fmt-test")
+        assert polished_summaries.put("fmt-test", run_id, "늦은 요약") is False
+        assert polished_summaries.put("fmt-test", newer, "새 요약") is True
+        assert get_polished_summary("fmt-test") == "새 요약"
+
+    def test_preset_default(self, monkeypatch, plan_state):
+        from utils.settings import get_preset
+
+        assert get_preset("fast").chat_summary_polish == POLISH_OFF
+        assert get_preset("balanced").chat_summary_polish == POLISH_BACKGROUND
+        _patch_llm(monkeypatch, lambda messages: pytest.fail("LLM 호출됨"))
+
+        state = FormatterAgent().run({**plan_state, "generation_preset": "fast"})
+        assert state["chat_summary"] == build_chat_summary(plan_state)
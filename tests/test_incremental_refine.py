@@ -0,0 +1,174 @@
+"""
+PlanCraft - 부분 재작성 (Incremental Refine) 테스트
+
+실행 방법:
+    pytest tests/test_incremental_refine.py -v
+
+테스트 항목:
+    - Reviewer target_sections → 초안 섹션명 매핑 (이름/부분 일치/번호)
+    - 구조 지적 또는 대상 과다 시 전체 재작성 경로 유지
+    - Refiner → write 직행 라우팅 (structure 재사용)
+    - Writer: 지목 섹션만 병렬 재작성, 나머지 섹션 고정 / 실패 섹션은 기존 내용 유지
+    - Reviewer: 변경 섹션 본문 + 나머지 섹션 개요로 재심사
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.helpers.incremental_refine import decide_refine_targets, resolve_target_sections
+from agents.helpers.review_gate import GATE_FULL, GateResult
+from graph.workflow import RouteKey, create_workflow
+
+SECTIONS = ["개요", "시장 분석", "수익 모델", "서비스 구조", "리스크"]
+
+
+def _draft():
+    return {"sections": [
+        {"id": i, "name": name, "content": f"{name} 기존 본문 " * 10}
+        for i, name in enumerate(SECTIONS, 1)
+    ]}
+
+
+def _review(targets, **extra):
+    return {
+        "overall_score": 7, "verdict": "REVISE",
+        "critical_issues": [], "action_items": ["시장 규모 근거 보강"],
+        "target_sections": targets, **extra,
+    }
+
+
+class TestTargetResolution:
+    """지목 섹션 매핑"""
+
+    def test_names_partial_and_ids(self):
+        targets = ["리스크", "시장", "3", "없는 섹션"]
+        assert resolve_target_sections(targets, _draft()) == ["시장 분석", "수익 모델", "리스크"]
+
+    def test_structure_issue_falls_back_to_full_rewrite(self):
+        review = _review(["시장 분석"], critical_issues=["목차 순서가 논리적이지 않음"])
+        assert decide_refine_targets(review, _draft()) == []
+
+    def test_too_many_targets_falls_back(self):
+        assert decide_refine_targets(_review(SECTIONS[:4]), _draft()) == []
+        assert decide_refine_targets(_review(["시장 분석"]), _draft()) == ["시장 분석"]
+        assert decide_refine_targets(_review(["시장 분석"]), None) == []
+
+
+class TestRefinerRouting:
+    """Refiner 결과 및 라우팅"""
+
+    def test_refiner_sets_targets(self, monkeypatch):
+        import agents.refiner as refiner
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.return_value = {
+            "overall_direction": "근거 보강", "key_focus_areas": [], "specific_guidelines": [],
+        }
+        monkeypatch.setattr(refiner, "get_llm", lambda **kwargs: llm)
+
+        state = refiner.run({
+            "review": _review(["시장 분석", "리스크"]), "draft": _draft(),
+            "refine_count": 0, "generation_preset": "balanced",
+        })
+
+        assert state["refined"] is True
+        assert state["refine_targets"] == ["시장 분석", "리스크"]
+
+    def test_route_to_write_when_targets(self):
+        branch = create_workflow().branches["refine"]["should_refine_again"]
+        route = branch.path.func
+
+        base = {"refined": True, "refine_count": 1, "generation_preset": "balanced"}
+        assert route({**base, "refine_targets": ["시장 분석"]}) == RouteKey.INCREMENTAL
+        assert route({**base, "refine_targets": []}) == RouteKey.RETRY
+        assert branch.ends[RouteKey.INCREMENTAL] == "write"
+
+
+class TestIncrementalWriter:
+    """지목 섹션만 재작성"""
+
+    @pytest.fixture
+    def writer_state(self):
+        return {
+            "user_input": "러닝 앱",
+            "structure": {"title": "러닝 앱", "sections": [{"title": name} for name in SECTIONS]},
+            "draft": _draft(),
+            "review": _review(["시장 분석", "리스크"]),
+            "refine_count": 1,
+            "refine_targets": ["시장 분석", "리스크"],
+            "generation_preset": "balanced",
+        }
+
+    def _patch_llm(self, monkeypatch, invoke):
+        import agents.writer as writer
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.side_effect = invoke
+        monkeypatch.setattr(writer, "get_llm", lambda **kwargs: llm)
+        return writer
+
+    def test_only_targets_rewritten(self, monkeypatch, writer_state):
+        prompts = []
+
+        def invoke(messages):
+            prompt = messages[-1]["content"]
+            prompts.append(prompt)
+            name = prompt.split("**다시 작성할 섹션**: ")[1].split("\n")[0]
+            return {"sections": [{"id": 1, "name": name, "content": f"{name} 개선 본문"}]}
+
+        writer = self._patch_llm(monkeypatch, invoke)
+        state = writer.run(writer_state)
+
+        assert len(prompts) == 2
+        assert all("완전히 새로 작성" not in prompt for prompt in prompts)
+        assert "개요: 개요 기존 본문" in prompts[0]  # 고정 섹션은 개요로만 전달
+        contents = {s["name"]: s["content"] for s in state["draft"]["sections"]}
+        assert [s["name"] for s in state["draft"]["sections"]] == SECTIONS
+        assert contents["시장 분석"] == "시장 분석 개선 본문"
+        assert contents["리스크"] == "리스크 개선 본문"
+        assert contents["개요"] == writer_state["draft"]["sections"][0]["content"]
+        assert state["changed_sections"] == ["시장 분석", "리스크"]
+        assert state["refine_targets"] == []
+
+    def test_failed_section_keeps_original(self, monkeypatch, writer_state):
+        def invoke(messages):
+            if "**다시 작성할 섹션**: 리스크" in messages[-1]["content"]:
+                raise RuntimeError("timeout")
+            return {"sections": [{"id": 1, "name": "시장 분석", "content": "개선"}]}
+
+        writer = self._patch_llm(monkeypatch, invoke)
+        state = writer.run(writer_state)
+
+        assert state["changed_sections"] == ["시장 분석"]
+        assert state["draft"]["sections"][4] == writer_state["draft"]["sections"][4]
+
+
+class TestIncrementalReviewer:
+    """변경 섹션 재심사"""
+
+    def test_prompt_contains_changed_sections_only(self, monkeypatch):
+        import agents.reviewer as reviewer
+
+        captured = []
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.side_effect = lambda messages: (
+            captured.append(messages) or _review([], overall_score=8)
+        )
+        monkeypatch.setattr(reviewer, "get_llm", lambda **kwargs: llm)
+        monkeypatch.setattr(reviewer, "pre_review_gate", lambda *args: GateResult(outcome=GATE_FULL))
+
+        state = reviewer.run({
+            "draft": _draft(),
+            "review": _review(["시장 분석"], critical_issues=["TAM 누락"]),
+            "changed_sections": ["시장 분석"],
+            "generation_preset": "balanced",
+        })
+
+        prompt = captured[0][-1]["content"]
+        assert "[부분 재심사]" in prompt
+        assert "## 시장 분석" in prompt
+        assert "## 개요" not in prompt
+        assert "1. 개요:" in prompt
+        assert "TAM 누락" in prompt
+        assert state["review"]["overall_score"] == 8
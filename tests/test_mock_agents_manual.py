@@ -11,6 +11,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from graph.state import create_initial_state, update_state
 from utils.schemas import AnalysisResult, StructureResult, SectionStructure, DraftResult, SectionContent, JudgeResult
+from agents.helpers.review_gate import GATE_FULL, GateResult
 
 class TestMockAgents:
     """
@@ -109,9 +110,10 @@ class TestMockAgents:
         assert len(draft["sections"]) >= 9, "최소 9개 섹션이 있어야 함"
         print("✅ Writer Output Verified")
 
+    @patch('agents.reviewer.pre_review_gate', return_value=GateResult(outcome=GATE_FULL))
     @patch('agents.reviewer.get_llm')
-    def test_reviewer_mock(self, mock_get_llm):
-        """Reviewer 에이전트 Mock 테스트 (get_llm 직접 패치)"""
+    def test_reviewer_mock(self, mock_get_llm, mock_gate):
+        """Reviewer 에이전트 Mock 테스트 (get_llm 직접 패치, 규칙 기반 사전 심사는 통과 처리)"""
         print("\n[Test] Reviewer Mock Run")
 
         # Mock Response
@@ -173,14 +175,15 @@ class TestMockAgents:
         mock_response.content = "## Mock Chat Summary"
         mock_llm_instance.invoke.return_value = mock_response
         
-        from agents.formatter import run
+        from agents.formatter import FormatterAgent, POLISH_SYNC
         state = create_initial_state("AI 앱")
         state = update_state(state, 
             analysis={"topic": "Mock", "key_features": []},
             final_output="# Full Plan"
         )
         
-        new_state = run(state)
+        # 규칙 기반 요약을 반환 전에 LLM으로 다듬는 모드
+        new_state = FormatterAgent(polish=POLISH_SYNC).run(state)
         
         assert new_state["chat_summary"] == "## Mock Chat Summary"
         print("✅ Formatter Output Verified")
@@ -0,0 +1,215 @@
+"""
+PlanCraft - 프롬프트 구성 요소별 토큰 측정 및 예산 맞춤 테스트
+
+실행 방법:
+    pytest tests/test_prompt_budget.py -v
+
+테스트 항목:
+    - 예산 이내: 자르지 않고 구성 요소별 토큰만 기록
+    - 예산 초과: 낮은 우선순위 → 뒤에 추가된 요소부터, min_tokens까지만 자름 (필수 요소 보존)
+    - 노드/구성 요소별 전역 통계 및 최근 호출 분석
+    - Writer/Reviewer: 비대한 참고 자료만 잘리고 구조/초안은 그대로 프롬프트에 포함
+      (단일 심사 예산을 넘는 초안은 자르지 않고 분할 심사로 전환)
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.evidence_bundle import estimate_tokens
+from utils.prompt_budget import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_MEDIUM,
+    PRIORITY_REQUIRED,
+    PromptAssembler,
+    PromptSizeStats,
+    prompt_size_stats,
+    truncate_to_tokens,
+)
+
+
+def _text(tokens: int, char: str = "a") -> str:
+    return char * (tokens * 4)
+
+
+@pytest.fixture(autouse=True)
+def clear_prompt_stats():
+    prompt_size_stats.clear()
+    yield
+    prompt_size_stats.clear()
+
+
+class TestPromptAssembler:
+    """구성 요소 측정 및 예산 맞춤"""
+
+    def test_within_budget_measures_only(self):
+        stats = PromptSizeStats()
+        parts = (PromptAssembler("writer", budget=1000, stats=stats)
+            .add("system", _text(300), PRIORITY_REQUIRED)
+            .add("rag", _text(200), PRIORITY_LOW)
+            .add("web", None, PRIORITY_LOW)
+            .fit())
+
+        assert parts == {"system": _text(300), "rag": _text(200), "web": ""}
+        assert stats.recent() == [{
+            "node": "writer", "budget": 1000, "total_tokens": 500, "trimmed_tokens": 0,
+            "components": {
+                "system": {"tokens": 300, "trimmed": 0},
+                "rag": {"tokens": 200, "trimmed": 0},
+                "web": {"tokens": 0, "trimmed": 0},
+            },
+        }]
+
+    def test_trims_low_priority_first(self):
+        assembler = (PromptAssembler("writer", budget=1000, stats=PromptSizeStats())
+            .add("system", _text(500), PRIORITY_REQUIRED)
+            .add("structure", _text(200), PRIORITY_REQUIRED)
+            .add("guidelines", _text(100), PRIORITY_HIGH)
+            .add("specialist", _text(300), PRIORITY_MEDIUM, min_tokens=100)
+            .add("rag", _text(200), PRIORITY_LOW, min_tokens=50)
+            .add("web", _text(200), PRIORITY_LOW))
+        parts = assembler.fit()
+
+        components = assembler.profile["components"]
+        # 같은 우선순위면 뒤에 추가된 web부터 전부 생략, rag는 min_tokens까지만
+        assert parts["web"] == ""
+        assert components["rag"]["tokens"] <= 50
+        assert "토큰 생략" in parts["rag"]
+        # 그래도 초과분이 남으면 다음 우선순위(specialist)를 자름, 필수/높은 우선순위는 보존
+        assert 100 <= components["specialist"]["tokens"] < 300
+        assert parts["system"] == _text(500) and parts["structure"] == _text(200)
+        assert parts["guidelines"] == _text(100)
+        assert assembler.profile["total_tokens"] <= 1000
+        assert assembler.profile["trimmed_tokens"] == sum(c["trimmed"] for c in components.values())
+
+    def test_required_over_budget_is_flagged(self):
+        assembler = (PromptAssembler("refiner", budget=100, stats=PromptSizeStats())
+            .add("system", _text(150), PRIORITY_REQUIRED)
+            .add("draft", _text(50), PRIORITY_LOW))
+        parts = assembler.fit()
+
+        assert parts["system"] == _text(150) and parts["draft"] == ""
+        assert assembler.profile["total_tokens"] == 150
+
+    def test_truncate_to_tokens(self):
+        text = "가" * 400  # 1,200바이트 = 300토큰
+        assert truncate_to_tokens(text, 300) == text
+        truncated = truncate_to_tokens(text, 40)
+        assert estimate_tokens(truncated) <= 40
+        assert truncated.startswith("가") and "토큰 생략" in truncated
+        assert truncate_to_tokens(text, 0) == ""
+
+
+class TestPromptSizeStats:
+    """전역 통계"""
+
+    def test_snapshot_aggregates_components(self):
+        stats = PromptSizeStats(recent_limit=2)
+        for rag in (100, 300, 600):
+            (PromptAssembler("writer", budget=800, stats=stats)
+                .add("system", _text(400), PRIORITY_REQUIRED)
+                .add("rag", _text(rag), PRIORITY_LOW)
+                .fit())
+
+        snapshot = stats.snapshot()["writer"]
+        assert snapshot["calls"] == 3
+        assert snapshot["max_tokens"] == 800
+        assert snapshot["trimmed_calls"] == 1 and snapshot["trimmed_tokens"] == 200
+        assert snapshot["components"]["rag"]["avg_tokens"] == round((100 + 300 + 400) / 3, 1)
+        assert snapshot["components"]["system"]["share"] == 0.6  # 1,200 / 2,000
+        assert len(stats.recent()) == 2
+        assert len(stats.recent(1)) == 1
+        assert stats.recent(0) == []
+
+
+class TestAgentPromptBudget:
+    """에이전트 프롬프트 예산 적용"""
+
+    def test_writer_trims_reference_material(self, monkeypatch):
+        import agents.writer as writer
+        from utils.prompt_budget import NODE_PROMPT_TOKEN_BUDGETS
+
+        # 근거 번들이 RAG를 항목 단위로 줄여 렌더링하므로 시스템 프롬프트 + 약간의 여유분으로 예산 축소
+        monkeypatch.setitem(NODE_PROMPT_TOKEN_BUDGETS, "writer", 6000)
+
+        prompts = []
+
+        def invoke(messages):
+            prompts.append(messages[-1]["content"])
+            return {"sections": [{"id": 1, "name": "개요", "content": "본문"}]}
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.side_effect = invoke
+        monkeypatch.setattr(writer, "get_llm", lambda **kwargs: llm)
+
+        writer.run({
+            "user_input": "러닝 코칭 앱",
+            "structure": {"title": "러닝 앱", "sections": [{"id": 1, "name": "개요"}]},
+            "rag_context": "가이드 " * 40000,
+            "generation_preset": "fast",
+            "enable_writer_react": False,
+        })
+
+        profile = prompt_size_stats.recent()[-1]
+        assert profile["node"] == "writer"
+        assert profile["components"]["rag"]["trimmed"] > 0
+        assert profile["total_tokens"] <= NODE_PROMPT_TOKEN_BUDGETS["writer"]
+        assert "'name': '개요'" in prompts[0] and "토큰 생략" in prompts[0]
+
+    def test_reviewer_records_draft_and_context(self, monkeypatch):
+        import agents.reviewer as reviewer
+        from utils.schemas import JudgeResult
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.return_value = JudgeResult(
+            overall_score=9, verdict="PASS", critical_issues=[], action_items=[], feedback_summary="좋음",
+        )
+        monkeypatch.setattr(reviewer, "get_llm", lambda **kwargs: llm)
+
+        reviewer.run({
+            "draft": {"sections": [{"name": f"섹션 {i}", "content": "내용 " * 200} for i in range(1, 10)]},
+            "web_context": "웹 자료",
+            "generation_preset": "fast",
+        })
+
+        components = prompt_size_stats.snapshot()["reviewer"]["components"]
+        assert components["draft"]["tokens"] > 0
+        assert components["web"]["tokens"] == estimate_tokens("웹 자료")
+
+    def test_reviewer_never_trims_draft(self, monkeypatch):
+        import agents.reviewer as reviewer
+        from utils.prompt_budget import NODE_PROMPT_TOKEN_BUDGETS
+        from utils.schemas import JudgeResult
+
+        # 초안이 단일 심사 예산을 넘으면 자르지 않고 분할 심사로 전환
+        monkeypatch.setitem(NODE_PROMPT_TOKEN_BUDGETS, "reviewer", 3000)
+        sharded = []
+
+        def fake_sharded(state, draft_dict, preset, build_messages, logger, model_type=None):
+            sharded.append(draft_dict)
+            return {"overall_score": 8, "verdict": "PASS", "critical_issues": [], "action_items": []}
+
+        monkeypatch.setattr(reviewer, "run_sharded_review", fake_sharded)
+        monkeypatch.setattr(reviewer, "get_llm", lambda **kwargs: pytest.fail("단일 심사 호출됨"))
+
+        draft = {"sections": [{"name": f"섹션 {i}", "content": "내용 " * 600} for i in range(1, 10)]}
+        state = reviewer.run({"draft": draft, "generation_preset": "fast"})
+
+        assert sharded == [draft]
+        assert state["review"]["verdict"] == "PASS"
+
+        # 분할 심사 실패 시 단일 심사는 초안 전체로 진행 (예산 초과 허용)
+        def fail_sharded(*args, **kwargs):
+            raise RuntimeError("shard failed")
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.return_value = JudgeResult(
+            overall_score=9, verdict="PASS", critical_issues=[], action_items=[], feedback_summary="좋음",
+        )
+        monkeypatch.setattr(reviewer, "run_sharded_review", fail_sharded)
+        monkeypatch.setattr(reviewer, "get_llm", lambda **kwargs: llm)
+        reviewer.run({"draft": draft, "generation_preset": "fast"})
+
+        profile = prompt_size_stats.recent(1)[0]
+        assert profile["components"]["draft"]["trimmed"] == 0
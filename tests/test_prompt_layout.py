@@ -0,0 +1,132 @@
+"""
+PlanCraft - Prefix Cache 친화적 프롬프트 배치 테스트
+
+실행 방법:
+    pytest tests/test_prompt_layout.py -v
+
+테스트 항목:
+    - 정적 지침 → 요청별 데이터 → 시간 컨텍스트 순서
+    - 서로 다른 요청 간 Writer/Analyzer/Structurer 메시지 접두부 공유
+    - 캐시 적중 토큰 집계 (cached_tokens, cache_hit_ratio)
+"""
+
+import pytest
+
+from utils.prompt_layout import DYNAMIC_BLOCK_HEADER, build_cacheable_messages, shared_prefix_length
+
+
+@pytest.fixture
+def fake_backend():
+    from utils.config import Config
+    from utils.fake_llm import configure_fake_backend
+    from utils.llm import set_llm_backend
+
+    previous = Config.LLM_BACKEND
+    configure_fake_backend()
+    set_llm_backend("fake")
+    yield
+    set_llm_backend(previous)
+    configure_fake_backend()
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    """에이전트 모듈의 build_cacheable_messages 호출 결과 수집"""
+    calls = []
+
+    def _capture(module):
+        def wrapper(*args, **kwargs):
+            messages = build_cacheable_messages(*args, **kwargs)
+            calls.append(messages)
+            return messages
+        monkeypatch.setattr(module, "build_cacheable_messages", wrapper)
+
+    _capture.calls = calls
+    return _capture
+
+
+def _state(user_input: str, rag: str, preset: str = "fast") -> dict:
+    return {
+        "user_input": user_input,
+        "rag_context": rag,
+        "web_context": f"{user_input} 관련 시장 조사",
+        "generation_preset": preset,
+        "analysis": {"topic": user_input, "doc_type": "web_app_plan", "user_constraints": []},
+        "structure": {"title": user_input, "sections": [{"name": "개요", "description": "개요"}]},
+        "refine_count": 0,
+    }
+
+
+class TestBuildCacheableMessages:
+    """메시지 배치 규칙 테스트"""
+
+    def test_order(self):
+        messages = build_cacheable_messages("SYSTEM", "사용자 데이터", static_instructions="정적 지침")
+        assert messages[0] == {"role": "system", "content": "SYSTEM"}
+        user = messages[1]["content"]
+        assert user.startswith("정적 지침" + DYNAMIC_BLOCK_HEADER)
+        assert user.index("사용자 데이터") < user.index("현재 날짜")
+
+    def test_without_time(self):
+        messages = build_cacheable_messages("SYSTEM", "데이터", include_time=False)
+        assert messages[1]["content"] == "데이터"
+
+    def test_shared_prefix_covers_static_part(self):
+        a = build_cacheable_messages("SYSTEM", "요청 A", static_instructions="정적 지침")
+        b = build_cacheable_messages("SYSTEM", "요청 B", static_instructions="정적 지침")
+        static_len = len("system:SYSTEM" + "user:정적 지침" + DYNAMIC_BLOCK_HEADER)
+        assert shared_prefix_length(a, b) >= static_len
+
+
+class TestAgentPrefixStability:
+    """서로 다른 요청 간 에이전트 프롬프트 접두부 공유"""
+
+    def test_writer_prefix_shared_across_requests(self, fake_backend, captured):
+        import agents.writer as writer
+
+        captured(writer)
+        writer.run(_state("점심 메뉴 추천 앱", "가이드 A"))
+        writer.run(_state("반려동물 산책 매칭", "가이드 B"))
+
+        first, second = captured.calls
+        assert first[0]["content"] == second[0]["content"]
+        assert "현재 날짜" not in first[0]["content"]
+        # user 메시지의 정적 작성 지침까지 동일해야 함
+        prefix = shared_prefix_length(first, second)
+        assert prefix > len(first[0]["content"]) + first[1]["content"].index(DYNAMIC_BLOCK_HEADER)
+        assert first[1]["content"].index("점심 메뉴 추천 앱") > first[1]["content"].index(DYNAMIC_BLOCK_HEADER)
+
+    def test_structurer_and_analyzer_system_static(self, fake_backend, captured):
+        import agents.analyzer as analyzer
+        import agents.structurer as structurer
+
+        captured(analyzer)
+        captured(structurer)
+        for text in ("점심 메뉴 추천 앱", "반려동물 산책 매칭"):
+            analyzer.run(_state(text, ""))
+            structurer.run(_state(text, ""))
+
+        a1, s1, a2, s2 = captured.calls
+        assert a1[0]["content"] == a2[0]["content"]
+        assert s1[0]["content"] == s2[0]["content"]
+        assert shared_prefix_length(s1, s2) > len(s1[0]["content"]) + s1[1]["content"].index(DYNAMIC_BLOCK_HEADER)
+
+
+class TestCachedTokenReporting:
+    """캐시 적중 토큰 집계 테스트"""
+
+    def test_cache_hit_ratio_in_summary(self, fake_backend):
+        import agents.writer as writer
+        from utils.fake_llm import configure_fake_backend
+        from utils.streamlit_callback import TokenTrackingCallback
+        from utils.token_accounting import cache_hit_ratio
+
+        configure_fake_backend(cached_prompt_ratio=0.8)
+        cb = TokenTrackingCallback()
+        messages = build_cacheable_messages("정적 지침 " * 1500, "요청 데이터")
+        writer.get_llm(model_type="gpt-4o-mini").invoke(messages, config={"callbacks": [cb]})
+
+        summary = cb.get_usage_summary()
+        assert summary["cached_tokens"] > 0
+        assert summary["cache_hit_ratio"] == cache_hit_ratio(summary["input_tokens"], summary["cached_tokens"])
+        assert 0 < summary["cache_hit_ratio"] <= 0.8
@@ -0,0 +1,141 @@
+"""
+PlanCraft - 규칙 기반 사전 심사 (Pre-Review Gate) 테스트
+
+실행 방법:
+    pytest tests/test_review_gate.py -v
+
+테스트 항목:
+    - 기계적 결함(섹션 부족/다이어그램 누락/빈 섹션/핵심 기능 미반영) → REVISE + 구체적 action_items
+    - 결함 없는 초안: 경량 모델(mini) / 전체 심사(full) 분기
+    - Reviewer: 사전 심사 REVISE 시 LLM 호출 없음, 깨끗한 초안은 경량 모델로 심사
+    - 라우팅: 사전 심사 REVISE는 토론 없이 Refine
+    - 프리셋별 적중률 통계
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.helpers.review_gate import (
+    GATE_FULL,
+    GATE_MINI,
+    GATE_REVISE,
+    ReviewGateStats,
+    missing_key_features,
+    pre_review_gate,
+)
+from graph.workflow import RouteKey, create_workflow
+from utils.schemas import JudgeResult
+from utils.settings import get_preset
+
+MERMAID = "```mermaid\ngraph TD\nA-->B\n```"
+CHART = "매출 ▓▓▓▓░░"
+
+
+def _clean_draft(count=9, chars=400):
+    sections = [
+        {"id": i, "name": f"섹션 {i}", "content": f"섹션 {i} 본문 러닝 코칭 " + "내용 " * (chars // 3)}
+        for i in range(1, count + 1)
+    ]
+    sections[0]["content"] += f"\n{MERMAID}\n{CHART}"
+    return {"sections": sections}
+
+
+class TestGateRules:
+    """규칙 기반 결함 검출"""
+
+    def test_mechanical_failures_produce_revise(self):
+        draft = _clean_draft(count=7)
+        draft["sections"][0]["content"] = draft["sections"][0]["content"].replace(MERMAID, "")
+        draft["sections"][3]["content"] = "  "
+
+        result = pre_review_gate(draft, get_preset("balanced"))
+
+        assert result.outcome == GATE_REVISE
+        review = result.review
+        JudgeResult(**review)  # 기존 스키마와 동일
+        assert review["verdict"] == "REVISE"
+        assert review["overall_score"] == 7
+        assert review["action_items"][0].startswith("섹션 구성 보완: 최소 9개")
+        assert "[섹션 4] 본문 작성" in review["action_items"]
+        assert any("Mermaid 다이어그램 추가" in item for item in review["action_items"])
+        assert "섹션 4" in review["target_sections"]
+
+    def test_missing_key_features(self):
+        text = "러닝 코칭과 커뮤니티 챌린지 기능을 제공합니다"
+        assert missing_key_features(["AI 러닝 코칭", "커뮤니티 챌린지", "보험 연동 할인"], text) == ["보험 연동 할인"]
+
+        result = pre_review_gate(_clean_draft(), get_preset("balanced"), ["보험 연동 할인"])
+        assert result.outcome == GATE_REVISE
+        assert any("보험 연동 할인" in item for item in result.review["action_items"])
+
+    def test_clean_draft_outcomes(self):
+        assert pre_review_gate(_clean_draft(), get_preset("balanced"), ["러닝 코칭"]).outcome == GATE_MINI
+        # 결함은 없지만 짧은 섹션이 있으면 전체 심사
+        assert pre_review_gate(_clean_draft(chars=150), get_preset("balanced")).outcome == GATE_FULL
+        # 경량 모델 미설정 프리셋은 항상 전체 심사
+        assert pre_review_gate(_clean_draft(count=13), get_preset("quality")).outcome == GATE_FULL
+
+
+class TestReviewerGate:
+    """Reviewer 사전 심사 경로"""
+
+    def _patch_llm(self, monkeypatch, invoke):
+        import agents.reviewer as reviewer
+
+        models = []
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.side_effect = invoke
+
+        def get_llm(**kwargs):
+            models.append(kwargs.get("model_type"))
+            return llm
+
+        monkeypatch.setattr(reviewer, "get_llm", get_llm)
+        return reviewer, models
+
+    def test_revise_skips_llm(self, monkeypatch):
+        reviewer, models = self._patch_llm(monkeypatch, lambda messages: pytest.fail("LLM 호출됨"))
+
+        state = reviewer.run({"draft": _clean_draft(count=3), "generation_preset": "balanced"})
+
+        assert models == []
+        assert state["review_gate"] == GATE_REVISE
+        assert state["review"]["verdict"] == "REVISE"
+
+    def test_clean_draft_uses_mini_model(self, monkeypatch):
+        reviewer, models = self._patch_llm(
+            monkeypatch, lambda messages: {"overall_score": 9, "verdict": "PASS"}
+        )
+
+        state = reviewer.run({
+            "draft": _clean_draft(), "generation_preset": "balanced",
+            "analysis": {"key_features": ["러닝 코칭"]},
+        })
+
+        assert models == ["gpt-4o-mini"]
+        assert state["review_gate"] == GATE_MINI
+        assert state["review"]["verdict"] == "PASS"
+
+
+class TestGateRoutingAndStats:
+    """라우팅 및 프리셋별 통계"""
+
+    def test_gate_revise_skips_discussion(self):
+        route = create_workflow().branches["review"]["should_discuss_or_complete"].path.func
+        review = {"overall_score": 7, "verdict": "REVISE"}
+
+        assert route({"review": review, "review_gate": GATE_REVISE}) == RouteKey.SKIP_TO_REFINE
+        assert route({"review": review, "review_gate": GATE_FULL}) == RouteKey.DISCUSS
+
+    def test_hit_rates_per_preset(self):
+        stats = ReviewGateStats()
+        for outcome in (GATE_REVISE, GATE_REVISE, GATE_MINI, GATE_FULL):
+            stats.record("balanced", outcome)
+        stats.record("quality", GATE_FULL)
+
+        snapshot = stats.snapshot()
+        assert snapshot["balanced"]["checked"] == 4
+        assert snapshot["balanced"]["revise_rate"] == 0.5
+        assert snapshot["balanced"]["mini_rate"] == 0.25
+        assert snapshot["quality"]["revise_rate"] == 0.0
@@ -0,0 +1,181 @@
+"""
+PlanCraft - 섹션 분할 심사 (Map-Reduce Reviewer) 테스트
+
+실행 방법:
+    pytest tests/test_review_shards.py -v
+
+테스트 항목:
+    - 분할 심사 조건 (프리셋 글자 수 기준)
+    - 섹션별 근거 선택 (매핑된 전문 에이전트 결과 + 겹치는 웹/RAG 항목만)
+    - 결정적 집계 → JudgeResult (점수/판정/target_sections)
+    - Reviewer: 섹션별 병렬 심사 / 실패 시 단일 심사 Fallback
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.helpers.review_gate import GATE_FULL, GateResult
+from agents.helpers.review_shards import (
+    build_section_evidence,
+    reduce_section_reviews,
+    should_shard_review,
+)
+from utils.evidence_bundle import build_evidence_bundle
+from utils.schemas import JudgeResult, SectionReview
+from utils.settings import get_preset
+
+SECTIONS = ["프로젝트 개요", "시장 분석", "수익 모델", "리스크 관리"]
+
+
+def _long_draft(chars=4000):
+    return {"sections": [
+        {"id": i, "name": name, "content": f"{name} 본문 " + "가" * chars}
+        for i, name in enumerate(SECTIONS, 1)
+    ]}
+
+
+def _section_review(score, **extra):
+    return {"score": score, "p0_issues": [], "issues": [], "strengths": [], "action_items": [],
+            "needs_revision": score < 9, **extra}
+
+
+class TestShardCondition:
+    """분할 심사 조건"""
+
+    def test_only_long_drafts_in_enabled_presets(self):
+        assert should_shard_review(_long_draft(), get_preset("quality"))
+        assert not should_shard_review(_long_draft(chars=100), get_preset("quality"))
+        assert not should_shard_review(_long_draft(), get_preset("balanced"))
+
+
+class TestSectionEvidence:
+    """섹션별 근거 선택"""
+
+    def test_related_evidence_only(self, monkeypatch):
+        import agents.helpers.review_shards as shards
+
+        monkeypatch.setattr(shards, "_integrate_specialist", lambda results: f"전문결과:{sorted(results)}")
+        bundle = build_evidence_bundle([
+            {"title": "러닝 앱 시장 규모", "url": "https://a.example", "content": "시장 연 12% 성장"},
+            {"title": "보험 약관", "url": "https://b.example", "content": "면책 조항"},
+        ])
+        specialist = {"market_analysis": {"tam": 1}, "risk_analysis": {"risks": []}}
+
+        text = build_section_evidence({"name": "시장 분석", "content": "시장 규모"}, specialist, bundle)
+
+        assert "market_analysis" in text
+        assert "risk_analysis" not in text
+        assert "https://a.example" in text
+        assert "https://b.example" not in text
+
+    def test_uses_public_supervisor_formatter(self, monkeypatch):
+        import agents.supervisor
+
+        calls = []
+
+        def integrate(results):
+            calls.append(sorted(results))
+            return "## 전문 에이전트 분석 결과"
+
+        monkeypatch.setattr(agents.supervisor, "integrate_specialist_results", integrate)
+        text = build_section_evidence({"name": "시장 분석"}, {"market_analysis": {"tam": 1}}, None)
+
+        assert calls == [["market_analysis"]]
+        assert text == "## 전문 에이전트 분석 결과"
+
+
+class TestReduce:
+    """결정적 집계"""
+
+    def test_scores_verdict_and_targets(self):
+        review = reduce_section_reviews({
+            "개요": _section_review(9),
+            "시장 분석": _section_review(6, issues=["TAM 근거 없음"], action_items=["TAM 출처 추가", "b", "c"]),
+            "수익 모델": _section_review(8),
+        })
+
+        JudgeResult(**review)  # 기존 스키마와 동일
+        assert review["overall_score"] == round(0.7 * (23 / 3) + 0.3 * 6)
+        assert review["verdict"] == "REVISE"
+        assert review["target_sections"] == ["시장 분석", "수익 모델"]
+        assert review["action_items"][:2] == ["[시장 분석] TAM 출처 추가", "[시장 분석] b"]
+        assert "[시장 분석] TAM 근거 없음" in review["weaknesses"]
+
+    def test_p0_fails_and_all_good_passes(self):
+        failed = reduce_section_reviews({"a": _section_review(9), "b": _section_review(9, p0_issues=["수치 모순"])})
+        assert failed["verdict"] == "FAIL"
+        assert failed["critical_issues"] == ["[b] 수치 모순"]
+
+        passed = reduce_section_reviews({"a": _section_review(10), "b": _section_review(9)})
+        assert passed["verdict"] == "PASS"
+        assert passed["target_sections"] == []
+
+
+class TestShardedReviewer:
+    """Reviewer 분할 심사 경로"""
+
+    def _patch_llm(self, monkeypatch, section_invoke, full_invoke=None):
+        import agents.reviewer as reviewer
+
+        def get_llm(**kwargs):
+            llm = MagicMock()
+
+            def structured(schema):
+                stub = MagicMock()
+                stub.invoke.side_effect = section_invoke if schema is SectionReview else full_invoke
+                return stub
+
+            llm.with_structured_output.side_effect = structured
+            return llm
+
+        monkeypatch.setattr("utils.llm.get_llm", get_llm)
+        monkeypatch.setattr(reviewer, "get_llm", get_llm)
+        monkeypatch.setattr(reviewer, "pre_review_gate", lambda *args: GateResult(outcome=GATE_FULL))
+        return reviewer
+
+    def test_sections_reviewed_in_parallel(self, monkeypatch):
+        prompts = []
+        active = {"now": 0, "max": 0}
+        lock = threading.Lock()
+
+        def section_invoke(messages):
+            with lock:
+                prompts.append(messages[-1]["content"])
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            name = messages[-1]["content"].split("**심사 대상 섹션:** ")[1].split("\n")[0]
+            return _section_review(6 if name == "시장 분석" else 9)
+
+        reviewer = self._patch_llm(monkeypatch, section_invoke)
+        state = reviewer.run({"draft": _long_draft(), "generation_preset": "quality"})
+
+        assert len(prompts) == 4
+        assert active["max"] > 1
+        # 각 프롬프트에는 자기 섹션 본문만 (다른 섹션은 목차로만)
+        market_prompt = next(p for p in prompts if "**심사 대상 섹션:** 시장 분석" in p)
+        assert "가" * 4000 in market_prompt
+        assert len(market_prompt) < 4000 * 2  # 다른 섹션 3개(각 4000자)는 미포함
+        assert state["review"]["target_sections"] == ["시장 분석"]
+        assert state["review"]["verdict"] == "REVISE"
+
+    def test_falls_back_to_single_review(self, monkeypatch):
+        full_calls = []
+
+        def section_invoke(messages):
+            raise RuntimeError("rate limit")
+
+        def full_invoke(messages):
+            full_calls.append(messages)
+            return {"overall_score": 8, "verdict": "REVISE", "target_sections": ["시장 분석"]}
+
+        reviewer = self._patch_llm(monkeypatch, section_invoke, full_invoke)
+        state = reviewer.run({"draft": _long_draft(), "generation_preset": "quality"})
+
+        assert len(full_calls) == 1
+        assert state["review"]["overall_score"] == 8
@@ -0,0 +1,230 @@
+"""
+PlanCraft - 섹션 단위 초안 캐시 테스트
+
+실행 방법:
+    pytest tests/test_section_cache.py -v
+
+테스트 항목:
+    - 섹션 키: 섹션 명세/관련 전문 에이전트 결과/적용 지침이 같으면 동일 (번호, 무관한 결과 변경은 무시)
+    - 섹션 키: 기획서 제목, 목차 내 위치/앞뒤 섹션이 바뀌면 무효화
+    - 지목 섹션만 심사 지침 반영, 지목 섹션 없는 심사는 전체 반영
+    - Writer: 입력이 같은 섹션은 재사용하고 나머지만 작성 / 전체 적중 시 LLM 호출 없음
+    - Writer: 일부 적중은 분할 작성 경로에서만 사용 (통 작성/ReAct 프리셋은 작성 경로 유지)
+    - 부분 재작성 결과는 이후 루프의 지침 없는 키로 재사용
+    - 프리셋별 재사용 비율 통계
+"""
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.section_cache import SectionDraftCache, section_cache, start_section_reuse
+from utils.settings import get_preset
+
+SECTIONS = ["프로젝트 개요", "시장 분석", "수익 모델", "서비스 구조", "리스크 관리"]
+
+
+def _structure():
+    return {"title": "러닝 앱", "sections": [
+        {"id": i, "name": name, "description": f"{name} 설명", "key_points": []}
+        for i, name in enumerate(SECTIONS, 1)
+    ]}
+
+
+def _state(**extra):
+    return {
+        "user_input": "러닝 코칭 앱",
+        "structure": _structure(),
+        "generation_preset": "quality",
+        "enable_writer_react": False,
+        "specialist_analysis": {"market_analysis": {"tam": "1조"}},
+        **extra,
+    }
+
+
+def _refine_state(targets):
+    return _state(
+        refine_count=1,
+        review={
+            "overall_score": 7, "verdict": "REVISE", "feedback_summary": "시장 근거 부족",
+            "critical_issues": [], "action_items": [f"[{name}] 근거 추가" for name in targets],
+            "target_sections": targets,
+        },
+        refinement_guideline={"overall_direction": "근거 보강", "specific_guidelines": ["출처 명시"]},
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_section_cache():
+    section_cache.clear()
+    yield
+    section_cache.clear()
+
+
+class TestSectionKeys:
+    """섹션 키 계산"""
+
+    def _keys(self, state, idx, cache=None):
+        reuse = start_section_reuse(state, get_preset("quality"), "prefix", cache=cache or SectionDraftCache())
+        return reuse.keys(idx, state.get("specialist_analysis"))
+
+    def test_same_inputs_same_key(self):
+        market = SECTIONS.index("시장 분석")
+        base = self._keys(_state(), market)
+
+        renumbered = _structure()
+        renumbered["sections"][market]["id"] = 9
+        assert self._keys(_state(structure=renumbered), market) == base
+        # 시장 분석에 매핑되지 않은 결과 변경은 무시, 매핑된 결과 변경은 무효화
+        assert self._keys(_state(specialist_analysis={
+            "market_analysis": {"tam": "1조"}, "risk_analysis": {"risks": ["규제"]},
+        }), market) == base
+        assert self._keys(_state(specialist_analysis={"market_analysis": {"tam": "2조"}}), market) != base
+        assert self._keys(_state(user_input="등산 앱"), market) != base
+
+    def test_title_and_outline_order_in_key(self):
+        market, risk = SECTIONS.index("시장 분석"), SECTIONS.index("리스크 관리")
+        base = {idx: self._keys(_state(), idx) for idx in (market, risk)}
+
+        assert self._keys(_state(structure={**_structure(), "title": "등산 앱"}), market) != base[market]
+
+        # 시장 분석 앞뒤 섹션 순서 변경 → 시장 분석만 무효화, 떨어진 섹션은 유지
+        reordered = _structure()
+        sections = reordered["sections"]
+        sections[0], sections[2] = sections[2], sections[0]
+        assert self._keys(_state(structure=reordered), market) != base[market]
+        assert self._keys(_state(structure=reordered), risk) == base[risk]
+
+        # 섹션 삽입으로 위치가 바뀌면 무효화
+        inserted = _structure()
+        inserted["sections"].insert(0, {"id": 0, "name": "요약", "description": "요약", "key_points": []})
+        assert self._keys(_state(structure=inserted), risk + 1) != base[risk]
+
+    def test_guidance_applies_to_targets_only(self):
+        market, bm = SECTIONS.index("시장 분석"), SECTIONS.index("수익 모델")
+        cold = {idx: self._keys(_state(), idx)[0] for idx in (market, bm)}
+
+        localized = {idx: self._keys(_refine_state(["시장 분석"]), idx) for idx in (market, bm)}
+        assert localized[market][0] != cold[market]
+        assert localized[market][1] == cold[market]  # 지침 없는 키는 동일
+        assert localized[bm][0] == cold[bm]
+
+        # 지목 섹션 없는 심사는 모든 섹션에 적용
+        assert self._keys(_refine_state([]), bm)[0] != cold[bm]
+
+
+class TestWriterReuse:
+    """Writer 섹션 재사용"""
+
+    def _patch_llm(self, monkeypatch):
+        import agents.writer as writer
+
+        written = []
+
+        def invoke(messages):
+            prompt = messages[-1]["content"]
+            if "**다시 작성할 섹션**: " in prompt:
+                names = [prompt.split("**다시 작성할 섹션**: ")[1].split("\n")[0]]
+            else:
+                block = prompt.split("**작성 대상 섹션**:")[-1].split("=====")[0]
+                names = re.findall(r"'name': '([^']+)'", block)
+            written.extend(names)
+            return {"sections": [{"id": 1, "name": n, "content": f"{n} 본문 v{len(written)}"} for n in names]}
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.side_effect = invoke
+        monkeypatch.setattr(writer, "get_llm", lambda **kwargs: llm)
+        return writer, written
+
+    def test_unchanged_sections_reused_in_refine_loop(self, monkeypatch):
+        writer, written = self._patch_llm(monkeypatch)
+        first = writer.run(_state())
+        assert sorted(written) == sorted(SECTIONS)
+        assert first["section_reuse"] == {"hits": 0, "lookups": 5, "reuse_ratio": 0.0}
+
+        written.clear()
+        state = writer.run(_refine_state(["시장 분석"]))
+
+        assert written == ["시장 분석"]
+        assert [s["name"] for s in state["draft"]["sections"]] == SECTIONS
+        # 재사용 섹션 번호는 목차 순서로 보정
+        assert [s["id"] for s in state["draft"]["sections"] if s["name"] != "시장 분석"] == [1, 3, 4, 5]
+        contents = {s["name"]: s["content"] for s in state["draft"]["sections"]}
+        assert contents["프로젝트 개요"] == {s["name"]: s["content"] for s in first["draft"]["sections"]}["프로젝트 개요"]
+        assert state["section_reuse"] == {"hits": 4, "lookups": 5, "reuse_ratio": 0.8}
+
+    def test_full_hit_skips_llm(self, monkeypatch):
+        writer, written = self._patch_llm(monkeypatch)
+        first = writer.run(_state())
+        written.clear()
+
+        again = writer.run(_state())
+
+        assert written == []
+        assert again["draft"]["sections"] == [
+            {**sec, "id": i} for i, sec in enumerate(first["draft"]["sections"], 1)
+        ]
+        assert again["section_reuse"]["reuse_ratio"] == 1.0
+
+    def test_partial_hit_keeps_standard_path(self, monkeypatch):
+        import agents.writer as writer
+
+        prompts = []
+
+        def invoke(messages):
+            prompts.append(messages[-1]["content"])
+            return {"sections": [{"id": i, "name": n, "content": f"{n} 본문"} for i, n in enumerate(SECTIONS, 1)]}
+
+        llm = MagicMock()
+        llm.with_structured_output.return_value.invoke.side_effect = invoke
+        monkeypatch.setattr(writer, "get_llm", lambda **kwargs: llm)
+        diagnoses = []
+        monkeypatch.setattr(writer, "diagnose_draft", lambda draft, *args: diagnoses.append(draft) or None)
+        writer.run(_state(generation_preset="balanced"))
+
+        # 시장 분석만 바뀜 → 나머지 4개는 적중하지만 Balanced는 분할 작성으로 바꾸지 않음
+        changed = _structure()
+        changed["sections"][SECTIONS.index("시장 분석")]["description"] = "경쟁사 중심"
+        prompts.clear()
+        state = writer.run(_state(generation_preset="balanced", structure=changed))
+
+        assert len(prompts) == 1 and "**작성 대상 섹션**" not in prompts[0]
+        assert state["section_reuse"]["hits"] == 0
+        assert [s["name"] for s in state["draft"]["sections"]] == SECTIONS
+
+        # 전체 적중도 Self-Check를 통과해야 재사용
+        prompts.clear()
+        diagnoses.clear()
+        reused = writer.run(_state(generation_preset="balanced"))
+        assert prompts == [] and len(diagnoses) == 1
+        assert reused["section_reuse"]["reuse_ratio"] == 1.0
+
+        failing = MagicMock(issues=["필수 섹션 누락"])
+        monkeypatch.setattr(writer, "diagnose_draft", lambda draft, *args: failing if not prompts else None)
+        rewritten = writer.run(_state(generation_preset="balanced"))
+        assert len(prompts) == 1
+        assert rewritten["section_reuse"]["hits"] == 0
+
+    def test_incremental_rewrite_updates_base_key(self, monkeypatch):
+        writer, written = self._patch_llm(monkeypatch)
+        first = writer.run(_state())
+
+        # 지목 섹션만 부분 재작성 → 이후 지목되지 않은 루프에서는 최신 작성본 재사용
+        refined = writer.run({**_refine_state(["시장 분석"]), "draft": first["draft"], "refine_targets": ["시장 분석"]})
+        rewritten = {s["name"]: s["content"] for s in refined["draft"]["sections"]}["시장 분석"]
+        written.clear()
+
+        later = writer.run(_refine_state(["리스크 관리"]))
+
+        assert written == ["리스크 관리"]
+        assert {s["name"]: s["content"] for s in later["draft"]["sections"]}["시장 분석"] == rewritten
+
+    def test_reuse_stats_per_preset(self):
+        cache = SectionDraftCache(ttl_sec=60, max_entries=10)
+        cache.record_reuse("quality", 0, 5)
+        cache.record_reuse("quality", 5, 5)
+        cache.record_reuse("balanced", 0, 0)  # 조회 없음은 제외
+
+        snapshot = cache.reuse_snapshot()
+        assert snapshot == {"quality": {"writes": 2, "lookups": 10, "hits": 5, "full_reuse": 1, "reuse_ratio": 0.5}}
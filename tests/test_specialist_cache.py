@@ -0,0 +1,144 @@
+"""
+PlanCraft - 전문 에이전트 결과 캐시 테스트
+
+실행 방법:
+    pytest tests/test_specialist_cache.py -v
+
+테스트 항목:
+    - 캐시 키 정규화 (공백/키 순서) 및 모델 구분
+    - TTL 만료 / LRU 상한 / Fallback 결과 저장 제외
+    - Supervisor 재실행 및 Writer ReAct 도구에서 캐시 재사용 (도구는 별도 네임스페이스)
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.agent_config import resolve_execution_plan_dag
+from agents.specialist_cache import (
+    NAMESPACE_WRITER_TOOL,
+    SpecialistResultCache,
+    mark_uncacheable,
+    specialist_cache,
+    strip_cache_marker,
+)
+
+
+class CountingAgent:
+    """호출 횟수를 기록하는 테스트용 에이전트"""
+
+    def __init__(self, agent_id, model="gpt-4o"):
+        self.agent_id = agent_id
+        self.llm = SimpleNamespace(deployment_name=model, temperature=0.4)
+        self.calls = 0
+
+    def run(self, **kwargs):
+        self.calls += 1
+        return {"agent": self.agent_id, "summary": f"{self.agent_id} 분석"}
+
+    def format_as_markdown(self, result):
+        return f"## {result['agent']}"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    specialist_cache.clear()
+    yield
+    specialist_cache.clear()
+
+
+class TestCacheKey:
+    """캐시 키 계산 테스트"""
+
+    def test_normalized_context_same_key(self):
+        agent = CountingAgent("market")
+        a = specialist_cache.make_key("market", agent, {"service_overview": "점심  메뉴\n앱", "x": {"b": 1, "a": 2}})
+        b = specialist_cache.make_key("market", agent, {"x": {"a": 2, "b": 1}, "service_overview": " 점심 메뉴 앱 "})
+        assert a == b
+
+    def test_model_and_agent_change_key(self):
+        ctx = {"service_overview": "점심 메뉴 앱"}
+        base = specialist_cache.make_key("market", CountingAgent("market"), ctx)
+        assert base != specialist_cache.make_key("market", CountingAgent("market", model="gpt-4o-mini"), ctx)
+        assert base != specialist_cache.make_key("bm", CountingAgent("market"), ctx)
+
+
+class TestCacheStorage:
+    """저장/만료 정책 테스트"""
+
+    def test_ttl_expiry(self):
+        cache = SpecialistResultCache(ttl_sec=0.05, max_entries=10)
+        assert cache.put("k", {"v": 1})
+        assert cache.get("k") == {"v": 1}
+        time.sleep(0.08)
+        assert cache.get("k") is None
+
+    def test_lru_bound(self):
+        cache = SpecialistResultCache(ttl_sec=60, max_entries=2)
+        cache.put("a", {"v": 1})
+        cache.put("b", {"v": 2})
+        cache.get("a")
+        cache.put("c", {"v": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+
+    def test_fallback_results_not_stored(self):
+        cache = SpecialistResultCache(ttl_sec=60, max_entries=10)
+        assert not cache.put("a", mark_uncacheable({"v": 1}))
+        assert not cache.put("b", {"fallback_used": True})
+        assert not cache.put("c", {"error": "실패"})
+        assert strip_cache_marker(mark_uncacheable({"v": 1})) == {"v": 1}
+
+    def test_returns_copy(self):
+        cache = SpecialistResultCache(ttl_sec=60, max_entries=10)
+        cache.put("k", {"items": [1]})
+        cache.get("k")["items"].append(2)
+        assert cache.get("k") == {"items": [1]}
+
+    def test_disabled_with_zero_ttl(self):
+        cache = SpecialistResultCache(ttl_sec=0, max_entries=10)
+        assert not cache.put("k", {"v": 1})
+        assert cache.get("k") is None
+
+
+class TestCacheReuse:
+    """Supervisor / Writer ReAct 도구 재사용 테스트"""
+
+    def test_supervisor_rerun_skips_agents(self):
+        from agents.supervisor import NativeSupervisor
+
+        supervisor = NativeSupervisor(llm=MagicMock())
+        supervisor.agents = {a: CountingAgent(a) for a in ("market", "bm")}
+        plan = resolve_execution_plan_dag(["market", "bm"], "test")
+        context = {"service_overview": "점심 메뉴 추천 앱"}
+
+        first, second = {}, {}
+        supervisor._execute_plan(plan, first, context)
+        supervisor._execute_plan(plan, second, context)
+
+        assert all(agent.calls == 1 for agent in supervisor.agents.values())
+        assert second["market_analysis"] == first["market_analysis"]
+        assert second["_execution_stats"]["cache_hit_count"] == 2
+        assert second["_execution_stats"]["agent_stats"]["bm"]["cache_hit"] is True
+
+    def test_writer_tool_reuses_result(self, monkeypatch):
+        import agents.agent_config as agent_config
+        from tools.writer_tools import request_specialist_analysis
+
+        agent = CountingAgent("market")
+        monkeypatch.setattr(agent_config, "create_agent", lambda agent_id, llm=None: agent)
+
+        args = {"specialist_type": "market", "query": "TAM/SAM/SOM 분석", "context": "점심 메뉴 앱"}
+        assert request_specialist_analysis.invoke(args) == "## market"
+        assert request_specialist_analysis.invoke(args) == "## market"
+        assert agent.calls == 1
+
+    def test_writer_tool_namespace_separate(self):
+        agent = CountingAgent("market")
+        context = {"service_overview": "점심 메뉴 앱", "target_market": "직장인"}
+
+        supervisor_key = specialist_cache.make_key("market", agent, context)
+        tool_key = specialist_cache.make_key("market", agent, context, namespace=NAMESPACE_WRITER_TOOL)
+        assert supervisor_key != tool_key
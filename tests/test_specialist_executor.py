@@ -0,0 +1,189 @@
+"""
+PlanCraft - 전문 에이전트 공용 실행기 / Supervisor 캐시 테스트
+
+실행 방법:
+    pytest tests/test_specialist_executor.py -v
+
+테스트 항목:
+    - 세션 간 라운드 로빈 공정 분배
+    - 워커 수 상한 및 대기열 지표
+    - 대기 작업 취소 / 예외 전파
+    - 용도별 풀 분리, 같은 스레드의 동시 run_bounded 호출 간 취소 격리
+    - (모델, temperature)별 Supervisor 인스턴스 재사용
+"""
+
+import threading
+import time
+
+import pytest
+
+from agents.specialist_executor import (
+    POOL_FANOUT,
+    POOL_SPECIALIST,
+    SpecialistExecutor,
+    get_executor,
+    reset_specialist_executor,
+    run_bounded,
+)
+
+
+@pytest.fixture
+def executor():
+    ex = SpecialistExecutor(max_workers=1)
+    yield ex
+    ex.shutdown(wait=False)
+
+
+def _blocker(executor):
+    """워커 1개를 점유하는 작업 제출 후 해제 이벤트 반환"""
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(2)
+
+    executor.submit("blocker", block)
+    assert started.wait(1)
+    return release
+
+
+class TestFairScheduling:
+    """세션 간 공정 분배 테스트"""
+
+    def test_round_robin_across_sessions(self, executor):
+        release = _blocker(executor)
+        order = []
+        futures = [executor.submit("A", order.append, f"A{i}") for i in range(3)]
+        futures.append(executor.submit("B", order.append, "B0"))
+
+        release.set()
+        for f in futures:
+            f.result(timeout=2)
+        # 먼저 몰린 세션 A가 B를 뒤로 밀지 않음
+        assert order == ["A0", "B0", "A1", "A2"]
+
+    def test_worker_bound(self):
+        ex = SpecialistExecutor(max_workers=2)
+        lock = threading.Lock()
+        state = {"active": 0, "max": 0}
+
+        def task():
+            with lock:
+                state["active"] += 1
+                state["max"] = max(state["max"], state["active"])
+            time.sleep(0.03)
+            with lock:
+                state["active"] -= 1
+
+        futures = [ex.submit(f"s{i % 3}", task) for i in range(6)]
+        for f in futures:
+            f.result(timeout=2)
+        assert state["max"] <= 2
+        assert ex.metrics()["workers"] == 2
+        ex.shutdown()
+
+
+class TestMetricsAndCancel:
+    """지표 / 취소 / 예외 테스트"""
+
+    def test_queue_depth_metrics(self, executor):
+        release = _blocker(executor)
+        executor.submit("A", lambda: None)
+        executor.submit("A", lambda: None)
+        executor.submit("B", lambda: None)
+
+        metrics = executor.metrics()
+        assert metrics["busy"] == 1
+        assert metrics["queued"] == 3
+        assert metrics["queued_by_session"] == {"A": 2, "B": 1}
+        assert metrics["max_queue_depth"] >= 3
+        release.set()
+
+    def test_cancel_session(self, executor):
+        release = _blocker(executor)
+        pending = executor.submit("A", lambda: "done")
+        assert executor.cancel_session("A") == 1
+        release.set()
+        assert pending.cancelled()
+
+    def test_exception_propagates(self, executor):
+        def fail():
+            raise ValueError("bad payload")
+
+        with pytest.raises(ValueError):
+            executor.submit("A", fail).result(timeout=2)
+
+
+class TestExecutorPools:
+    """용도별 풀 / 호출 단위 세션"""
+
+    @pytest.fixture(autouse=True)
+    def small_pools(self, monkeypatch):
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "SPECIALIST_POOL_WORKERS", 1)
+        monkeypatch.setattr(settings, "FANOUT_POOL_WORKERS", 2)
+        reset_specialist_executor()
+        yield
+        reset_specialist_executor()
+
+    def test_fanout_not_starved_by_specialist_pool(self):
+        release = _blocker(get_executor(POOL_SPECIALIST))
+        try:
+            assert run_bounded("thread-1:writer", [(lambda: "청크",)], 2) == ["청크"]
+        finally:
+            release.set()
+        assert get_executor(POOL_FANOUT) is not get_executor(POOL_SPECIALIST)
+
+    def test_concurrent_calls_do_not_cancel_each_other(self):
+        first_started = threading.Event()
+        release = threading.Event()
+        outcome = {}
+
+        def slow():
+            first_started.set()
+            release.wait(2)
+            return "1"
+
+        def fail():
+            raise ValueError("청크 실패")
+
+        # 같은 thread_id 접두사로 두 호출 실행: 한쪽의 실패 정리가 다른 쪽의 대기 호출을 취소하지 않아야 함
+        worker = threading.Thread(target=lambda: outcome.setdefault(
+            "result", run_bounded("thread-1:writer", [(slow,), (lambda: "2",)], 1)
+        ))
+        worker.start()
+        assert first_started.wait(1)
+        with pytest.raises(ValueError):
+            run_bounded("thread-1:writer", [(fail,)], 1)
+        release.set()
+        worker.join(2)
+
+        assert outcome["result"] == ["1", "2"]
+
+
+class TestSupervisorCache:
+    """Supervisor 인스턴스 캐시 테스트"""
+
+    @pytest.fixture
+    def fake_backend(self):
+        from agents.supervisor import clear_supervisor_cache
+        from utils.config import Config
+        from utils.llm import set_llm_backend
+
+        previous = Config.LLM_BACKEND
+        set_llm_backend("fake")
+        clear_supervisor_cache()
+        yield
+        set_llm_backend(previous)
+        clear_supervisor_cache()
+
+    def test_reused_per_model_and_temperature(self, fake_backend):
+        from agents.supervisor import get_supervisor
+
+        first = get_supervisor()
+        assert get_supervisor() is first
+        assert get_supervisor(temperature=0.7) is not first
+        assert get_supervisor(model_type="gpt-4o-mini") is not first
+        assert first.agents  # 에이전트는 최초 1회만 생성
@@ -0,0 +1,170 @@
+"""
+PlanCraft - 전문 에이전트 Structured Output / 부분 파싱 테스트
+
+실행 방법:
+    pytest tests/test_specialist_output.py -v
+
+테스트 항목:
+    - 스키마 바인딩 호출 성공 (Fake 백엔드, 6개 전문 에이전트)
+    - 파서 실패 시 잘린 JSON/본문/잘못된 도구 호출 인자에서 부분 복구 (재요청 없음)
+    - 복구 불가 시 Fallback + 파싱 실패 카운트
+    - Supervisor 실행 통계의 parse_status / parse_failure_count
+"""
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+import pytest
+
+from agents.specialist_cache import UNCACHEABLE_KEY
+from agents.specialist_output import (
+    PARSE_FAILED,
+    PARSE_PARTIAL,
+    PARSE_STATUS_KEY,
+    invoke_structured,
+    pop_parse_status,
+    specialist_parse_stats,
+)
+from agents.specialists.market_agent import MarketAgent, MarketAnalysis
+from agents.supervisor_types import ExecutionStats
+
+
+class StubLLM:
+    """고정 응답을 반환하고 스키마 파서는 항상 실패하는 테스트용 모델"""
+
+    def __init__(self, message: AIMessage):
+        self.message = message
+        self.calls = 0
+
+    def with_structured_output(self, schema, **kwargs):
+        def call(_messages):
+            self.calls += 1
+            return self.message
+
+        def parse(_message):
+            raise ValueError("tool call not found")
+
+        return RunnableLambda(call) | RunnableLambda(parse)
+
+
+def _fallback():
+    return MarketAgent.__new__(MarketAgent)._get_fallback_analysis("러닝 앱")
+
+
+def _invoke(message: AIMessage = None, llm=None):
+    llm = llm or StubLLM(message)
+    return invoke_structured(llm, MarketAnalysis, [], agent_name="TestAgent", fallback=_fallback)
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_stats():
+    specialist_parse_stats.clear()
+    yield
+    specialist_parse_stats.clear()
+
+
+class TestStructuredSuccess:
+    """스키마 바인딩 호출 성공 경로"""
+
+    @pytest.mark.parametrize("agent_path, kwargs", [
+        ("agents.specialists.market_agent.MarketAgent", {"service_overview": "러닝 앱", "target_market": "러너"}),
+        ("agents.specialists.bm_agent.BMAgent", {"service_overview": "러닝 앱", "target_users": "러너"}),
+        ("agents.specialists.financial_agent.FinancialAgent", {"service_overview": "러닝 앱", "business_model": {}, "market_analysis": {}}),
+        ("agents.specialists.risk_agent.RiskAgent", {"service_overview": "러닝 앱", "business_model": {}}),
+        ("agents.specialists.tech_architect.TechArchitectAgent", {"service_overview": "러닝 앱"}),
+        ("agents.specialists.content_strategist.ContentStrategistAgent", {"service_overview": "러닝 앱"}),
+    ])
+    def test_specialists_return_schema_valid_result(self, agent_path, kwargs):
+        import importlib
+
+        from utils.fake_llm import FakeChatModel
+
+        module_name, class_name = agent_path.rsplit(".", 1)
+        agent = getattr(importlib.import_module(module_name), class_name)(llm=FakeChatModel())
+
+        result = agent.run(**kwargs)
+
+        assert UNCACHEABLE_KEY not in result
+        assert PARSE_STATUS_KEY not in result
+        assert specialist_parse_stats.snapshot()[agent.name]["structured"] == 1
+        assert agent.format_as_markdown(result)
+
+
+class TestPartialParsing:
+    """파서 실패 시 같은 응답에서 부분 복구 (재요청 없음)"""
+
+    def test_truncated_json_keeps_valid_fields(self):
+        content = (
+            '```json\n{"trends": ["러닝 크루 확산", "웨어러블 연동"], '
+            '"opportunities": ["MZ 러너"], "tam": {"value": "$12B", "year": 2026, "sour'
+        )
+        llm = StubLLM(AIMessage(content=content))
+
+        result = _invoke(llm=llm)
+
+        assert llm.calls == 1
+        assert result["trends"] == ["러닝 크루 확산", "웨어러블 연동"]
+        assert result["opportunities"] == ["MZ 러너"]
+        # 잘려서 검증에 실패한 tam과 누락 필드는 Fallback 값
+        assert result["tam"] == _fallback()["tam"]
+        assert result["competitors"] == _fallback()["competitors"]
+        assert result[UNCACHEABLE_KEY] is True
+        assert result[PARSE_STATUS_KEY] == PARSE_PARTIAL
+
+    def test_complete_json_in_prose_is_cacheable(self):
+        payload = MarketAnalysis.model_validate(_fallback()).model_dump_json()
+        result = _invoke(AIMessage(content=f"분석 결과입니다.\n{payload}\n감사합니다."))
+
+        assert UNCACHEABLE_KEY not in result
+        assert result[PARSE_STATUS_KEY] == PARSE_PARTIAL
+        assert result["som"]["value"] == "50억 원"
+
+    def test_invalid_tool_call_args_recovered(self):
+        message = AIMessage(
+            content="",
+            invalid_tool_calls=[{
+                "name": "MarketAnalysis",
+                "args": '{"trends": ["구독 경제"], "opportunities": ["B2B 제휴"',
+                "id": "call_1",
+                "error": "JSONDecodeError",
+                "type": "invalid_tool_call",
+            }],
+        )
+        result = _invoke(message)
+
+        assert result["trends"] == ["구독 경제"]
+        assert result["opportunities"] == ["B2B 제휴"]
+        assert result[PARSE_STATUS_KEY] == PARSE_PARTIAL
+
+    def test_no_json_uses_fallback_and_counts_failure(self):
+        result = _invoke(AIMessage(content="죄송합니다. 분석할 수 없습니다."))
+
+        assert result["tam"] == _fallback()["tam"]
+        assert result[UNCACHEABLE_KEY] is True
+        assert result[PARSE_STATUS_KEY] == PARSE_FAILED
+
+        stats = specialist_parse_stats.snapshot()["TestAgent"]
+        assert stats["failed"] == 1
+        assert stats["parse_failures"] == 1
+
+
+class TestParseStatusStats:
+    """Supervisor 실행 통계 연동"""
+
+    def test_pop_parse_status(self):
+        result = {"a": 1, PARSE_STATUS_KEY: PARSE_PARTIAL}
+        assert pop_parse_status(result) == PARSE_PARTIAL
+        assert result == {"a": 1}
+        assert pop_parse_status(result) is None
+        assert pop_parse_status("text") is None
+
+    def test_execution_stats_counts_parse_failures(self):
+        stats = ExecutionStats()
+        for agent_id, status in [("market", "structured"), ("bm", "partial"), ("risk", "failed")]:
+            agent_stats = stats.get_agent_stats(agent_id)
+            agent_stats.parse_status = status
+            agent_stats.record_end(success=True)
+        stats.record_end()
+
+        assert stats.parse_failure_count == 2
+        assert stats.to_dict()["agent_stats"]["bm"]["parse_status"] == "partial"
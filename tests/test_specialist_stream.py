@@ -0,0 +1,276 @@
+"""
+PlanCraft - 전문 에이전트 결과 스트림 (Supervisor → Writer 파이프라인) 테스트
+
+실행 방법:
+    pytest tests/test_specialist_stream.py -v
+
+테스트 항목:
+    - 스트림 준비 판정 (게시됨 / 계획 밖 / 종료)
+    - 섹션 → 필요 결과 키 매핑 (agents.yaml provides/section_keywords)
+    - Supervisor가 에이전트 완료 즉시 결과 게시
+    - Writer가 느린 에이전트를 기다리지 않고 준비된 섹션부터 작성
+    - run_specialists 노드 통과 / 스트림 유실 시 순차 실행
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import agents.writer as writer
+import graph.nodes.supervisor_node as supervisor_node
+from agents.agent_config import map_sections_to_result_keys, resolve_execution_plan_dag
+from agents.specialist_stream import (
+    SpecialistResultStream,
+    get_specialist_stream,
+    open_specialist_stream,
+    release_specialist_stream,
+)
+from agents.supervisor import NativeSupervisor
+from graph.state import create_initial_state
+from utils.file_logger import get_file_logger
+from utils.settings import get_preset
+
+
+@pytest.fixture(autouse=True)
+def clear_specialist_cache():
+    from agents.specialist_cache import specialist_cache
+
+    specialist_cache.clear()
+    yield
+    specialist_cache.clear()
+
+
+@pytest.fixture
+def stub_supervisor(monkeypatch):
+    """부분 결과 포맷용 Supervisor (LLM 자격 증명 없이 생성)"""
+    import agents.supervisor
+
+    supervisor = NativeSupervisor(llm=MagicMock())
+    supervisor.agents = {}  # JSON Fallback 포맷터 사용
+    monkeypatch.setattr(agents.supervisor, "get_supervisor", lambda *args, **kwargs: supervisor)
+    return supervisor
+
+
+class StubChunkLLM:
+    """작성 지시문의 섹션 제목을 그대로 섹션으로 돌려주고 호출별 섹션을 기록"""
+
+    def __init__(self, titles):
+        self.titles = titles
+        self.order = []
+        self.prompts = []
+        self.called = threading.Event()
+
+    def invoke(self, messages):
+        content = messages[-1]["content"]
+        chunk = [t for t in self.titles if f"- {t}" in content]
+        self.order.append(chunk)
+        self.prompts.append(content)
+        self.called.set()
+        return {
+            "title": f"제목-{chunk[0]}",
+            "sections": [{"name": t, "content": f"{t} 본문"} for t in chunk],
+            "key_features": [f"기능-{chunk[0]}"],
+            "executive_summary": f"요약-{chunk[0]}",
+        }
+
+
+TITLES = ["재무 계획", "팀 구성", "추진 일정", "시장 분석"]
+STRUCTURE = {"title": "러닝 앱", "sections": [{"title": t} for t in TITLES]}
+MESSAGES = [{"role": "system", "content": "system"}, {"role": "user", "content": "base"}]
+
+
+class TestResultStream:
+    """스트림 준비 판정"""
+
+    def test_ready_semantics(self):
+        stream = SpecialistResultStream()
+        assert not stream.ready(["market_analysis"])  # 계획 전: 모든 키 대기
+
+        stream.set_planned(["market_analysis", "financial_plan"])
+        assert stream.ready(["risk_analysis"])  # 계획 밖
+        assert not stream.ready(["market_analysis"])
+
+        stream.publish("market_analysis", {"tam": "1조"})
+        assert stream.ready(["market_analysis"])
+        assert stream.snapshot(["market_analysis", "financial_plan"]) == {"market_analysis": {"tam": "1조"}}
+        assert not stream.wait_ready(["financial_plan"], timeout=0.01)
+
+        stream.finish({"market_analysis": {"tam": "1조"}})
+        assert stream.ready(["financial_plan"])
+        assert stream.result(timeout=0) == {"market_analysis": {"tam": "1조"}}
+
+    def test_failed_stream_returns_none(self):
+        stream = SpecialistResultStream()
+        stream.fail(RuntimeError("down"))
+        assert stream.closed
+        assert stream.result(timeout=0) is None
+
+    def test_registry(self):
+        stream = open_specialist_stream()
+        assert get_specialist_stream(stream.stream_id) is stream
+        release_specialist_stream(stream.stream_id)
+        assert get_specialist_stream(stream.stream_id) is None
+        assert get_specialist_stream(None) is None
+
+
+class TestSectionMapping:
+    """섹션 → 필요 결과 키"""
+
+    def test_korean_and_english_sections(self):
+        sections = [
+            {"name": "재무 계획"},
+            {"name": "프로젝트 개요"},
+            {"name": "시장 분석 및 경쟁사"},
+            {"name": "Revenue model"},
+            {"name": "awesome"},  # 'som' 부분 일치 아님
+        ]
+        assert map_sections_to_result_keys(sections) == [
+            ["financial_plan"], [], ["market_analysis"], ["business_model"], []
+        ]
+
+    def test_agent_filter(self):
+        assert map_sections_to_result_keys([{"name": "시장 및 재무"}], agent_ids=["market"]) == [["market_analysis"]]
+
+
+class TestSupervisorPublish:
+    """Supervisor가 완료 즉시 결과 게시"""
+
+    def test_publishes_before_plan_finishes(self):
+        supervisor = NativeSupervisor(llm=MagicMock())
+        release = threading.Event()
+
+        fast = MagicMock()
+        fast.run.return_value = {"tam": "1조"}
+        slow = MagicMock()
+        slow.run.side_effect = lambda **kwargs: release.wait(5) and {"bep": "2년"}
+        supervisor.agents = {"market": fast, "tech": slow}
+
+        stream = SpecialistResultStream()
+        plan = resolve_execution_plan_dag(["market", "tech"], "test")
+        runner = threading.Thread(target=supervisor._execute_plan, args=(plan, {}, {
+            "service_overview": "러닝 앱",
+            "result_stream": stream,
+        }))
+        runner.start()
+
+        try:
+            assert stream.wait_ready(["market_analysis"], timeout=5)
+            assert stream.snapshot(["market_analysis"]) == {"market_analysis": {"tam": "1조"}}
+            assert not stream.ready(["tech_architecture"])
+            assert stream.ready(["financial_plan"])  # 계획 밖
+        finally:
+            release.set()
+            runner.join(5)
+        assert stream.ready(["tech_architecture"])
+
+
+class TestWriterPipeline:
+    """Writer 섹션 단위 파이프라인"""
+
+    def test_ready_sections_written_while_financial_runs(self, stub_supervisor):
+        stream = SpecialistResultStream()
+        stream.set_planned(["market_analysis", "financial_plan"])
+        stream.publish("market_analysis", {"tam": "1조"})
+        llm = StubChunkLLM(TITLES)
+        outcome = {}
+
+        def write():
+            outcome["draft"] = writer._write_sections_as_ready(
+                llm, MESSAGES, STRUCTURE, stream, get_file_logger()
+            )
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        # financial 실행 중에도 재무 외 섹션은 한 번에 작성 시작
+        assert llm.called.wait(5)
+        assert llm.order == [["팀 구성", "추진 일정", "시장 분석"]]
+        assert "tam" in llm.prompts[0]
+
+        stream.publish("financial_plan", {"bep": "2년"})
+        thread.join(5)
+
+        assert llm.order[1] == ["재무 계획"]
+        assert "bep" in llm.prompts[1]
+        assert "tam" not in llm.prompts[1]  # 섹션에 필요한 결과만 주입
+        draft = outcome["draft"]
+        assert [s["name"] for s in draft["sections"]] == TITLES  # 목차 순서 유지
+        assert draft["executive_summary"] == "요약-재무 계획"  # 첫 섹션 작성 호출이 메타데이터 담당
+
+    def test_all_ready_writes_in_one_call(self, stub_supervisor):
+        stream = SpecialistResultStream()
+        stream.finish({})
+        llm = StubChunkLLM(TITLES)
+
+        draft = writer._write_sections_as_ready(llm, MESSAGES, STRUCTURE, stream, get_file_logger())
+
+        assert llm.order == [TITLES]
+        assert draft["key_features"] == ["기능-재무 계획"]
+
+    def test_stream_result_attached_to_state(self, monkeypatch, stub_supervisor):
+        stream = open_specialist_stream()
+        stream.finish({"market_analysis": {"tam": "1조"}})
+        llm = StubChunkLLM(TITLES)
+        monkeypatch.setattr(writer, "get_llm", lambda **kwargs: MagicMock(with_structured_output=lambda schema: llm))
+
+        state = create_initial_state("러닝 앱", generation_preset="quality")
+        state.update({"structure": STRUCTURE, "specialist_stream_id": stream.stream_id})
+        result = writer._write_with_specialist_stream(state, stream, MESSAGES, get_preset("quality"), get_file_logger())
+
+        assert result["specialist_analysis"] == {"market_analysis": {"tam": "1조"}}
+        assert result["specialist_stream_id"] is None
+        assert len(result["draft"]["sections"]) == len(TITLES)
+        assert get_specialist_stream(stream.stream_id) is None
+
+
+class TestSupervisorNodeStreaming:
+    """run_specialists 노드 동작"""
+
+    def _state(self, **overrides):
+        state = create_initial_state("러닝 앱", generation_preset="quality")
+        state.update({"analysis": {"topic": "러닝 앱"}, **overrides})
+        return state
+
+    def test_open_stream_passes_through(self, monkeypatch):
+        monkeypatch.setattr(supervisor_node, "_run_specialist_analysis", MagicMock(side_effect=AssertionError))
+        stream = open_specialist_stream()
+        try:
+            result = supervisor_node.run_supervisor_node(self._state(specialist_stream_id=stream.stream_id))
+        finally:
+            release_specialist_stream(stream.stream_id)
+
+        assert result["specialist_stream_id"] == stream.stream_id
+        assert result["step_history"][-1]["status"] == "SUCCESS"
+
+    def test_speculative_start_streams_without_join(self, monkeypatch):
+        release = threading.Event()
+
+        def slow_specialists(state, start_time, result_stream=None, cancel_event=None):
+            release.wait(5)
+            return {"market_analysis": {"tam": "1조"}}, ["market"]
+
+        monkeypatch.setattr(supervisor_node, "_run_specialist_analysis", slow_specialists)
+        state = self._state()
+        future = supervisor_node.start_speculative_specialists(state)
+
+        start = time.perf_counter()
+        joined = supervisor_node.join_speculative_specialists(future, state)
+        assert time.perf_counter() - start < 1.0  # 결과를 기다리지 않음
+
+        stream = get_specialist_stream(joined["specialist_stream_id"])
+        release.set()
+        assert stream.result(timeout=5) == {"market_analysis": {"tam": "1조"}}
+        release_specialist_stream(stream.stream_id)
+
+    def test_missing_stream_runs_sequentially(self, monkeypatch):
+        monkeypatch.setattr(
+            supervisor_node, "_run_specialist_analysis",
+            lambda state, start_time, result_stream=None: ({"market_analysis": {"tam": "1조"}}, ["market"])
+        )
+        monkeypatch.setattr(get_preset("quality"), "stream_specialists_to_writer", False)
+
+        result = supervisor_node.run_supervisor_node(self._state(specialist_stream_id="stream-gone"))
+
+        assert result["specialist_stream_id"] is None
+        assert result["specialist_analysis"] == {"market_analysis": {"tam": "1조"}}
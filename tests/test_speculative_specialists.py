@@ -0,0 +1,169 @@
+"""
+PlanCraft - 전문 에이전트 선행 실행(구조 설계와 병렬) 테스트
+
+실행 방법:
+    pytest tests/test_speculative_specialists.py -v
+
+테스트 항목:
+    - Balanced 프리셋: structure 노드 안에서 전문 에이전트 분석이 병렬 실행
+    - run_specialists 노드는 선행 결과를 재사용 (재실행 없음)
+    - Fast 프리셋 / 개선 루프: 선행 실행하지 않음
+    - 선행 실행 실패 시 run_specialists가 순차 실행
+    - 구조 설계 실패 시 선행 실행 취소
+    - 선행 실행은 공용 prefetch 풀에서 실행 (지표 노출, 시작 전 취소 시 결과 스트림 실패 처리)
+"""
+
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+import graph.nodes.structurer_node as structurer_node
+import graph.nodes.supervisor_node as supervisor_node
+from graph.state import create_initial_state
+
+
+@pytest.fixture
+def slow_nodes(monkeypatch):
+    """구조 설계/전문가 분석을 각각 0.2초 걸리는 스텁으로 대체"""
+    calls = {"specialists": 0}
+
+    def fake_structurer(state):
+        time.sleep(0.2)
+        return {**state, "structure": {"title": "t", "sections": [{"name": "개요"}]}}
+
+    def fake_specialists(state, start_time, result_stream=None, cancel_event=None):
+        calls["specialists"] += 1
+        time.sleep(0.2)
+        return {"market_analysis": {"tam": "1조"}, "business_model": {"model": "구독"}}, ["market", "business"]
+
+    monkeypatch.setattr(structurer_node, "run", fake_structurer)
+    monkeypatch.setattr(supervisor_node, "_run_specialist_analysis", fake_specialists)
+    return calls
+
+
+def _state(preset: str, **overrides):
+    state = create_initial_state("점심 메뉴 추천 앱", generation_preset=preset)
+    state.update({"analysis": {"topic": "점심 메뉴 추천 앱"}, **overrides})
+    return state
+
+
+class TestSpeculativeStart:
+    """선행 실행 동작 테스트"""
+
+    def test_balanced_overlaps_structure(self, slow_nodes):
+        start = time.perf_counter()
+        after_structure = structurer_node.run_structurer_node(_state("balanced"))
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.35  # 순차라면 0.4초 이상
+        assert after_structure["specialist_prefetched"] is True
+        assert after_structure["specialist_analysis"]["market_analysis"] == {"tam": "1조"}
+
+        after_specialists = supervisor_node.run_supervisor_node(after_structure)
+        assert slow_nodes["specialists"] == 1
+        assert after_specialists["specialist_prefetched"] is False
+        assert after_specialists["step_history"][-1]["status"] == "SUCCESS"
+
+    def test_fast_preset_stays_sequential(self, slow_nodes):
+        after_structure = structurer_node.run_structurer_node(_state("fast"))
+        assert not after_structure.get("specialist_prefetched")
+        assert slow_nodes["specialists"] == 0
+
+        supervisor_node.run_supervisor_node(after_structure)
+        assert slow_nodes["specialists"] == 1
+
+    def test_refine_loop_not_prefetched(self, slow_nodes):
+        assert supervisor_node.start_speculative_specialists(_state("balanced", refine_count=1)) is None
+        assert supervisor_node.start_speculative_specialists(_state("balanced", use_specialist_agents=False)) is None
+
+    def test_failed_prefetch_falls_back_to_node(self, monkeypatch, slow_nodes):
+        def broken(state, start_time, result_stream=None, cancel_event=None):
+            raise RuntimeError("supervisor down")
+
+        monkeypatch.setattr(supervisor_node, "_run_specialist_analysis", broken)
+        after_structure = structurer_node.run_structurer_node(_state("balanced"))
+
+        assert not after_structure.get("specialist_prefetched")
+        assert after_structure.get("structure")
+
+
+class TestSpeculativeCancel:
+    """구조 설계 실패 시 선행 실행 취소"""
+
+    def test_structurer_failure_cancels_prefetch(self, monkeypatch):
+        started, cancelled = threading.Event(), threading.Event()
+        futures = []
+
+        def fake_specialists(state, start_time, result_stream=None, cancel_event=None):
+            started.set()
+            if cancel_event.wait(5):
+                cancelled.set()
+                raise CancelledError()
+            return {}, []
+
+        def broken_structurer(state):
+            started.wait(5)
+            raise RuntimeError("structure down")
+
+        original_start = supervisor_node.start_speculative_specialists
+
+        def tracking_start(state):
+            future = original_start(state)
+            futures.append(future)
+            return future
+
+        monkeypatch.setattr(supervisor_node, "_run_specialist_analysis", fake_specialists)
+        monkeypatch.setattr(structurer_node, "start_speculative_specialists", tracking_start)
+        monkeypatch.setattr(structurer_node, "run", broken_structurer)
+
+        result = structurer_node.run_structurer_node(_state("balanced"))
+
+        assert result.get("error")  # handle_node_error가 에러 상태로 변환
+        assert cancelled.wait(5)
+        with pytest.raises(CancelledError):
+            futures[0].result(timeout=5)
+
+
+
+class TestPrefetchPool:
+    """선행 실행 공용 풀"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_pools(self):
+        from agents.specialist_executor import reset_specialist_executor
+
+        reset_specialist_executor()
+        yield
+        reset_specialist_executor()
+
+    def test_runs_on_prefetch_pool(self, slow_nodes):
+        from agents.specialist_executor import POOL_PREFETCH, executor_metrics
+
+        future = supervisor_node.start_speculative_specialists(_state("balanced", thread_id="t-pool"))
+
+        assert future.session_id.startswith("t-pool:prefetch:")
+        assert future.result(timeout=5)[1] == ["market", "business"]
+        metrics = executor_metrics()[POOL_PREFETCH]
+        assert metrics["submitted"] == 1 and metrics["completed"] == 1
+
+    def test_cancel_before_start_fails_stream(self, monkeypatch, slow_nodes):
+        from agents.specialist_executor import POOL_PREFETCH, get_executor
+        from agents.specialist_stream import get_specialist_stream
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "PREFETCH_POOL_WORKERS", 1)
+        release = threading.Event()
+        get_executor(POOL_PREFETCH).submit("busy", release.wait, 5)  # 유일한 워커 점유
+        try:
+            future = supervisor_node._start_in_background(_state("quality"), stream=True)
+            stream = get_specialist_stream(future.stream_id)
+            assert get_executor(POOL_PREFETCH).cancel_session(future.session_id) == 1
+        finally:
+            release.set()
+
+        assert future.cancelled()
+        assert stream.closed
+        assert slow_nodes["specialists"] == 0
+        supervisor_node.cancel_speculative_specialists(future)  # 스트림 등록 해제
@@ -0,0 +1,264 @@
+"""
+PlanCraft - Supervisor 이벤트 기반 DAG 스케줄러 테스트
+
+실행 방법:
+    pytest tests/test_supervisor_scheduler.py -v
+
+테스트 항목:
+    - 의존성 충족 즉시 실행 (단계 배리어 없음)
+    - 동시 실행 수 제한 (MAX_PARALLEL_AGENTS)
+    - 타임아웃 시 대기 없이 Fallback
+    - 재시도 / Critical Path 기록
+    - 호출 측 취소 신호(cancel_event) 시 실행 중 에이전트 마감시간 취소 후 중단
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.agent_config import AGENT_REGISTRY, resolve_execution_plan_dag
+from agents.supervisor import NativeSupervisor
+from agents.supervisor_types import compute_critical_path
+from utils.settings import settings
+
+ALL_AGENTS = ["market", "bm", "financial", "risk", "tech", "content"]
+
+
+class StubAgent:
+    """지정 시간만큼 대기 후 결과를 반환하는 테스트용 에이전트"""
+
+    def __init__(self, agent_id, duration, log, errors=None):
+        self.agent_id = agent_id
+        self.duration = duration
+        self.log = log
+        self.errors = list(errors or [])
+
+    def run(self, **kwargs):
+        start = time.perf_counter()
+        with self.log["lock"]:
+            self.log["active"] += 1
+            self.log["max_active"] = max(self.log["max_active"], self.log["active"])
+        try:
+            time.sleep(self.duration)
+            if self.errors:
+                raise self.errors.pop(0)
+            return {"agent": self.agent_id}
+        finally:
+            with self.log["lock"]:
+                self.log["active"] -= 1
+                self.log["spans"][self.agent_id] = (start, time.perf_counter())
+
+    def format_as_markdown(self, result):
+        return str(result)
+
+
+@pytest.fixture(autouse=True)
+def clear_specialist_cache():
+    from agents.specialist_cache import specialist_cache
+
+    specialist_cache.clear()
+    yield
+    specialist_cache.clear()
+
+
+@pytest.fixture
+def supervisor():
+    return NativeSupervisor(llm=MagicMock())
+
+
+@pytest.fixture
+def log():
+    return {"lock": threading.Lock(), "active": 0, "max_active": 0, "spans": {}}
+
+
+def _install(supervisor, log, durations, errors=None):
+    errors = errors or {}
+    supervisor.agents = {
+        agent_id: StubAgent(agent_id, duration, log, errors.get(agent_id))
+        for agent_id, duration in durations.items()
+    }
+
+
+def _run(supervisor, agents, events=None):
+    plan = resolve_execution_plan_dag(agents, "test")
+    results = {}
+    supervisor._execute_plan(plan, results, {
+        "service_overview": "점심 메뉴 추천 앱",
+        "on_event": events.append if events is not None else None,
+    })
+    return results
+
+
+class TestReadyQueueScheduling:
+    """의존성 기반 즉시 실행 테스트"""
+
+    def test_dependent_starts_without_layer_barrier(self, supervisor, log):
+        """risk(bm 의존)는 같은 단계의 느린 tech/content를 기다리지 않음"""
+        _install(supervisor, log, {
+            "market": 0.05, "bm": 0.05, "risk": 0.05, "financial": 0.05,
+            "tech": 0.5, "content": 0.5,
+        })
+        results = _run(supervisor, ALL_AGENTS)
+
+        spans = log["spans"]
+        assert spans["risk"][0] < spans["tech"][1]
+        assert spans["financial"][0] < spans["content"][1]
+        # 의존성은 지켜져야 함
+        assert spans["bm"][0] >= spans["market"][1]
+        assert spans["risk"][0] >= spans["bm"][1]
+
+        schedule = results["_execution_stats"]["schedule"]
+        assert schedule["makespan_ms"] < schedule["layered_estimate_ms"]
+        assert schedule["critical_path"][-1] == "content"
+        assert schedule["critical_path"][0] == "market"
+
+    def test_bounded_pool(self, supervisor, log, monkeypatch):
+        monkeypatch.setattr(settings, "MAX_PARALLEL_AGENTS", 2)
+        _install(supervisor, log, {a: 0.05 for a in ALL_AGENTS})
+        results = _run(supervisor, ALL_AGENTS)
+
+        assert log["max_active"] <= 2
+        assert results["_execution_stats"]["successful_agents"] == len(ALL_AGENTS)
+
+    def test_step_start_events_preserved(self, supervisor, log):
+        _install(supervisor, log, {"market": 0.01, "bm": 0.01})
+        events = []
+        _run(supervisor, ["market", "bm"], events)
+
+        types = [e["type"] for e in events]
+        assert types.count("step_start") == 2
+        assert types.count("agent_success") == 2
+
+
+class TestFailureHandling:
+    """타임아웃/재시도/Fallback 테스트"""
+
+    def test_timeout_uses_fallback_without_waiting(self, supervisor, log, monkeypatch):
+        monkeypatch.setattr(AGENT_REGISTRY["tech"], "timeout_seconds", 0.2)
+        _install(supervisor, log, {"market": 0.01, "tech": 2.0})
+
+        start = time.perf_counter()
+        results = _run(supervisor, ["market", "tech"])
+        assert time.perf_counter() - start < 1.5
+
+        tech = results[supervisor._get_result_key("tech")]
+        assert tech["fallback_used"] is True
+        assert tech["error_category"] == "TIMEOUT_ERROR"
+
+    def test_retryable_error_is_retried(self, supervisor, log):
+        _install(
+            supervisor, log, {"market": 0.01, "bm": 0.01},
+            errors={"market": [ConnectionError("connection reset")]},
+        )
+        events = []
+        results = _run(supervisor, ["market", "bm"], events)
+
+        assert results[supervisor._get_result_key("market")] == {"agent": "market"}
+        assert "agent_retry_success" in [e["type"] for e in events]
+        assert results["_execution_stats"]["agent_stats"]["market"]["retry_count"] == 1
+
+    def test_non_retryable_error_falls_back_and_dependents_run(self, supervisor, log):
+        _install(
+            supervisor, log, {"market": 0.01, "bm": 0.01},
+            errors={"market": [ValueError("bad payload")]},
+        )
+        results = _run(supervisor, ["market", "bm"])
+
+        assert results[supervisor._get_result_key("market")]["fallback_used"] is True
+        assert results[supervisor._get_result_key("bm")] == {"agent": "bm"}
+
+
+class TestCriticalPath:
+    """Critical Path 계산 테스트"""
+
+    def test_follows_latest_finishing_dependency(self):
+        timeline = {
+            "market": {"start_ms": 0, "end_ms": 10},
+            "tech": {"start_ms": 0, "end_ms": 50},
+            "bm": {"start_ms": 10, "end_ms": 20},
+            "risk": {"start_ms": 20, "end_ms": 60},
+        }
+        deps = {"market": [], "tech": [], "bm": ["market"], "risk": ["bm"]}
+        assert compute_critical_path(timeline, deps) == ["market", "bm", "risk"]
+        assert compute_critical_path({}, deps) == []
+
+
+class TestDeadlinePropagation:
+    """에이전트/계획 마감시간 전파 테스트"""
+
+    def test_plan_deadline_skips_unstarted_agents(self, supervisor, log, monkeypatch):
+        monkeypatch.setattr(settings, "PLAN_TIMEOUT_SEC", 0.2)
+        _install(supervisor, log, {"market": 1.0, "bm": 0.01})
+
+        start = time.perf_counter()
+        results = _run(supervisor, ["market", "bm"])
+        assert time.perf_counter() - start < 0.8
+
+        assert "bm" not in log["spans"]
+        bm = results[supervisor._get_result_key("bm")]
+        assert bm["fallback_used"] is True
+        assert bm["error_category"] == "TIMEOUT_ERROR"
+
+    def test_hung_llm_call_ends_at_agent_budget(self, supervisor, monkeypatch):
+        """멈춘 LLM 호출은 요청 timeout으로 종료되어 워커 스레드가 남지 않음"""
+        from agents.specialists.market_agent import MarketAgent
+        from utils.fake_llm import FakeChatModel, configure_fake_backend
+
+        configure_fake_backend(latency_ms_mean=3000)
+        try:
+            monkeypatch.setattr(AGENT_REGISTRY["market"], "timeout_seconds", 0.3)
+            agent = MarketAgent(llm=FakeChatModel())
+            finished = threading.Event()
+            original_run = agent.run
+
+            def run(**kwargs):
+                try:
+                    return original_run(**kwargs)
+                finally:
+                    finished.set()
+
+            agent.run = run
+            supervisor.agents = {"market": agent}
+
+            results = _run(supervisor, ["market"])
+            market = results[supervisor._get_result_key("market")]
+            assert market["error_category"] == "TIMEOUT_ERROR"
+            # 3초 지연 호출이 예산(0.3초) 직후 종료되어야 함
+            assert finished.wait(0.5)
+        finally:
+            configure_fake_backend()
+
+
+class TestCancelEvent:
+    """호출 측 취소 신호"""
+
+    def test_cancel_event_stops_running_agents(self, supervisor):
+        from concurrent.futures import CancelledError
+        from utils.deadline import get_current_deadline
+
+        running, released = threading.Event(), threading.Event()
+        deadlines = []
+
+        class HangingAgent:
+            def run(self, **kwargs):
+                deadlines.append(get_current_deadline())
+                running.set()
+                while not deadlines[0].expired():
+                    time.sleep(0.01)
+                released.set()
+                return {}
+
+        supervisor.agents = {"market": HangingAgent()}
+        cancel_event = threading.Event()
+        threading.Thread(target=lambda: running.wait(5) and cancel_event.set(), daemon=True).start()
+
+        with pytest.raises(CancelledError):
+            supervisor._execute_plan(resolve_execution_plan_dag(["market"], "test"), {}, {
+                "service_overview": "점심 메뉴 추천 앱",
+                "cancel_event": cancel_event,
+            })
+
+        # 에이전트 마감시간이 취소되어 실행 중 스레드도 곧바로 종료
+        assert released.wait(2)
@@ -0,0 +1,103 @@
+"""
+PlanCraft - 시간 컨텍스트 (백그라운드 시계 오프셋 동기화) 테스트
+
+실행 방법:
+    pytest tests/test_time_context.py -v
+
+테스트 항목:
+    - 요청 경로(get_naver_time)에서 네트워크 I/O 없음
+    - 오프셋 측정 및 적용, 측정 실패 시 기존 값 유지
+    - off 모드 (폐쇄망)
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+import utils.time_context as tc
+from utils.config import Config
+
+
+@pytest.fixture(autouse=True)
+def _reset_clock(monkeypatch):
+    tc.stop_clock_sync(timeout=1)
+    monkeypatch.setattr(tc, "_clock_offset", None)
+    monkeypatch.setattr(tc, "_sync_thread", None)
+    monkeypatch.setattr(Config, "TIME_SYNC_MODE", "background")
+    yield
+    tc.stop_clock_sync(timeout=1)
+
+
+def _head_response(offset: timedelta):
+    server_now = datetime.now(timezone.utc) + offset
+    response = MagicMock()
+    response.headers = {"Date": format_datetime(server_now, usegmt=True)}
+    return response
+
+
+def _local_kst_gap() -> timedelta:
+    """로컬 naive 시간과 KST naive 시간의 차이 (테스트 환경 TZ 보정)"""
+    kst_now = datetime.now(timezone(timedelta(hours=9))).replace(tzinfo=None)
+    return kst_now - datetime.now()
+
+
+class TestClockOffset:
+    """오프셋 측정/적용 테스트"""
+
+    def test_sync_applies_offset(self, monkeypatch):
+        monkeypatch.setattr(tc.requests, "head", lambda *a, **kw: _head_response(timedelta(hours=1)))
+        assert tc.sync_clock_once() is True
+
+        expected = (timedelta(hours=1) + _local_kst_gap()).total_seconds()
+        assert abs(tc.get_clock_offset_seconds() - expected) < 2
+
+    def test_time_advances_between_calls(self, monkeypatch):
+        monkeypatch.setattr(tc.requests, "head", lambda *a, **kw: _head_response(timedelta(0)))
+        tc.sync_clock_once()
+        first = tc.get_naver_time()
+        time.sleep(0.02)
+        assert tc.get_naver_time() > first
+
+    def test_failure_keeps_previous_offset(self, monkeypatch):
+        monkeypatch.setattr(tc, "_clock_offset", timedelta(seconds=42))
+
+        def fail(*args, **kwargs):
+            raise ConnectionError("offline")
+
+        monkeypatch.setattr(tc.requests, "head", fail)
+        assert tc.sync_clock_once() is False
+        assert tc.get_clock_offset_seconds() == 42
+
+
+class TestRequestPath:
+    """요청 경로 비차단 테스트"""
+
+    def test_get_naver_time_does_not_block_on_network(self, monkeypatch):
+        release = threading.Event()
+
+        def slow_head(*args, **kwargs):
+            release.wait(5)
+            return _head_response(timedelta(0))
+
+        monkeypatch.setattr(tc.requests, "head", slow_head)
+        start = time.perf_counter()
+        now = tc.get_naver_time()
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        assert elapsed < 0.5
+        assert abs((now - datetime.now()).total_seconds()) < 1  # 측정 전: 로컬 시간
+
+    def test_off_mode_never_touches_network(self, monkeypatch):
+        monkeypatch.setattr(Config, "TIME_SYNC_MODE", "off")
+        head = MagicMock(side_effect=AssertionError("network used"))
+        monkeypatch.setattr(tc.requests, "head", head)
+
+        assert "현재 날짜" in tc.get_time_context()
+        assert tc.start_clock_sync() is False
+        assert tc._sync_thread is None
+        head.assert_not_called()
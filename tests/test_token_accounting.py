@@ -0,0 +1,159 @@
+"""
+PlanCraft - 노드/에이전트 단위 토큰 회계 테스트
+
+TokenTrackingCallback이 run 메타데이터(langgraph_node, agent_id)를 기준으로
+입력/출력/캐시 토큰, 호출 수, 지연시간, 비용을 올바르게 집계하는지 검증합니다.
+
+실행 방법:
+    pytest tests/test_token_accounting.py -v
+"""
+
+import contextvars
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from utils.streamlit_callback import TokenTrackingCallback
+from utils.token_accounting import (
+    UNATTRIBUTED,
+    agent_scope,
+    estimate_cost_usd,
+    extract_usage,
+    get_current_agent,
+)
+
+
+def _openai_result(prompt: int, completion: int, cached: int = 0) -> LLMResult:
+    """OpenAI 형식 llm_output을 가진 LLMResult 생성"""
+    return LLMResult(
+        generations=[[ChatGeneration(message=AIMessage(content="ok"))]],
+        llm_output={"token_usage": {
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "prompt_tokens_details": {"cached_tokens": cached},
+        }},
+    )
+
+
+def _simulate_call(cb: TokenTrackingCallback, result: LLMResult, metadata: dict = None):
+    run_id = uuid.uuid4()
+    cb.on_llm_start({}, ["prompt"], run_id=run_id, metadata=metadata or {})
+    cb.on_llm_end(result, run_id=run_id)
+
+
+class TestExtractUsage:
+    """LLMResult 토큰 추출 테스트"""
+
+    def test_from_llm_output(self):
+        usage = extract_usage(_openai_result(100, 20, cached=64))
+        assert usage == {"input_tokens": 100, "output_tokens": 20, "cached_tokens": 64}
+
+    def test_from_usage_metadata(self):
+        message = AIMessage(content="ok", usage_metadata={
+            "input_tokens": 50, "output_tokens": 5, "total_tokens": 55,
+            "input_token_details": {"cache_read": 32},
+        })
+        result = LLMResult(generations=[[ChatGeneration(message=message)]])
+        usage = extract_usage(result)
+        assert usage == {"input_tokens": 50, "output_tokens": 5, "cached_tokens": 32}
+
+    def test_cached_tokens_are_cheaper(self):
+        assert estimate_cost_usd(1000, 0, cached_tokens=1000) < estimate_cost_usd(1000, 0)
+
+
+class TestTokenTrackingCallback:
+    """노드/에이전트별 집계 테스트"""
+
+    def test_by_node_breakdown(self):
+        cb = TokenTrackingCallback()
+        _simulate_call(cb, _openai_result(100, 10), {"langgraph_node": "analyze"})
+        _simulate_call(cb, _openai_result(200, 20, cached=128), {"langgraph_node": "write"})
+        _simulate_call(cb, _openai_result(300, 30), {"langgraph_node": "write"})
+
+        summary = cb.get_usage_summary()
+        assert summary["input_tokens"] == 600
+        assert summary["cached_tokens"] == 128
+        assert summary["llm_calls"] == 3
+        assert summary["by_node"]["analyze"]["llm_calls"] == 1
+        assert summary["by_node"]["write"]["input_tokens"] == 500
+        assert summary["by_node"]["write"]["cached_tokens"] == 128
+        assert summary["by_node"]["write"]["latency_ms"] >= 0
+
+    def test_unattributed_node(self):
+        cb = TokenTrackingCallback()
+        _simulate_call(cb, _openai_result(10, 1))
+        assert UNATTRIBUTED in cb.get_usage_summary()["by_node"]
+
+    def test_agent_from_metadata(self):
+        cb = TokenTrackingCallback()
+        _simulate_call(cb, _openai_result(10, 1), {"langgraph_node": "run_specialists", "agent_id": "risk"})
+        assert cb.get_usage_summary()["by_agent"]["risk"]["total_tokens"] == 11
+
+    def test_agent_from_scope_in_worker_threads(self):
+        """Supervisor처럼 copy_context로 제출한 스레드에서 agent_scope 귀속"""
+        cb = TokenTrackingCallback()
+
+        def run(agent_id, prompt):
+            with agent_scope(agent_id):
+                assert get_current_agent() == agent_id
+                _simulate_call(cb, _openai_result(prompt, 1), {"langgraph_node": "run_specialists"})
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, run, "market", 100),
+                executor.submit(contextvars.copy_context().run, run, "tech", 40),
+            ]
+            for f in futures:
+                f.result()
+
+        summary = cb.get_usage_summary()
+        assert summary["by_agent"]["market"]["input_tokens"] == 100
+        assert summary["by_agent"]["tech"]["input_tokens"] == 40
+        assert summary["by_node"]["run_specialists"]["llm_calls"] == 2
+        assert get_current_agent() is None
+
+    def test_error_clears_pending_run(self):
+        cb = TokenTrackingCallback()
+        run_id = uuid.uuid4()
+        cb.on_llm_start({}, ["p"], run_id=run_id, metadata={"langgraph_node": "review"})
+        cb.on_llm_error(RuntimeError("boom"), run_id=run_id)
+        assert cb._pending_runs == {}
+        assert cb.get_usage_summary()["llm_calls"] == 1
+
+    def test_errors_recorded_in_buckets(self):
+        """실패/429 재시도 호출도 노드·에이전트별 호출 수와 지연시간에 포함 (토큰 0)"""
+        cb = TokenTrackingCallback()
+        metadata = {"langgraph_node": "run_specialists", "agent_id": "market"}
+        run_id = uuid.uuid4()
+        cb.on_llm_start({}, ["p"], run_id=run_id, metadata=metadata)
+        cb.on_llm_error(RuntimeError("429 Too Many Requests"), run_id=run_id)
+        _simulate_call(cb, _openai_result(100, 10), metadata)
+        _simulate_call(cb, _openai_result(50, 5), {"langgraph_node": "write"})
+
+        summary = cb.get_usage_summary()
+        assert summary["llm_calls"] == 3 and summary["llm_errors"] == 1
+        assert sum(node["llm_calls"] for node in summary["by_node"].values()) == summary["llm_calls"]
+        market = summary["by_agent"]["market"]
+        assert market["llm_calls"] == 2 and market["llm_errors"] == 1
+        assert market["input_tokens"] == 100
+        assert summary["by_node"]["run_specialists"]["latency_ms"] >= 0
+
+
+class TestTokenUsageApiSchema:
+    """WorkflowStatusResponse용 TokenUsage 변환 테스트"""
+
+    def test_extract_token_usage_with_breakdown(self):
+        pytest.importorskip("fastapi")
+        from api.services.workflow_service import WorkflowService
+
+        cb = TokenTrackingCallback()
+        _simulate_call(cb, _openai_result(100, 10, cached=50), {"langgraph_node": "run_specialists", "agent_id": "market"})
+
+        usage = WorkflowService()._extract_token_usage(cb.get_usage_summary())
+        assert usage.cached_tokens == 50
+        assert usage.by_node["run_specialists"].llm_calls == 1
+        assert usage.by_agent["market"].input_tokens == 100
+        assert usage.llm_errors == 0 and usage.by_node["run_specialists"].llm_errors == 0
@@ -0,0 +1,146 @@
+"""
+PlanCraft - Quality 모드 분할 작성 (Chunk Writer) 테스트
+
+실행 방법:
+    pytest tests/test_writer_chunks.py -v
+
+테스트 항목:
+    - 청크 동시 실행 (공용 실행기, 동시 실행 수 상한)
+    - 완료 순서와 무관한 목차 순서 병합 / 메타데이터는 첫 청크에서만
+    - 청크별 재시도 / 재시도 소진 시 예외 전파
+    - 기본 메시지 비변경 (deepcopy 없이 마지막 메시지만 교체)
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from agents.writer import _chunk_messages, _write_in_chunks
+from utils.settings import settings
+
+LOGGER = logging.getLogger("test_writer_chunks")
+STRUCTURE = {"title": "구조 제목", "sections": [{"title": f"섹션{i}"} for i in range(1, 8)]}
+BASE_MESSAGES = [
+    {"role": "system", "content": "시스템"},
+    {"role": "user", "content": "기획서를 작성하세요."},
+]
+
+
+def _chunk_no(messages):
+    return int(messages[-1]["content"].split("[Section Writing Phase ")[1].split("/")[0])
+
+
+class FakeChunkLLM:
+    """청크 번호별 응답 지연/실패를 제어하는 LLM"""
+
+    def __init__(self, delays=None, failures=None):
+        self.delays = delays or {}
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def invoke(self, messages):
+        chunk_no = _chunk_no(messages)
+        with self.lock:
+            self.calls.append(chunk_no)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(chunk_no, 0.05))
+            with self.lock:
+                if self.failures.get(chunk_no, 0) > 0:
+                    self.failures[chunk_no] -= 1
+                    raise RuntimeError(f"chunk {chunk_no} failed")
+            return {
+                "title": f"제목{chunk_no}",
+                "sections": [{"name": f"{chunk_no}-{i}", "content": "본문"} for i in range(3)],
+                "key_features": [f"기능{chunk_no}"],
+                "executive_summary": f"요약{chunk_no}",
+            }
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestChunkWriter:
+    """분할 작성 동시 실행 및 병합"""
+
+    def test_chunks_run_concurrently(self):
+        llm = FakeChunkLLM(delays={1: 0.3, 2: 0.3, 3: 0.3})
+
+        started = time.perf_counter()
+        draft = _write_in_chunks(llm, BASE_MESSAGES, STRUCTURE, LOGGER, session_id="t1")
+        elapsed = time.perf_counter() - started
+
+        assert sorted(llm.calls) == [1, 2, 3]
+        assert llm.max_active == 3
+        assert elapsed < 0.8  # 순차 실행이면 0.9초 이상
+        assert len(draft["sections"]) == 9
+
+    def test_parallelism_bounded(self, monkeypatch):
+        monkeypatch.setattr(settings, "WRITER_CHUNK_PARALLELISM", 2)
+        llm = FakeChunkLLM()
+
+        _write_in_chunks(llm, BASE_MESSAGES, STRUCTURE, LOGGER)
+
+        assert llm.max_active == 2
+        assert sorted(llm.calls) == [1, 2, 3]
+
+    def test_ordered_merge_and_first_chunk_metadata(self):
+        # 첫 청크가 가장 늦게 끝나도 목차 순서 유지
+        llm = FakeChunkLLM(delays={1: 0.3, 2: 0.01, 3: 0.1})
+
+        draft = _write_in_chunks(llm, BASE_MESSAGES, STRUCTURE, LOGGER)
+
+        assert [s["name"][0] for s in draft["sections"]] == ["1"] * 3 + ["2"] * 3 + ["3"] * 3
+        assert draft["title"] == "제목1"
+        assert draft["key_features"] == ["기능1"]
+        assert draft["executive_summary"] == "요약1"
+
+    def test_only_first_chunk_writes_metadata(self):
+        captured = []
+
+        class CapturingLLM(FakeChunkLLM):
+            def invoke(self, messages):
+                captured.append(messages[-1]["content"])
+                return super().invoke(messages)
+
+        _write_in_chunks(CapturingLLM(), BASE_MESSAGES, STRUCTURE, LOGGER)
+
+        by_chunk = {_chunk_no([{"content": c}]): c for c in captured}
+        assert "요약(executive_summary)도 함께 작성" in by_chunk[1]
+        assert "생략하세요" in by_chunk[2] and "생략하세요" in by_chunk[3]
+        assert "이전 섹션" not in by_chunk[2]
+
+    def test_failed_chunk_retried(self):
+        llm = FakeChunkLLM(failures={2: 1})
+
+        draft = _write_in_chunks(llm, BASE_MESSAGES, STRUCTURE, LOGGER)
+
+        assert llm.calls.count(2) == 2
+        assert len(draft["sections"]) == 9
+
+    def test_exhausted_retries_raise(self):
+        llm = FakeChunkLLM(failures={3: 5})
+
+        with pytest.raises(RuntimeError, match="chunk 3"):
+            _write_in_chunks(llm, BASE_MESSAGES, STRUCTURE, LOGGER)
+
+    def test_empty_structure_raises(self):
+        with pytest.raises(ValueError):
+            _write_in_chunks(FakeChunkLLM(), BASE_MESSAGES, {"sections": []}, LOGGER)
+
+
+class TestChunkMessages:
+    """청크 메시지 구성"""
+
+    def test_base_messages_untouched(self):
+        messages = _chunk_messages(BASE_MESSAGES, "\n추가 지시")
+
+        assert messages[-1]["content"] == "기획서를 작성하세요.\n추가 지시"
+        assert BASE_MESSAGES[-1]["content"] == "기획서를 작성하세요."
+        assert messages[0] is BASE_MESSAGES[0]  # 캐시 접두부 공유
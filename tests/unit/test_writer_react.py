@@ -242,3 +242,178 @@ class TestReactLoopIntegration:
 
         assert "[ERROR]" in result
         assert "실행 실패" in result
+
+
+# =============================================================================
+# [NEW] 같은 턴 도구 동시 실행 Tests
+# =============================================================================
+
+class TestConcurrentReactTools:
+    """같은 턴의 도구 호출 동시 실행 / 도구별 타임아웃 / 순서 유지"""
+
+    @staticmethod
+    def _sleepy_tool(seconds, result):
+        import time
+
+        tool = Mock()
+        tool.invoke.side_effect = lambda args: (time.sleep(seconds), result)[1]
+        return tool
+
+    @staticmethod
+    def _blocking_tool(wait, result):
+        tool = Mock()
+        tool.invoke.side_effect = lambda args: (wait(), result)[1]
+        return tool
+
+    def test_tools_run_concurrently_in_order(self):
+        """세 도구가 동시에 실행 중이어야 통과하는 배리어 사용, 결과는 원래 순서"""
+        import threading
+        from agents.writer import _execute_react_tools
+
+        barrier = threading.Barrier(3, timeout=5)  # 순차 실행이면 BrokenBarrierError → [ERROR]
+        tool_map = {
+            "search_web": self._blocking_tool(barrier.wait, "웹 결과"),
+            "search_rag_documents": self._blocking_tool(barrier.wait, "RAG 결과"),
+            "request_specialist_analysis": self._blocking_tool(barrier.wait, "전문 분석"),
+        }
+        calls = [{"name": name, "args": {"query": "q"}, "id": f"call_{i}"} for i, name in enumerate(tool_map)]
+
+        records = _execute_react_tools(calls, tool_map, Mock())
+
+        assert [r["result"] for r in records] == ["웹 결과", "RAG 결과", "전문 분석"]
+        assert all(r["status"] == "ok" for r in records)
+
+    def test_per_tool_timeout(self, monkeypatch):
+        """타임아웃 도구는 [TIMEOUT] 결과로 대체, 다른 도구 결과는 유지"""
+        import threading
+        import agents.writer as writer
+
+        release = threading.Event()
+        monkeypatch.setitem(writer.REACT_TOOL_TIMEOUT_SEC, "search_web", 0.1)
+        tool_map = {
+            "search_web": self._blocking_tool(lambda: release.wait(5), "늦은 결과"),
+            "search_rag_documents": self._blocking_tool(lambda: None, "RAG 결과"),
+        }
+        calls = [{"name": name, "args": {}, "id": name} for name in tool_map]
+
+        try:
+            records = writer._execute_react_tools(calls, tool_map, Mock())
+        finally:
+            release.set()
+
+        assert records[0]["status"] == "timeout"
+        assert records[0]["result"].startswith("[TIMEOUT]")
+        assert "응답 시간 초과" in records[0]["result"]
+        assert records[1]["result"] == "RAG 결과"
+
+    def test_timeout_starts_when_tool_starts(self, monkeypatch):
+        """도구 풀 대기 시간은 도구 타임아웃에 포함하지 않음 (워커 1개로 두 번째 도구가 대기)"""
+        import threading
+        import time
+        import agents.writer as writer
+        from agents.specialist_executor import reset_specialist_executor
+        from utils.settings import settings
+
+        monkeypatch.setattr(settings, "TOOL_POOL_WORKERS", 1)
+        monkeypatch.setitem(writer.REACT_TOOL_TIMEOUT_SEC, "search_web", 5)
+        monkeypatch.setitem(writer.REACT_TOOL_TIMEOUT_SEC, "search_rag_documents", 0.5)
+        reset_specialist_executor()
+
+        release = threading.Event()
+        first_started = threading.Event()
+
+        def first():
+            first_started.set()
+            release.wait(5)
+
+        tool_map = {
+            "search_web": self._blocking_tool(first, "웹 결과"),
+            "search_rag_documents": self._blocking_tool(lambda: time.sleep(0.1), "RAG 결과"),
+        }
+        calls = [{"name": name, "args": {}, "id": name} for name in tool_map]
+
+        def release_later():
+            # 두 번째 도구가 자기 타임아웃(0.5초)보다 오래 대기한 뒤 시작
+            first_started.wait(5)
+            time.sleep(0.8)
+            release.set()
+
+        releaser = threading.Thread(target=release_later)
+
+        try:
+            releaser.start()
+            records = writer._execute_react_tools(calls, tool_map, Mock())
+        finally:
+            release.set()
+            reset_specialist_executor()
+
+        assert [r["status"] for r in records] == ["ok", "ok"]
+        assert records[1]["result"] == "RAG 결과"
+
+    def test_loop_feeds_results_in_order_and_records_latency(self, monkeypatch):
+        """턴별 동시 실행 결과를 원래 순서로 전달, 한도(3개) 초과분은 실행하지 않고 writer_tool_calls 기록"""
+        from langchain_core.messages import AIMessage, ToolMessage
+        import agents.writer as writer
+        import tools.writer_tools as writer_tools
+        from utils.settings import get_preset
+
+        tools = []
+        for name in ["search_web", "search_rag_documents", "request_specialist_analysis", "extra_tool"]:
+            tool = self._sleepy_tool(0.0, f"{name} 결과")
+            tool.name = name
+            tools.append(tool)
+        monkeypatch.setattr(writer_tools, "get_writer_tools", lambda: tools)
+
+        turns = [
+            AIMessage(content="", tool_calls=[
+                {"name": tool.name, "args": {"query": "q"}, "id": f"call_{i}"} for i, tool in enumerate(tools)
+            ][start:start + 2])
+            for start in (0, 2)
+        ]
+        snapshots = []
+
+        def invoke(messages):
+            snapshots.append(list(messages))
+            return turns[len(snapshots) - 1]
+
+        llm = MagicMock()
+        llm.bind_tools.return_value.invoke.side_effect = invoke
+        llm.with_structured_output.return_value.invoke.return_value = {
+            "sections": [{"id": 1, "name": "개요", "content": "본문"}]
+        }
+        monkeypatch.setattr(writer, "get_llm", lambda **kwargs: llm)
+
+        base_messages = [{"role": "system", "content": "sys"}, {"role": "user", "content": "user"}]
+        state = writer._run_with_react_loop({}, base_messages, get_preset("balanced"), "", Mock())
+
+        tool_messages = [m for m in snapshots[1] if isinstance(m, ToolMessage)]
+        assert [(m.tool_call_id, m.content) for m in tool_messages] == [
+            ("call_0", "search_web 결과"), ("call_1", "search_rag_documents 결과")
+        ]
+        tools[3].invoke.assert_not_called()
+        assert [(c["tool"], c["turn"]) for c in state["writer_tool_calls"]] == [
+            ("search_web", 1), ("search_rag_documents", 1), ("request_specialist_analysis", 2)
+        ]
+        assert all("elapsed_ms" in c for c in state["writer_tool_calls"])
+
+    def test_writer_node_records_tool_latency(self, monkeypatch):
+        """Writer 노드: 도구 지연시간을 step_history에 기록"""
+        import graph.nodes.writer_node as writer_node
+
+        monkeypatch.setattr(writer_node, "run", lambda state: {
+            **state,
+            "draft": {"sections": [{"id": 1, "name": "개요", "content": "본문"}]},
+            "writer_tool_calls": [
+                {"tool": "search_web", "status": "ok", "elapsed_ms": 1200.0, "turn": 1},
+                {"tool": "search_rag_documents", "status": "timeout", "elapsed_ms": 800.0, "turn": 1},
+            ],
+        })
+
+        state = writer_node.run_writer_node({"structure": {"sections": []}, "step_history": []})
+
+        steps = [h["step"] for h in state["step_history"]]
+        assert steps == ["write_tools", "write"]
+        tools_entry = state["step_history"][0]
+        assert "search_web 1.20s" in tools_entry["summary"]
+        assert "search_rag_documents 0.80s(timeout)" in tools_entry["summary"]
+        assert tools_entry["execution_time"] == "1.20s"
@@ -456,6 +456,37 @@ def fetch_url_sync(url: str, max_length: int = 5000) -> str:
     return toolkit._fallback_fetch(url, max_length)
 
 
+def _fake_search(query: str, max_results: int = 5) -> Dict[str, Any]:
+    """
+    결정론적 Fake 검색 결과 (네트워크 호출 없음)
+
+    동일 쿼리 → 동일 결과. Tavily Fallback 검색과 같은 응답 형식을 반환합니다.
+    """
+    import hashlib
+
+    digest = hashlib.sha256(query.encode("utf-8")).hexdigest()[:8]
+    results = [
+        {
+            "title": f"{query[:30]} 관련 자료 {i}",
+            "url": f"https://example.com/{digest}/{i}",
+            "snippet": f"{query[:50]}에 대한 시장 규모, 성장률, 경쟁 현황 요약 ({i})",
+            "raw_content": "",
+        }
+        for i in range(1, max_results + 1)
+    ]
+    formatted = "\n\n".join(
+        f"[{i}] {r['title']}\n    URL: {r['url']}\n    내용:\n{r['snippet']}"
+        for i, r in enumerate(results, 1)
+    )
+    return {
+        "success": True,
+        "query": query,
+        "results": results,
+        "formatted": formatted,
+        "source": "fake",
+    }
+
+
 def search_sync(
     query: str,
     max_results: int = 5,
@@ -477,6 +508,10 @@ def search_sync(
     from utils.config import Config
     import shutil
 
+    # [NEW] 오프라인 Fake 검색 백엔드 (벤치마크/부하 테스트용)
+    if Config.SEARCH_BACKEND == "fake":
+        return _fake_search(query, max_results)
+
     # [수정] npx 감지 - 없으면 즉시 Fallback (Async 루프 진입 방지)
     has_npx = shutil.which("npx") is not None
 
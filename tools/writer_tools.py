@@ -80,6 +80,8 @@ def request_specialist_analysis(
         전문 에이전트의 분석 결과 (마크다운 형식)
     """
     from agents.agent_config import create_agent
+    from agents.specialist_cache import NAMESPACE_WRITER_TOOL, specialist_cache, strip_cache_marker
+    from agents.specialist_output import pop_parse_status
     from utils.file_logger import get_file_logger
 
     logger = get_file_logger()
@@ -90,12 +92,24 @@ def request_specialist_analysis(
         if agent is None:
             return f"[ERROR] '{specialist_type}' 에이전트를 찾을 수 없습니다. 사용 가능: market, bm, financial, risk, tech"
 
-        # 에이전트 실행
-        result = agent.run(
-            service_overview=context or query,
-            target_market=query if specialist_type == "market" else "",
-            target_users=query if specialist_type in ["bm", "content"] else ""
-        )
+        agent_kwargs = {
+            "service_overview": context or query,
+            "target_market": query if specialist_type == "market" else "",
+            "target_users": query if specialist_type in ["bm", "content"] else "",
+        }
+
+        # [NEW] 결과 캐시 조회 (동일 질의 반복 시 재계산 방지)
+        #       질의 기반 입력이라 Supervisor 항목과는 모양이 달라 별도 네임스페이스 사용
+        cache_key = specialist_cache.make_key(specialist_type, agent, agent_kwargs, namespace=NAMESPACE_WRITER_TOOL)
+        result = specialist_cache.get(cache_key)
+        if result is not None:
+            logger.info(f"[Writer ReAct] Specialist 캐시 적중: {specialist_type}")
+        else:
+            # 에이전트 실행
+            result = agent.run(**agent_kwargs)
+            pop_parse_status(result)
+            specialist_cache.put(cache_key, result)
+            strip_cache_marker(result)
 
         # 결과를 마크다운으로 포맷팅
         if hasattr(agent, 'format_as_markdown'):
@@ -9,9 +9,13 @@ from ui.components import (
 )
 from ui.dialogs import show_plan_dialog, show_analysis_dialog
 from ui.refinement import render_refinement_ui
+from ui.workflow_runner import refresh_polished_summaries
 
 def render_chat_and_state():
     """채팅 히스토리와 현재 상태 UI 렌더링"""
+    # [NEW] 백그라운드로 다듬어진 채팅 요약 반영
+    refresh_polished_summaries()
+
     # 채팅 히스토리
     for msg in st.session_state.chat_history:
         render_chat_message(
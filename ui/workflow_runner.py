@@ -72,6 +72,9 @@ STEP_LABELS = {
     "format": ("📋", "최종 포맷팅"),
 }
 
+# [NEW] 백그라운드로 다듬는 채팅 요약을 화면 갱신 때 다시 조회하는 최대 시간 (초)
+POLISH_REFRESH_SEC = 60
+
 
 def parse_resume_command(pending_text: str) -> Optional[Dict[str, Any]]:
     """
@@ -467,6 +470,9 @@ def _handle_plan_result(generated_plan: str, final_result: dict, status_data: di
     if token_usage and token_usage.get("total_tokens", 0) > 0:
         usage_info += f"\n📊 **토큰 사용량**: {token_usage['total_tokens']:,}개"
         usage_info += f" (입력: {token_usage['input_tokens']:,}, 출력: {token_usage['output_tokens']:,})"
+        if token_usage.get("cached_tokens", 0) > 0:
+            usage_info += f"\n♻️ **캐시 적중**: {token_usage['cached_tokens']:,}개"
+            usage_info += f" ({token_usage.get('cache_hit_ratio', 0):.0%})"
         usage_info += f"\n💰 **예상 비용**: ${token_usage['estimated_cost_usd']:.4f}"
         usage_info += f" (약 {int(token_usage['estimated_cost_krw'])}원)"
 
@@ -490,9 +496,45 @@ def _handle_plan_result(generated_plan: str, final_result: dict, status_data: di
     # 채팅 요약 추가
     chat_summary = final_result.get("chat_summary", "")
     if chat_summary:
-        st.session_state.chat_history.append({
-            "role": "assistant", "content": chat_summary, "type": "summary"
-        })
+        summary_msg = {"role": "assistant", "content": chat_summary, "type": "summary"}
+        # [NEW] Formatter가 백그라운드로 다듬는 프리셋이면 이후 화면 갱신 때 다듬은 요약으로 교체
+        if preset.chat_summary_polish == "background":
+            summary_msg["polish_thread_id"] = st.session_state.thread_id
+            summary_msg["polish_until"] = time.time() + POLISH_REFRESH_SEC
+        st.session_state.chat_history.append(summary_msg)
+
+
+def _clear_polish_pending(msg: dict):
+    """채팅 요약 메시지의 다듬기 대기 표시 제거"""
+    msg.pop("polish_thread_id", None)
+    msg.pop("polish_until", None)
+
+
+def refresh_polished_summaries():
+    """
+    [NEW] 백그라운드로 다듬어진 채팅 요약 반영
+
+    Formatter는 기획서를 먼저 반환하고 요약을 비동기로 다듬으므로, 다듬기 대기 중인
+    요약 메시지가 있으면 상태 API의 chat_summary를 조회해 내용을 교체합니다.
+    (화면 갱신 시 호출, POLISH_REFRESH_SEC가 지나면 규칙 기반 요약 유지)
+    """
+    for msg in st.session_state.get("chat_history", []):
+        thread_id = msg.get("polish_thread_id")
+        if not thread_id:
+            continue
+        if time.time() > msg.get("polish_until", 0):
+            _clear_polish_pending(msg)
+            continue
+        try:
+            res = httpx.get(f"{Config.API_BASE_URL}/workflow/status/{thread_id}", timeout=2.0)
+        except httpx.RequestError:
+            continue
+        if res.status_code != 200:
+            continue
+        polished = res.json().get("chat_summary")
+        if polished and polished != msg["content"]:
+            msg["content"] = polished
+            _clear_polish_pending(msg)
 
 
 def run_pending_workflow(pending_text: str, status_placeholder):
@@ -506,6 +548,10 @@ def run_pending_workflow(pending_text: str, status_placeholder):
     # Resume 명령 파싱
     resume_cmd = parse_resume_command(pending_text)
 
+    # [NEW] 같은 thread_id로 새 실행이 시작되면 이전 요약은 더 이상 교체하지 않음
+    for msg in st.session_state.get("chat_history", []):
+        _clear_polish_pending(msg)
+
     with status_placeholder.container():
         with st.status("🚀 작업을 수행하고 있습니다...", expanded=True) as status:
             try:
@@ -65,6 +65,22 @@ class Config:
     AOAI_DEPLOY_EMBED_LARGE = os.getenv("AOAI_DEPLOY_EMBED_3_LARGE", "text-embedding-3-large")
     AOAI_DEPLOY_EMBED_SMALL = os.getenv("AOAI_DEPLOY_EMBED_3_SMALL", "text-embedding-3-small")
     AOAI_DEPLOY_EMBED_ADA = os.getenv("AOAI_DEPLOY_EMBED_ADA", "text-embedding-ada-002")
+
+    # =========================================================================
+    # LLM 백엔드 선택 (azure | fake)
+    # =========================================================================
+    # fake: 오프라인 결정론적 LLM/Embedding (부하 테스트/벤치마크용, utils/fake_llm.py)
+    LLM_BACKEND = os.getenv("PLANCRAFT_LLM_BACKEND", "azure").lower()
+    # fake: 결정론적 웹 검색 결과 (tools/mcp_client.search_sync)
+    SEARCH_BACKEND = os.getenv("PLANCRAFT_SEARCH_BACKEND", "tavily").lower()
+
+    # =========================================================================
+    # 시간 동기화 (utils/time_context.py)
+    # =========================================================================
+    # background: 백그라운드 스레드가 주기적으로 서버 시간 오프셋 측정
+    # off: 네트워크 사용 안 함 (폐쇄망 배포) - 로컬 시스템 시간 사용
+    TIME_SYNC_MODE = os.getenv("PLANCRAFT_TIME_SYNC", "background").lower()
+    TIME_SYNC_INTERVAL_SEC = int(os.getenv("PLANCRAFT_TIME_SYNC_INTERVAL_SEC", "600"))
     
     # =========================================================================
     # LangSmith 트레이싱 설정 (Observability)
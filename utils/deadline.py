@@ -0,0 +1,127 @@
+"""
+PlanCraft Agent - 실행 마감시간(Deadline) 전파 유틸리티
+
+전문 에이전트 실행 시 Supervisor가 정한 마감시간을 에이전트 내부의 LLM 호출까지 전달합니다.
+
+- 에이전트별 예산: config/agents.yaml의 timeout_seconds
+- 계획 전체 예산: settings.PLAN_TIMEOUT_SEC (에이전트 마감시간의 상한)
+- LLM 호출: 남은 시간을 요청 타임아웃(timeout)으로 전달 → 멈춘 Azure 호출도 예산 내 종료
+- 협조적 취소: Supervisor가 Fallback으로 전환하면 cancel() → 이후 LLM 호출 전 즉시 중단
+
+사용 예시:
+    from utils.deadline import Deadline, deadline_scope, invoke_with_deadline
+
+    with deadline_scope(Deadline.after(60)):
+        response = invoke_with_deadline(llm, messages)  # timeout=남은 시간
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Optional
+
+# LLM 요청 타임아웃 하한 (0초 타임아웃 방지)
+MIN_REQUEST_TIMEOUT_SEC = 0.05
+
+
+class DeadlineExceeded(TimeoutError):
+    """마감시간 초과 또는 취소 (error_handler에서 TIMEOUT_ERROR로 분류)"""
+
+
+class Deadline:
+    """
+    단조 시계(perf_counter) 기반 마감시간 + 취소 신호
+
+    Attributes:
+        expires_at: 만료 시각 (time.perf_counter 기준)
+        budget_sec: 생성 시 부여된 예산 (로그/에러 메시지용)
+    """
+
+    def __init__(self, expires_at: float, budget_sec: float = None):
+        self.expires_at = expires_at
+        self.budget_sec = budget_sec
+        self._cancelled = threading.Event()
+
+    @classmethod
+    def after(cls, seconds: float, cap: Optional[float] = None) -> "Deadline":
+        """지금부터 seconds 후 만료 (cap: 상위 마감시각, 예: 계획 전체 마감)"""
+        expires_at = time.perf_counter() + seconds
+        if cap is not None:
+            expires_at = min(expires_at, cap)
+        return cls(expires_at, budget_sec=seconds)
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 음수 없음)"""
+        return max(0.0, self.expires_at - time.perf_counter())
+
+    def expired(self) -> bool:
+        return self._cancelled.is_set() or time.perf_counter() >= self.expires_at
+
+    def cancel(self) -> None:
+        """협조적 취소 (실행 중인 스레드는 다음 확인 지점에서 중단)"""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def check(self) -> None:
+        """만료/취소 시 DeadlineExceeded 발생"""
+        if self._cancelled.is_set():
+            raise DeadlineExceeded("Agent cancelled after deadline timeout")
+        if time.perf_counter() >= self.expires_at:
+            raise DeadlineExceeded(f"Agent deadline exceeded (timeout {self.budget_sec}s)")
+
+
+# 현재 실행 중인 에이전트의 마감시간 (스레드별 컨텍스트)
+_current_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "plancraft_current_deadline", default=None
+)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]):
+    """블록 내부의 LLM 호출에 마감시간을 적용하는 컨텍스트 매니저"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def get_current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 마감시간 반환 (없으면 None)"""
+    return _current_deadline.get()
+
+
+def check_deadline() -> None:
+    """현재 마감시간이 지났거나 취소되었으면 DeadlineExceeded 발생 (없으면 무시)"""
+    deadline = _current_deadline.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def invoke_with_deadline(llm, messages, **kwargs) -> Any:
+    """
+    현재 마감시간을 요청 타임아웃으로 전달하여 LLM을 호출합니다.
+
+    마감시간이 없으면 llm.invoke(messages)와 동일합니다.
+    AzureChatOpenAI는 invoke kwargs의 timeout을 OpenAI 요청 타임아웃으로 사용합니다.
+
+    Raises:
+        DeadlineExceeded: 호출 전 이미 만료/취소되었거나, 마감시간 초과로 요청이 실패한 경우
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return llm.invoke(messages, **kwargs)
+
+    deadline.check()
+    kwargs.setdefault("timeout", max(MIN_REQUEST_TIMEOUT_SEC, deadline.remaining()))
+    try:
+        return llm.invoke(messages, **kwargs)
+    except Exception as e:
+        # 요청 타임아웃(APITimeoutError 등)을 마감시간 초과로 통일 → 에이전트 내부 Fallback 대신 Supervisor가 처리
+        if deadline.expired():
+            raise DeadlineExceeded(f"Agent deadline exceeded (timeout {deadline.budget_sec}s)") from e
+        raise
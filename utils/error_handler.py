@@ -109,6 +109,20 @@ def categorize_error(exception: Exception) -> str:
     return "UNKNOWN_ERROR"
 
 
+# [NEW] Supervisor 동적 Replan(1회 재시도) 대상 카테고리
+RETRYABLE_ERROR_CATEGORIES = ("LLM_ERROR", "NETWORK_ERROR")
+
+
+def is_retryable_error(exception: Exception) -> bool:
+    """
+    Supervisor가 재시도할 수 있는 에러인지 여부
+
+    전문 에이전트는 이 에러를 자체 Fallback으로 삼키지 않고 다시 발생시켜
+    Supervisor의 에러 분류/재시도 경로가 적용되도록 합니다.
+    """
+    return categorize_error(exception) in RETRYABLE_ERROR_CATEGORIES
+
+
 # =============================================================================
 # 에러 핸들링 데코레이터
 # =============================================================================
@@ -0,0 +1,286 @@
+"""
+PlanCraft - 근거 자료 번들 (Evidence Bundle)
+
+web_context를 줄 단위로 잘라 {"title": "", "content": line} 목록으로 넘기던 방식은
+제목/구분선 같은 의미 없는 줄이 "검색 결과" 슬롯을 차지하고, 같은 내용이
+전문 에이전트와 Writer 프롬프트에 중복으로 들어가는 문제가 있었습니다.
+
+이 모듈은 web_sources(검색 결과), URL 직접 조회 본문, RAG 문서를 한 번만 모아
+중복을 제거한 근거 항목 목록으로 만들고, 소비자(에이전트/Writer)별 토큰 예산
+안에서 간결한 텍스트로 렌더링합니다.
+
+- 생성: fetch_web 노드 (state["evidence_bundle"], 직렬화 가능한 dict)
+- 소비: MarketAgent(web_search_results), 나머지 전문 에이전트(evidence, 에이전트별 예산),
+        Writer(참고 자료/웹 컨텍스트 슬롯), Reviewer 섹션 심사(relevant()로 섹션 관련 항목만)
+- 지표: evidence_token_stats.snapshot() → 소비자별 렌더링 토큰 수 (/metrics/specialists)
+
+사용 예시:
+    from utils.evidence_bundle import get_evidence_bundle
+
+    bundle = get_evidence_bundle(state)          # 상태에 없으면 web_sources/rag_context로 생성
+    text = bundle.render("market")               # 소비자 예산 내 렌더링 + 토큰 기록
+"""
+
+import hashlib
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.file_logger import get_file_logger
+
+logger = get_file_logger()
+
+KIND_WEB = "web"
+KIND_RAG = "rag"
+
+# 소비자별 렌더링 토큰 예산 (없는 소비자는 "default")
+CONSUMER_TOKEN_BUDGETS: Dict[str, int] = {
+    "market": 1200,
+    # [NEW] 시장 분석 외 전문 에이전트 (시장 분석 결과를 함께 받으므로 보조 근거만)
+    "bm": 600,
+    "financial": 600,
+    "risk": 600,
+    "tech": 400,
+    "content": 400,
+    "writer:web": 1500,
+    "writer:rag": 1000,
+    "reviewer:section": 600,
+    "default": 800,
+}
+
+# 항목당 본문 상한 (문자) - 한 출처가 예산을 독점하지 않도록 제한
+MAX_ITEM_CHARS = 600
+# 예산 끝에서 잘린 항목을 넣을 최소 토큰 (이보다 적게 남으면 생략)
+MIN_TRUNCATED_TOKENS = 40
+
+# fetch_web / Retriever가 문서 사이에 넣는 구분자
+_BLOCK_SEPARATOR = re.compile(r"\n\s*---\s*\n")
+# 검색 결과 content의 "- [제목](URL)" 머리줄
+_MARKDOWN_LINK_LINE = re.compile(r"^\s*-\s*\[[^\]]*\]\([^)]*\)\s*\n?")
+_URL_HEADER = re.compile(r"^\[URL 참조:\s*(?P<url>[^\]]+)\]\s*\n?")
+
+
+def estimate_tokens(text: str) -> int:
+    """오프라인 토큰 수 추정 (UTF-8 4바이트 ≈ 1토큰, Fake 백엔드와 동일 기준)"""
+    return max(1, len(text.encode("utf-8")) // 4) if text else 0
+
+
+@dataclass
+class EvidenceItem:
+    """근거 항목 하나 (검색 결과 / URL 본문 / RAG 문서)"""
+    kind: str
+    content: str
+    title: str = ""
+    url: str = ""
+
+    def render(self, index: int, max_tokens: Optional[int] = None) -> str:
+        """"[W1] 제목 (URL)" 머리줄 + 본문 (max_tokens 지정 시 본문을 잘라 맞춤)"""
+        tag = f"[{'W' if self.kind == KIND_WEB else 'R'}{index}]"
+        head = " ".join(p for p in (tag, self.title, f"({self.url})" if self.url else "") if p)
+        content = self.content
+        if max_tokens is not None:
+            content_bytes = max(0, max_tokens - estimate_tokens(head) - 1) * 4
+            content = content.encode("utf-8")[:content_bytes].decode("utf-8", errors="ignore").rstrip() + "…"
+        return f"{head}\n  {content}" if content else head
+
+
+class EvidenceTokenStats:
+    """소비자별 렌더링 토큰 카운터 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, consumer: str, tokens: int, items: int, dropped: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                consumer, {"renders": 0, "tokens": 0, "max_tokens": 0, "items": 0, "dropped_items": 0}
+            )
+            stats["renders"] += 1
+            stats["tokens"] += tokens
+            stats["max_tokens"] = max(stats["max_tokens"], tokens)
+            stats["items"] += items
+            stats["dropped_items"] += dropped
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """소비자별 {renders, tokens, avg_tokens, max_tokens, items, dropped_items}"""
+        with self._lock:
+            return {
+                consumer: {**stats, "avg_tokens": round(stats["tokens"] / stats["renders"], 1)}
+                for consumer, stats in self._stats.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+# 전역 토큰 통계 (/metrics/specialists 노출)
+evidence_token_stats = EvidenceTokenStats()
+
+
+@dataclass
+class EvidenceBundle:
+    """중복 제거된 근거 항목 목록 (state에는 to_dict() 형태로 저장)"""
+    items: List[EvidenceItem] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"items": [asdict(item) for item in self.items]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EvidenceBundle":
+        return cls(items=[EvidenceItem(**item) for item in (data or {}).get("items", [])])
+
+    def relevant(self, query: str, limit: Optional[int] = None) -> "EvidenceBundle":
+        """
+        [NEW] 질의(섹션명/본문 등)와 겹치는 용어가 많은 항목만 골라낸 번들
+
+        질의의 2글자 이상 단어가 항목 제목/본문에 포함된 개수로 순위를 매기며,
+        하나도 겹치지 않는 항목은 제외합니다. (동점이면 원래 순서 유지)
+        """
+        terms = {term.lower() for term in re.findall(r"\w{2,}", query or "")}
+        scored = []
+        for order, item in enumerate(self.items):
+            text = f"{item.title} {item.content}".lower()
+            score = sum(1 for term in terms if term in text)
+            if score:
+                scored.append((-score, order, item))
+        scored.sort(key=lambda entry: entry[:2])
+        return EvidenceBundle(items=[item for _, _, item in scored[:limit]])
+
+    def render(
+        self,
+        consumer: str,
+        kinds: Optional[Iterable[str]] = None,
+        budget: Optional[int] = None,
+    ) -> str:
+        """
+        소비자 토큰 예산 안에서 근거 항목을 순서대로 렌더링
+
+        Args:
+            consumer: 소비자 이름 (예산 조회 및 토큰 기록 키)
+            kinds: 포함할 항목 종류 (None이면 전체)
+            budget: 토큰 예산 (None이면 CONSUMER_TOKEN_BUDGETS)
+
+        Returns:
+            str: 렌더링된 근거 텍스트 (항목이 없으면 빈 문자열)
+        """
+        if budget is None:
+            budget = CONSUMER_TOKEN_BUDGETS.get(consumer, CONSUMER_TOKEN_BUDGETS["default"])
+        selected = [item for item in self.items if kinds is None or item.kind in kinds]
+
+        lines: List[str] = []
+        used = 0
+        for index, item in enumerate(selected, 1):
+            text = item.render(index)
+            tokens = estimate_tokens(text) + 1
+            if used + tokens > budget:
+                remaining = budget - used
+                if remaining >= MIN_TRUNCATED_TOKENS:
+                    # 남은 예산만큼 본문을 잘라 포함
+                    text = item.render(index, max_tokens=remaining - 1)
+                    lines.append(text)
+                    used += estimate_tokens(text) + 1
+                break
+            lines.append(text)
+            used += tokens
+
+        rendered = "\n".join(lines)
+        dropped = len(selected) - len(lines)
+        evidence_token_stats.record(consumer, estimate_tokens(rendered), len(lines), dropped)
+        if dropped:
+            logger.info(f"[Evidence] {consumer}: {len(lines)}/{len(selected)}개 항목, 약 {used} 토큰 (예산 {budget})")
+        return rendered
+
+
+# =============================================================================
+# 생성
+# =============================================================================
+
+def _fingerprint(text: str) -> str:
+    normalized = re.sub(r"\s+", " ", text).strip().lower()[:300]
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def _compact(text: str) -> str:
+    """공백 정리 + 항목 본문 상한"""
+    text = re.sub(r"[ \t]+", " ", re.sub(r"\n\s*\n+", "\n", text or "")).strip()
+    return text[:MAX_ITEM_CHARS].rstrip() + "…" if len(text) > MAX_ITEM_CHARS else text
+
+
+def build_evidence_bundle(
+    web_sources: Optional[List[dict]] = None,
+    rag_context: Optional[str] = None,
+    web_context: Optional[str] = None,
+) -> EvidenceBundle:
+    """
+    검색 결과 / URL 조회 본문 / RAG 문서로 근거 번들 생성 (URL·본문 기준 중복 제거)
+
+    Args:
+        web_sources: fetch_web의 [{"title", "url", "content"}] 목록
+        rag_context: Retriever.get_formatted_context() 결과 ("---" 구분)
+        web_context: fetch_web의 조합 문자열 (web_sources에 없는 URL 본문/Fallback 결과 보충용)
+
+    Returns:
+        EvidenceBundle
+    """
+    items: List[EvidenceItem] = []
+    seen_urls = set()
+    seen_texts = set()
+
+    def add(kind: str, content: str, title: str = "", url: str = "") -> None:
+        content = _compact(content)
+        if not content and not title:
+            return
+        fingerprint = _fingerprint(content or title)
+        if (url and url in seen_urls) or fingerprint in seen_texts:
+            return
+        if url:
+            seen_urls.add(url)
+        seen_texts.add(fingerprint)
+        items.append(EvidenceItem(kind=kind, content=content, title=(title or "").strip(), url=url))
+
+    # 1. 검색 결과 (관련도 순)
+    for source in web_sources or []:
+        content = _MARKDOWN_LINK_LINE.sub("", source.get("content") or "", count=1)
+        add(KIND_WEB, content, source.get("title", ""), source.get("url", ""))
+
+    # 2. web_sources에 없는 웹 컨텍스트 블록 (URL 직접 조회 본문, 구조화되지 않은 검색 결과)
+    for block in _BLOCK_SEPARATOR.split(web_context or ""):
+        block = block.strip()
+        if not block or any(url and url in block for url in seen_urls):
+            continue
+        url = ""
+        match = _URL_HEADER.match(block)
+        if match:
+            url = match.group("url").strip()
+            block = block[match.end():]
+        add(KIND_WEB, block, url=url)
+
+    # 3. RAG 문서
+    for index, block in enumerate(_BLOCK_SEPARATOR.split(rag_context or ""), 1):
+        if block.strip():
+            add(KIND_RAG, block, title=f"내부 자료 {index}")
+
+    return EvidenceBundle(items=items)
+
+
+def format_evidence_section(evidence: Optional[str]) -> str:
+    """[NEW] 전문 에이전트 사용자 프롬프트 끝에 붙일 근거 자료 섹션 (근거가 없으면 빈 문자열)"""
+    if not evidence:
+        return ""
+    return f"\n**참고 근거 자료 (웹 검색):**\n{evidence}\n"
+
+
+def get_evidence_bundle(state: Dict[str, Any]) -> EvidenceBundle:
+    """상태의 근거 번들 반환 (없으면 web_sources/rag_context/web_context로 생성)"""
+    data = state.get("evidence_bundle")
+    if data:
+        return EvidenceBundle.from_dict(data)
+    return build_evidence_bundle(
+        state.get("web_sources"), state.get("rag_context"), state.get("web_context")
+    )
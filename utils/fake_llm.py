@@ -0,0 +1,464 @@
+"""
+PlanCraft - 오프라인 Fake LLM / Embedding 백엔드
+
+Azure 쿼터를 소모하지 않고 전체 워크플로우를 부하 테스트/벤치마크하기 위한
+결정론적(deterministic) LLM 및 Embedding 대체 구현입니다.
+
+특징:
+    - with_structured_output(): 스키마(Pydantic) 필드 정의를 따라 유효한 인스턴스 생성
+      (utils/schemas.py의 모든 스키마 + 전문 에이전트 스키마 지원)
+    - 결정론적 응답: 동일 (seed, 모델, 프롬프트, 시도 횟수) → 동일 응답
+    - 지연시간 분포: 평균/표준편차 (ms) 기반 정규분포 샘플링
+    - 토큰 분포: 출력 토큰 평균/표준편차, 프롬프트 캐시 적중 비율
+    - 장애 주입: 일반 실패(5xx) 비율, 429 Rate Limit 비율
+    - Embedding: 토큰 해싱(Bag-of-Words) 기반 결정론적 벡터 (유사 텍스트 → 유사 벡터)
+
+활성화 방법:
+    # 환경변수 (앱/API 전체)
+    PLANCRAFT_LLM_BACKEND=fake
+    PLANCRAFT_FAKE_LATENCY_MS_MEAN=800
+    PLANCRAFT_FAKE_RATE_LIMIT_RATE=0.05
+
+    # 코드 (테스트/벤치마크)
+    from utils.llm import set_llm_backend
+    from utils.fake_llm import configure_fake_backend
+
+    configure_fake_backend(latency_ms_mean=200, failure_rate=0.1)
+    set_llm_backend("fake")
+"""
+
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+import typing
+from dataclasses import dataclass, fields, replace
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+
+
+# =============================================================================
+# 설정
+# =============================================================================
+
+@dataclass(frozen=True)
+class FakeBackendConfig:
+    """
+    Fake 백엔드 동작 설정
+
+    환경변수 PLANCRAFT_FAKE_<FIELD_NAME 대문자>로 오버라이드 가능합니다.
+    (예: PLANCRAFT_FAKE_LATENCY_MS_MEAN=500)
+    """
+    seed: int = 42
+    latency_ms_mean: float = 0.0       # LLM 호출당 평균 지연 (ms)
+    latency_ms_std: float = 0.0        # 지연 표준편차 (ms)
+    output_tokens_mean: int = 400      # 보고되는 출력 토큰 평균
+    output_tokens_std: int = 150       # 출력 토큰 표준편차
+    cached_prompt_ratio: float = 0.0   # 프롬프트 중 캐시 적중으로 보고할 비율 (0~1)
+    failure_rate: float = 0.0          # 일반 실패(5xx) 주입 비율 (0~1)
+    rate_limit_rate: float = 0.0       # 429 Rate Limit 주입 비율 (0~1)
+    embedding_dim: int = 3072          # text-embedding-3-large와 동일 차원
+    judge_score: int = 9               # Reviewer(JudgeResult) 점수
+    list_items: int = 5                # 일반 리스트 필드 항목 수
+    section_count: int = 13            # sections 필드 항목 수 (quality 프리셋 최소 섹션 충족)
+
+    @classmethod
+    def from_env(cls) -> "FakeBackendConfig":
+        overrides = {}
+        for f in fields(cls):
+            raw = os.getenv(f"PLANCRAFT_FAKE_{f.name.upper()}")
+            if raw is None:
+                continue
+            try:
+                overrides[f.name] = type(f.default)(raw)
+            except ValueError:
+                pass
+        return cls(**overrides)
+
+
+_config: FakeBackendConfig = FakeBackendConfig.from_env()
+_attempts: Dict[str, int] = {}
+_attempts_lock = threading.Lock()
+
+
+def get_fake_config() -> FakeBackendConfig:
+    """현재 Fake 백엔드 설정 반환"""
+    return _config
+
+
+def configure_fake_backend(**overrides) -> FakeBackendConfig:
+    """
+    Fake 백엔드 설정 변경 (시도 카운터 초기화 포함)
+
+    Example:
+        >>> configure_fake_backend(latency_ms_mean=300, rate_limit_rate=0.1)
+    """
+    global _config
+    _config = replace(FakeBackendConfig.from_env(), **overrides)
+    reset_fake_backend()
+    return _config
+
+
+def reset_fake_backend() -> None:
+    """프롬프트별 시도 카운터 초기화 (벤치마크 반복 실행 간 결정론 보장)"""
+    with _attempts_lock:
+        _attempts.clear()
+
+
+def _next_attempt(key: str) -> int:
+    with _attempts_lock:
+        attempt = _attempts.get(key, 0)
+        _attempts[key] = attempt + 1
+        return attempt
+
+
+def estimate_tokens(text: str) -> int:
+    """오프라인 토큰 수 추정 (UTF-8 4바이트 ≈ 1토큰)"""
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+# =============================================================================
+# 장애 주입용 예외
+# =============================================================================
+
+def _make_openai_error(status_code: int, message: str) -> Exception:
+    """openai SDK 예외 생성 (미설치 시 일반 예외로 대체)"""
+    try:
+        import httpx
+        import openai
+
+        request = httpx.Request("POST", "https://fake.plancraft.local/chat/completions")
+        response = httpx.Response(status_code, request=request)
+        error_cls = openai.RateLimitError if status_code == 429 else openai.InternalServerError
+        return error_cls(message, response=response, body=None)
+    except ImportError:
+        return ConnectionError(message)
+
+
+# =============================================================================
+# 스키마 기반 Structured Output 생성
+# =============================================================================
+
+# 워크플로우가 정상 경로(Happy Path)로 진행되도록 의미가 있는 필드 고정값
+_FIELD_OVERRIDES: Dict[str, Any] = {
+    "need_more_info": False,
+    "is_general_query": False,
+    "general_answer": None,
+    "has_gaps": False,
+    "can_proceed_with_assumptions": True,
+    "consensus_reached": True,
+    "doc_type": "web_app_plan",
+    "missing_slots": [],
+    "missing_info": [],
+    "clarification_questions": [],
+    "options": [],
+    "option_question": "",
+    "gap_requests": [],
+}
+
+_SECTION_CONTENT = """{name}에 대한 상세 내용입니다. 시장 규모는 TAM 5조 원, SAM 5,000억 원, SOM 50억 원으로 추정됩니다.
+주요 경쟁사 대비 차별점은 개인화 추천과 커뮤니티 기능입니다. BEP(손익분기점)는 18개월 차로 예상되며,
+핵심 리스크와 대응 방안은 아래와 같습니다.
+
+- 핵심 지표: MAU 10만, 유료 전환율 5%
+- 리스크: 초기 사용자 확보 지연 → 대응 방안: 제휴 마케팅
+
+```mermaid
+graph LR
+    A[사용자] --> B[서비스]
+    B --> C[가치 제공]
+```
+
+| 분기 | 매출 |
+|------|------|
+| Q1 | ▓▓▓░░ 30% |
+| Q2 | ▓▓▓▓░ 45% |
+"""
+
+
+def _field_description(field_info) -> str:
+    return (getattr(field_info, "description", None) or "").split("(")[0].strip()
+
+
+def _numeric_bounds(field_info, default_low: float, default_high: float):
+    low, high = default_low, default_high
+    for meta in getattr(field_info, "metadata", []) or []:
+        if getattr(meta, "ge", None) is not None:
+            low = meta.ge
+        if getattr(meta, "gt", None) is not None:
+            low = meta.gt
+        if getattr(meta, "le", None) is not None:
+            high = meta.le
+        if getattr(meta, "lt", None) is not None:
+            high = meta.lt
+    return low, high
+
+
+def _fake_value(annotation: Any, name: str, field_info, rng: random.Random, index: int) -> Any:
+    """타입 어노테이션에 맞는 결정론적 값 생성"""
+    config = _config
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    # Optional[X] / Union[X, None]
+    if origin is typing.Union:
+        non_none = [a for a in args if a is not type(None)]
+        return _fake_value(non_none[0], name, field_info, rng, index) if non_none else None
+
+    if origin is typing.Literal:
+        return args[index % len(args)]
+
+    if origin in (list, List):
+        item_type = args[0] if args else str
+        count = config.section_count if name == "sections" else config.list_items
+        if typing.get_origin(item_type) is typing.Literal:
+            count = min(count, len(typing.get_args(item_type)))
+        return [_fake_value(item_type, name, field_info, rng, i) for i in range(count)]
+
+    if origin in (dict, Dict):
+        value_type = args[1] if len(args) == 2 else str
+        return {
+            f"{name}_{i + 1}": _fake_value(value_type, name, field_info, rng, i)
+            for i in range(2)
+        }
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return build_fake_payload(annotation, rng, index=index)
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return list(annotation)[0].value
+
+    if annotation is bool:
+        return False
+
+    if annotation is int:
+        if name == "id":
+            return index + 1
+        if name == "overall_score":
+            return config.judge_score
+        low, high = _numeric_bounds(field_info, 1, 100)
+        return rng.randint(int(math.ceil(low)), int(math.floor(high)))
+
+    if annotation is float:
+        if name == "confidence":
+            return 0.9
+        low, high = _numeric_bounds(field_info, 0.0, 1.0)
+        return round(rng.uniform(low, high), 2)
+
+    if annotation is str:
+        if name == "verdict":
+            from utils.settings import QualityThresholds
+            if config.judge_score >= QualityThresholds.SCORE_PASS:
+                return "PASS"
+            return "REVISE" if config.judge_score >= QualityThresholds.SCORE_FAIL else "FAIL"
+        if name == "name":
+            return f"섹션 {index + 1}"
+        if name == "content":
+            return _SECTION_CONTENT.format(name=f"섹션 {index + 1}")
+        label = _field_description(field_info) or name
+        return f"{label} {index + 1} ({rng.randrange(16 ** 6):06x})"
+
+    # Any / 기타 타입
+    return f"{name} {index + 1}"
+
+
+def build_fake_payload(schema: type, rng: random.Random, index: int = 0) -> Dict[str, Any]:
+    """Pydantic 스키마의 모든 필드를 채운 dict 생성 (검증 전)"""
+    payload = {}
+    hints = typing.get_type_hints(schema)
+    for name, field_info in schema.model_fields.items():
+        if name in _FIELD_OVERRIDES:
+            payload[name] = _FIELD_OVERRIDES[name]
+            continue
+        payload[name] = _fake_value(hints.get(name, field_info.annotation), name, field_info, rng, index)
+    return payload
+
+
+def build_fake_structured_output(schema: type, seed_text: str = "") -> BaseModel:
+    """
+    스키마에 대해 검증을 통과하는 결정론적 인스턴스 생성
+
+    Args:
+        schema: Pydantic BaseModel 클래스
+        seed_text: 결정론적 난수 시드 보조 텍스트 (보통 프롬프트)
+    """
+    rng = random.Random(f"{_config.seed}:{schema.__name__}:{seed_text}")
+    return schema.model_validate(build_fake_payload(schema, rng))
+
+
+# =============================================================================
+# Fake Chat Model
+# =============================================================================
+
+_SCHEMA_REGISTRY: Dict[str, type] = {}
+
+
+def _schema_key(schema: type) -> str:
+    key = f"{schema.__module__}.{schema.__qualname__}"
+    _SCHEMA_REGISTRY[key] = schema
+    return key
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    오프라인 결정론적 Chat 모델 (AzureChatOpenAI 대체)
+
+    - invoke(): 마크다운 텍스트 응답
+    - with_structured_output(schema): 스키마 유효 인스턴스 반환
+    - bind_tools(): 도구 호출 없이 텍스트 응답 (ReAct 루프 즉시 종료)
+    - llm_output.token_usage / usage_metadata: 토큰 분포 설정에 따른 사용량 보고
+    """
+    model_name: str = "gpt-4o"
+    temperature: float = 0.7
+
+    @property
+    def _llm_type(self) -> str:
+        return "plancraft-fake"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "temperature": self.temperature}
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        config = _config
+        prompt_text = "\n".join(str(m.content) for m in messages)
+        schema_key = kwargs.get("fake_schema")
+
+        digest = hashlib.sha256(
+            f"{self.model_name}|{schema_key}|{prompt_text}".encode("utf-8")
+        ).hexdigest()
+        attempt = _next_attempt(digest)
+        rng = random.Random(f"{config.seed}:{digest}:{attempt}")
+
+        # 1. 지연시간 시뮬레이션 (요청 timeout 초과 시 OpenAI SDK처럼 타임아웃)
+        if config.latency_ms_mean > 0:
+            latency_ms = max(0.0, rng.gauss(config.latency_ms_mean, config.latency_ms_std))
+            timeout = kwargs.get("timeout")
+            if timeout is not None and latency_ms / 1000 > timeout:
+                time.sleep(timeout)
+                raise TimeoutError("Request timed out (fake backend)")
+            time.sleep(latency_ms / 1000)
+
+        # 2. 장애 주입 (429 → 5xx 순)
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            raise _make_openai_error(429, "Error code: 429 - Rate limit exceeded (fake backend)")
+        if roll < config.rate_limit_rate + config.failure_rate:
+            raise _make_openai_error(500, "Error code: 500 - Injected failure (fake backend)")
+
+        # 3. 응답 생성
+        if schema_key:
+            schema = _SCHEMA_REGISTRY[schema_key]
+            content = build_fake_structured_output(schema, prompt_text).model_dump_json()
+        else:
+            content = self._fake_text(messages, rng)
+
+        # 4. 토큰 사용량 보고
+        prompt_tokens = estimate_tokens(prompt_text)
+        completion_tokens = max(1, int(rng.gauss(config.output_tokens_mean, config.output_tokens_std)))
+        # OpenAI Prompt Caching은 128토큰 단위로 적중 (최소 1024토큰)
+        cached_tokens = int(prompt_tokens * config.cached_prompt_ratio) // 128 * 128
+        if prompt_tokens < 1024:
+            cached_tokens = 0
+
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "input_token_details": {"cache_read": cached_tokens},
+            },
+        )
+        return ChatResult(
+            generations=[ChatGeneration(message=message)],
+            llm_output={
+                "model_name": self.model_name,
+                "token_usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                    "prompt_tokens_details": {"cached_tokens": cached_tokens},
+                },
+            },
+        )
+
+    def _fake_text(self, messages: List[BaseMessage], rng: random.Random) -> str:
+        """자유형식 응답 (Formatter 요약, Discussion 발화, 검색 쿼리 생성 등)"""
+        last = str(messages[-1].content) if messages else ""
+        topic = re.sub(r"\s+", " ", last)[:40]
+
+        # JSON 배열 출력을 요구하는 프롬프트 (예: 웹 검색 쿼리 생성)
+        if any("```json\n[" in str(m.content) for m in messages):
+            return json.dumps(
+                [f"{topic} 시장 규모", f"{topic} 수익 모델", f"{topic} 규제"],
+                ensure_ascii=False,
+            )
+
+        return (
+            f"[Fake 응답 {rng.randrange(16 ** 4):04x}] '{topic}'에 대한 검토 결과입니다. "
+            "제안된 개선 계획에 동의하며 합의 완료로 진행합니다."
+        )
+
+    def with_structured_output(self, schema, *, include_raw: bool = False, **kwargs):
+        """스키마 유효 인스턴스를 반환하는 Runnable (콜백/토큰 집계 유지)"""
+        bound = self.bind(fake_schema=_schema_key(schema))
+
+        def _parse(message: AIMessage):
+            parsed = schema.model_validate_json(message.content)
+            if include_raw:
+                return {"raw": message, "parsed": parsed, "parsing_error": None}
+            return parsed
+
+        return bound | RunnableLambda(_parse)
+
+    def bind_tools(self, tools, **kwargs):
+        """도구 바인딩 (Fake 모델은 도구를 호출하지 않음)"""
+        return self.bind(fake_tools=[getattr(t, "name", str(t)) for t in tools])
+
+
+# =============================================================================
+# Fake Embeddings
+# =============================================================================
+
+class FakeEmbeddings(Embeddings):
+    """
+    결정론적 해싱 임베딩 (AzureOpenAIEmbeddings 대체)
+
+    토큰별 해시 버킷에 ±1을 누적한 뒤 L2 정규화합니다.
+    동일 텍스트 → 동일 벡터, 토큰이 겹치는 텍스트 → 높은 코사인 유사도.
+    """
+
+    def __init__(self, dim: Optional[int] = None):
+        self.dim = dim or _config.embedding_dim
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dim
+        for token in re.findall(r"\w+", text.lower()) or [text]:
+            h = int.from_bytes(hashlib.md5(token.encode("utf-8")).digest()[:8], "big")
+            vector[h % self.dim] += 1.0 if (h >> 63) & 1 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
@@ -23,6 +23,10 @@ LangChain의 AzureChatOpenAI와 AzureOpenAIEmbeddings를 래핑합니다.
     # Embedding 모델 가져오기
     embeddings = get_embeddings()
     vector = embeddings.embed_query("텍스트")
+
+[NEW] 오프라인 Fake 백엔드 (부하 테스트/벤치마크):
+    PLANCRAFT_LLM_BACKEND=fake 또는 set_llm_backend("fake")
+    → get_llm()/get_embeddings()가 utils.fake_llm의 결정론적 구현을 반환
 """
 
 from functools import lru_cache
@@ -49,6 +53,12 @@ def _get_cached_llm(model_type: str, temperature_key: int) -> AzureChatOpenAI:
         AzureChatOpenAI: 캐싱된 LLM 인스턴스
     """
     temperature = temperature_key / 100.0
+
+    # [NEW] 오프라인 Fake 백엔드
+    if Config.LLM_BACKEND == "fake":
+        from utils.fake_llm import FakeChatModel
+        return FakeChatModel(model_name=model_type, temperature=temperature)
+
     deployment_name = Config.get_model_deployment(model_type)
 
     return AzureChatOpenAI(
@@ -114,6 +124,11 @@ def get_embeddings() -> AzureOpenAIEmbeddings:
         - 동일한 텍스트는 항상 동일한 벡터를 생성합니다.
         - 싱글톤 패턴으로 인스턴스가 캐싱됩니다.
     """
+    # [NEW] 오프라인 Fake 백엔드
+    if Config.LLM_BACKEND == "fake":
+        from utils.fake_llm import FakeEmbeddings
+        return FakeEmbeddings()
+
     return AzureOpenAIEmbeddings(
         azure_endpoint=Config.AOAI_ENDPOINT,
         api_key=Config.AOAI_API_KEY,
@@ -122,6 +137,25 @@ def get_embeddings() -> AzureOpenAIEmbeddings:
     )
 
 
+def set_llm_backend(backend: str) -> None:
+    """
+    LLM 백엔드 전환 (azure | fake)
+
+    캐싱된 LLM/Embedding 인스턴스를 비워 다음 호출부터 새 백엔드가 적용됩니다.
+
+    Example:
+        >>> set_llm_backend("fake")   # 오프라인 벤치마크
+        >>> set_llm_backend("azure")  # 원복
+    """
+    backend = backend.lower()
+    if backend not in ("azure", "fake"):
+        raise ValueError(f"지원하지 않는 LLM 백엔드: {backend} (azure | fake)")
+
+    Config.LLM_BACKEND = backend
+    _get_cached_llm.cache_clear()
+    get_embeddings.cache_clear()
+
+
 # =============================================================================
 # Retry 적용 LLM (프로덕션 권장)
 # =============================================================================
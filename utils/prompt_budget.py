@@ -0,0 +1,216 @@
+"""
+PlanCraft - 프롬프트 구성 요소별 토큰 측정 및 예산 맞춤 (Prompt Budget)
+
+에이전트 프롬프트는 시스템 프롬프트, 사용자 입력, RAG/웹 근거, 전문 에이전트 분석,
+초안, 개선 지침 등을 이어 붙여 만들어지지만, 지금까지는 `[:200]`, `max_length=10000`
+같은 문자 단위 임시 자르기만 있어 실제 토큰 수와 비대해진 원인을 알 수 없었습니다.
+
+이 모듈은 이름 붙은 구성 요소를 모아 각각의 토큰 수를 측정하고, 노드별 토큰 예산을
+넘으면 우선순위가 낮은 요소부터 잘라 맞춘 뒤 호출 단위 분석 결과를 기록합니다.
+
+- 측정: utils.evidence_bundle.estimate_tokens (UTF-8 4바이트 ≈ 1토큰, Fake 백엔드와 동일 기준)
+- 예산: NODE_PROMPT_TOKEN_BUDGETS (없는 노드는 "default")
+- 자르기: 우선순위 낮은 요소 → 같은 우선순위면 뒤에 추가된 요소부터, min_tokens까지만
+          (PRIORITY_REQUIRED 요소는 자르지 않음)
+- 지표: prompt_size_stats.snapshot() → 노드/구성 요소별 토큰 (/metrics/prompts)
+
+사용 예시:
+    from utils.prompt_budget import PromptAssembler, PRIORITY_LOW, PRIORITY_REQUIRED
+
+    parts = (PromptAssembler("writer")
+        .add("system", system_prompt, PRIORITY_REQUIRED)
+        .add("rag", rag_context, PRIORITY_LOW, min_tokens=200)
+        .fit())                                  # {"system": ..., "rag": (잘렸을 수 있음)}
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from utils.evidence_bundle import estimate_tokens
+from utils.file_logger import get_file_logger
+
+logger = get_file_logger()
+
+# 우선순위 (값이 클수록 마지막까지 보존)
+PRIORITY_LOW = 1        # 참고 자료 (RAG/웹 근거, URL 목록)
+PRIORITY_MEDIUM = 2     # 보조 분석 (전문 에이전트 결과, 이전 초안 요약)
+PRIORITY_HIGH = 3       # 작업 지침 (개선 지침, 첨부 파일)
+PRIORITY_REQUIRED = 100  # 자르지 않음 (시스템 프롬프트, 정적 지침, 사용자 입력, 작성 구조, 심사 초안)
+
+# 노드별 프롬프트 토큰 예산 (없는 노드는 "default")
+NODE_PROMPT_TOKEN_BUDGETS: Dict[str, int] = {
+    "analyzer": 8000,
+    "writer": 16000,
+    "reviewer": 12000,
+    "refiner": 4000,
+    "default": 8000,
+}
+
+# /metrics/prompts에 보관할 최근 호출 분석 수
+RECENT_PROFILE_LIMIT = 50
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """max_tokens 이내로 뒷부분을 자르고 생략 표시를 붙입니다. (0 이하면 빈 문자열)"""
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+    marker = f"\n…(프롬프트 예산 초과로 약 {tokens - max_tokens:,}토큰 생략)"
+    keep_bytes = max(0, max_tokens * 4 - len(marker.encode("utf-8")))
+    kept = text.encode("utf-8")[:keep_bytes].decode("utf-8", errors="ignore").rstrip()
+    return kept + marker if kept else ""
+
+
+@dataclass
+class PromptComponent:
+    """프롬프트 구성 요소 하나"""
+    name: str
+    text: str
+    priority: int = PRIORITY_MEDIUM
+    min_tokens: int = 0
+
+
+class PromptSizeStats:
+    """노드/구성 요소별 프롬프트 토큰 카운터 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self, recent_limit: int = RECENT_PROFILE_LIMIT):
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._recent: deque = deque(maxlen=recent_limit)
+        self._lock = threading.Lock()
+
+    def record(self, profile: Dict[str, Any]) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(profile["node"], {
+                "calls": 0, "tokens": 0, "max_tokens": 0,
+                "trimmed_calls": 0, "trimmed_tokens": 0, "over_budget_calls": 0, "components": {},
+            })
+            stats["calls"] += 1
+            stats["tokens"] += profile["total_tokens"]
+            stats["max_tokens"] = max(stats["max_tokens"], profile["total_tokens"])
+            stats["trimmed_calls"] += 1 if profile["trimmed_tokens"] else 0
+            stats["trimmed_tokens"] += profile["trimmed_tokens"]
+            stats["over_budget_calls"] += 1 if profile["total_tokens"] > profile["budget"] else 0
+            for name, comp in profile["components"].items():
+                entry = stats["components"].setdefault(
+                    name, {"calls": 0, "tokens": 0, "max_tokens": 0, "trimmed_tokens": 0}
+                )
+                entry["calls"] += 1
+                entry["tokens"] += comp["tokens"]
+                entry["max_tokens"] = max(entry["max_tokens"], comp["tokens"])
+                entry["trimmed_tokens"] += comp["trimmed"]
+            self._recent.append(profile)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """노드별 {calls, tokens, avg_tokens, max_tokens, trimmed_*, components: {이름: {avg_tokens, share, ...}}}"""
+        with self._lock:
+            result = {}
+            for node, stats in self._stats.items():
+                components = {
+                    name: {
+                        **entry,
+                        "avg_tokens": round(entry["tokens"] / entry["calls"], 1),
+                        "share": round(entry["tokens"] / stats["tokens"], 3) if stats["tokens"] else 0.0,
+                    }
+                    for name, entry in stats["components"].items()
+                }
+                result[node] = {
+                    **stats,
+                    "avg_tokens": round(stats["tokens"] / stats["calls"], 1),
+                    "components": components,
+                }
+            return result
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 호출별 분석 결과 (오래된 순, limit이 None이면 전체, 0 이하면 빈 목록)"""
+        with self._lock:
+            profiles = list(self._recent)
+        if limit is None:
+            return profiles
+        return profiles[-limit:] if limit > 0 else []
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._recent.clear()
+
+
+# 전역 프롬프트 크기 통계 (/metrics/prompts 노출)
+prompt_size_stats = PromptSizeStats()
+
+
+class PromptAssembler:
+    """
+    이름 붙은 구성 요소를 모아 토큰 수를 측정하고 노드 예산에 맞춰 자릅니다.
+
+    fit()은 {이름: 텍스트}를 반환하며, 반환된 텍스트로 프롬프트 템플릿을 채웁니다.
+    같은 이름으로 다시 add()하면 기존 요소를 대체합니다.
+    """
+
+    def __init__(self, node: str, budget: Optional[int] = None, stats: Optional[PromptSizeStats] = None):
+        self.node = node
+        self.budget = budget or NODE_PROMPT_TOKEN_BUDGETS.get(node, NODE_PROMPT_TOKEN_BUDGETS["default"])
+        self.stats = stats or prompt_size_stats
+        self.components: Dict[str, PromptComponent] = {}
+        self.profile: Optional[Dict[str, Any]] = None
+
+    def add(self, name: str, text: Optional[str], priority: int = PRIORITY_MEDIUM,
+            min_tokens: int = 0) -> "PromptAssembler":
+        self.components.pop(name, None)
+        self.components[name] = PromptComponent(name, text or "", priority, min_tokens)
+        return self
+
+    def fit(self) -> Dict[str, str]:
+        """예산 초과분을 낮은 우선순위 요소부터 잘라내고, 호출 분석 결과를 기록/로깅합니다."""
+        order = list(self.components.values())
+        original = {c.name: estimate_tokens(c.text) for c in order}
+        texts = {c.name: c.text for c in order}
+        tokens = dict(original)
+
+        excess = sum(tokens.values()) - self.budget
+        trimmable = sorted(
+            (c for c in order if c.priority < PRIORITY_REQUIRED),
+            key=lambda c: (c.priority, -order.index(c)),
+        )
+        for comp in trimmable:
+            if excess <= 0:
+                break
+            keep = max(comp.min_tokens, tokens[comp.name] - excess)
+            if keep >= tokens[comp.name]:
+                continue
+            texts[comp.name] = truncate_to_tokens(texts[comp.name], keep)
+            trimmed = tokens[comp.name] - estimate_tokens(texts[comp.name])
+            tokens[comp.name] -= trimmed
+            excess -= trimmed
+
+        total = sum(tokens.values())
+        self.profile = {
+            "node": self.node,
+            "budget": self.budget,
+            "total_tokens": total,
+            "trimmed_tokens": sum(original.values()) - total,
+            "components": {
+                name: {"tokens": tokens[name], "trimmed": original[name] - tokens[name]}
+                for name in texts
+            },
+        }
+        self.stats.record(self.profile)
+        self._log()
+        return texts
+
+    def _log(self) -> None:
+        profile = self.profile
+        breakdown = " · ".join(
+            f"{name} {comp['tokens']:,}" + (f"(-{comp['trimmed']:,})" if comp["trimmed"] else "")
+            for name, comp in profile["components"].items()
+        )
+        message = f"[Prompt] {self.node} {profile['total_tokens']:,}/{self.budget:,} 토큰 | {breakdown}"
+        if profile["total_tokens"] > self.budget:
+            logger.warning(message + " (필수 요소만으로 예산 초과)")
+        elif profile["trimmed_tokens"]:
+            logger.info(message + f" (예산 맞춤 {profile['trimmed_tokens']:,}토큰 생략)")
+        else:
+            logger.debug(message)
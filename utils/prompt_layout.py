@@ -0,0 +1,86 @@
+"""
+PlanCraft Agent - Prefix Cache 친화적 메시지 구성 유틸리티
+
+OpenAI/Azure OpenAI의 Prompt Caching은 요청 간 **바이트 단위로 동일한 접두부**
+(1024 토큰 이상, 이후 128 토큰 단위)에만 적용됩니다.
+현재 시각, RAG/웹 검색 결과, 사용자 입력 같은 요청별 데이터를 시스템 프롬프트
+앞이나 중간에 끼워 넣으면 접두부가 매번 달라져 캐시가 적중하지 않습니다.
+
+메시지 배치 규칙:
+    1. system : 정적 지침 (요청 간 동일)
+    2. user   : 정적 작성 지침 (프리셋 단위 값만 포함)
+                → 요청별 입력 데이터 (사용자 입력, 구조, RAG, 웹, 전문가 분석, 피드백)
+                → 시간 컨텍스트 (매 요청 변경)
+
+재시도/Refine 시 추가되는 메시지는 항상 끝에 붙이므로 기존 접두부는 유지됩니다.
+캐시 적중량은 TokenTrackingCallback의 cached_tokens로 확인할 수 있습니다.
+
+사용 예시:
+    from utils.prompt_layout import build_cacheable_messages
+
+    messages = build_cacheable_messages(
+        system_prompt=WRITER_SYSTEM_PROMPT,
+        static_instructions=WRITER_USER_INSTRUCTIONS.format(visual_instruction=...),
+        dynamic_content=WRITER_USER_PROMPT.format(user_input=..., ...),
+    )
+"""
+
+from typing import Dict, List
+
+from utils.time_context import get_time_context, get_time_instruction
+
+# 정적 지침과 요청별 데이터의 경계 (고정 문자열 - 접두부의 일부가 됨)
+DYNAMIC_BLOCK_HEADER = """
+
+=====================================================================
+📥 이번 요청 입력 데이터 (아래 데이터를 위 지침에 따라 처리하세요)
+=====================================================================
+"""
+
+
+def build_cacheable_messages(
+    system_prompt: str,
+    dynamic_content: str,
+    static_instructions: str = "",
+    include_time: bool = True,
+) -> List[Dict[str, str]]:
+    """
+    정적 접두부 → 동적 데이터 순서로 system/user 메시지를 구성합니다.
+
+    Args:
+        system_prompt: 정적 시스템 프롬프트 (요청별 값 포함 금지)
+        dynamic_content: 요청별 데이터 (사용자 입력, RAG/웹 컨텍스트 등)
+        static_instructions: user 메시지 앞부분에 둘 정적 작성 지침
+        include_time: 시간 컨텍스트를 user 메시지 끝에 추가할지 여부
+
+    Returns:
+        List[Dict[str, str]]: [system, user] 메시지 리스트
+    """
+    user_content = ""
+    if static_instructions:
+        user_content = static_instructions.rstrip() + DYNAMIC_BLOCK_HEADER
+    user_content += dynamic_content.strip("\n")
+
+    if include_time:
+        user_content += "\n" + get_time_context() + get_time_instruction()
+
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_content},
+    ]
+
+
+def shared_prefix_length(first: List[Dict[str, str]], second: List[Dict[str, str]]) -> int:
+    """
+    두 메시지 리스트를 직렬화했을 때 공통 접두부 길이(문자 수)를 반환합니다.
+
+    프롬프트 변경이 캐시 가능한 접두부를 깨뜨리지 않는지 확인하는 진단용 함수입니다.
+    """
+    a = "".join(f"{m['role']}:{m['content']}" for m in first)
+    b = "".join(f"{m['role']}:{m['content']}" for m in second)
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
@@ -254,6 +254,20 @@ class JudgeResult(BaseModel):
         return 'REVISE'  # 기본값
 
 
+class SectionReview(BaseModel):
+    """
+    [NEW] 섹션 단위 심사 결과 (분할 심사 Map 단계 출력)
+
+    섹션별 결과는 agents/helpers/review_shards.py에서 하나의 JudgeResult로 집계됩니다.
+    """
+    score: int = Field(ge=1, le=10, description="섹션 점수 (1-10)")
+    p0_issues: List[str] = Field(default_factory=list, description="치명적 문제 (사실 오류, 근거와 모순 등)")
+    issues: List[str] = Field(default_factory=list, description="개선이 필요한 문제")
+    strengths: List[str] = Field(default_factory=list, description="잘된 점")
+    action_items: List[str] = Field(default_factory=list, description="구체적 수정 지시")
+    needs_revision: bool = Field(default=False, description="섹션 재작성 필요 여부")
+
+
 class RefinementStrategy(BaseModel):
     """
     기획서 개선 전략 (Refiner Agent Output)
@@ -359,6 +373,19 @@ class ConsensusResult(BaseModel):
     )
 
 
+class DiscussionTurn(BaseModel):
+    """
+    [NEW] Compact 토론 모드의 Reviewer 턴 (응답 + 합의 판정을 한 번의 호출로)
+
+    ConsensusResult와 같은 판정 필드에 Writer에게 보낼 Reviewer 응답(reply)을 더합니다.
+    """
+    reply: str = Field(description="Writer의 개선 계획에 대한 Reviewer 응답 (3-5문장)")
+    consensus_reached: bool = Field(description="합의 도달 여부")
+    confidence: float = Field(ge=0.0, le=1.0, description="합의 판정 신뢰도 (0.0~1.0)")
+    agreed_items: List[str] = Field(default_factory=list, description="지금까지 합의된 개선 사항 전체 목록")
+    unresolved_items: List[str] = Field(default_factory=list, description="미해결 사항 목록")
+
+
 class DataGapRequest(BaseModel):
     """
     Writer가 작성 중 발견한 데이터 부족 요청
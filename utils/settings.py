@@ -1,4 +1,6 @@
 import os
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -62,6 +64,35 @@ class GenerationPreset(BaseModel):
     web_search_depth: str = Field(default="basic", description="검색 깊이 (basic/advanced)")
     web_search_max_queries: int = Field(default=3, description="최대 검색 쿼리 수")
     market_agent_search: bool = Field(default=False, description="MarketAgent 추가 검색 허용")
+    # [NEW] 구조 설계(structure)와 전문 에이전트 분석을 병렬 실행 (Structurer 지연을 Critical Path에서 제거)
+    speculative_specialists: bool = Field(default=False, description="전문 에이전트 분석을 구조 설계와 동시에 시작")
+    # [NEW] 전문 에이전트 결과를 완료 즉시 Writer에 전달 (섹션별 분할 작성과 파이프라인 실행)
+    stream_specialists_to_writer: bool = Field(
+        default=False,
+        description="전문 에이전트 결과 스트리밍 + 준비된 섹션부터 분할 작성 (첫 작성 시 ReAct 대신 사용)"
+    )
+    # [NEW] 전문 에이전트 실행 예산 (초과 시 비용/효용 모델로 다운그레이드/생략, agents/agent_cost_model.py)
+    specialist_latency_budget_ms: Optional[int] = Field(
+        default=None, description="전문 에이전트 Critical Path 지연시간 예산 (None이면 제한 없음)"
+    )
+    specialist_token_budget: Optional[int] = Field(
+        default=None, description="전문 에이전트 토큰 예산 (gpt-4o 단가 환산, None이면 제한 없음)"
+    )
+    specialist_downgrade_model: Optional[str] = Field(
+        default=None, description="예산 초과 시 다운그레이드 모델 (None이면 생략만)"
+    )
+    # [NEW] 긴 초안은 섹션별 병렬 심사 후 집계 (agents/helpers/review_shards.py)
+    review_shard_min_chars: Optional[int] = Field(
+        default=None, description="이 글자 수 이상인 초안은 섹션 분할 심사 (None이면 단일 심사)"
+    )
+    # [NEW] 규칙 기반 사전 심사를 통과한 깨끗한 초안의 심사 모델 (agents/helpers/review_gate.py)
+    review_clean_model: Optional[str] = Field(
+        default=None, description="사전 심사 통과 초안의 경량 심사 모델 (None이면 model_type)"
+    )
+    # [NEW] 채팅 요약 LLM 다듬기 (요약 자체는 규칙 기반으로 즉시 생성, agents/formatter.py)
+    chat_summary_polish: str = Field(
+        default="off", description="채팅 요약 LLM 다듬기 (off: 사용 안 함, background: 반환 후 비동기, sync: 반환 전)"
+    )
 
 
 # 프리셋 정의
@@ -96,6 +127,9 @@ GENERATION_PRESETS = {
         web_search_depth="basic",
         web_search_max_queries=3,
         market_agent_search=False,
+        speculative_specialists=True,  # [NEW] 구조 설계와 병렬 실행
+        review_clean_model="gpt-4o-mini",  # [NEW] 사전 심사 통과 초안은 경량 모델로 심사
+        chat_summary_polish="background",  # [NEW] 기획서 먼저 반환, 요약은 비동기로 다듬기
     ),
     "fast": GenerationPreset(
         name="빠른 생성",
@@ -117,6 +151,10 @@ GENERATION_PRESETS = {
         web_search_depth="basic",
         web_search_max_queries=1,
         market_agent_search=False,
+        # [NEW] 전문 에이전트 예산: 초과분은 gpt-4o-mini 다운그레이드 → 저효용 에이전트 생략
+        specialist_latency_budget_ms=25000,
+        specialist_token_budget=6000,
+        specialist_downgrade_model="gpt-4o-mini",
     ),
     "quality": GenerationPreset(
         name="고품질",
@@ -147,6 +185,10 @@ GENERATION_PRESETS = {
         web_search_depth="advanced",
         web_search_max_queries=5,
         market_agent_search=True,  # MarketAgent 추가 검색 허용
+        speculative_specialists=True,  # [NEW] 구조 설계와 병렬 실행
+        stream_specialists_to_writer=True,  # [NEW] 섹션별 분할 작성을 전문 에이전트 실행과 파이프라인
+        review_shard_min_chars=12000,  # [NEW] 긴 초안은 섹션 분할 심사
+        chat_summary_polish="background",  # [NEW] 기획서 먼저 반환, 요약은 비동기로 다듬기
     ),
 }
 
@@ -264,6 +306,9 @@ class ProjectSettings(BaseModel):
     
     DISCUSSION_MAX_ROUNDS: int = Field(default=2, description="Reviewer-Writer 대화 최대 라운드 (데모 효과 강화)")
     DISCUSSION_SKIP_THRESHOLD: int = Field(default=9, description="Discussion 건너뛰기 점수 (9점 미만은 무조건 토론)")
+    DISCUSSION_COMPACT: bool = Field(
+        default=True, description="Compact 토론 모드 (Reviewer 응답 + 합의 판정을 라운드당 1회 호출로, 합의 사항 수렴 시 조기 종료)"
+    )
 
     # === HITL (Human-in-the-Loop) Settings ===
     HITL_MAX_RETRIES: int = Field(default=5, description="사용자 입력 유효성 검사 최대 재시도 횟수")
@@ -276,7 +321,23 @@ class ProjectSettings(BaseModel):
 
     # === Supervisor Settings ===
     MAX_PARALLEL_AGENTS: int = Field(default=5, description="Supervisor 최대 병렬 실행 에이전트 수")
-    AGENT_TIMEOUT_SEC: int = Field(default=60, description="전문 에이전트 실행 타임아웃 (초)")
+    AGENT_TIMEOUT_SEC: int = Field(default=60, description="전문 에이전트 실행 타임아웃 (초, agents.yaml에 timeout_seconds가 없을 때)")
+    PLAN_TIMEOUT_SEC: int = Field(default=240, description="전문 에이전트 실행 계획 전체 마감시간 (초)")
+    SPECIALIST_CACHE_TTL_SEC: int = Field(default=3600, description="전문 에이전트 결과 캐시 유효시간 (초, 0이면 비활성화)")
+    SPECIALIST_CACHE_MAX_ENTRIES: int = Field(default=256, description="전문 에이전트 결과 캐시 최대 항목 수")
+    SECTION_CACHE_TTL_SEC: int = Field(default=3600, description="[NEW] 섹션 단위 초안 캐시 유효시간 (초, 0이면 비활성화)")
+    SECTION_CACHE_MAX_ENTRIES: int = Field(default=512, description="[NEW] 섹션 단위 초안 캐시 최대 항목 수")
+    SPECIALIST_POOL_WORKERS: int = Field(default=8, description="전문 에이전트 공용 워커 풀 크기 (프로세스 전체)")
+    FANOUT_POOL_WORKERS: int = Field(default=8, description="[NEW] Writer 분할 작성/Reviewer 분할 심사 공용 워커 풀 크기")
+    TOOL_POOL_WORKERS: int = Field(default=4, description="[NEW] Writer ReAct 도구 호출 워커 풀 크기")
+    BACKGROUND_POOL_WORKERS: int = Field(default=2, description="[NEW] 응답 이후 후처리(요약 다듬기 등) 워커 풀 크기")
+    PREFETCH_POOL_WORKERS: int = Field(default=4, description="[NEW] 구조 설계와 병렬로 시작하는 전문 에이전트 선행 실행 워커 풀 크기")
+    WRITER_CHUNK_PARALLELISM: int = Field(default=4, description="Quality 분할 작성 시 요청당 동시 작성 청크 수")
+    REVIEWER_SHARD_PARALLELISM: int = Field(default=4, description="분할 심사 시 요청당 동시 심사 섹션 수")
+    AGENT_STATS_DB_PATH: str = Field(
+        default="./data/agent_stats.db",
+        description="전문 에이전트 실행 이력 SQLite 경로 (\":memory:\"면 프로세스 내 메모리)"
+    )
 
     def get_effective_settings(self) -> dict:
         """
@@ -348,6 +409,61 @@ class ProjectSettings(BaseModel):
             except ValueError:
                 pass
 
+        if plan_timeout := os.getenv("PLANCRAFT_PLAN_TIMEOUT"):
+            try:
+                overrides["PLAN_TIMEOUT_SEC"] = int(plan_timeout)
+            except ValueError:
+                pass
+
+        if cache_ttl := os.getenv("PLANCRAFT_SPECIALIST_CACHE_TTL"):
+            try:
+                overrides["SPECIALIST_CACHE_TTL_SEC"] = int(cache_ttl)
+            except ValueError:
+                pass
+
+        if section_ttl := os.getenv("PLANCRAFT_SECTION_CACHE_TTL"):
+            try:
+                overrides["SECTION_CACHE_TTL_SEC"] = int(section_ttl)
+            except ValueError:
+                pass
+
+        if pool_workers := os.getenv("PLANCRAFT_SPECIALIST_WORKERS"):
+            try:
+                overrides["SPECIALIST_POOL_WORKERS"] = int(pool_workers)
+            except ValueError:
+                pass
+
+        # [NEW] 용도별 워커 풀 크기
+        for env_name, field_name in (
+            ("PLANCRAFT_FANOUT_WORKERS", "FANOUT_POOL_WORKERS"),
+            ("PLANCRAFT_TOOL_WORKERS", "TOOL_POOL_WORKERS"),
+            ("PLANCRAFT_BACKGROUND_WORKERS", "BACKGROUND_POOL_WORKERS"),
+            ("PLANCRAFT_PREFETCH_WORKERS", "PREFETCH_POOL_WORKERS"),
+        ):
+            if workers := os.getenv(env_name):
+                try:
+                    overrides[field_name] = int(workers)
+                except ValueError:
+                    pass
+
+        if chunk_parallelism := os.getenv("PLANCRAFT_WRITER_CHUNK_PARALLELISM"):
+            try:
+                overrides["WRITER_CHUNK_PARALLELISM"] = int(chunk_parallelism)
+            except ValueError:
+                pass
+
+        if shard_parallelism := os.getenv("PLANCRAFT_REVIEWER_SHARD_PARALLELISM"):
+            try:
+                overrides["REVIEWER_SHARD_PARALLELISM"] = int(shard_parallelism)
+            except ValueError:
+                pass
+
+        if compact := os.getenv("PLANCRAFT_DISCUSSION_COMPACT"):
+            overrides["DISCUSSION_COMPACT"] = compact.lower() not in ("0", "false", "no")
+
+        if stats_db := os.getenv("PLANCRAFT_AGENT_STATS_DB"):
+            overrides["AGENT_STATS_DB_PATH"] = stats_db
+
         return cls(**overrides)
 
 
@@ -1,55 +1,119 @@
 import time
+import threading
 from typing import Any, Dict, List, Optional
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
-# 토큰당 비용 (USD) - GPT-4o 기준
-COST_PER_INPUT_TOKEN = 2.5 / 1_000_000  # $2.5 per 1M tokens
-COST_PER_OUTPUT_TOKEN = 10 / 1_000_000  # $10 per 1M tokens
+from utils.token_accounting import (
+    COST_PER_INPUT_TOKEN,
+    COST_PER_OUTPUT_TOKEN,
+    USD_TO_KRW,
+    UNATTRIBUTED,
+    UsageBucket,
+    cache_hit_ratio,
+    estimate_cost_usd,
+    extract_usage,
+    get_current_agent,
+)
 
 
 class TokenTrackingCallback(BaseCallbackHandler):
     """
     API 환경에서 토큰 사용량을 추적하는 콜백.
     Streamlit 의존성 없이 토큰 사용량만 추적합니다.
+
+    [NEW] run 메타데이터 기반 노드/에이전트별 집계
+    - 노드: metadata["langgraph_node"]
+    - 에이전트: metadata["agent_id"] 또는 utils.token_accounting.agent_scope()
+    - 입력/출력/캐시 토큰, 호출 수, 지연시간, 비용
+    - 실패한 호출도 노드/에이전트별 호출 수·지연시간에 포함 (llm_errors, 토큰 0)
+      → 노드별 llm_calls 합계 = 전체 llm_calls
     """
 
     def __init__(self):
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cached_tokens = 0
         self.llm_call_count = 0
+        self.llm_error_count = 0
+
+        # [NEW] 노드/에이전트별 집계 (병렬 에이전트 대비 Lock 보호)
+        self._lock = threading.Lock()
+        self._pending_runs: Dict[Any, Dict[str, Any]] = {}
+        self.by_node: Dict[str, UsageBucket] = {}
+        self.by_agent: Dict[str, UsageBucket] = {}
 
     def on_llm_start(
         self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any
     ) -> None:
-        """LLM 호출 시작"""
-        self.llm_call_count += 1
+        """LLM 호출 시작 - 귀속 정보(노드/에이전트)와 시작 시각 기록"""
+        metadata = kwargs.get("metadata") or {}
+        run_info = {
+            "node": metadata.get("langgraph_node") or UNATTRIBUTED,
+            "agent": metadata.get("agent_id") or get_current_agent(),
+            "start": time.perf_counter(),
+        }
+        with self._lock:
+            self.llm_call_count += 1
+            self._pending_runs[kwargs.get("run_id")] = run_info
 
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """LLM 호출 완료 - 토큰 추적"""
         try:
-            if response.llm_output:
-                usage = response.llm_output.get("token_usage", {})
-                self.total_input_tokens += usage.get("prompt_tokens", 0)
-                self.total_output_tokens += usage.get("completion_tokens", 0)
+            self._record(kwargs.get("run_id"), extract_usage(response))
         except Exception:
             pass
 
-    def get_usage_summary(self) -> dict:
-        """토큰 사용량 요약"""
-        total_tokens = self.total_input_tokens + self.total_output_tokens
-        estimated_cost = (
-            self.total_input_tokens * COST_PER_INPUT_TOKEN +
-            self.total_output_tokens * COST_PER_OUTPUT_TOKEN
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        """LLM 호출 실패 - 토큰 0, 지연시간과 실패 횟수만 노드/에이전트별로 기록"""
+        self._record(
+            kwargs.get("run_id"), {"input_tokens": 0, "output_tokens": 0, "cached_tokens": 0}, error=True
         )
-        return {
-            "input_tokens": self.total_input_tokens,
-            "output_tokens": self.total_output_tokens,
-            "total_tokens": total_tokens,
-            "llm_calls": self.llm_call_count,
-            "estimated_cost_usd": round(estimated_cost, 4),
-            "estimated_cost_krw": round(estimated_cost * 1350, 0)
-        }
+
+    def _record(self, run_id: Any, usage: Dict[str, int], error: bool = False) -> None:
+        """대기 중인 run을 꺼내 전체/노드/에이전트별로 집계"""
+        with self._lock:
+            run_info = self._pending_runs.pop(run_id, None) or {
+                "node": UNATTRIBUTED, "agent": get_current_agent(), "start": None
+            }
+            latency_ms = (
+                (time.perf_counter() - run_info["start"]) * 1000
+                if run_info["start"] is not None else 0.0
+            )
+
+            self.total_input_tokens += usage["input_tokens"]
+            self.total_output_tokens += usage["output_tokens"]
+            self.total_cached_tokens += usage["cached_tokens"]
+            self.llm_error_count += 1 if error else 0
+
+            self.by_node.setdefault(run_info["node"], UsageBucket()).add(
+                latency_ms=latency_ms, error=error, **usage
+            )
+            if run_info["agent"]:
+                self.by_agent.setdefault(run_info["agent"], UsageBucket()).add(
+                    latency_ms=latency_ms, error=error, **usage
+                )
+
+    def get_usage_summary(self) -> dict:
+        """토큰 사용량 요약 (노드/에이전트별 breakdown 포함)"""
+        with self._lock:
+            total_tokens = self.total_input_tokens + self.total_output_tokens
+            estimated_cost = estimate_cost_usd(
+                self.total_input_tokens, self.total_output_tokens, self.total_cached_tokens
+            )
+            return {
+                "input_tokens": self.total_input_tokens,
+                "output_tokens": self.total_output_tokens,
+                "cached_tokens": self.total_cached_tokens,
+                "cache_hit_ratio": cache_hit_ratio(self.total_input_tokens, self.total_cached_tokens),
+                "total_tokens": total_tokens,
+                "llm_calls": self.llm_call_count,
+                "llm_errors": self.llm_error_count,
+                "estimated_cost_usd": round(estimated_cost, 4),
+                "estimated_cost_krw": round(estimated_cost * USD_TO_KRW, 0),
+                "by_node": {k: v.to_dict() for k, v in self.by_node.items()},
+                "by_agent": {k: v.to_dict() for k, v in self.by_agent.items()},
+            }
 
 # 단계별 표시 정보 (key, icon, label, progress%)
 STEP_INFO = {
@@ -64,7 +128,7 @@ STEP_INFO = {
 }
 
 
-class StreamlitStatusCallback(BaseCallbackHandler):
+class StreamlitStatusCallback(TokenTrackingCallback):
     """
     LangChain/LangGraph 실행 과정을 Streamlit st.status에 실시간 표시.
 
@@ -77,6 +141,7 @@ class StreamlitStatusCallback(BaseCallbackHandler):
     """
 
     def __init__(self, status_container):
+        super().__init__()  # 토큰 추적 (노드/에이전트별 집계 포함)
         self.status = status_container
         self.start_time = time.time()
 
@@ -88,11 +153,6 @@ class StreamlitStatusCallback(BaseCallbackHandler):
         self.current_step_key: Optional[str] = None
         self.step_start_time: Optional[float] = None
 
-        # 토큰 추적
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
-        self.llm_call_count = 0
-
     def set_step(self, step_key: str):
         """현재 단계 설정 - label과 progress 실시간 업데이트"""
         # 이전 단계 완료 기록
@@ -147,24 +207,9 @@ class StreamlitStatusCallback(BaseCallbackHandler):
 
     # =========================================================================
     # LangChain 콜백 메서드
+    # (on_llm_start/on_llm_end 토큰 추적은 TokenTrackingCallback에서 상속)
     # =========================================================================
 
-    def on_llm_start(
-        self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any
-    ) -> None:
-        """LLM 호출 시작"""
-        self.llm_call_count += 1
-
-    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
-        """LLM 호출 완료 - 토큰 추적"""
-        try:
-            if response.llm_output:
-                usage = response.llm_output.get("token_usage", {})
-                self.total_input_tokens += usage.get("prompt_tokens", 0)
-                self.total_output_tokens += usage.get("completion_tokens", 0)
-        except Exception:
-            pass
-
     def on_tool_start(
         self, serialized: Dict[str, Any], input_str: str, **kwargs: Any
     ) -> None:
@@ -177,22 +222,6 @@ class StreamlitStatusCallback(BaseCallbackHandler):
         """하위 호환용"""
         pass
 
-    def get_usage_summary(self) -> dict:
-        """토큰 사용량 요약"""
-        total_tokens = self.total_input_tokens + self.total_output_tokens
-        estimated_cost = (
-            self.total_input_tokens * COST_PER_INPUT_TOKEN +
-            self.total_output_tokens * COST_PER_OUTPUT_TOKEN
-        )
-        return {
-            "input_tokens": self.total_input_tokens,
-            "output_tokens": self.total_output_tokens,
-            "total_tokens": total_tokens,
-            "llm_calls": self.llm_call_count,
-            "estimated_cost_usd": round(estimated_cost, 4),
-            "estimated_cost_krw": round(estimated_cost * 1350, 0)
-        }
-
     def get_execution_summary(self) -> List[dict]:
         """실행 로그 요약"""
         return [
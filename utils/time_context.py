@@ -2,65 +2,165 @@
 PlanCraft Agent - 시간 컨텍스트 유틸리티
 
 LLM에게 현재 날짜/시간을 정확히 전달하기 위한 공통 모듈입니다.
-네이버 타임 서버에서 정확한 시간을 가져와 사용합니다.
+네이버 타임 서버와 로컬 시계의 오프셋을 백그라운드에서 주기적으로 측정하고,
+요청 경로에서는 네트워크 I/O 없이 `로컬 시간 + 오프셋`을 반환합니다.
+
+설정 (utils/config.py):
+    PLANCRAFT_TIME_SYNC=background   # 기본값: 백그라운드 오프셋 동기화
+    PLANCRAFT_TIME_SYNC=off          # 폐쇄망: 네트워크 미사용, 로컬 시간 사용
+    PLANCRAFT_TIME_SYNC_INTERVAL_SEC=600
 """
 
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
 import requests
 
-# 캐싱: 동일 실행 내에서 시간 서버 재호출 방지
-_cached_time = None
+TIME_SERVER_URL = "https://www.naver.com"
+TIME_SERVER_TIMEOUT_SEC = 3
+# 측정 실패 시 재시도 간격 (동기화 주기보다 짧게)
+RETRY_INTERVAL_SEC = 60
 
+_KST = timezone(timedelta(hours=9))
 
-def get_naver_time() -> datetime:
+# 서버(KST) 시간 - 로컬 시간. None이면 아직 측정 전 (로컬 시간 사용)
+_clock_offset: Optional[timedelta] = None
+_last_sync_at: Optional[float] = None
+_sync_lock = threading.Lock()
+_sync_thread: Optional[threading.Thread] = None
+_stop_event = threading.Event()
+
+
+def _measure_offset() -> Optional[timedelta]:
     """
-    네이버 타임 서버에서 현재 시간을 가져옵니다.
-    
-    실패 시 로컬 시스템 시간을 반환합니다.
-    
+    타임 서버의 Date 헤더로 로컬 시계 오프셋을 1회 측정합니다. (네트워크 I/O)
+
+    왕복 시간의 중간 지점을 서버 응답 시각으로 간주합니다.
+    Date 헤더는 초 단위이므로 오프셋 정확도는 약 ±1초입니다.
+
     Returns:
-        datetime: 현재 시간
+        timedelta: 서버(KST) - 로컬 시간, 실패 시 None
+    """
+    sent_at = datetime.now()
+    response = requests.head(TIME_SERVER_URL, timeout=TIME_SERVER_TIMEOUT_SEC)
+    received_at = datetime.now()
+
+    date_str = response.headers.get("Date")
+    if not date_str:
+        return None
+
+    # HTTP Date 형식: "Sun, 29 Dec 2025 05:20:00 GMT" → KST
+    server_time = parsedate_to_datetime(date_str).astimezone(_KST).replace(tzinfo=None)
+    midpoint = sent_at + (received_at - sent_at) / 2
+    return server_time - midpoint
+
+
+def sync_clock_once() -> bool:
     """
-    global _cached_time
-    
-    # 캐시된 시간이 있고, 10분 이내면 재사용
-    if _cached_time:
-        diff = (datetime.now() - _cached_time).total_seconds()
-        if diff < 600:  # 10분
-            return _cached_time
-    
+    오프셋을 즉시 1회 측정하여 반영합니다. (블로킹 - 요청 경로에서 호출 금지)
+
+    Returns:
+        bool: 측정 성공 여부
+    """
+    global _clock_offset, _last_sync_at
+
     try:
-        # 네이버 메인 페이지에서 서버 시간 헤더 추출
-        response = requests.head("https://www.naver.com", timeout=3)
-        date_str = response.headers.get("Date")
-        
-        if date_str:
-            # HTTP Date 형식: "Sun, 29 Dec 2025 05:20:00 GMT"
-            from email.utils import parsedate_to_datetime
-            server_time = parsedate_to_datetime(date_str)
-            # GMT → KST 변환 (+9시간)
-            from datetime import timedelta, timezone
-            kst = timezone(timedelta(hours=9))
-            _cached_time = server_time.astimezone(kst).replace(tzinfo=None)
-            return _cached_time
+        offset = _measure_offset()
     except Exception as e:
-        print(f"[TIME] 네이버 타임 서버 조회 실패, 로컬 시간 사용: {e}")
-    
-    # Fallback: 로컬 시스템 시간
-    return datetime.now()
+        print(f"[TIME] 타임 서버 오프셋 측정 실패, 기존 값 유지: {e}")
+        return False
+
+    if offset is None:
+        return False
+
+    with _sync_lock:
+        _clock_offset = offset
+        _last_sync_at = time.monotonic()
+    return True
+
+
+def _sync_loop(interval_sec: float) -> None:
+    """백그라운드 동기화 루프 (데몬 스레드)"""
+    while not _stop_event.is_set():
+        ok = sync_clock_once()
+        _stop_event.wait(interval_sec if ok else min(interval_sec, RETRY_INTERVAL_SEC))
+
+
+def start_clock_sync(interval_sec: float = None) -> bool:
+    """
+    백그라운드 오프셋 동기화 스레드를 시작합니다. (이미 실행 중이면 무시)
+
+    TIME_SYNC_MODE가 "off"이면 스레드를 시작하지 않습니다.
+
+    Returns:
+        bool: 스레드 실행 여부
+    """
+    global _sync_thread
+    from utils.config import Config
+
+    if Config.TIME_SYNC_MODE == "off":
+        return False
+
+    with _sync_lock:
+        if _sync_thread and _sync_thread.is_alive():
+            return True
+        _stop_event.clear()
+        _sync_thread = threading.Thread(
+            target=_sync_loop,
+            args=(interval_sec or Config.TIME_SYNC_INTERVAL_SEC,),
+            name="plancraft-clock-sync",
+            daemon=True,
+        )
+        _sync_thread.start()
+    return True
+
+
+def stop_clock_sync(timeout: float = None) -> None:
+    """백그라운드 동기화 스레드 종료"""
+    _stop_event.set()
+    thread = _sync_thread
+    if thread and thread.is_alive():
+        thread.join(timeout)
+
+
+def get_clock_offset_seconds() -> Optional[float]:
+    """현재 적용 중인 오프셋(초), 측정 전이면 None"""
+    offset = _clock_offset
+    return offset.total_seconds() if offset is not None else None
+
+
+def get_naver_time() -> datetime:
+    """
+    현재 시간을 반환합니다. (네트워크 I/O 없음)
+
+    백그라운드 동기화로 측정된 오프셋을 로컬 시간에 더해 반환합니다.
+    첫 호출 시 동기화 스레드를 시작하며, 측정 전이거나 off 모드이면 로컬 시스템 시간을 반환합니다.
+
+    Returns:
+        datetime: 현재 시간
+    """
+    if _sync_thread is None:
+        start_clock_sync()
+
+    offset = _clock_offset
+    now = datetime.now()
+    return now + offset if offset is not None else now
 
 
 def get_time_context() -> str:
     """
     현재 시간 컨텍스트를 반환합니다.
-    
+
     모든 Agent 프롬프트에 주입하여 LLM이 정확한 날짜/시간을 인식하도록 합니다.
-    
+
     Returns:
-        str: 시간 컨텍스트 문자열 (시스템 프롬프트 상단에 추가)
+        str: 시간 컨텍스트 문자열 (user 메시지 끝에 추가, utils/prompt_layout.py 참고)
     """
     now = get_naver_time()
-    
+
     return f"""
 === 🕐 현재 시간 정보 (CRITICAL) ===
 현재 날짜: {now.strftime("%Y년 %m월 %d일")}
@@ -69,7 +169,7 @@ def get_time_context() -> str:
 현재 분기: Q{(now.month - 1) // 3 + 1}
 
 ⚠️ 중요: 모든 일정, 로드맵, 타임라인은 위 날짜를 기준으로 작성하세요.
-- "{now.year}년 {now.month + 1 if now.month < 12 else 1}월 출시" (O) 
+- "{now.year}년 {now.month + 1 if now.month < 12 else 1}월 출시" (O)
 - "2024년" 또는 과거 날짜 사용 금지 (X)
 - 오늘 이후의 미래 날짜만 사용하세요.
 =====================================
@@ -80,11 +180,11 @@ def get_time_context() -> str:
 def get_time_instruction() -> str:
     """
     시간 관련 명시적 지시를 반환합니다.
-    
+
     User 프롬프트 끝에 추가하여 날짜 정확성을 강조합니다.
     """
     now = get_naver_time()
-    
+
     return f"""
 
 ⏰ 날짜 확인: 오늘은 {now.year}년 {now.month}월 {now.day}일입니다.
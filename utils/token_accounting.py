@@ -0,0 +1,134 @@
+"""
+PlanCraft - 노드/에이전트 단위 토큰 회계 (Token Accounting)
+
+LangChain 콜백의 run 메타데이터를 이용해 LLM 호출을 노드(langgraph_node)와
+전문 에이전트(agent_id) 단위로 귀속시키고, 입력/출력/캐시 토큰, 호출 수,
+지연시간, 비용을 집계합니다.
+
+귀속 규칙:
+    - 노드: 콜백 metadata["langgraph_node"] (LangGraph가 자동 주입)
+    - 에이전트: metadata["agent_id"] 우선, 없으면 agent_scope() 컨텍스트 변수
+      (Supervisor가 ThreadPoolExecutor 안에서 에이전트를 실행할 때 설정)
+
+사용 예시:
+    from utils.token_accounting import agent_scope
+
+    with agent_scope("market"):
+        result = market_agent.run(...)   # 이 안의 LLM 호출은 "market"으로 집계
+"""
+
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+# 토큰당 비용 (USD) - GPT-4o 기준
+COST_PER_INPUT_TOKEN = 2.5 / 1_000_000  # $2.5 per 1M tokens
+COST_PER_CACHED_INPUT_TOKEN = 1.25 / 1_000_000  # $1.25 per 1M tokens (Prompt Caching 할인)
+COST_PER_OUTPUT_TOKEN = 10 / 1_000_000  # $10 per 1M tokens
+USD_TO_KRW = 1350
+
+UNATTRIBUTED = "_unattributed"
+
+# 현재 실행 중인 전문 에이전트 ID (스레드별 컨텍스트)
+_current_agent: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "plancraft_current_agent", default=None
+)
+
+
+@contextmanager
+def agent_scope(agent_id: str):
+    """블록 내부의 LLM 호출을 지정한 에이전트로 귀속시키는 컨텍스트 매니저"""
+    token = _current_agent.set(agent_id)
+    try:
+        yield
+    finally:
+        _current_agent.reset(token)
+
+
+def get_current_agent() -> Optional[str]:
+    """현재 컨텍스트의 에이전트 ID 반환 (없으면 None)"""
+    return _current_agent.get()
+
+
+def estimate_cost_usd(input_tokens: int, output_tokens: int, cached_tokens: int = 0) -> float:
+    """
+    토큰 수 기반 예상 비용 계산 (USD)
+
+    cached_tokens는 input_tokens에 포함된 값이며, 캐시 단가로 재계산됩니다.
+    """
+    cached = min(cached_tokens, input_tokens)
+    return (
+        (input_tokens - cached) * COST_PER_INPUT_TOKEN +
+        cached * COST_PER_CACHED_INPUT_TOKEN +
+        output_tokens * COST_PER_OUTPUT_TOKEN
+    )
+
+
+def cache_hit_ratio(input_tokens: int, cached_tokens: int) -> float:
+    """입력 토큰 중 Prompt Cache로 처리된 비율 (0.0~1.0)"""
+    if input_tokens <= 0:
+        return 0.0
+    return round(min(cached_tokens, input_tokens) / input_tokens, 3)
+
+
+def extract_usage(response: Any) -> Dict[str, int]:
+    """
+    LLMResult에서 입력/출력/캐시 토큰을 추출합니다.
+
+    1순위: llm_output["token_usage"] (OpenAI 원본 usage)
+    2순위: generations[*].message.usage_metadata (스트리밍 등 llm_output이 없는 경우)
+    """
+    input_tokens = output_tokens = cached_tokens = 0
+
+    llm_output = getattr(response, "llm_output", None) or {}
+    usage = llm_output.get("token_usage") or {}
+    if usage:
+        input_tokens = usage.get("prompt_tokens", 0) or 0
+        output_tokens = usage.get("completion_tokens", 0) or 0
+        details = usage.get("prompt_tokens_details") or {}
+        cached_tokens = details.get("cached_tokens", 0) or 0
+        return {"input_tokens": input_tokens, "output_tokens": output_tokens, "cached_tokens": cached_tokens}
+
+    for generation_list in getattr(response, "generations", None) or []:
+        for generation in generation_list:
+            message = getattr(generation, "message", None)
+            usage_metadata = getattr(message, "usage_metadata", None) if message else None
+            if not usage_metadata:
+                continue
+            input_tokens += usage_metadata.get("input_tokens", 0) or 0
+            output_tokens += usage_metadata.get("output_tokens", 0) or 0
+            details = usage_metadata.get("input_token_details") or {}
+            cached_tokens += details.get("cache_read", 0) or 0
+
+    return {"input_tokens": input_tokens, "output_tokens": output_tokens, "cached_tokens": cached_tokens}
+
+
+@dataclass
+class UsageBucket:
+    """노드/에이전트 단위 사용량 집계"""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+    llm_calls: int = 0
+    llm_errors: int = 0  # llm_calls 중 실패한 호출 (429 재시도 포함, 토큰 0)
+    latency_ms: float = 0.0
+
+    def add(self, input_tokens: int, output_tokens: int, cached_tokens: int, latency_ms: float,
+            error: bool = False):
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.cached_tokens += cached_tokens
+        self.llm_calls += 1
+        self.llm_errors += 1 if error else 0
+        self.latency_ms += latency_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["latency_ms"] = round(self.latency_ms, 1)
+        data["total_tokens"] = self.input_tokens + self.output_tokens
+        data["cache_hit_ratio"] = cache_hit_ratio(self.input_tokens, self.cached_tokens)
+        data["estimated_cost_usd"] = round(
+            estimate_cost_usd(self.input_tokens, self.output_tokens, self.cached_tokens), 6
+        )
+        return data